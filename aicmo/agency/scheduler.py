@@ -23,6 +23,8 @@ import uuid
 import sqlite3
 import os
 
+from aicmo.shared.db import get_sqlite_connection
+
 logger = logging.getLogger(__name__)
 
 
@@ -118,7 +120,7 @@ class SchedulerRepository:
     
     def _init_db(self):
         """Create tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
+        with get_sqlite_connection(self.db_path) as conn:
             cursor = conn.cursor()
             
             # scheduled_tasks table
@@ -158,7 +160,7 @@ class SchedulerRepository:
     
     def add_scheduled_task(self, task: ScheduledTask) -> None:
         """Add a scheduled task."""
-        with sqlite3.connect(self.db_path) as conn:
+        with get_sqlite_connection(self.db_path) as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 INSERT INTO scheduled_tasks 
@@ -184,7 +186,7 @@ class SchedulerRepository:
     
     def get_scheduled_task(self, scheduled_id: str) -> Optional[ScheduledTask]:
         """Get a scheduled task by ID."""
-        with sqlite3.connect(self.db_path) as conn:
+        with get_sqlite_connection(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             cursor.execute('SELECT * FROM scheduled_tasks WHERE scheduled_id = ?', (scheduled_id,))
@@ -199,7 +201,7 @@ class SchedulerRepository:
         """
         Get tasks that are due (run_at <= now and not completed).
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with get_sqlite_connection(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             cursor.execute('''
@@ -219,7 +221,7 @@ class SchedulerRepository:
         error_message: Optional[str] = None,
     ) -> None:
         """Update scheduled task status and metadata."""
-        with sqlite3.connect(self.db_path) as conn:
+        with get_sqlite_connection(self.db_path) as conn:
             cursor = conn.cursor()
             
             updates = {
@@ -255,7 +257,7 @@ class SchedulerRepository:
         status: Optional[ScheduledTaskStatus] = None,
     ) -> List[ScheduledTask]:
         """List all scheduled tasks for a brand."""
-        with sqlite3.connect(self.db_path) as conn:
+        with get_sqlite_connection(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
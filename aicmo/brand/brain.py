@@ -186,7 +186,7 @@ def generate_with_brand_brain(
     
     Process:
     1. Load brand memory from repository
-    2. Add memory context to generator arguments (if applicable)
+    2. Add memory context (the persisted insight summary) to the brief (if applicable)
     3. Call the generator
     4. Extract insights from output
     5. Save generation record to memory
@@ -221,7 +221,7 @@ def generate_with_brand_brain(
         # Some generators might use this context to improve outputs
         if brief:
             # This is optional - not all generators will use it
-            brief._brand_memory_insights = memory.get_insight_summary()
+            brief._brand_memory_insights = repo.get_insight_summary(brand_id, generator_type)
         
         # Call the generator
         start_time = time.time()
@@ -251,9 +251,8 @@ def generate_with_brand_brain(
             confidence_score=0.7,  # Default; could be refined based on output quality
         )
         
-        # Add record to memory and save
+        # Add record to memory and save (refreshes the persisted insight summaries)
         memory.add_generation_record(record)
-        memory.consolidate_insights()
         repo.save_memory(memory)
         
         logger.info(
@@ -292,3 +291,15 @@ def get_brand_insights(
     if repo is None:
         repo = BrandBrainRepository()
     return repo.get_recent_insights(brand_id, days=days, limit=limit)
+
+
+def get_brand_insight_summary(
+    brand_id: str,
+    generator_type: Optional[str] = None,
+    max_tokens: Optional[int] = None,
+    repo: Optional[BrandBrainRepository] = None,
+) -> str:
+    """Convenience function to retrieve the ranked insight summary used as prompt context."""
+    if repo is None:
+        repo = BrandBrainRepository()
+    return repo.get_insight_summary(brand_id, generator_type, max_tokens=max_tokens)
@@ -16,14 +16,18 @@ Architecture:
 - Zero-impact on existing generators (wrapper pattern)
 """
 
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, asdict, field, replace
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 import json
 import logging
 
+from aicmo.llm.cache import estimate_tokens
+
 logger = logging.getLogger(__name__)
 
+SUMMARY_HEADER = "Brand Memory Insights:"
+
 
 @dataclass
 class BrandGenerationInsight:
@@ -116,6 +120,47 @@ class BrandGenerationRecord:
         return record
 
 
+def merge_insight(insight_map: Dict[str, BrandGenerationInsight], insight: BrandGenerationInsight) -> bool:
+    """
+    Fold one occurrence of an insight into insight_map (keyed by text).
+    
+    A repeat increases frequency, keeps the latest last_seen and averages
+    confidence. Returns True if the text was new (a copy was added).
+    """
+    existing = insight_map.get(insight.insight_text)
+    if existing is None:
+        # Copy, so merging doesn't modify (and dirty) the record's own insight
+        insight_map[insight.insight_text] = replace(insight)
+        return True
+    existing.frequency += 1
+    existing.last_seen = max(existing.last_seen, insight.last_seen)
+    existing.confidence = (existing.confidence + insight.confidence) / 2
+    return False
+
+
+def rank_insights(insights: List[BrandGenerationInsight]) -> List[BrandGenerationInsight]:
+    """Most useful first: confidence * frequency, then most recently seen."""
+    return sorted(insights, key=lambda x: (x.confidence * x.frequency, x.last_seen), reverse=True)
+
+
+def render_insight_summary(
+    ranked: List[BrandGenerationInsight],
+    max_insights: int = 5,
+    max_tokens: Optional[int] = None,
+) -> str:
+    """
+    Prompt context for already ranked insights: at most max_insights lines,
+    stopping before the text would exceed max_tokens (estimated).
+    """
+    lines = [SUMMARY_HEADER]
+    for insight in ranked[:max_insights]:
+        line = f"- {insight.insight_text}"
+        if max_tokens is not None and estimate_tokens("\n".join(lines + [line])) > max_tokens:
+            break
+        lines.append(line)
+    return "\n".join(lines) if len(lines) > 1 else ""
+
+
 @dataclass
 class BrandMemory:
     """
@@ -185,58 +230,64 @@ class BrandMemory:
             consolidated_insights=insights,
         )
     
-    def get_insight_summary(self, max_insights: int = 5) -> str:
+    def get_insight_summary(self, max_insights: int = 5, max_tokens: Optional[int] = None) -> str:
         """
         Get a natural language summary of the top insights for this brand.
         Used as context when prompting generators.
+        
+        Generators should prefer BrandBrainRepository.get_insight_summary(),
+        which reads the persisted summary instead of ranking in memory.
         """
         if not self.consolidated_insights:
             return ""
-        
-        # Sort by confidence * frequency
-        sorted_insights = sorted(
-            self.consolidated_insights,
-            key=lambda x: x.confidence * x.frequency,
-            reverse=True
-        )[:max_insights]
-        
-        insights_text = "\n".join([f"- {i.insight_text}" for i in sorted_insights])
-        return f"Brand Memory Insights:\n{insights_text}"
+        return render_insight_summary(
+            rank_insights(self.consolidated_insights), max_insights, max_tokens
+        )
     
     def add_generation_record(self, record: BrandGenerationRecord) -> None:
-        """Add a new generation record to this brand's memory."""
+        """Add a new generation record and fold its insights into consolidated_insights."""
         self.generation_history.append(record)
+        
+        insight_map = {i.insight_text: i for i in self.consolidated_insights}
+        for insight in record.extracted_insights + record.manual_insights:
+            if merge_insight(insight_map, insight):
+                self.consolidated_insights.append(insight_map[insight.insight_text])
+        
         self.total_generations = len(self.generation_history)
         self.updated_at = datetime.utcnow()
         
-        # Update average quality
-        if self.generation_history:
-            self.avg_generation_quality = sum(
-                r.confidence_score for r in self.generation_history
-            ) / len(self.generation_history)
+        # Update average quality (a lazily loaded history keeps a running total)
+        history = self.generation_history
+        if history:
+            if hasattr(history, "confidence_total"):
+                total = history.confidence_total()
+            else:
+                total = sum(r.confidence_score for r in history)
+            self.avg_generation_quality = total / len(history)
     
     def consolidate_insights(self) -> None:
         """
-        Process all generation records and extract consolidated insights.
-        Should be called periodically to update consolidated_insights.
+        Rebuild consolidated_insights from every generation record.
+        
+        add_generation_record() already keeps them up to date; this is only
+        needed after editing or removing records.
         """
-        # Aggregate all insights from all records
-        all_insights = []
-        for record in self.generation_history:
-            all_insights.extend(record.extracted_insights)
-            all_insights.extend(record.manual_insights)
+        # Aggregate all insights from all records (a lazily loaded history
+        # streams them without loading the records themselves)
+        history = self.generation_history
+        if hasattr(history, "iter_insights"):
+            all_insights = history.iter_insights()
+        else:
+            all_insights = (
+                insight
+                for record in history
+                for insight in record.extracted_insights + record.manual_insights
+            )
         
         # Group by insight text (fuzzy matching for very similar insights)
         # For now, simple deduplication by exact text match
         insight_map: Dict[str, BrandGenerationInsight] = {}
         for insight in all_insights:
-            if insight.insight_text in insight_map:
-                # Merge: increase frequency, update last_seen, average confidence
-                existing = insight_map[insight.insight_text]
-                existing.frequency += 1
-                existing.last_seen = max(existing.last_seen, insight.last_seen)
-                existing.confidence = (existing.confidence + insight.confidence) / 2
-            else:
-                insight_map[insight.insight_text] = insight
+            merge_insight(insight_map, insight)
         
         self.consolidated_insights = list(insight_map.values())
@@ -10,20 +10,263 @@ Features:
 - Indexed queries for fast retrieval
 - Automatic memory expiration (old, low-confidence memories)
 - Semantic search (embeddings-based, optional)
+
+Loading is set-based and lazy: load_memory() reads the brand, its metadata
+and history totals in one query and returns a LazyGenerationHistory that
+fetches records a page at a time (two queries per page: headers, then
+their insights). output_json is only read when a record's output is first
+accessed. save_memory() compares records against the snapshot taken when
+they were loaded or last saved and writes only new or changed records and
+insights.
+
+Insight summaries: every new record's insights are folded into per-brand
+aggregates (one set per generator type, plus "*" for the whole brand) and
+the ranked summaries for those keys are re-rendered, so prompt context is
+a single keyed read (get_insight_summary) however long the history is.
 """
 
 import sqlite3
 import json
 import logging
 import os
+from collections.abc import MutableSequence, Sequence
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Iterator, Tuple
 from pathlib import Path
 
-from aicmo.brand.memory import BrandMemory, BrandGenerationRecord, BrandGenerationInsight
+from aicmo.brand.memory import (
+    BrandMemory,
+    BrandGenerationRecord,
+    BrandGenerationInsight,
+    render_insight_summary,
+)
+from aicmo.shared.config import settings
+from aicmo.shared.db import get_sqlite_connection
 
 logger = logging.getLogger(__name__)
 
+# Generation records fetched per page of LazyGenerationHistory
+DEFAULT_PAGE_SIZE = 200
+
+_RECORD_COLUMNS = (
+    "generation_id, brand_id, generator_type, brief_id, prompt, brief_summary, "
+    "llm_provider, completion_time_ms, created_at, confidence_score"
+)
+_INSIGHT_COLUMNS = (
+    "generation_id, insight_text, confidence, frequency, last_seen, source_context, generator_type"
+)
+
+# Newest first; generation_id breaks ties so keyset paging is stable
+_HISTORY_ORDER = "created_at DESC, generation_id DESC"
+
+# Summary scope covering every generator type of a brand
+BRAND_SCOPE = "*"
+
+# What a record looked like when it was loaded or last saved (kept in record.__dict__)
+_SNAPSHOT = "_brand_brain_snapshot"
+_DEFERRED = object()
+
+Cursor = Tuple[str, str]  # (created_at, generation_id) of the last record fetched
+
+
+def _record_row(record: BrandGenerationRecord) -> tuple:
+    return (
+        record.generation_id,
+        record.brand_id,
+        record.generator_type,
+        record.brief_id,
+        record.prompt,
+        record.brief_summary,
+        record.llm_provider,
+        record.completion_time_ms,
+        record.created_at.isoformat(),
+        record.confidence_score,
+    )
+
+
+def _insight_rows(record: BrandGenerationRecord) -> tuple:
+    return tuple(
+        (
+            insight.insight_text,
+            insight.confidence,
+            insight.frequency,
+            insight.last_seen.isoformat(),
+            insight.source_context,
+            insight.generator_type,
+        )
+        for insight in record.extracted_insights + record.manual_insights
+    )
+
+
+def _insight_from_row(row: sqlite3.Row) -> BrandGenerationInsight:
+    return BrandGenerationInsight(
+        insight_text=row["insight_text"],
+        confidence=row["confidence"],
+        frequency=row["frequency"],
+        last_seen=datetime.fromisoformat(row["last_seen"]),
+        source_context=row["source_context"],
+        generator_type=row["generator_type"],
+    )
+
+
+def _after_cursor(cursor: Optional[Cursor], prefix: str = "") -> Tuple[str, tuple]:
+    """SQL condition (and params) for records older than cursor in history order."""
+    if cursor is None:
+        return "", ()
+    return f" AND ({prefix}created_at, {prefix}generation_id) < (?, ?)", cursor
+
+
+class StoredGenerationRecord(BrandGenerationRecord):
+    """
+    A BrandGenerationRecord loaded by BrandBrainRepository.
+
+    output_json is read from the database on first access; assigning it
+    works as usual (and marks the output as changed for the next save).
+    """
+
+    def __init__(self, *args, output_loader: Callable[[str], Dict[str, Any]], **kwargs):
+        self.__dict__["_output_loader"] = output_loader
+        super().__init__(*args, output_json=_DEFERRED, **kwargs)
+
+    @property
+    def output_json(self) -> Dict[str, Any]:
+        value = self.__dict__["_output_json"]
+        if value is _DEFERRED:
+            value = self.__dict__["_output_json"] = self.__dict__["_output_loader"](self)
+        return value
+
+    @output_json.setter
+    def output_json(self, value: Dict[str, Any]) -> None:
+        self.__dict__["_output_json"] = value
+
+    @property
+    def output_loaded(self) -> bool:
+        return self.__dict__["_output_json"] is not _DEFERRED
+
+
+class LazyGenerationHistory(MutableSequence):
+    """
+    A brand's generation history, newest first, fetched a page at a time.
+
+    len() and confidence_total() come from the totals read with the brand,
+    append() never touches the database, and iter_insights() streams the
+    insights of records that have not been fetched yet in one query.
+    Anything else that needs a record beyond the fetched pages fetches
+    the pages in between; arbitrary inserts/deletes fetch everything first.
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[[Optional[Cursor], int], List[StoredGenerationRecord]],
+        fetch_insights: Callable[[Optional[Cursor]], Iterator[BrandGenerationInsight]],
+        total: int,
+        confidence_total: float,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ):
+        self._fetch_page = fetch_page
+        self._fetch_insights = fetch_insights
+        self._page_size = page_size
+        self._records: List[BrandGenerationRecord] = []  # fetched, in history order
+        self._appended: List[BrandGenerationRecord] = []  # added while pages remain
+        self._cursor: Optional[Cursor] = None
+        self._unfetched = total
+        self._unfetched_confidence = confidence_total
+
+    @property
+    def fully_loaded(self) -> bool:
+        return self._unfetched == 0
+
+    def _fetch_next_page(self) -> bool:
+        if not self._unfetched:
+            return False
+        page = self._fetch_page(self._cursor, self._page_size)
+        self._records.extend(page)
+        if page:
+            last = page[-1]
+            self._cursor = (last.created_at.isoformat(), last.generation_id)
+        if len(page) < self._page_size:
+            self._unfetched, self._unfetched_confidence = 0, 0.0
+        else:
+            self._unfetched = max(0, self._unfetched - len(page))
+            self._unfetched_confidence -= sum(r.confidence_score for r in page)
+        if not self._unfetched:
+            self._records.extend(self._appended)
+            self._appended.clear()
+        return bool(page)
+
+    def load_all(self) -> List[BrandGenerationRecord]:
+        """Fetch every remaining page; returns the underlying list."""
+        while self._unfetched:
+            self._fetch_next_page()
+        return self._records
+
+    def materialized(self) -> List[BrandGenerationRecord]:
+        """Records held in memory (fetched or appended), without fetching more."""
+        return self._records + self._appended
+
+    def confidence_total(self) -> float:
+        """Sum of confidence_score over the whole history, without fetching it."""
+        return self._unfetched_confidence + sum(r.confidence_score for r in self.materialized())
+
+    def iter_insights(self) -> Iterator[BrandGenerationInsight]:
+        """Insights of every record in history order (extracted, then manual)."""
+        for record in list(self._records):
+            yield from record.extracted_insights
+            yield from record.manual_insights
+        if self._unfetched:
+            yield from self._fetch_insights(self._cursor)
+        for record in list(self._appended):
+            yield from record.extracted_insights
+            yield from record.manual_insights
+
+    def __len__(self) -> int:
+        return len(self._records) + self._unfetched + len(self._appended)
+
+    def __iter__(self) -> Iterator[BrandGenerationRecord]:
+        i = 0
+        while True:
+            while i >= len(self._records) and self._fetch_next_page():
+                pass
+            if i >= len(self._records):
+                break
+            yield self._records[i]
+            i += 1
+        yield from list(self._appended)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("generation history index out of range")
+        while index >= len(self._records) and self._unfetched and self._fetch_next_page():
+            pass
+        if index < len(self._records):
+            return self._records[index]
+        return self._appended[index - len(self._records) - self._unfetched]
+
+    def __setitem__(self, index, value) -> None:
+        self.load_all()[index] = value
+
+    def __delitem__(self, index) -> None:
+        del self.load_all()[index]
+
+    def insert(self, index: int, value: BrandGenerationRecord) -> None:
+        if self._unfetched and index >= len(self):
+            self._appended.append(value)
+        else:
+            self.load_all().insert(index, value)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (LazyGenerationHistory, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LazyGenerationHistory(fetched={len(self._records)}, total={len(self)})"
+
 
 class BrandBrainRepository:
     """
@@ -36,14 +279,15 @@ class BrandBrainRepository:
     - Embeddings (for semantic search, optional)
     """
     
-    def __init__(self, db_path: str = "aicmo_brand_memory.db"):
+    def __init__(self, db_path: str = "aicmo_brand_memory.db", page_size: int = DEFAULT_PAGE_SIZE):
         """Initialize repository with SQLite database."""
         self.db_path = db_path
+        self.page_size = page_size
         self._init_db()
     
     def _init_db(self) -> None:
         """Create tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
+        with get_sqlite_connection(self.db_path) as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS brands (
                     brand_id TEXT PRIMARY KEY,
@@ -76,6 +320,10 @@ class BrandBrainRepository:
             conn.execute("CREATE INDEX IF NOT EXISTS idx_gen_brand_id ON generation_records(brand_id)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_gen_type ON generation_records(generator_type)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_gen_created ON generation_records(created_at)")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_gen_brand_history "
+                "ON generation_records(brand_id, created_at, generation_id)"
+            )
             
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS insights (
@@ -97,6 +345,39 @@ class BrandBrainRepository:
             # Create indexes for insights
             conn.execute("CREATE INDEX IF NOT EXISTS idx_insight_brand_id ON insights(brand_id)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_insight_gen_type ON insights(generator_type)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_insight_generation ON insights(generation_id)")
+            
+            # Running consolidation of every insight ever saved, per scope
+            # (generator type or BRAND_SCOPE); same merge rule as merge_insight()
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS insight_aggregates (
+                    brand_id TEXT NOT NULL,
+                    scope TEXT NOT NULL,
+                    insight_text TEXT NOT NULL,
+                    confidence REAL,
+                    frequency INTEGER,
+                    last_seen TEXT,
+                    source_context TEXT,
+                    generator_type TEXT,
+                    PRIMARY KEY (brand_id, scope, insight_text)
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_insight_agg_rank "
+                "ON insight_aggregates(brand_id, scope, (confidence * frequency) DESC, last_seen DESC)"
+            )
+            
+            # Top BRAND_INSIGHT_SUMMARY_SIZE aggregates per scope, ranked and rendered
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS insight_summaries (
+                    brand_id TEXT NOT NULL,
+                    scope TEXT NOT NULL,
+                    summary_text TEXT NOT NULL,
+                    insights_json TEXT NOT NULL,
+                    updated_at TEXT,
+                    PRIMARY KEY (brand_id, scope)
+                )
+            """)
             
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS brand_metadata (
@@ -115,7 +396,7 @@ class BrandBrainRepository:
     def save_memory(self, memory: BrandMemory) -> None:
         """Save a complete BrandMemory to persistent storage."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with get_sqlite_connection(self.db_path) as conn:
                 # Save brand record
                 conn.execute("""
                     INSERT OR REPLACE INTO brands
@@ -129,9 +410,13 @@ class BrandBrainRepository:
                     memory.avg_generation_quality,
                 ))
                 
-                # Save generation records
-                for record in memory.generation_history:
-                    self._save_generation_record(conn, record)
+                # Save new or changed generation records
+                history = memory.generation_history
+                records = (
+                    history.materialized() if isinstance(history, LazyGenerationHistory) else history
+                )
+                written, added = self._save_generation_records(conn, records)
+                self._fold_into_summaries(conn, added)
                 
                 # Save metadata
                 conn.execute("""
@@ -149,143 +434,397 @@ class BrandBrainRepository:
                 ))
                 
                 conn.commit()
-                logger.info(f"Saved memory for brand {memory.brand_id}")
+                for record, snapshot in written:
+                    record.__dict__[_SNAPSHOT] = snapshot
+                logger.info(f"Saved memory for brand {memory.brand_id} ({len(written)} records written)")
         except Exception as e:
             logger.error(f"Error saving memory for brand {memory.brand_id}: {e}")
             raise
     
-    def _save_generation_record(self, conn: sqlite3.Connection, record: BrandGenerationRecord) -> None:
-        """Save a single generation record to the database."""
-        conn.execute("""
-            INSERT OR REPLACE INTO generation_records
-            (generation_id, brand_id, generator_type, brief_id, prompt, brief_summary,
-             output_json, llm_provider, completion_time_ms, created_at, confidence_score)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            record.generation_id,
-            record.brand_id,
-            record.generator_type,
-            record.brief_id,
-            record.prompt,
-            record.brief_summary,
-            json.dumps(record.output_json),
-            record.llm_provider,
-            record.completion_time_ms,
-            record.created_at.isoformat(),
-            record.confidence_score,
-        ))
+    def _save_generation_records(
+        self, conn: sqlite3.Connection, records: List[BrandGenerationRecord]
+    ) -> Tuple[List[Tuple[BrandGenerationRecord, Dict[str, Any]]], List[BrandGenerationRecord]]:
+        """
+        Write records that are new or changed since their snapshot.
         
-        # Save all insights
-        all_insights = record.extracted_insights + record.manual_insights
-        for insight in all_insights:
-            conn.execute("""
+        Returns (record, new snapshot) pairs to apply once the transaction
+        commits, and the records that were not in the database before.
+        """
+        new_rows, header_updates, output_updates = [], [], []
+        insight_writes: List[Tuple[BrandGenerationRecord, tuple]] = []
+        written = []
+        
+        for record in records:
+            snapshot = record.__dict__.get(_SNAPSHOT)
+            row = _record_row(record)
+            insights = _insight_rows(record)
+            output_pending = isinstance(record, StoredGenerationRecord) and not record.output_loaded
+            output_text = None if output_pending else json.dumps(record.output_json)
+            
+            if snapshot is None:
+                new_rows.append(row[:6] + (output_text,) + row[6:])
+                insight_writes.append((record, insights))
+            else:
+                if row == snapshot["row"] and insights == snapshot["insights"] and (
+                    output_text is None or hash(output_text) == snapshot["output"]
+                ):
+                    continue
+                if row != snapshot["row"]:
+                    header_updates.append(row[1:] + (row[0],))
+                if output_text is not None and hash(output_text) != snapshot["output"]:
+                    output_updates.append((output_text, record.generation_id))
+                if insights != snapshot["insights"]:
+                    insight_writes.append((record, insights))
+            
+            written.append((record, {
+                "row": row,
+                "insights": insights,
+                "output": hash(output_text) if output_text is not None else snapshot["output"],
+            }))
+        
+        added: List[BrandGenerationRecord] = []
+        if new_rows:
+            ids = [row[0] for row in new_rows]
+            existing = set()
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                existing.update(r[0] for r in conn.execute(
+                    f"SELECT generation_id FROM generation_records "
+                    f"WHERE generation_id IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                ))
+            added = [
+                record for record, _ in written
+                if record.__dict__.get(_SNAPSHOT) is None and record.generation_id not in existing
+            ]
+            conn.executemany("""
+                INSERT OR REPLACE INTO generation_records
+                (generation_id, brand_id, generator_type, brief_id, prompt, brief_summary,
+                 output_json, llm_provider, completion_time_ms, created_at, confidence_score)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, new_rows)
+        if header_updates:
+            conn.executemany("""
+                UPDATE generation_records
+                SET brand_id = ?, generator_type = ?, brief_id = ?, prompt = ?, brief_summary = ?,
+                    llm_provider = ?, completion_time_ms = ?, created_at = ?, confidence_score = ?
+                WHERE generation_id = ?
+            """, header_updates)
+        if output_updates:
+            conn.executemany(
+                "UPDATE generation_records SET output_json = ? WHERE generation_id = ?",
+                output_updates,
+            )
+        if insight_writes:
+            # A changed insight list is replaced as a whole
+            conn.executemany(
+                "DELETE FROM insights WHERE generation_id = ?",
+                [(record.generation_id,) for record, _ in insight_writes],
+            )
+            conn.executemany("""
                 INSERT INTO insights
                 (generation_id, brand_id, insight_text, confidence, frequency,
                  last_seen, source_context, generator_type)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                record.generation_id,
-                record.brand_id,
-                insight.insight_text,
-                insight.confidence,
-                insight.frequency,
-                insight.last_seen.isoformat(),
-                insight.source_context,
-                insight.generator_type,
+            """, [
+                (record.generation_id, record.brand_id) + insight
+                for record, insights in insight_writes
+                for insight in insights
+            ])
+        
+        return written, added
+    
+    def _fold_into_summaries(self, conn: sqlite3.Connection, records: List[BrandGenerationRecord]) -> None:
+        """Merge the insights of newly added records into the aggregates and re-rank their summaries."""
+        rows = []
+        for record in records:
+            for insight in record.extracted_insights + record.manual_insights:
+                values = (
+                    insight.insight_text,
+                    insight.confidence,
+                    insight.frequency,
+                    insight.last_seen.isoformat(),
+                    insight.source_context,
+                    insight.generator_type,
+                )
+                rows.append((record.brand_id, record.generator_type) + values)
+                rows.append((record.brand_id, BRAND_SCOPE) + values)
+        self._merge_aggregates(conn, rows)
+    
+    def _merge_aggregates(self, conn: sqlite3.Connection, rows: List[tuple]) -> None:
+        """
+        Merge (brand_id, scope, insight_text, confidence, frequency, last_seen,
+        source_context, generator_type) rows into the aggregates, in order
+        (so repeats merge exactly as merge_insight() would), then re-rank
+        the affected summaries.
+        """
+        if not rows:
+            return
+        conn.executemany("""
+            INSERT INTO insight_aggregates
+            (brand_id, scope, insight_text, confidence, frequency, last_seen,
+             source_context, generator_type)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (brand_id, scope, insight_text) DO UPDATE SET
+                frequency = frequency + 1,
+                last_seen = MAX(last_seen, excluded.last_seen),
+                confidence = (confidence + excluded.confidence) / 2
+        """, rows)
+        self._refresh_summaries(conn, {(row[0], row[1]) for row in rows})
+    
+    def _refresh_summaries(self, conn: sqlite3.Connection, keys) -> None:
+        """Re-rank and re-render the summaries for (brand_id, scope) keys from their aggregates."""
+        now = datetime.utcnow().isoformat()
+        summaries = []
+        for brand_id, scope in sorted(keys):
+            rows = conn.execute("""
+                SELECT insight_text, confidence, frequency, last_seen, source_context, generator_type
+                FROM insight_aggregates
+                WHERE brand_id = ? AND scope = ?
+                ORDER BY (confidence * frequency) DESC, last_seen DESC
+                LIMIT ?
+            """, (brand_id, scope, settings.BRAND_INSIGHT_SUMMARY_SIZE)).fetchall()
+            ranked = [
+                BrandGenerationInsight(
+                    insight_text=row[0],
+                    confidence=row[1],
+                    frequency=row[2],
+                    last_seen=datetime.fromisoformat(row[3]),
+                    source_context=row[4],
+                    generator_type=row[5],
+                )
+                for row in rows
+            ]
+            summaries.append((
+                brand_id,
+                scope,
+                render_insight_summary(
+                    ranked,
+                    settings.BRAND_INSIGHT_SUMMARY_MAX_INSIGHTS,
+                    settings.BRAND_INSIGHT_SUMMARY_MAX_TOKENS,
+                ),
+                json.dumps([i.to_dict() for i in ranked]),
+                now,
             ))
+        conn.executemany("""
+            INSERT OR REPLACE INTO insight_summaries
+            (brand_id, scope, summary_text, insights_json, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+        """, summaries)
+    
+    def get_insight_summary(
+        self,
+        brand_id: str,
+        generator_type: Optional[str] = None,
+        max_insights: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """
+        Prompt context for a brand, read from its persisted summary.
+        
+        Uses the generator type's summary, falling back to the brand-wide one
+        when that generator has no insights yet. Without max_insights or
+        max_tokens the stored text (rendered with the configured limits) is
+        returned as is; otherwise it is re-rendered from the stored ranking.
+        """
+        scopes = [generator_type, BRAND_SCOPE] if generator_type else [BRAND_SCOPE]
+        with get_sqlite_connection(self.db_path) as conn:
+            rows = dict(
+                (row[0], row[1:]) for row in conn.execute(
+                    f"SELECT scope, summary_text, insights_json FROM insight_summaries "
+                    f"WHERE brand_id = ? AND scope IN ({', '.join('?' * len(scopes))})",
+                    (brand_id, *scopes),
+                )
+            )
+        
+        for scope in scopes:
+            if scope not in rows:
+                continue
+            summary_text, insights_json = rows[scope]
+            if max_insights is None and max_tokens is None:
+                return summary_text
+            ranked = [BrandGenerationInsight.from_dict(i) for i in json.loads(insights_json)]
+            return render_insight_summary(
+                ranked,
+                max_insights if max_insights is not None else settings.BRAND_INSIGHT_SUMMARY_MAX_INSIGHTS,
+                max_tokens if max_tokens is not None else settings.BRAND_INSIGHT_SUMMARY_MAX_TOKENS,
+            )
+        return ""
+    
+    def rebuild_insight_summaries(self, brand_id: str) -> None:
+        """
+        Recompute a brand's aggregates and summaries from its stored insights,
+        replaying records oldest first. For databases written before summaries
+        existed, or after records were removed.
+        """
+        with get_sqlite_connection(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute("""
+                SELECT g.brand_id, g.generator_type AS scope, i.insight_text, i.confidence,
+                       i.frequency, i.last_seen, i.source_context, i.generator_type
+                FROM generation_records g JOIN insights i ON i.generation_id = g.generation_id
+                WHERE g.brand_id = ?
+                ORDER BY g.created_at, g.generation_id, i.insight_id
+            """, (brand_id,)).fetchall()
+            conn.execute("DELETE FROM insight_aggregates WHERE brand_id = ?", (brand_id,))
+            conn.execute("DELETE FROM insight_summaries WHERE brand_id = ?", (brand_id,))
+            
+            replay = []
+            for row in rows:
+                values = tuple(row)[2:]
+                replay.append((row["brand_id"], row["scope"]) + values)
+                replay.append((row["brand_id"], BRAND_SCOPE) + values)
+            self._merge_aggregates(conn, replay)
+            conn.commit()
     
     def load_memory(self, brand_id: str) -> Optional[BrandMemory]:
-        """Load a complete BrandMemory from persistent storage."""
+        """
+        Load a BrandMemory from persistent storage.
+        
+        Reads the brand, its metadata, history totals and brand-wide insight
+        summary in one query; generation_history is a LazyGenerationHistory
+        fetched on demand and consolidated_insights holds the top ranked
+        insights (BRAND_INSIGHT_SUMMARY_SIZE), not every distinct one.
+        """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with get_sqlite_connection(self.db_path) as conn:
                 conn.row_factory = sqlite3.Row
-                
-                # Load brand record
-                brand_row = conn.execute(
-                    "SELECT * FROM brands WHERE brand_id = ?",
-                    (brand_id,)
-                ).fetchone()
-                
-                if not brand_row:
-                    logger.warning(f"Brand {brand_id} not found in database")
-                    return None
-                
-                # Load generation records
-                gen_rows = conn.execute(
-                    "SELECT * FROM generation_records WHERE brand_id = ? ORDER BY created_at DESC",
-                    (brand_id,)
-                ).fetchall()
-                
-                generation_records = []
-                for row in gen_rows:
-                    record = BrandGenerationRecord(
-                        generation_id=row["generation_id"],
-                        generator_type=row["generator_type"],
-                        brand_id=row["brand_id"],
-                        brief_id=row["brief_id"],
-                        prompt=row["prompt"],
-                        brief_summary=row["brief_summary"],
-                        output_json=json.loads(row["output_json"]),
-                        llm_provider=row["llm_provider"],
-                        completion_time_ms=row["completion_time_ms"],
-                        created_at=datetime.fromisoformat(row["created_at"]),
-                        confidence_score=row["confidence_score"],
-                    )
-                    
-                    # Load insights for this record
-                    insight_rows = conn.execute(
-                        "SELECT * FROM insights WHERE generation_id = ?",
-                        (row["generation_id"],)
-                    ).fetchall()
-                    
-                    for irow in insight_rows:
-                        insight = BrandGenerationInsight(
-                            insight_text=irow["insight_text"],
-                            confidence=irow["confidence"],
-                            frequency=irow["frequency"],
-                            last_seen=datetime.fromisoformat(irow["last_seen"]),
-                            source_context=irow["source_context"],
-                            generator_type=irow["generator_type"],
-                        )
-                        record.extracted_insights.append(insight)
-                    
-                    generation_records.append(record)
-                
-                # Load metadata
-                meta_row = conn.execute(
-                    "SELECT * FROM brand_metadata WHERE brand_id = ?",
-                    (brand_id,)
-                ).fetchone()
-                
-                # Create BrandMemory
-                memory = BrandMemory(
-                    brand_id=brand_id,
-                    brand_name=brand_row["brand_name"],
-                    generation_history=generation_records,
-                    total_generations=brand_row["total_generations"],
-                    avg_generation_quality=brand_row["avg_generation_quality"],
-                    updated_at=datetime.fromisoformat(brand_row["updated_at"]),
-                )
-                
-                if meta_row:
-                    memory.brand_voice_summary = meta_row["brand_voice_summary"]
-                    memory.learned_behaviors = json.loads(meta_row["learned_behaviors"] or "[]")
-                    memory.anti_patterns = json.loads(meta_row["anti_patterns"] or "[]")
-                    memory.learned_audience_segments = json.loads(meta_row["learned_audience_segments"] or "[]")
-                    memory.resonant_topics = json.loads(meta_row["resonant_topics"] or "[]")
-                
-                logger.info(f"Loaded memory for brand {brand_id} with {len(generation_records)} records")
-                return memory
+                brand_row = conn.execute("""
+                    SELECT b.brand_name, b.updated_at, b.total_generations, b.avg_generation_quality,
+                           m.brand_id AS meta_brand_id, m.brand_voice_summary, m.learned_behaviors,
+                           m.anti_patterns, m.learned_audience_segments, m.resonant_topics,
+                           (SELECT COUNT(*) FROM generation_records g
+                            WHERE g.brand_id = b.brand_id) AS history_count,
+                           (SELECT COALESCE(SUM(g.confidence_score), 0.0) FROM generation_records g
+                            WHERE g.brand_id = b.brand_id) AS history_confidence,
+                           s.insights_json AS ranked_insights
+                    FROM brands b
+                    LEFT JOIN brand_metadata m ON m.brand_id = b.brand_id
+                    LEFT JOIN insight_summaries s ON s.brand_id = b.brand_id AND s.scope = ?
+                    WHERE b.brand_id = ?
+                """, (BRAND_SCOPE, brand_id)).fetchone()
+            
+            if not brand_row:
+                logger.warning(f"Brand {brand_id} not found in database")
+                return None
+            
+            history = LazyGenerationHistory(
+                fetch_page=lambda cursor, limit: self._load_history_page(brand_id, cursor, limit),
+                fetch_insights=lambda cursor: self._iter_history_insights(brand_id, cursor),
+                total=brand_row["history_count"],
+                confidence_total=brand_row["history_confidence"],
+                page_size=self.page_size,
+            )
+            memory = BrandMemory(
+                brand_id=brand_id,
+                brand_name=brand_row["brand_name"],
+                generation_history=history,
+                total_generations=brand_row["total_generations"],
+                avg_generation_quality=brand_row["avg_generation_quality"],
+                updated_at=datetime.fromisoformat(brand_row["updated_at"]),
+                consolidated_insights=[
+                    BrandGenerationInsight.from_dict(i)
+                    for i in json.loads(brand_row["ranked_insights"] or "[]")
+                ],
+            )
+            
+            if brand_row["meta_brand_id"] is not None:
+                memory.brand_voice_summary = brand_row["brand_voice_summary"]
+                memory.learned_behaviors = json.loads(brand_row["learned_behaviors"] or "[]")
+                memory.anti_patterns = json.loads(brand_row["anti_patterns"] or "[]")
+                memory.learned_audience_segments = json.loads(brand_row["learned_audience_segments"] or "[]")
+                memory.resonant_topics = json.loads(brand_row["resonant_topics"] or "[]")
+            
+            logger.info(f"Loaded memory for brand {brand_id} with {len(history)} records")
+            return memory
         
         except Exception as e:
             logger.error(f"Error loading memory for brand {brand_id}: {e}")
             raise
     
+    def _load_history_page(
+        self, brand_id: str, cursor: Optional[Cursor], limit: int
+    ) -> List[StoredGenerationRecord]:
+        """One page of generation records (without output_json) and their insights."""
+        condition, params = _after_cursor(cursor)
+        with get_sqlite_connection(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(
+                f"SELECT {_RECORD_COLUMNS} FROM generation_records "
+                f"WHERE brand_id = ?{condition} ORDER BY {_HISTORY_ORDER} LIMIT ?",
+                (brand_id, *params, limit),
+            ).fetchall()
+            
+            insights: Dict[str, List[BrandGenerationInsight]] = {}
+            if rows:
+                placeholders = ", ".join("?" * len(rows))
+                insight_rows = conn.execute(
+                    f"SELECT {_INSIGHT_COLUMNS} FROM insights "
+                    f"WHERE generation_id IN ({placeholders}) ORDER BY insight_id",
+                    [row["generation_id"] for row in rows],
+                ).fetchall()
+                for irow in insight_rows:
+                    insights.setdefault(irow["generation_id"], []).append(_insight_from_row(irow))
+        
+        page = []
+        for row in rows:
+            record = StoredGenerationRecord(
+                generation_id=row["generation_id"],
+                generator_type=row["generator_type"],
+                brand_id=row["brand_id"],
+                brief_id=row["brief_id"],
+                prompt=row["prompt"],
+                brief_summary=row["brief_summary"],
+                llm_provider=row["llm_provider"],
+                completion_time_ms=row["completion_time_ms"],
+                created_at=datetime.fromisoformat(row["created_at"]),
+                confidence_score=row["confidence_score"],
+                extracted_insights=insights.get(row["generation_id"], []),
+                output_loader=self._load_output,
+            )
+            record.__dict__[_SNAPSHOT] = {
+                "row": _record_row(record),
+                "insights": _insight_rows(record),
+                "output": None,
+            }
+            page.append(record)
+        return page
+    
+    def _iter_history_insights(
+        self, brand_id: str, cursor: Optional[Cursor]
+    ) -> Iterator[BrandGenerationInsight]:
+        """Insights of records older than cursor, in history order, in one query."""
+        condition, params = _after_cursor(cursor, prefix="g.")
+        with get_sqlite_connection(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(
+                f"SELECT i.generation_id, i.insight_text, i.confidence, i.frequency, i.last_seen, "
+                f"i.source_context, i.generator_type "
+                f"FROM generation_records g JOIN insights i ON i.generation_id = g.generation_id "
+                f"WHERE g.brand_id = ?{condition} "
+                f"ORDER BY g.created_at DESC, g.generation_id DESC, i.insight_id",
+                (brand_id, *params),
+            ).fetchall()
+        return (_insight_from_row(row) for row in rows)
+    
+    def _load_output(self, record: StoredGenerationRecord) -> Dict[str, Any]:
+        """Read a record's deferred output_json (and remember it for change detection)."""
+        with get_sqlite_connection(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT output_json FROM generation_records WHERE generation_id = ?",
+                (record.generation_id,),
+            ).fetchone()
+        text = row[0] if row else "{}"
+        snapshot = record.__dict__.get(_SNAPSHOT)
+        if snapshot is not None:
+            snapshot["output"] = hash(text)
+        return json.loads(text)
+    
     def get_recent_insights(self, brand_id: str, days: int = 30, limit: int = 10) -> List[BrandGenerationInsight]:
         """Get the most recent high-confidence insights for a brand."""
         cutoff_date = (datetime.utcnow() - timedelta(days=days)).isoformat()
         
-        with sqlite3.connect(self.db_path) as conn:
+        with get_sqlite_connection(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
             rows = conn.execute("""
                 SELECT insight_text, confidence, frequency, last_seen, source_context, generator_type
@@ -311,7 +850,12 @@ class BrandBrainRepository:
         """Remove generation records older than X days with low confidence."""
         cutoff_date = (datetime.utcnow() - timedelta(days=days)).isoformat()
         
-        with sqlite3.connect(self.db_path) as conn:
+        with get_sqlite_connection(self.db_path) as conn:
+            affected_brands = [row[0] for row in conn.execute("""
+                SELECT DISTINCT brand_id FROM generation_records
+                WHERE created_at < ? AND confidence_score < 0.5
+            """, (cutoff_date,))]
+            
             # Delete insights from old records
             conn.execute("""
                 DELETE FROM insights
@@ -328,11 +872,14 @@ class BrandBrainRepository:
             """, (cutoff_date,))
             
             conn.commit()
-            logger.info(f"Cleaned up old memories before {cutoff_date}")
+        
+        for brand_id in affected_brands:
+            self.rebuild_insight_summaries(brand_id)
+        logger.info(f"Cleaned up old memories before {cutoff_date}")
     
     def list_brands(self) -> List[Dict[str, Any]]:
         """List all brands in the repository."""
-        with sqlite3.connect(self.db_path) as conn:
+        with get_sqlite_connection(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
             rows = conn.execute(
                 "SELECT brand_id, brand_name, total_generations, avg_generation_quality, updated_at FROM brands"
@@ -7,43 +7,58 @@ REST endpoints for operators to:
 - Provide custom input
 """
 
+import threading
+from contextlib import closing
+
 from flask import Blueprint, request, jsonify
 from flask_login import login_required
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from aicmo.cam.engine.review_queue import (
-    get_review_queue,
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    get_review_queue_page,
+    get_review_queue_stats,
     approve_review_task,
     reject_review_task,
     flag_lead_for_review,
 )
-from aicmo.cam.db_models import Base
+from aicmo.shared.db import get_engine
 
 bp = Blueprint("review_queue", __name__, url_prefix="/api/v1/review-queue")
 
+_session_factory = None
+_session_factory_lock = threading.Lock()
+
 
 def get_db_session():
-    """Factory for database sessions."""
-    engine = create_engine("sqlite:///./cam.db")
-    Session = sessionmaker(bind=engine)
-    return Session()
+    """Session on the shared, pooled engine for AICMO_DATABASE_URL."""
+    global _session_factory
+    if _session_factory is None:
+        with _session_factory_lock:
+            if _session_factory is None:
+                _session_factory = sessionmaker(bind=get_engine())
+    return _session_factory()
 
 
 @bp.route("/tasks", methods=["GET"])
 @login_required
 def list_review_tasks():
     """
-    Get all review tasks.
+    Get one page of review tasks.
     
     Query params:
     - campaign_id: Optional filter
     - review_type: Optional filter (MESSAGE, PROPOSAL, etc.)
+    - limit: Page size (default 100, max 1000)
+    - offset: Tasks to skip (default 0)
     
     Returns:
         {
-            "total": int,
-            "tasks": [ReviewTask dicts],
+            "total": int (all matching tasks),
+            "limit": int,
+            "offset": int,
+            "tasks": [ReviewTask dicts on this page],
             "summary": {
                 "MESSAGE": count,
                 "PROPOSAL": count,
@@ -54,26 +69,26 @@ def list_review_tasks():
     try:
         campaign_id = request.args.get("campaign_id", type=int)
         review_type_filter = request.args.get("review_type", type=str)
+        limit = max(1, min(request.args.get("limit", DEFAULT_PAGE_SIZE, type=int), MAX_PAGE_SIZE))
+        offset = max(0, request.args.get("offset", 0, type=int))
         
-        db_session = get_db_session()
-        tasks = get_review_queue(db_session, campaign_id=campaign_id)
-        
-        # Optional filter by review_type
-        if review_type_filter:
-            tasks = [t for t in tasks if t.review_type == review_type_filter]
-        
-        # Build summary
-        summary = {}
-        for task in tasks:
-            summary[task.review_type] = summary.get(task.review_type, 0) + 1
+        with closing(get_db_session()) as db_session:
+            tasks, total, summary = get_review_queue_page(
+                db_session,
+                campaign_id=campaign_id,
+                review_type=review_type_filter,
+                limit=limit,
+                offset=offset,
+            )
         
         response = {
-            "total": len(tasks),
+            "total": total,
+            "limit": limit,
+            "offset": offset,
             "tasks": [t.to_dict() for t in tasks],
             "summary": summary,
         }
         
-        db_session.close()
         return jsonify(response), 200
     
     except Exception as e:
@@ -97,14 +112,13 @@ def approve_task(lead_id):
         action = data.get("action", "approve")
         custom_message = data.get("custom_message")
         
-        db_session = get_db_session()
-        success = approve_review_task(
-            lead_id,
-            db_session,
-            action=action,
-            custom_message=custom_message,
-        )
-        db_session.close()
+        with closing(get_db_session()) as db_session:
+            success = approve_review_task(
+                lead_id,
+                db_session,
+                action=action,
+                custom_message=custom_message,
+            )
         
         if success:
             return jsonify({"status": "approved", "lead_id": lead_id}), 200
@@ -130,9 +144,8 @@ def reject_task(lead_id):
         data = request.get_json()
         reason = data.get("reason", "Operator rejection")
         
-        db_session = get_db_session()
-        success = reject_review_task(lead_id, db_session, reason=reason)
-        db_session.close()
+        with closing(get_db_session()) as db_session:
+            success = reject_review_task(lead_id, db_session, reason=reason)
         
         if success:
             return jsonify({"status": "rejected", "lead_id": lead_id}), 200
@@ -160,14 +173,13 @@ def flag_task(lead_id):
         review_type = data.get("review_type", "MESSAGE")
         reason = data.get("reason", "Flagged for human review")
         
-        db_session = get_db_session()
-        success = flag_lead_for_review(
-            lead_id,
-            db_session,
-            review_type=review_type,
-            reason=reason,
-        )
-        db_session.close()
+        with closing(get_db_session()) as db_session:
+            success = flag_lead_for_review(
+                lead_id,
+                db_session,
+                review_type=review_type,
+                reason=reason,
+            )
         
         if success:
             return jsonify({"status": "flagged", "lead_id": lead_id}), 200
@@ -193,26 +205,15 @@ def queue_stats():
         }
     """
     try:
-        db_session = get_db_session()
-        tasks = get_review_queue(db_session)
-        
-        by_type = {}
-        by_campaign = {}
-        oldest_created = None
-        
-        for task in tasks:
-            by_type[task.review_type] = by_type.get(task.review_type, 0) + 1
-            
-            if oldest_created is None or task.created_at < oldest_created:
-                oldest_created = task.created_at
+        with closing(get_db_session()) as db_session:
+            stats = get_review_queue_stats(db_session)
         
+        oldest_created = stats["oldest_task_created_at"]
         response = {
-            "total_pending": len(tasks),
-            "by_type": by_type,
+            **stats,
             "oldest_task_created_at": oldest_created.isoformat() if oldest_created else None,
         }
         
-        db_session.close()
         return jsonify(response), 200
     
     except Exception as e:
@@ -8,8 +8,18 @@ Public API:
 - CamFlowRunner: Main orchestrator class
 - CycleResult: Result of one worker cycle
 - StepResult: Result of one step in the cycle
+- CamStepScheduler: Runs each step on its own cadence
+- StepSchedule: Cadence, concurrency and backpressure of one step
 """
 
 from .flow_runner import CamFlowRunner, CycleResult, StepResult
+from .scheduler import CamStepScheduler, StepSchedule, default_schedules
 
-__all__ = ["CamFlowRunner", "CycleResult", "StepResult"]
+__all__ = [
+    "CamFlowRunner",
+    "CycleResult",
+    "StepResult",
+    "CamStepScheduler",
+    "StepSchedule",
+    "default_schedules",
+]
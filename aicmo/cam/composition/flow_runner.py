@@ -9,9 +9,13 @@ Design:
 - Calls modules ONLY through ports (abstract interfaces)
 - Each step wrapped in try-except (failures don't cascade)
 - Returns CycleResult with per-step outcomes
+
+run_one_cycle() runs the steps in order; CamStepScheduler (scheduler.py)
+runs the same step methods on independent cadences instead.
 """
 
 import logging
+import time
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from typing import List, Dict, Any, Optional
@@ -97,6 +101,7 @@ class CamFlowRunner:
         container: DIContainer,
         registry: ModuleRegistry,
         db_session: Session,
+        cam_settings=None,
     ):
         """
         Initialize flow runner with DI container and module registry.
@@ -105,10 +110,15 @@ class CamFlowRunner:
             container: DIContainer with all service instances
             registry: ModuleRegistry tracking module health/capabilities
             db_session: SQLAlchemy session for database access
+            cam_settings: CamSettings for step limits (default: aicmo.cam.config.settings)
         """
+        if cam_settings is None:
+            from aicmo.cam.config import settings as cam_settings
+        
         self.container = container
         self.registry = registry
         self.db_session = db_session
+        self.cam_settings = cam_settings
         self.cycle_number = 0
     
     def run_one_cycle(self) -> CycleResult:
@@ -210,6 +220,12 @@ class CamFlowRunner:
                 steps=steps,
             )
     
+    def count_unclassified_replies(self) -> int:
+        """Backlog of step 3: inbound emails waiting to be classified."""
+        return self.db_session.query(InboundEmailDB).filter(
+            InboundEmailDB.classification.is_(None)
+        ).count()
+    
     # ─────────────────────────────────────────────────────────────────
     # STEP IMPLEMENTATIONS
     # ─────────────────────────────────────────────────────────────────
@@ -315,7 +331,17 @@ class CamFlowRunner:
         return result
     
     def _step_classify_and_process_replies(self) -> StepResult:
-        """Step 3: Classify and process unclassified replies."""
+        """
+        Step 3: Classify and process unclassified replies.
+        
+        The backlog is drained in chunks of CAM_CLASSIFY_CHUNK_SIZE, oldest
+        first. Each chunk is classified with one classify_many() call, its
+        lead transitions applied with one process_replies() call, and
+        committed on its own, so a failing reply only costs its chunk a
+        one-by-one retry. The step stops when the backlog is empty or after
+        CAM_CLASSIFY_MAX_PER_STEP replies or CAM_CLASSIFY_TIME_BUDGET_SECONDS,
+        so a reply storm drains in one run instead of 50 replies per run.
+        """
         step_start = datetime.utcnow()
         result = StepResult(step_name="ClassifyAndProcess", step_number=3, success=False)
         
@@ -331,45 +357,35 @@ class CamFlowRunner:
                 result.success = True
                 return result
             
-            # Find unclassified inbound emails
-            unclassified = self.db_session.query(InboundEmailDB).filter(
-                InboundEmailDB.classification.is_(None)
-            ).limit(50).all()
-            
-            logger.info(f"  Processing {len(unclassified)} unclassified emails...")
-            processed_count = 0
-            
-            for inbound in unclassified:
-                try:
-                    # Classify through port
-                    classify_request = ClassifyReplyRequest(
-                        subject=inbound.subject or "",
-                        body=inbound.body_text or ""
-                    )
-                    classify_response = classifier.classify(classify_request)
-                    
-                    inbound.classification = classify_response.classification.value
-                    inbound.classification_confidence = classify_response.confidence
-                    inbound.classification_reason = classify_response.reason
-                    
-                    # Process through port
-                    if inbound.lead_id:
-                        process_request = ProcessReplyRequest(
-                            lead_id=inbound.lead_id,
-                            inbound_email_id=inbound.id,
-                            classification=classify_response.classification
-                        )
-                        followup.process_reply(process_request)
-                    
-                    processed_count += 1
+            chunk_size = max(1, self.cam_settings.CAM_CLASSIFY_CHUNK_SIZE)
+            max_replies = self.cam_settings.CAM_CLASSIFY_MAX_PER_STEP
+            deadline = time.monotonic() + self.cam_settings.CAM_CLASSIFY_TIME_BUDGET_SECONDS
+            
+            processed_count = seen_count = chunks = 0
+            last_id = 0
+            while seen_count < max_replies:
+                # Keyset paging: replies that failed stay unclassified but are not refetched this run
+                limit = min(chunk_size, max_replies - seen_count)
+                chunk = self.db_session.query(InboundEmailDB).filter(
+                    InboundEmailDB.classification.is_(None),
+                    InboundEmailDB.id > last_id,
+                ).order_by(InboundEmailDB.id).limit(limit).all()
+                if not chunk:
+                    break
                 
-                except Exception as e:
-                    logger.warning(f"Failed to classify email {inbound.id}: {e}")
+                last_id = chunk[-1].id
+                seen_count += len(chunk)
+                chunks += 1
+                processed_count += self._classify_chunk(classifier, followup, chunk)
+                
+                if len(chunk) < limit or time.monotonic() >= deadline:
+                    break
             
-            self.db_session.commit()
             result.success = True
             result.items_processed = processed_count
-            logger.info(f"  ✓ Processed {processed_count} emails")
+            logger.info(
+                f"  ✓ Processed {processed_count}/{seen_count} emails in {chunks} chunk(s)"
+            )
         
         except Exception as e:
             logger.error(f"Step 3 error: {e}", exc_info=True)
@@ -378,6 +394,60 @@ class CamFlowRunner:
         result.duration_seconds = (datetime.utcnow() - step_start).total_seconds()
         return result
     
+    def _classify_chunk(self, classifier, followup, chunk: List[InboundEmailDB]) -> int:
+        """Classify, process and commit one chunk; on failure retry its replies one by one."""
+        try:
+            self._apply_classifications(classifier, followup, chunk)
+            self.db_session.commit()
+            return len(chunk)
+        except Exception as e:
+            self.db_session.rollback()
+            logger.warning(f"Batch of {len(chunk)} replies failed ({e}), retrying one by one")
+        
+        processed_count = 0
+        for inbound in chunk:
+            try:
+                self._apply_classifications(classifier, followup, [inbound])
+                self.db_session.commit()
+                processed_count += 1
+            except Exception as e:
+                self.db_session.rollback()
+                logger.warning(f"Failed to classify email {inbound.id}: {e}")
+        return processed_count
+    
+    @staticmethod
+    def _apply_classifications(classifier, followup, inbound_emails: List[InboundEmailDB]) -> None:
+        """Classify replies through the ports and hand the lead transitions to FollowUpModule."""
+        classify_requests = [
+            ClassifyReplyRequest(subject=inbound.subject or "", body=inbound.body_text or "")
+            for inbound in inbound_emails
+        ]
+        # Modules that predate the batch ports get one call per reply
+        if hasattr(classifier, "classify_many"):
+            responses = classifier.classify_many(classify_requests)
+        else:
+            responses = [classifier.classify(request) for request in classify_requests]
+        
+        process_requests = []
+        for inbound, classify_response in zip(inbound_emails, responses):
+            inbound.classification = classify_response.classification.value
+            inbound.classification_confidence = classify_response.confidence
+            inbound.classification_reason = classify_response.reason
+            if inbound.lead_id:
+                process_requests.append(ProcessReplyRequest(
+                    lead_id=inbound.lead_id,
+                    inbound_email_id=inbound.id,
+                    classification=classify_response.classification,
+                ))
+        
+        if not process_requests:
+            return
+        if hasattr(followup, "process_replies"):
+            followup.process_replies(process_requests)
+        else:
+            for request in process_requests:
+                followup.process_reply(request)
+    
     def _step_handle_no_reply_timeouts(self) -> StepResult:
         """Step 4: Handle no-reply timeouts (follow-up scheduling)."""
         step_start = datetime.utcnow()
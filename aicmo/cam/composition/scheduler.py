@@ -0,0 +1,347 @@
+"""
+Composition Layer - CAM Step Scheduler
+
+Runs the CamFlowRunner steps as independently scheduled tasks instead of
+one sequential cycle, so outbound sending and reply handling are no longer
+held up by the slowest analytics step.
+
+Design:
+- Each step has its own cadence (StepSchedule.interval_seconds). A step
+  that comes due while max_concurrency runs of it are still in flight is
+  skipped for that tick (overlap protection).
+- Steps run on a shared thread pool. Each pool thread builds its own
+  CamFlowRunner through runner_factory, so every thread has its own
+  session and module instances (sessions are not thread-safe).
+- Backpressure between producer and consumer steps: a producer (inbox
+  polling) is deferred while its consumer's backlog (unclassified replies)
+  is at max_backlog, and a producer run that processed items wakes its
+  consumer immediately instead of waiting for the consumer's next tick.
+- Ordering between steps that touch the same leads: steps sharing a mutex
+  never run at the same time, and a step's runs_after steps run first in
+  the same slot. No-reply timeouts therefore always see every reply that
+  was already fetched as classified, so a lead that replied is never
+  timed out.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from aicmo.cam.composition.flow_runner import CamFlowRunner, StepResult
+from aicmo.shared import metrics
+
+
+logger = logging.getLogger(__name__)
+
+
+# ─────────────────────────────────────────────────────────────────
+# SCHEDULES
+# ─────────────────────────────────────────────────────────────────
+
+@dataclass
+class StepSchedule:
+    """When and how one CamFlowRunner step runs."""
+    name: str
+    method: str  # CamFlowRunner step method, e.g. "_step_send_emails"
+    interval_seconds: float
+    max_concurrency: int = 1
+    wakes: Tuple[str, ...] = ()  # steps to run right away after this one processes items
+    backlog_method: Optional[str] = None  # CamFlowRunner method counting this step's pending input
+    backlog_of: Optional[str] = None  # consumer step whose backlog gates this (producer) step
+    max_backlog: Optional[int] = None
+    mutex: Optional[str] = None  # steps with the same mutex never run concurrently
+    runs_after: Tuple[str, ...] = ()  # steps run first, under this step's mutex
+
+
+@dataclass
+class StepState:
+    """Runtime counters for one scheduled step."""
+    next_due: float = 0.0
+    in_flight: int = 0
+    runs: int = 0
+    failures: int = 0
+    skipped_overlap: int = 0
+    deferred_backpressure: int = 0
+    last_started: Optional[float] = None
+    last_seconds: Optional[float] = None
+    last_result: Optional[StepResult] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "in_flight": self.in_flight,
+            "runs": self.runs,
+            "failures": self.failures,
+            "skipped_overlap": self.skipped_overlap,
+            "deferred_backpressure": self.deferred_backpressure,
+            "last_seconds": self.last_seconds,
+            "last_items_processed": self.last_result.items_processed if self.last_result else None,
+            "last_error": self.last_result.error_message if self.last_result else None,
+        }
+
+
+def default_schedules(cam_settings=None) -> List[StepSchedule]:
+    """The seven worker steps with cadences from CamSettings."""
+    if cam_settings is None:
+        from aicmo.cam.config import settings as cam_settings
+
+    return [
+        StepSchedule("send_emails", "_step_send_emails", cam_settings.CAM_SEND_INTERVAL_SECONDS),
+        StepSchedule(
+            "poll_inbox",
+            "_step_poll_inbox",
+            cam_settings.CAM_POLL_INTERVAL_SECONDS,
+            wakes=("classify_replies",),
+            backlog_of="classify_replies",
+            max_backlog=cam_settings.CAM_REPLY_BACKLOG_MAX,
+        ),
+        StepSchedule(
+            "classify_replies",
+            "_step_classify_and_process_replies",
+            cam_settings.CAM_CLASSIFY_INTERVAL_SECONDS,
+            wakes=("dispatch_alerts",),
+            backlog_method="count_unclassified_replies",
+            mutex="lead_replies",
+        ),
+        StepSchedule(
+            "no_reply_timeouts",
+            "_step_handle_no_reply_timeouts",
+            cam_settings.CAM_NO_REPLY_INTERVAL_SECONDS,
+            mutex="lead_replies",
+            runs_after=("classify_replies",),
+        ),
+        StepSchedule("compute_metrics", "_step_compute_metrics", cam_settings.CAM_METRICS_INTERVAL_SECONDS),
+        StepSchedule("evaluate_campaigns", "_step_evaluate_campaigns", cam_settings.CAM_EVALUATE_INTERVAL_SECONDS),
+        StepSchedule("dispatch_alerts", "_step_dispatch_alerts", cam_settings.CAM_ALERT_INTERVAL_SECONDS),
+    ]
+
+
+# ─────────────────────────────────────────────────────────────────
+# CAM STEP SCHEDULER
+# ─────────────────────────────────────────────────────────────────
+
+class CamStepScheduler:
+    """
+    Runs each worker step on its own cadence.
+
+    Usage:
+        scheduler = CamStepScheduler(make_flow_runner)
+        scheduler.start()
+        ...
+        scheduler.stop()
+
+    run_due() dispatches whatever is due once; the background dispatcher
+    started by start() simply calls it whenever the next step comes due
+    or a step is triggered.
+    """
+
+    def __init__(
+        self,
+        runner_factory: Callable[[], CamFlowRunner],
+        schedules: Optional[List[StepSchedule]] = None,
+        max_workers: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            runner_factory: Builds a CamFlowRunner with its own session; called once per thread
+            schedules: Step schedules (default: default_schedules())
+            max_workers: Pool size (default: enough for every step's max_concurrency)
+            clock: Monotonic clock, injectable for tests
+        """
+        self.schedules = {s.name: s for s in (schedules or default_schedules())}
+        for schedule in self.schedules.values():
+            refs = schedule.wakes + schedule.runs_after + ((schedule.backlog_of,) if schedule.backlog_of else ())
+            unknown = [n for n in refs if n not in self.schedules]
+            if unknown:
+                raise ValueError(f"Step {schedule.name!r} refers to unknown steps {unknown}")
+
+        self.runner_factory = runner_factory
+        self.clock = clock
+        self.state = {name: StepState() for name in self.schedules}
+        self._lock = threading.Lock()
+        self._mutexes = {s.mutex: threading.Lock() for s in self.schedules.values() if s.mutex}
+        self._local = threading.local()
+        self._runners: List[CamFlowRunner] = []
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._dispatcher: Optional[threading.Thread] = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or sum(s.max_concurrency for s in self.schedules.values()),
+            thread_name_prefix="cam-step",
+        )
+
+    # ── runners ──────────────────────────────────────────────────
+
+    def _runner(self) -> CamFlowRunner:
+        """This thread's CamFlowRunner (own session and modules)."""
+        runner = getattr(self._local, "runner", None)
+        if runner is None:
+            runner = self._local.runner = self.runner_factory()
+            with self._lock:
+                self._runners.append(runner)
+        return runner
+
+    def backlog(self, name: str) -> Optional[int]:
+        """Pending input of a consumer step, or None if it has no backlog measure."""
+        schedule = self.schedules[name]
+        if not schedule.backlog_method:
+            return None
+        count = getattr(self._runner(), schedule.backlog_method)()
+        metrics.QUEUE_DEPTH.labels(f"cam_{name}").set(count)
+        return count
+
+    # ── dispatching ──────────────────────────────────────────────
+
+    def trigger(self, name: str) -> None:
+        """Make a step due now."""
+        with self._lock:
+            self.state[name].next_due = 0.0
+        self._wake.set()
+
+    def run_due(self, now: Optional[float] = None) -> List[str]:
+        """Submit every step that is due; returns the names submitted."""
+        now = self.clock() if now is None else now
+        submitted = []
+        for name, schedule in self.schedules.items():
+            state = self.state[name]
+            with self._lock:
+                if now < state.next_due:
+                    continue
+                # Fixed cadence; ticks missed while a run was in flight are dropped
+                state.next_due = now + schedule.interval_seconds
+                if state.in_flight >= schedule.max_concurrency:
+                    state.skipped_overlap += 1
+                    logger.debug(f"Step {name} still running, skipping this tick")
+                    continue
+
+            if schedule.backlog_of and schedule.max_backlog is not None:
+                try:
+                    pending = self.backlog(schedule.backlog_of)
+                except Exception as e:
+                    logger.warning(f"Backlog check for {schedule.backlog_of} failed: {e}")
+                    self._reset_session(self._runner())
+                    pending = None
+                if pending is not None and pending >= schedule.max_backlog:
+                    consumer = self.schedules[schedule.backlog_of]
+                    with self._lock:
+                        state.deferred_backpressure += 1
+                        # Retry once the consumer has had a chance to drain
+                        state.next_due = now + min(schedule.interval_seconds, consumer.interval_seconds)
+                    logger.info(f"Step {name} deferred: {pending} items waiting for {schedule.backlog_of}")
+                    continue
+
+            with self._lock:
+                state.in_flight += 1
+            self._executor.submit(self._run, schedule)
+            submitted.append(name)
+        return submitted
+
+    def _run(self, schedule: StepSchedule) -> StepResult:
+        state = self.state[schedule.name]
+        started = self.clock()
+        runner = None
+        mutex = self._mutexes.get(schedule.mutex)
+        try:
+            runner = self._runner()
+            if mutex is not None:
+                mutex.acquire()
+            try:
+                result = self._run_steps(runner, schedule)
+            finally:
+                if mutex is not None:
+                    mutex.release()
+        except Exception as e:
+            logger.error(f"Step {schedule.name} error: {e}", exc_info=True)
+            result = StepResult(step_name=schedule.name, step_number=0, success=False, error_message=str(e))
+
+        if not result.success and runner is not None:
+            self._reset_session(runner)
+
+        seconds = self.clock() - started
+        with self._lock:
+            state.in_flight -= 1
+            state.runs += 1
+            state.failures += 0 if result.success else 1
+            state.last_started = started
+            state.last_seconds = seconds
+            state.last_result = result
+
+        job_type = f"worker.{schedule.name}"
+        metrics.CAM_JOB_RUNS.labels(job_type, "success" if result.success else "failure").inc()
+        metrics.CAM_JOB_SECONDS.labels(job_type).observe(seconds)
+
+        if result.success and result.items_processed and schedule.wakes:
+            for name in schedule.wakes:
+                self.trigger(name)
+        return result
+
+    def _run_steps(self, runner: CamFlowRunner, schedule: StepSchedule) -> StepResult:
+        """schedule's runs_after steps, then the step itself; stops at the first failure."""
+        for name in schedule.runs_after:
+            result = getattr(runner, self.schedules[name].method)()
+            if not result.success:
+                return StepResult(
+                    step_name=schedule.name,
+                    step_number=0,
+                    success=False,
+                    error_message=f"{name} failed first: {result.error_message}",
+                )
+        return getattr(runner, schedule.method)()
+
+    @staticmethod
+    def _reset_session(runner: CamFlowRunner) -> None:
+        """Roll back a failed step's transaction so the thread's session stays usable."""
+        try:
+            runner.db_session.rollback()
+        except Exception as e:
+            logger.warning(f"Session rollback failed: {e}")
+
+    # ── lifecycle ────────────────────────────────────────────────
+
+    def start(self) -> None:
+        """Start the background dispatcher."""
+        if self._dispatcher is not None:
+            return
+        self._stop.clear()
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, name="cam-step-dispatcher", daemon=True)
+        self._dispatcher.start()
+        logger.info(
+            "CAM step scheduler started: "
+            + ", ".join(f"{s.name} every {s.interval_seconds:g}s" for s in self.schedules.values())
+        )
+
+    def _dispatch_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_due()
+            except Exception as e:
+                logger.error(f"Step dispatch error: {e}", exc_info=True)
+            with self._lock:
+                next_due = min(state.next_due for state in self.state.values())
+            self._wake.wait(timeout=min(1.0, max(0.0, next_due - self.clock())))
+            self._wake.clear()
+
+    def stop(self, wait: bool = True) -> None:
+        """Stop dispatching; optionally wait for running steps, then close the sessions."""
+        self._stop.set()
+        self._wake.set()
+        if self._dispatcher is not None:
+            self._dispatcher.join()
+            self._dispatcher = None
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        if wait:
+            with self._lock:
+                runners, self._runners = self._runners, []
+            for runner in runners:
+                try:
+                    runner.db_session.close()
+                except Exception as e:
+                    logger.warning(f"Failed to close step session: {e}")
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-step counters for logging and health checks."""
+        with self._lock:
+            return {name: state.to_dict() for name, state in self.state.items()}
@@ -40,6 +40,24 @@ class CamSettings(BaseSettings):
     CAM_AUTO_PAUSE_REPLY_RATE_THRESHOLD: float = 0.1  # If reply_rate < 10%, flag campaign
     CAM_AUTO_PAUSE_ENABLE: bool = False  # If true, pause campaigns below threshold
     CAM_AUTO_PAUSE_MIN_SENDS_TO_EVALUATE: int = 50  # Only evaluate if sent >= N emails
+    
+    # Worker step cadences (aicmo.cam.composition.scheduler): each step of the
+    # worker cycle runs on its own schedule in the "scheduled" worker mode
+    CAM_SEND_INTERVAL_SECONDS: float = 5.0
+    CAM_POLL_INTERVAL_SECONDS: float = 60.0
+    CAM_CLASSIFY_INTERVAL_SECONDS: float = 15.0
+    CAM_NO_REPLY_INTERVAL_SECONDS: float = 300.0
+    CAM_METRICS_INTERVAL_SECONDS: float = 600.0
+    CAM_EVALUATE_INTERVAL_SECONDS: float = 600.0
+    CAM_ALERT_INTERVAL_SECONDS: float = 15.0
+    CAM_REPLY_BACKLOG_MAX: int = 200  # inbox polling pauses while this many replies await classification
+    
+    # Reply classification step: unclassified replies are drained in chunks, each
+    # classified as a batch and committed on its own, until the backlog is empty or
+    # either per-step limit is reached
+    CAM_CLASSIFY_CHUNK_SIZE: int = 100
+    CAM_CLASSIFY_MAX_PER_STEP: int = 5000
+    CAM_CLASSIFY_TIME_BUDGET_SECONDS: float = 20.0
 
 
 settings = CamSettings()
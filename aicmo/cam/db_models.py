@@ -218,6 +218,9 @@ class LeadDB(Base):
         Index('idx_lead_grade', 'lead_grade'),
         Index('idx_conversion_probability', 'conversion_probability'),
         Index('idx_fit_score_for_service', 'fit_score_for_service'),
+        # Phase 9: review queue filtering, paging and per-type counts
+        Index('idx_lead_review_queue', 'requires_human_review', 'review_type', 'id'),
+        Index('idx_lead_review_campaign', 'campaign_id', 'requires_human_review', 'review_type'),
     )
 
 
@@ -26,6 +26,7 @@ from sqlalchemy.orm import Session
 from aicmo.cam.domain import Lead, LeadStatus
 from aicmo.cam.db_models import LeadDB
 from aicmo.core import SessionLocal
+from aicmo.shared import metrics as shared_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -217,6 +218,10 @@ class CronScheduler:
     def record_job_result(self, result: JobResult) -> None:
         """Record a job result in history and update metrics."""
         self.job_history.append(result)
+        job_type = getattr(result.job_type, "value", str(result.job_type))
+        status = getattr(result.status, "value", str(result.status))
+        shared_metrics.CAM_JOB_RUNS.labels(job_type, status).inc()
+        shared_metrics.CAM_JOB_SECONDS.labels(job_type).observe(result.duration_seconds)
         metrics = self.metrics.get(result.job_type)
         if metrics:
             metrics.update_from_result(result)
@@ -14,6 +14,7 @@ Key Features:
 """
 
 import logging
+import time
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 
@@ -26,6 +27,7 @@ from aicmo.cam.engine.lead_pipeline import (
     deduplicate_leads,
 )
 from aicmo.cam.ports.lead_source import LeadSourcePort
+from aicmo.shared.metrics import record_provider_call
 
 logger = logging.getLogger(__name__)
 
@@ -142,6 +144,7 @@ class HarvestOrchestrator:
         Returns:
             Tuple of (leads list, error message or None)
         """
+        started = time.perf_counter()
         try:
             logger.info(f"Fetching from {source_name} (max {max_leads} leads)")
             
@@ -149,6 +152,7 @@ class HarvestOrchestrator:
             
             logger.info(f"{source_name} returned {len(leads)} leads")
             self.metrics.sources_succeeded += 1
+            record_provider_call("lead_source", source_name, True, time.perf_counter() - started)
             
             return leads, None
         
@@ -156,6 +160,7 @@ class HarvestOrchestrator:
             error_msg = f"{source_name}: {str(e)}"
             logger.error(f"Error fetching from {source_name}: {e}")
             self.metrics.sources_failed += 1
+            record_provider_call("lead_source", source_name, False)
             return [], error_msg
     
     def harvest_with_fallback(
@@ -14,13 +14,34 @@ This adds safety layer between autonomous engine and real outreach.
 
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func, or_
+from sqlalchemy.orm import load_only
 
 from aicmo.cam.db_models import LeadDB, CampaignDB
 from aicmo.cam.domain import LeadStatus
 
 logger = logging.getLogger(__name__)
 
+# Review type shown for leads flagged without one
+DEFAULT_REVIEW_TYPE = "MESSAGE"
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Columns a ReviewTask is built from (notes only for the last reply snippet)
+_TASK_COLUMNS = (
+    LeadDB.id,
+    LeadDB.name,
+    LeadDB.company,
+    LeadDB.email,
+    LeadDB.review_type,
+    LeadDB.review_reason,
+    LeadDB.lead_score,
+    LeadDB.notes,
+)
+
 
 class ReviewTask:
     """
@@ -74,6 +95,52 @@ class ReviewTask:
         }
 
 
+def _pending_reviews(query, campaign_id: Optional[int] = None, review_type: Optional[str] = None):
+    """Restrict a LeadDB query to pending review tasks (served by idx_lead_review_*)."""
+    query = query.filter(LeadDB.requires_human_review == True)
+    
+    if campaign_id:
+        query = query.filter(LeadDB.campaign_id == campaign_id)
+    
+    if review_type == DEFAULT_REVIEW_TYPE:
+        query = query.filter(or_(LeadDB.review_type == review_type, LeadDB.review_type.is_(None)))
+    elif review_type:
+        query = query.filter(LeadDB.review_type == review_type)
+    
+    return query
+
+
+def _to_task(lead: LeadDB) -> ReviewTask:
+    # Extract last reply snippet if available
+    last_reply = None
+    if lead.notes:
+        lines = lead.notes.split("\n")
+        for line in lines[-5:]:  # Last 5 lines
+            if "[Reply]" in line:
+                last_reply = line[:100]
+                break
+    
+    return ReviewTask(
+        lead_id=lead.id,
+        lead_name=lead.name,
+        lead_company=lead.company,
+        lead_email=lead.email,
+        review_type=lead.review_type or DEFAULT_REVIEW_TYPE,
+        review_reason=lead.review_reason or "Pending human review",
+        lead_score=lead.lead_score,
+        last_reply_snippet=last_reply,
+    )
+
+
+def _count_by_type(rows) -> Dict[str, int]:
+    """Fold (review_type, count) rows into {review_type: count}, NULL as the default type."""
+    counts: Dict[str, int] = {}
+    for review_type, count in rows:
+        review_type = review_type or DEFAULT_REVIEW_TYPE
+        counts[review_type] = counts.get(review_type, 0) + count
+    return counts
+
+
 def get_review_queue(
     db_session,
     campaign_id: Optional[int] = None,
@@ -89,35 +156,10 @@ def get_review_queue(
         List of ReviewTask objects
     """
     try:
-        query = db_session.query(LeadDB).filter(LeadDB.requires_human_review == True)
-        
-        if campaign_id:
-            query = query.filter(LeadDB.campaign_id == campaign_id)
+        query = _pending_reviews(db_session.query(LeadDB), campaign_id=campaign_id)
+        leads = query.options(load_only(*_TASK_COLUMNS)).order_by(LeadDB.id).all()
         
-        leads = query.all()
-        
-        tasks = []
-        for lead in leads:
-            # Extract last reply snippet if available
-            last_reply = None
-            if lead.notes:
-                lines = lead.notes.split("\n")
-                for line in lines[-5:]:  # Last 5 lines
-                    if "[Reply]" in line:
-                        last_reply = line[:100]
-                        break
-            
-            task = ReviewTask(
-                lead_id=lead.id,
-                lead_name=lead.name,
-                lead_company=lead.company,
-                lead_email=lead.email,
-                review_type=lead.review_type or "MESSAGE",
-                review_reason=lead.review_reason or "Pending human review",
-                lead_score=lead.lead_score,
-                last_reply_snippet=last_reply,
-            )
-            tasks.append(task)
+        tasks = [_to_task(lead) for lead in leads]
         
         logger.info(f"Review queue has {len(tasks)} tasks")
         return tasks
@@ -127,6 +169,82 @@ def get_review_queue(
         return []
 
 
+def get_review_queue_page(
+    db_session,
+    campaign_id: Optional[int] = None,
+    review_type: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    offset: int = 0,
+) -> Tuple[List[ReviewTask], int, Dict[str, int]]:
+    """
+    One page of the review queue, filtered and counted in SQL.
+    
+    Args:
+        db_session: Database session
+        campaign_id: Optional filter to single campaign
+        review_type: Optional filter to one review type (MESSAGE, PROPOSAL, etc.)
+        limit: Page size (capped at MAX_PAGE_SIZE)
+        offset: Tasks to skip, in lead id order
+        
+    Returns:
+        (tasks on this page, total matching tasks, {review_type: count} over all matches)
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    offset = max(0, offset)
+    
+    leads = (
+        _pending_reviews(db_session.query(LeadDB), campaign_id, review_type)
+        .options(load_only(*_TASK_COLUMNS))
+        .order_by(LeadDB.id)
+        .limit(limit)
+        .offset(offset)
+        .all()
+    )
+    summary = _count_by_type(
+        _pending_reviews(
+            db_session.query(LeadDB.review_type, func.count(LeadDB.id)), campaign_id, review_type
+        ).group_by(LeadDB.review_type).all()
+    )
+    return [_to_task(lead) for lead in leads], sum(summary.values()), summary
+
+
+def get_review_queue_stats(db_session) -> Dict:
+    """
+    Review queue statistics from aggregate queries (no tasks are loaded).
+    
+    Returns:
+        {
+            "total_pending": int,
+            "by_type": {"MESSAGE": count, ...},
+            "by_campaign": {"Campaign Name": count, ...},
+            "oldest_task_created_at": datetime of the least recently
+                updated pending lead (flagging updates it), or None
+        }
+    """
+    by_type_rows = _pending_reviews(
+        db_session.query(LeadDB.review_type, func.count(LeadDB.id), func.min(LeadDB.updated_at))
+    ).group_by(LeadDB.review_type).all()
+    
+    by_campaign_rows = _pending_reviews(
+        db_session.query(LeadDB.campaign_id, CampaignDB.name, func.count(LeadDB.id))
+        .outerjoin(CampaignDB, CampaignDB.id == LeadDB.campaign_id)
+    ).group_by(LeadDB.campaign_id, CampaignDB.name).all()
+    
+    by_type = _count_by_type((review_type, count) for review_type, count, _ in by_type_rows)
+    oldest = [oldest for _, _, oldest in by_type_rows if oldest is not None]
+    by_campaign = {}
+    for campaign_id, name, count in by_campaign_rows:
+        key = name or (f"Campaign {campaign_id}" if campaign_id else "No campaign")
+        by_campaign[key] = by_campaign.get(key, 0) + count
+    
+    return {
+        "total_pending": sum(by_type.values()),
+        "by_type": by_type,
+        "by_campaign": by_campaign,
+        "oldest_task_created_at": min(oldest) if oldest else None,
+    }
+
+
 def approve_review_task(
     lead_id: int,
     db_session,
@@ -87,6 +87,25 @@ class ClassificationModule(ABC):
             ClassifyReplyResponse with classification, confidence, reason
         """
         ...
+    
+    def classify_many(self, requests: List[ClassifyReplyRequest]) -> List[ClassifyReplyResponse]:
+        """
+        Classify a batch of reply emails.
+        
+        Contract:
+        - Same as classify(), element-wise: responses[i] answers requests[i]
+        - Never raises
+        
+        Implementations should override this to classify the whole batch in
+        one pass; the default simply calls classify() per request.
+        
+        Args:
+            requests: ClassifyReplyRequests with subject and body
+        
+        Returns:
+            List of ClassifyReplyResponse, in request order
+        """
+        return [self.classify(request) for request in requests]
 
 
 # ─────────────────────────────────────────────────────────────────
@@ -118,6 +137,26 @@ class FollowUpModule(ABC):
             bool: True if state advanced, False otherwise
         """
         ...
+    
+    def process_replies(self, requests: List[ProcessReplyRequest]) -> List[bool]:
+        """
+        Process a batch of classified replies.
+        
+        Contract:
+        - Same as process_reply(), element-wise and in request order
+          (a lead with several replies ends in the state of its last one)
+        - Persists the whole batch together
+        
+        Implementations should override this to load and update the
+        affected leads together; the default calls process_reply() per request.
+        
+        Args:
+            requests: ProcessReplyRequests with lead, email, classification
+        
+        Returns:
+            List of bool, True where the lead's state advanced
+        """
+        return [self.process_reply(request) for request in requests]
 
 
 # ─────────────────────────────────────────────────────────────────
@@ -9,8 +9,11 @@ Handles:
 
 import logging
 from datetime import datetime, timedelta
+from typing import List
+from sqlalchemy import String, select, type_coerce, update
 from sqlalchemy.orm import Session
 
+from aicmo.cam.contracts import ProcessReplyRequest
 from aicmo.cam.db_models import LeadDB, OutboundEmailDB, InboundEmailDB, CampaignDB
 from aicmo.cam.engine.lead_nurture import EmailTemplate, NurtureScheduler
 from aicmo.cam.services.email_sending_service import EmailSendingService
@@ -31,6 +34,13 @@ class FollowUpEngine:
     - No reply after delay → Send next email in sequence
     """
     
+    # Lead status set by each actionable reply classification
+    REPLY_STATUS = {
+        ReplyClassification.POSITIVE: "qualified",
+        ReplyClassification.NEGATIVE: "suppressed",
+        ReplyClassification.UNSUB: "unsubscribed",
+    }
+    
     def __init__(self, db_session: Session):
         """Initialize with database session."""
         self.db = db_session
@@ -130,6 +140,73 @@ class FollowUpEngine:
             self.handle_unsub_request(lead_id, inbound_email.id)
         # OOO and BOUNCE: no action, let sequence continue
     
+    def process_replies(self, requests: List[ProcessReplyRequest]) -> List[bool]:
+        """
+        Process a batch of classified replies with one lead read, one bulk update and one commit.
+        
+        Applies the same transitions as handle_positive_reply,
+        handle_negative_reply and handle_unsub_request, in request order, so a
+        lead with several replies in the batch ends in the state of its last one.
+        
+        Lead rows are read and written as plain columns rather than loaded as
+        LeadDB objects: the statuses written here ("qualified", ...) are not
+        LeadStatus names, so a lead already transitioned could not be loaded.
+        
+        Args:
+            requests: ProcessReplyRequests (lead_id, inbound_email_id, classification)
+        
+        Returns:
+            List of bool, True where the lead's status changed
+        """
+        lead_ids = {r.lead_id for r in requests if r.lead_id}
+        leads = {}
+        if lead_ids:
+            rows = self.db.execute(
+                select(
+                    LeadDB.id,
+                    type_coerce(LeadDB.status, String),
+                    LeadDB.tags,
+                    LeadDB.last_replied_at,
+                ).where(LeadDB.id.in_(lead_ids))
+            ).all()
+            leads = {
+                lead_id: {"id": lead_id, "status": status, "tags": tags, "last_replied_at": last_replied_at}
+                for lead_id, status, tags, last_replied_at in rows
+            }
+        
+        now = datetime.utcnow()
+        advanced = []
+        changed = {}
+        for request in requests:
+            classification = ReplyClassification(request.classification)
+            new_status = self.REPLY_STATUS.get(classification)
+            lead = leads.get(request.lead_id)
+            if new_status is None or lead is None:
+                # OOO, BOUNCE and NEUTRAL: no action, let sequence continue
+                if new_status is not None:
+                    logger.warning(f"Lead {request.lead_id} not found for {classification.value} reply")
+                advanced.append(False)
+                continue
+            
+            if lead["status"] == new_status:
+                advanced.append(False)
+                continue
+            logger.info(f"Lead {lead['id']} marked as {new_status} due to {classification.value} reply")
+            lead["status"] = new_status
+            if new_status == "unsubscribed":
+                if "unsubscribed" not in (lead["tags"] or []):
+                    lead["tags"] = list(lead["tags"] or []) + ["unsubscribed"]
+            else:
+                lead["last_replied_at"] = now
+            changed[lead["id"]] = lead
+            advanced.append(True)
+        
+        if changed:
+            # ORM bulk UPDATE by primary key: one executemany for the whole batch
+            self.db.execute(update(LeadDB), list(changed.values()))
+        self.db.commit()
+        return advanced
+    
     def trigger_no_reply_timeout(self, campaign_id: int, days_since_last_send: int = 7) -> int:
         """
         Find leads with no reply after specified days and send next email.
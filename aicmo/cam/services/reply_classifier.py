@@ -6,9 +6,12 @@ Phase 2: Classifies incoming emails as POSITIVE, NEGATIVE, OOO, BOUNCE, UNSUB, N
 
 import logging
 import re
-from typing import Tuple
+from bisect import bisect_right
+from typing import Dict, List, Tuple
 from enum import Enum
 
+from aicmo.cam.contracts import ClassifyReplyRequest, ClassifyReplyResponse, ReplyClassificationEnum
+
 
 logger = logging.getLogger(__name__)
 
@@ -120,6 +123,19 @@ class ReplyClassifier:
         self.bounce_patterns = [re.compile(p, re.IGNORECASE) for p in self.BOUNCE_KEYWORDS]
         self.unsub_patterns = [re.compile(p, re.IGNORECASE) for p in self.UNSUB_KEYWORDS]
     
+    # Joins the texts of a classify_many() batch into one scanned string. No
+    # pattern can match across it: "." stops at newlines and "\s" skips NUL.
+    BATCH_SEPARATOR = "\n\x00\n"
+    
+    def _pattern_groups(self) -> List[Tuple[str, list]]:
+        return [
+            ("ooo", self.ooo_patterns),
+            ("bounce", self.bounce_patterns),
+            ("unsub", self.unsub_patterns),
+            ("negative", self.negative_patterns),
+            ("positive", self.positive_patterns),
+        ]
+    
     def classify(
         self,
         subject: str,
@@ -136,33 +152,85 @@ class ReplyClassifier:
             Tuple of (classification, confidence 0.0-1.0, reason string)
         """
         combined_text = f"{subject}\n{body}".lower()
+        matches = {
+            group: sum(1 for p in patterns if p.search(combined_text))
+            for group, patterns in self._pattern_groups()
+        }
+        return self._decide(matches)
+    
+    def classify_texts(
+        self,
+        emails: List[Tuple[str, str]],
+    ) -> List[Tuple[ReplyClassification, float, str]]:
+        """
+        Classify many (subject, body) pairs; same results as classify() per pair.
         
+        Every pattern is run once over the whole batch joined by
+        BATCH_SEPARATOR, and each match is attributed to its email by offset,
+        instead of running every pattern once per email.
+        """
+        texts = [f"{subject}\n{body}".lower().replace("\x00", "") for subject, body in emails]
+        if not texts:
+            return []
+        
+        starts, offset = [], 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + len(self.BATCH_SEPARATOR)
+        corpus = self.BATCH_SEPARATOR.join(texts)
+        
+        matches: List[Dict[str, int]] = [{} for _ in texts]
+        for group, patterns in self._pattern_groups():
+            for pattern in patterns:
+                last_index = -1
+                for match in pattern.finditer(corpus):
+                    index = bisect_right(starts, match.start()) - 1
+                    if index != last_index:  # count each pattern once per email
+                        matches[index][group] = matches[index].get(group, 0) + 1
+                        last_index = index
+        return [self._decide(m) for m in matches]
+    
+    def classify_many(self, requests: List[ClassifyReplyRequest]) -> List[ClassifyReplyResponse]:
+        """ClassificationModule.classify_many: classify a batch of replies in one pass."""
+        results = self.classify_texts([(r.subject or "", r.body or "") for r in requests])
+        return [
+            ClassifyReplyResponse(
+                classification=ReplyClassificationEnum(classification.value),
+                confidence=confidence,
+                reason=reason,
+            )
+            for classification, confidence, reason in results
+        ]
+    
+    @staticmethod
+    def _decide(matches: Dict[str, int]) -> Tuple[ReplyClassification, float, str]:
+        """Pick the classification from per-group pattern match counts."""
         # Check in order of priority
         # (OOO, BOUNCE, UNSUB are high-confidence; POSITIVE/NEGATIVE are lower)
         
         # Check OOO
-        ooo_matches = sum(1 for p in self.ooo_patterns if p.search(combined_text))
+        ooo_matches = matches.get("ooo", 0)
         if ooo_matches > 0:
             confidence = min(1.0, ooo_matches / 3.0)  # Normalize
             return (ReplyClassification.OOO, confidence, "Out of office pattern detected")
         
         # Check BOUNCE
-        bounce_matches = sum(1 for p in self.bounce_patterns if p.search(combined_text))
+        bounce_matches = matches.get("bounce", 0)
         if bounce_matches > 0:
             confidence = min(1.0, bounce_matches / 3.0)
             return (ReplyClassification.BOUNCE, confidence, "Delivery failure pattern detected")
         
         # Check UNSUB
-        unsub_matches = sum(1 for p in self.unsub_patterns if p.search(combined_text))
+        unsub_matches = matches.get("unsub", 0)
         if unsub_matches > 0:
             confidence = min(1.0, unsub_matches / 2.0)
             return (ReplyClassification.UNSUB, confidence, "Unsubscribe request detected")
         
         # Check NEGATIVE (higher priority than positive, explicit rejection)
-        negative_matches = sum(1 for p in self.negative_patterns if p.search(combined_text))
+        negative_matches = matches.get("negative", 0)
         
         # Check POSITIVE
-        positive_matches = sum(1 for p in self.positive_patterns if p.search(combined_text))
+        positive_matches = matches.get("positive", 0)
         
         if negative_matches > 0 and negative_matches > positive_matches:
             confidence = min(1.0, negative_matches / 3.0)
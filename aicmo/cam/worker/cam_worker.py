@@ -1,7 +1,7 @@
 """
 Autonomous CAM Worker Process.
 
-Runs continuously without UI, executing all campaign automation steps in sequence:
+Runs continuously without UI, executing all campaign automation steps:
 1. Send outbound email batches
 2. Poll inbox for replies
 3. Process reply events → state transitions
@@ -9,15 +9,33 @@ Runs continuously without UI, executing all campaign automation steps in sequenc
 5. Compute campaign metrics
 6. Execute decision engine (pause/degrade)
 7. Dispatch human alerts
-8. Sleep for configured interval
+8. Record cycle metrics and push a metrics snapshot (job "cam_worker")
+9. Sleep for configured interval
+
+The default "cycle" mode runs the steps in sequence. In "scheduled" mode
+each step runs on its own cadence (AICMO_CAM_*_INTERVAL_SECONDS, see
+CamStepScheduler), so sending and reply handling are not delayed by
+metrics; the main loop only updates the heartbeat and pushes metrics.
+
+In both modes the heartbeat is refreshed every
+AICMO_CAM_WORKER_HEARTBEAT_SECONDS while the worker sleeps, well inside the
+worker lock TTL (locking.LOCK_TTL_MINUTES), so a live worker's lock is
+never taken over as stale.
 
 Entry point: python -m aicmo.cam.worker.cam_worker
 
 Environment variables:
-  AICMO_CAM_WORKER_INTERVAL_SECONDS - Sleep between cycles (default: 300)
+  AICMO_CAM_WORKER_MODE - "cycle" (default) or "scheduled"
+  AICMO_CAM_WORKER_INTERVAL_SECONDS - Sleep between cycles in cycle mode,
+    metrics interval in scheduled mode (default: 300)
+  AICMO_CAM_WORKER_HEARTBEAT_SECONDS - Heartbeat interval (default: 60,
+    capped at a third of the lock TTL)
   AICMO_CAM_WORKER_ENABLED - Enable/disable worker (default: true)
   Database URL for session management
   Resend + IMAP credentials for email operations
+
+Profiling: `kill -USR2 <pid>` samples the worker for AICMO_PROFILE_SIGNAL_SECONDS
+and saves the profile to AICMO_PROFILE_DIR (see GET /admin/profiling/profiles).
 """
 
 import sys
@@ -45,9 +63,10 @@ from aicmo.cam.services.follow_up_engine import FollowUpEngine
 from aicmo.cam.services.decision_engine import DecisionEngine
 from aicmo.cam.gateways.inbox_providers.imap import IMAPInboxProvider
 from aicmo.cam.gateways.alert_providers.alert_provider_factory import get_alert_provider
-from aicmo.cam.worker.locking import acquire_worker_lock, release_worker_lock
+from aicmo.cam.worker.locking import LOCK_TTL_MINUTES, acquire_worker_lock, release_worker_lock
 from aicmo.platform.orchestration import DIContainer, ModuleRegistry
-from aicmo.cam.composition import CamFlowRunner
+from aicmo.cam.composition import CamFlowRunner, CamStepScheduler
+from aicmo.shared import metrics, profiling
 
 
 # Configure logging
@@ -74,6 +93,11 @@ class CamWorkerConfig:
         )
         self.enabled = os.getenv('AICMO_CAM_WORKER_ENABLED', 'true').lower() == 'true'
         self.worker_id = os.getenv('AICMO_CAM_WORKER_ID', 'cam-worker-1')
+        self.mode = os.getenv('AICMO_CAM_WORKER_MODE', 'cycle').lower()
+        self.heartbeat_seconds = min(
+            int(os.getenv('AICMO_CAM_WORKER_HEARTBEAT_SECONDS', '60')),
+            LOCK_TTL_MINUTES * 60 // 3,
+        )
 
 
 class CamWorker:
@@ -558,21 +582,67 @@ class CamWorker:
             logger.error(f"  ✗ Alert dispatch failed: {str(e)}", exc_info=True)
             return False
     
+    def _record_cycle_metrics(self, succeeded: bool, seconds: float) -> None:
+        """Observe the cycle duration and push the process's metrics snapshot."""
+        status = "success" if succeeded else "failure"
+        metrics.WORKER_CYCLE_SECONDS.labels("cam_worker", status).observe(seconds)
+        metrics.push_snapshot("cam_worker")
+    
+    def _make_flow_runner(self) -> CamFlowRunner:
+        """A CamFlowRunner with its own session, for one scheduler thread."""
+        from backend.db.session import _get_session_maker
+        session = _get_session_maker()()
+        container, registry = DIContainer.create_default(session)
+        return CamFlowRunner(container, registry, session)
+    
+    def _run_cycles(self) -> None:
+        """Run all steps in sequence every interval_seconds."""
+        while self.config.enabled:
+            started = time.perf_counter()
+            succeeded = False
+            try:
+                succeeded = self.run_one_cycle()
+            except Exception as e:
+                logger.error(f"Cycle execution failed: {str(e)}", exc_info=True)
+            self._record_cycle_metrics(succeeded, time.perf_counter() - started)
+            
+            logger.info(f"💤 Sleeping for {self.config.interval_seconds}s...")
+            self._sleep_with_heartbeat(self.config.interval_seconds)
+    
+    def _sleep_with_heartbeat(self, seconds: float) -> None:
+        """Sleep for `seconds`, updating the heartbeat every heartbeat_seconds."""
+        deadline = time.monotonic() + seconds
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(remaining, max(1, self.config.heartbeat_seconds)))
+            self._update_heartbeat()
+    
+    def _run_scheduled(self) -> None:
+        """Run each step on its own cadence; this thread only keeps the heartbeat and metrics."""
+        scheduler = CamStepScheduler(self._make_flow_runner)
+        scheduler.start()
+        try:
+            while self.config.enabled:
+                self._sleep_with_heartbeat(self.config.interval_seconds)
+                metrics.push_snapshot("cam_worker")
+                logger.info(f"📊 Step stats: {scheduler.stats()}")
+        finally:
+            scheduler.stop()
+    
     def run(self):
         """Run the worker indefinitely."""
         if not self.setup():
             logger.error("Failed to setup worker")
             return 1
+        profiling.install_signal_handler("cam_worker")
         
         try:
-            while self.config.enabled:
-                try:
-                    self.run_one_cycle()
-                except Exception as e:
-                    logger.error(f"Cycle execution failed: {str(e)}", exc_info=True)
-                
-                logger.info(f"💤 Sleeping for {self.config.interval_seconds}s...")
-                time.sleep(self.config.interval_seconds)
+            if self.config.mode == "scheduled" and self.flow_runner:
+                self._run_scheduled()
+            else:
+                self._run_cycles()
         
         except KeyboardInterrupt:
             logger.info("\n⏹️  Worker interrupted by user")
@@ -11,8 +11,11 @@ from sqlalchemy import and_
 
 logger = logging.getLogger(__name__)
 
+# A RUNNING heartbeat older than this is stale and its lock can be taken over
+LOCK_TTL_MINUTES = 5
 
-def acquire_worker_lock(session: Session, worker_id: str, ttl_minutes: int = 5) -> bool:
+
+def acquire_worker_lock(session: Session, worker_id: str, ttl_minutes: int = LOCK_TTL_MINUTES) -> bool:
     """
     Acquire exclusive lock for worker.
     
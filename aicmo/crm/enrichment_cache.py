@@ -0,0 +1,137 @@
+"""
+Persistent cache of contact enrichment results.
+
+Entries live in SQLite (AICMO_ENRICHMENT_CACHE_PATH) with a TTL
+(AICMO_ENRICHMENT_CACHE_TTL_SECONDS). Two kinds of key:
+- "email:<email>": the full EnrichmentData of a contact, or None when Apollo
+  had no record (negative entries stop re-querying unknown contacts)
+- "domain:<domain>": company fields shared by every contact of a domain
+
+Re-enriching a campaign therefore only calls providers for new contacts.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+
+from aicmo.shared.config import settings
+from aicmo.shared import metrics
+from aicmo.shared.db import get_sqlite_connection
+
+logger = logging.getLogger(__name__)
+
+# Company-level fields cached per domain
+DOMAIN_FIELDS = ("company_name", "industry", "company_size")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS enrichment_cache (
+    key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL
+)
+"""
+
+# Max keys per IN (...) lookup (SQLite variable limit)
+_LOOKUP_CHUNK = 500
+
+
+def email_key(email: str) -> str:
+    return f"email:{email.strip().lower()}"
+
+
+def domain_key(domain: str) -> str:
+    return f"domain:{domain.strip().lower()}"
+
+
+class EnrichmentCache:
+    """SQLite key/value store with TTL and hit/miss counters."""
+
+    def __init__(self, path: Optional[str] = None, ttl_seconds: Optional[int] = None):
+        self.path = os.path.expanduser(path or settings.ENRICHMENT_CACHE_PATH)
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None else settings.ENRICHMENT_CACHE_TTL_SECONDS
+        )
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "stores": 0}
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._conn()
+        conn.execute(_SCHEMA)
+        conn.commit()
+
+    def _conn(self):
+        return get_sqlite_connection(self.path)
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += amount
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Live entries among keys (missing and expired keys are absent)."""
+        keys = list(dict.fromkeys(keys))
+        oldest = time.time() - self.ttl_seconds if self.ttl_seconds else 0
+        found: Dict[str, Any] = {}
+        try:
+            conn = self._conn()
+            for i in range(0, len(keys), _LOOKUP_CHUNK):
+                chunk = keys[i:i + _LOOKUP_CHUNK]
+                rows = conn.execute(
+                    f"SELECT key, payload FROM enrichment_cache "
+                    f"WHERE created_at >= ? AND key IN ({','.join('?' * len(chunk))})",
+                    (oldest, *chunk),
+                ).fetchall()
+                found.update((key, json.loads(payload)) for key, payload in rows)
+        except Exception as e:
+            logger.debug(f"Enrichment cache lookup failed: {e}")
+        self._count("hits", len(found))
+        self._count("misses", len(keys) - len(found))
+        metrics.record_cache("enrichment", hits=len(found), misses=len(keys) - len(found))
+        return found
+
+    def put_many(self, entries: Dict[str, Any]) -> None:
+        """Store (or refresh) entries in one transaction."""
+        if not entries:
+            return
+        now = time.time()
+        conn = self._conn()
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO enrichment_cache (key, payload, created_at) VALUES (?, ?, ?)",
+                [(key, json.dumps(value), now) for key, value in entries.items()],
+            )
+            conn.commit()
+        except Exception as e:
+            logger.debug(f"Enrichment cache store failed: {e}")
+            conn.rollback()
+            return
+        self._count("stores", len(entries))
+
+    def purge_expired(self) -> int:
+        if not self.ttl_seconds:
+            return 0
+        conn = self._conn()
+        removed = conn.execute(
+            "DELETE FROM enrichment_cache WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+        ).rowcount
+        conn.commit()
+        return removed
+
+    def clear(self) -> None:
+        conn = self._conn()
+        conn.execute("DELETE FROM enrichment_cache")
+        conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+        lookups = counters["hits"] + counters["misses"]
+        counters["hit_rate"] = round(counters["hits"] / lookups, 4) if lookups else 0.0
+        return counters
+
+
+__all__ = ["EnrichmentCache", "DOMAIN_FIELDS", "email_key", "domain_key"]
@@ -264,6 +264,13 @@ class CRMRepository:
             self._contacts[contact.email.lower()] = contact
             self._persist_to_file()
     
+    def add_contacts(self, contacts: List[Contact]) -> None:
+        """Add or update many contacts with a single write to disk."""
+        with self._lock:
+            for contact in contacts:
+                self._contacts[contact.email.lower()] = contact
+            self._persist_to_file()
+    
     def get_contact(self, email: str) -> Optional[Contact]:
         """Retrieve contact by email."""
         with self._lock:
@@ -4,7 +4,7 @@ Stage K3: End-to-end orchestrator with Kaizen insights.
 """
 
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 from aicmo.domain.intake import ClientIntake
@@ -25,6 +25,8 @@ from aicmo.portal.service import create_approval_request
 from aicmo.portal.domain import AssetType
 from aicmo.pm.service import create_project_task
 from aicmo.pm.domain import TaskPriority
+from aicmo.shared.config import settings
+from aicmo.shared.step_graph import Step, run_step_graph, step_timings
 
 logger = logging.getLogger(__name__)
 
@@ -225,15 +227,21 @@ class KaizenOrchestrator:
         """
         Run complete unified Kaizen flow wiring ALL subsystems.
         
-        W1: This orchestrates the entire AICMO workflow:
-        1. Strategy generation
-        2. Brand core + positioning
-        3. Social intelligence (trend analysis)
-        4. Media planning
-        5. Analytics (performance dashboard setup)
-        6. Client Portal (approval requests)
-        7. Project Management (task scheduling)
-        8. Creatives generation
+        W1: This orchestrates the entire AICMO workflow as a dependency graph
+        (see _kaizen_flow_steps). Steps that only need the intake and the
+        KaizenContext run concurrently, so wall time approaches the slowest
+        branch:
+        
+            kaizen ─┬─ brand_core
+                    ├─ brand_positioning
+                    └─ media_plan ── pm_tasks
+            social_trends, analytics_dashboard, approval_request, creatives
+        
+        Each step is bounded by AICMO_KAIZEN_STEP_TIMEOUT_SECONDS. A failed or
+        timed-out step leaves its output as None (dependents are skipped) and
+        is listed in "failed_steps"; "step_timings" has per-step status,
+        start offset and duration. A failed kaizen step falls back to running
+        without insights.
         
         Args:
             intake: Client intake data
@@ -248,118 +256,24 @@ class KaizenOrchestrator:
         self.logger.info(f"[W1] Starting UNIFIED Kaizen flow for {intake.brand_name} (project {project_id})")
         start_time = datetime.now()
         
-        # Step 1: Build Kaizen context
-        kaizen: Optional[KaizenContext] = None
-        if not skip_kaizen:
-            self.logger.info("Building Kaizen context from historical data...")
-            kaizen = build_kaizen_context(
-                project_id=int(project_id) if project_id and project_id.isdigit() else None,
-                client_id=client_id,
-                brand_name=intake.brand_name
-            )
-            
-            if kaizen and (kaizen.best_channels or kaizen.successful_hooks):
-                self.logger.info(f"Kaizen insights: {len(kaizen.best_channels or [])} channels, "
-                               f"{len(kaizen.successful_hooks or [])} hooks")
-        
-        # Step 2: Generate strategy (optional - requires LLM)
-        # For W1, we focus on wiring the 4 unwired subsystems
-        # Strategy can be generated separately via generate_strategy if needed
-        self.logger.info("Strategy generation (skipped in orchestrator - use separate call if needed)...")
-        strategy = None  # Can be passed in or generated separately
-        
-        # Step 3: Generate brand core and positioning
-        self.logger.info("Generating brand core and positioning...")
-        brand_core = generate_brand_core(intake, kaizen=kaizen)
-        brand_positioning = generate_brand_positioning(intake, kaizen=kaizen)
-        
-        # Step 4: W1 - Social Intelligence (analyze trends)
-        self.logger.info("[W1] Analyzing social trends...")
-        social_trends = analyze_trends(intake, days_back=7)
-        self.logger.info(f"[W1] Social: Identified {len(social_trends.emerging_trends)} trends")
-        
-        # Step 5: Generate media plan
-        self.logger.info("Generating media plan...")
-        media_plan = generate_media_plan(intake, total_budget=total_budget, kaizen=kaizen)
-        
-        # Step 6: W1 - Analytics (generate performance dashboard)
-        self.logger.info("[W1] Generating analytics dashboard...")
-        analytics_dashboard = generate_performance_dashboard(
-            intake=intake,
-            period_days=7
-        )
-        self.logger.info(f"[W1] Analytics: Dashboard with {len(analytics_dashboard.current_metrics)} metrics")
-        
-        # Step 7: W1 - Client Portal (create approval request for strategy)
-        self.logger.info("[W1] Creating approval request for strategy...")
-        approval_request = create_approval_request(
-            intake=intake,
-            asset_type=AssetType.STRATEGY_DOCUMENT,
-            asset_name=f"{intake.brand_name} Strategy Document",
-            asset_url=f"https://portal.aicmo.dev/projects/{project_id}/strategy",
-            requested_by="AICMO Orchestrator",
-            reviewers=["client@example.com"],  # Default reviewer
-            due_days=3
-        )
-        self.logger.info(f"[W1] Portal: Approval request created ({approval_request.request_id})")
-        
-        # Step 8: W1 - Project Management (create project tasks)
-        self.logger.info("[W1] Creating project tasks...")
-        pm_tasks = []
+        # Strategy generation requires an LLM; it is generated separately via
+        # generate_strategy if needed
+        strategy = None
         
-        # Create strategy review task
-        task_strategy = create_project_task(
-            intake=intake,
-            project_id=project_id,
-            title="Review and approve strategy document",
-            description=f"Review the generated strategy for {intake.brand_name} and provide feedback",
-            priority=TaskPriority.HIGH,
-            due_days=3,
-            estimated_hours=2.0
+        step_results = run_step_graph(
+            self._kaizen_flow_steps(intake, project_id, total_budget, client_id, skip_kaizen),
+            max_workers=settings.KAIZEN_MAX_CONCURRENCY,
+            default_timeout=settings.KAIZEN_STEP_TIMEOUT_SECONDS or None,
         )
-        pm_tasks.append(task_strategy)
+        outputs = {name: r.value for name, r in step_results.items()}
+        failed_steps = [name for name, r in step_results.items() if not r.ok]
+        if failed_steps:
+            self.logger.warning(f"[W1] Steps without output: {failed_steps}")
         
-        # Create creative development task
-        task_creative = create_project_task(
-            intake=intake,
-            project_id=project_id,
-            title="Develop creative assets",
-            description=f"Create {len(media_plan.channels)} creative variants based on media plan",
-            priority=TaskPriority.MEDIUM,
-            due_days=7,
-            estimated_hours=8.0
-        )
-        pm_tasks.append(task_creative)
-        
-        # Create media launch task
-        task_media = create_project_task(
-            intake=intake,
-            project_id=project_id,
-            title="Launch media campaign",
-            description=f"Execute media plan across {len(media_plan.channels)} channels",
-            priority=TaskPriority.HIGH,
-            due_days=10,
-            estimated_hours=4.0
-        )
-        pm_tasks.append(task_media)
-        
-        self.logger.info(f"[W1] PM: Created {len(pm_tasks)} tasks")
-        
-        # Step 9: Generate creatives (simplified for orchestration)
-        self.logger.info("Generating creative library...")
-        from aicmo.creatives.service import CreativeLibrary
-        from aicmo.domain.execution import CreativeVariant
-        
-        creatives = CreativeLibrary()
-        creatives.add_variant(
-            CreativeVariant(
-                platform="instagram",
-                format="post",
-                hook="Sample hook for orchestration",
-                caption="Sample caption",
-                cta="Learn More"
-            )
-        )
+        kaizen: Optional[KaizenContext] = outputs.get("kaizen")
+        social_trends = outputs["social_trends"]
+        analytics_dashboard = outputs["analytics_dashboard"]
+        pm_tasks = outputs["pm_tasks"] or []
         
         # Calculate execution time
         end_time = datetime.now()
@@ -375,17 +289,19 @@ class KaizenOrchestrator:
             ),
             # Core outputs
             "strategy": strategy,
-            "brand_core": brand_core,
-            "brand_positioning": brand_positioning,
-            "media_plan": media_plan,
-            "creatives": creatives,
+            "brand_core": outputs["brand_core"],
+            "brand_positioning": outputs["brand_positioning"],
+            "media_plan": outputs["media_plan"],
+            "creatives": outputs["creatives"],
             # W1: New subsystem outputs
             "social_trends": social_trends,
             "analytics_dashboard": analytics_dashboard,
-            "approval_request": approval_request,
+            "approval_request": outputs["approval_request"],
             "pm_tasks": pm_tasks,
             # Metadata
             "execution_time_seconds": execution_seconds,
+            "step_timings": step_timings(step_results),
+            "failed_steps": failed_steps,
             "total_budget": total_budget,
             "timestamp": end_time.isoformat(),
             "subsystems_wired": [
@@ -406,10 +322,11 @@ class KaizenOrchestrator:
                 "kaizen_insights_found": kaizen is not None,
                 "execution_time": execution_seconds,
                 "components_generated": result["subsystems_wired"],
-                "social_trends_count": len(social_trends.emerging_trends),
-                "analytics_metrics_count": len(analytics_dashboard.current_metrics),
+                "social_trends_count": len(social_trends.emerging_trends) if social_trends else 0,
+                "analytics_metrics_count": len(analytics_dashboard.current_metrics) if analytics_dashboard else 0,
                 "pm_tasks_count": len(pm_tasks),
-                "approval_requests_count": 1,
+                "approval_requests_count": 0 if outputs["approval_request"] is None else 1,
+                "failed_steps": failed_steps,
                 "client_id": client_id
             },
             tags=["orchestrator", "kaizen", "unified_flow", "w1"]
@@ -418,6 +335,147 @@ class KaizenOrchestrator:
         self.logger.info(f"[W1] UNIFIED orchestration complete in {execution_seconds:.2f}s - ALL subsystems wired")
         return result
     
+    def _kaizen_flow_steps(
+        self,
+        intake: ClientIntake,
+        project_id: str,
+        total_budget: float,
+        client_id: Optional[int],
+        skip_kaizen: bool,
+    ) -> List[Step]:
+        """The unified flow's steps; each receives {dependency: output}."""
+        kaizen_dep = () if skip_kaizen else ("kaizen",)
+        steps = [
+            Step(
+                "brand_core",
+                lambda deps: generate_brand_core(intake, kaizen=deps.get("kaizen")),
+                kaizen_dep,
+            ),
+            Step(
+                "brand_positioning",
+                lambda deps: generate_brand_positioning(intake, kaizen=deps.get("kaizen")),
+                kaizen_dep,
+            ),
+            Step(
+                "media_plan",
+                lambda deps: generate_media_plan(
+                    intake, total_budget=total_budget, kaizen=deps.get("kaizen")
+                ),
+                kaizen_dep,
+            ),
+            Step("social_trends", lambda deps: self._analyze_social_trends(intake)),
+            Step("analytics_dashboard", lambda deps: self._generate_analytics_dashboard(intake)),
+            Step("approval_request", lambda deps: self._request_strategy_approval(intake, project_id)),
+            Step(
+                "pm_tasks",
+                lambda deps: self._create_pm_tasks(intake, project_id, deps["media_plan"]),
+                ("media_plan",),
+            ),
+            Step("creatives", lambda deps: self._build_creative_library()),
+        ]
+        if not skip_kaizen:
+            steps.insert(
+                0,
+                Step(
+                    "kaizen",
+                    lambda deps: self._build_kaizen(intake, project_id, client_id),
+                    optional=True,
+                ),
+            )
+        return steps
+    
+    def _build_kaizen(
+        self, intake: ClientIntake, project_id: str, client_id: Optional[int]
+    ) -> Optional[KaizenContext]:
+        self.logger.info("Building Kaizen context from historical data...")
+        kaizen = build_kaizen_context(
+            project_id=int(project_id) if project_id and project_id.isdigit() else None,
+            client_id=client_id,
+            brand_name=intake.brand_name
+        )
+        if kaizen and (kaizen.best_channels or kaizen.successful_hooks):
+            self.logger.info(f"Kaizen insights: {len(kaizen.best_channels or [])} channels, "
+                           f"{len(kaizen.successful_hooks or [])} hooks")
+        return kaizen
+    
+    def _analyze_social_trends(self, intake: ClientIntake):
+        social_trends = analyze_trends(intake, days_back=7)
+        self.logger.info(f"[W1] Social: Identified {len(social_trends.emerging_trends)} trends")
+        return social_trends
+    
+    def _generate_analytics_dashboard(self, intake: ClientIntake):
+        analytics_dashboard = generate_performance_dashboard(
+            intake=intake,
+            period_days=7
+        )
+        self.logger.info(f"[W1] Analytics: Dashboard with {len(analytics_dashboard.current_metrics)} metrics")
+        return analytics_dashboard
+    
+    def _request_strategy_approval(self, intake: ClientIntake, project_id: str):
+        approval_request = create_approval_request(
+            intake=intake,
+            asset_type=AssetType.STRATEGY_DOCUMENT,
+            asset_name=f"{intake.brand_name} Strategy Document",
+            asset_url=f"https://portal.aicmo.dev/projects/{project_id}/strategy",
+            requested_by="AICMO Orchestrator",
+            reviewers=["client@example.com"],  # Default reviewer
+            due_days=3
+        )
+        self.logger.info(f"[W1] Portal: Approval request created ({approval_request.request_id})")
+        return approval_request
+    
+    def _create_pm_tasks(self, intake: ClientIntake, project_id: str, media_plan) -> list:
+        """Strategy review, creative development and media launch tasks."""
+        channel_count = len(media_plan.channels)
+        pm_tasks = [
+            create_project_task(
+                intake=intake,
+                project_id=project_id,
+                title="Review and approve strategy document",
+                description=f"Review the generated strategy for {intake.brand_name} and provide feedback",
+                priority=TaskPriority.HIGH,
+                due_days=3,
+                estimated_hours=2.0
+            ),
+            create_project_task(
+                intake=intake,
+                project_id=project_id,
+                title="Develop creative assets",
+                description=f"Create {channel_count} creative variants based on media plan",
+                priority=TaskPriority.MEDIUM,
+                due_days=7,
+                estimated_hours=8.0
+            ),
+            create_project_task(
+                intake=intake,
+                project_id=project_id,
+                title="Launch media campaign",
+                description=f"Execute media plan across {channel_count} channels",
+                priority=TaskPriority.HIGH,
+                due_days=10,
+                estimated_hours=4.0
+            ),
+        ]
+        self.logger.info(f"[W1] PM: Created {len(pm_tasks)} tasks")
+        return pm_tasks
+    
+    def _build_creative_library(self):
+        """Creative library for orchestration (simplified)."""
+        from aicmo.creatives.service import CreativeLibrary
+        from aicmo.domain.execution import CreativeVariant
+        
+        creatives = CreativeLibrary()
+        creatives.add_variant(
+            CreativeVariant(
+                platform="instagram",
+                format="post",
+                hook="Sample hook for orchestration",
+                caption="Sample caption",
+                cta="Learn More"
+            )
+        )
+        return creatives
+    
     def compare_kaizen_impact(
         self,
         intake: ClientIntake,
@@ -7,6 +7,7 @@ Only active if APOLLO_API_KEY is configured.
 
 import logging
 import os
+from datetime import datetime
 from typing import List, Dict, Optional, Any
 
 from aicmo.cam.ports import LeadEnricherPort
@@ -26,7 +27,28 @@ class ApolloEnricher(LeadEnricherPort):
     def __init__(self):
         """Initialize Apollo enricher."""
         self.api_key = os.getenv("APOLLO_API_KEY")
-        self.api_base = "https://api.apollo.io/v1"
+        self.api_base = os.getenv("APOLLO_API_BASE", "https://api.apollo.io/v1")
+    
+    def _headers(self) -> Dict[str, str]:
+        return {"X-Api-Key": self.api_key, "Content-Type": "application/json"}
+    
+    @staticmethod
+    def _to_enrichment(contact: Dict[str, Any]) -> Dict[str, Any]:
+        """Map one Apollo contact record to AICMO enrichment fields."""
+        organization = contact.get("organization") or {}
+        return {
+            "source": "apollo",
+            "enriched_at": datetime.utcnow().isoformat(),
+            "contact_id": contact.get("id"),
+            "email_status": contact.get("email_status"),  # verified, bounced, etc.
+            "company": organization.get("name"),
+            "job_title": contact.get("title"),
+            "linkedin_url": contact.get("linkedin_url"),
+            "phone": contact.get("phone_number"),
+            "industry": organization.get("industry"),
+            "company_size": organization.get("size"),
+            "seniority_level": contact.get("seniority"),
+        }
     
     def fetch_from_apollo(self, lead: Lead) -> Optional[Dict[str, Any]]:
         """
@@ -46,42 +68,23 @@ class ApolloEnricher(LeadEnricherPort):
         
         try:
             import requests
-            from datetime import datetime
             
             # Apollo People Search endpoint
             url = f"{self.api_base}/people/search"
             
-            headers = {
-                "X-Api-Key": self.api_key,
-                "Content-Type": "application/json"
-            }
-            
             payload = {
                 "q_emails": [lead.email],
                 "reveal_personal_emails": True
             }
             
-            response = requests.post(url, json=payload, headers=headers, timeout=10)
+            response = requests.post(url, json=payload, headers=self._headers(), timeout=10)
             response.raise_for_status()
             
             data = response.json()
             
             if data.get("contacts") and len(data["contacts"]) > 0:
                 contact = data["contacts"][0]
-                
-                enrichment = {
-                    "source": "apollo",
-                    "enriched_at": datetime.utcnow().isoformat(),
-                    "contact_id": contact.get("id"),
-                    "email_status": contact.get("email_status"),  # verified, bounced, etc.
-                    "company": contact.get("organization", {}).get("name"),
-                    "job_title": contact.get("title"),
-                    "linkedin_url": contact.get("linkedin_url"),
-                    "phone": contact.get("phone_number"),
-                    "industry": contact.get("organization", {}).get("industry"),
-                    "company_size": contact.get("organization", {}).get("size"),
-                    "seniority_level": contact.get("seniority"),
-                }
+                enrichment = self._to_enrichment(contact)
                 
                 logger.info(f"Apollo enriched {lead.email}: {contact.get('title')} at {contact.get('organization', {}).get('name')}")
                 return enrichment
@@ -137,7 +140,6 @@ class ApolloEnricher(LeadEnricherPort):
         
         try:
             import requests
-            from datetime import datetime
             
             # Filter leads with emails
             enrichable_leads = [lead for lead in leads if lead.email]
@@ -147,17 +149,12 @@ class ApolloEnricher(LeadEnricherPort):
             # Apollo People Search with batch of emails
             url = f"{self.api_base}/people/search"
             
-            headers = {
-                "X-Api-Key": self.api_key,
-                "Content-Type": "application/json"
-            }
-            
             payload = {
                 "q_emails": [lead.email for lead in enrichable_leads],
                 "reveal_personal_emails": True
             }
             
-            response = requests.post(url, json=payload, headers=headers, timeout=15)
+            response = requests.post(url, json=payload, headers=self._headers(), timeout=15)
             response.raise_for_status()
             
             data = response.json()
@@ -176,19 +173,7 @@ class ApolloEnricher(LeadEnricherPort):
                 if lead.email in contact_map:
                     contact = contact_map[lead.email]
                     lead.enrichment_data = lead.enrichment_data or {}
-                    lead.enrichment_data.update({
-                        "source": "apollo",
-                        "enriched_at": datetime.utcnow().isoformat(),
-                        "contact_id": contact.get("id"),
-                        "email_status": contact.get("email_status"),
-                        "company": contact.get("organization", {}).get("name"),
-                        "job_title": contact.get("title"),
-                        "linkedin_url": contact.get("linkedin_url"),
-                        "phone": contact.get("phone_number"),
-                        "industry": contact.get("organization", {}).get("industry"),
-                        "company_size": contact.get("organization", {}).get("size"),
-                        "seniority_level": contact.get("seniority"),
-                    })
+                    lead.enrichment_data.update(self._to_enrichment(contact))
                     enriched_count += 1
             
             logger.info(f"Enriched {enriched_count}/{len(enrichable_leads)} leads via Apollo")
@@ -201,6 +186,44 @@ class ApolloEnricher(LeadEnricherPort):
             logger.error(f"Apollo batch enrichment error: {e}")
             return leads
     
+    async def fetch_many_async(self, emails: List[str], client) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Look up a batch of emails with one People Search request.
+        
+        Args:
+            emails: Emails to look up (one or many)
+            client: Pooled httpx.AsyncClient
+            
+        Returns:
+            Dict mapping email -> enrichment data for the emails Apollo knows
+            (absent = not found), or None if the request failed
+        """
+        if not self.is_configured() or not emails:
+            return {}
+        
+        try:
+            response = await client.post(
+                f"{self.api_base}/people/search",
+                json={"q_emails": list(emails), "reveal_personal_emails": True},
+                headers=self._headers(),
+                timeout=15 if len(emails) > 1 else 10,
+            )
+            response.raise_for_status()
+            data = response.json()
+        except Exception as e:
+            logger.error(f"Apollo API request error for {len(emails)} email(s): {e}")
+            return None
+        
+        wanted = {email.lower(): email for email in emails}
+        results = {}
+        for contact in data.get("contacts") or []:
+            email = wanted.get((contact.get("email") or "").lower())
+            if email is None and len(emails) == 1:
+                email = emails[0]
+            if email:
+                results[email] = self._to_enrichment(contact)
+        return results
+    
     def is_configured(self) -> bool:
         """Check if Apollo API key is set."""
         return bool(self.api_key)
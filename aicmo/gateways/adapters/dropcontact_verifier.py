@@ -7,12 +7,15 @@ Only active if DROPCONTACT_API_KEY is configured.
 
 import logging
 import os
-from typing import Dict
+from typing import Dict, List, Optional
 
 from aicmo.cam.ports import EmailVerifierPort
 
 logger = logging.getLogger(__name__)
 
+# Dropcontact statuses that mean "do not send"
+INVALID_STATUSES = ("invalid", "not_found", "role", "disposable")
+
 
 class DropcontactVerifier(EmailVerifierPort):
     """
@@ -22,10 +25,16 @@ class DropcontactVerifier(EmailVerifierPort):
     Only works if DROPCONTACT_API_KEY environment variable is set.
     """
     
+    # Max contacts per batch verification request
+    BATCH_SIZE = 1000
+    
     def __init__(self):
         """Initialize Dropcontact verifier."""
         self.api_key = os.getenv("DROPCONTACT_API_KEY")
-        self.api_base = "https://api.dropcontact.io/v1"
+        self.api_base = os.getenv("DROPCONTACT_API_BASE", "https://api.dropcontact.io/v1")
+    
+    def _headers(self) -> Dict[str, str]:
+        return {"X-Dropcontact-ApiKey": self.api_key, "Content-Type": "application/json"}
     
     def verify(self, email: str) -> bool:
         """
@@ -73,7 +82,7 @@ class DropcontactVerifier(EmailVerifierPort):
             # "unknown" = uncertain (we'll approve)
             
             status = data.get("status", "unknown")
-            is_valid = status not in ["invalid", "not_found", "role", "disposable"]
+            is_valid = status not in INVALID_STATUSES
             
             log_msg = f"Dropcontact verified {email}: {status}"
             if is_valid:
@@ -119,8 +128,8 @@ class DropcontactVerifier(EmailVerifierPort):
                 "Content-Type": "application/json"
             }
             
-            # Prepare batch payload (max 1000 per request)
-            batch_size = 1000
+            # Prepare batch payload (max BATCH_SIZE per request)
+            batch_size = self.BATCH_SIZE
             all_results = {}
             
             for i in range(0, len(emails), batch_size):
@@ -140,7 +149,7 @@ class DropcontactVerifier(EmailVerifierPort):
                     for contact in data["contacts"]:
                         email = contact.get("email")
                         status = contact.get("status", "unknown")
-                        is_valid = status not in ["invalid", "not_found", "role", "disposable"]
+                        is_valid = status not in INVALID_STATUSES
                         all_results[email] = is_valid
             
             logger.info(f"Batch verified {len(all_results)} emails via Dropcontact")
@@ -154,6 +163,62 @@ class DropcontactVerifier(EmailVerifierPort):
             logger.error(f"Dropcontact batch verification error: {e}")
             return {email: True for email in emails}
     
+    async def verify_async(self, email: str, client) -> Optional[bool]:
+        """
+        Verify one email through a pooled httpx.AsyncClient.
+        
+        Returns:
+            Validity, or None if the request failed
+        """
+        if not self.is_configured():
+            return True
+        if not email or "@" not in email:
+            return False
+        
+        try:
+            response = await client.post(
+                f"{self.api_base}/contact/verify",
+                json={"email": email, "phone": None, "name": None},
+                headers=self._headers(),
+                timeout=10,
+            )
+            response.raise_for_status()
+            return response.json().get("status", "unknown") not in INVALID_STATUSES
+        except Exception as e:
+            logger.error(f"Dropcontact API error for {email}: {e}")
+            return None
+    
+    async def verify_batch_async(self, emails: List[str], client) -> Optional[Dict[str, bool]]:
+        """
+        Verify up to BATCH_SIZE emails with one batch request.
+        
+        Returns:
+            Dict mapping email -> validity, or None if the request failed
+        """
+        if not self.is_configured():
+            return {email: True for email in emails}
+        if not emails:
+            return {}
+        
+        try:
+            response = await client.post(
+                f"{self.api_base}/contact/verify/batch",
+                json={"contacts": [{"email": email} for email in emails]},
+                headers=self._headers(),
+                timeout=30,
+            )
+            response.raise_for_status()
+            data = response.json()
+        except Exception as e:
+            logger.error(f"Dropcontact batch verification API error: {e}")
+            return None
+        
+        return {
+            contact.get("email"): contact.get("status", "unknown") not in INVALID_STATUSES
+            for contact in data.get("contacts") or []
+            if contact.get("email")
+        }
+    
     def is_configured(self) -> bool:
         """Check if Dropcontact API key is set."""
         return bool(self.api_key)
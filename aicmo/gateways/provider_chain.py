@@ -15,19 +15,76 @@ SAFETY PATTERNS:
 - No circular imports: Monitoring is light, imported late
 - Thread-safe: Uses local lists for provider sorting, never mutates shared state
 - Operator-first: Every operation integrates CAM visibility
+- Bounded: Operation log is a ring buffer; health is kept as EWMAs
+- Deadlines: Each provider attempt can be capped so a hung provider fails
+  over. Sync provider methods run on a shared worker pool, so the event loop
+  can stop waiting for them; an abandoned call finishes in its thread and its
+  result is discarded
+- Hedging (optional): If the primary is slower than its own p95, the next
+  healthy provider is raced against it, within a HedgeBudget. Sync provider
+  methods run off the loop (see Deadlines), so they can be raced too
+- Response cache (optional): Duck-typed lookup/store hook, e.g.
+  aicmo.llm.cache.ChainResponseCache for LLM chains
 """
 
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional, Protocol, Callable, Awaitable
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+import contextvars
+import functools
 import logging
 import asyncio
+import threading
+import time
+
+from aicmo.shared import metrics, tracing
 
 # Avoid circular imports: lightweight typing only at top level
 logger = logging.getLogger(__name__)
 
+# Weight of the newest sample in the latency / error-rate moving averages
+EWMA_ALPHA = 0.3
+
+# Operations kept per chain for status reports
+DEFAULT_OPERATION_LOG_SIZE = 1000
+
+# Successful-call latencies kept per provider for percentiles
+LATENCY_WINDOW = 200
+
+# Worker threads for sync provider methods, shared by every chain
+SYNC_CALL_WORKERS = 32
+
+_sync_executor: Optional[ThreadPoolExecutor] = None
+_sync_executor_lock = threading.Lock()
+
+
+def _get_sync_executor() -> ThreadPoolExecutor:
+    global _sync_executor
+    if _sync_executor is None:
+        with _sync_executor_lock:
+            if _sync_executor is None:
+                _sync_executor = ThreadPoolExecutor(
+                    max_workers=SYNC_CALL_WORKERS, thread_name_prefix="aicmo-provider"
+                )
+    return _sync_executor
+
+
+def _run_sync(method: Callable, *args, **kwargs) -> Awaitable[Any]:
+    """
+    Run a blocking provider method on the shared pool, in a copy of the
+    caller's context (so tracing spans nest under the current one).
+    
+    A process-wide pool rather than the loop's default executor: asyncio.run()
+    joins its default executor on exit, which would make an abandoned call
+    block its caller after all.
+    """
+    call = functools.partial(contextvars.copy_context().run, method, *args, **kwargs)
+    return asyncio.get_running_loop().run_in_executor(_get_sync_executor(), call)
 
 class ProviderHealth(Enum):
     """Health status of an external service provider."""
@@ -37,6 +94,53 @@ class ProviderHealth(Enum):
     UNKNOWN = "unknown"  # Not yet evaluated
 
 
+def _percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile (q in 0..100) of an ascending list."""
+    if not sorted_values:
+        return None
+    rank = max(int(-(-q * len(sorted_values) // 100)), 1)
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class HedgeBudget:
+    """
+    Token bucket capping hedged attempts to a fraction of requests.
+
+    Every request earns `ratio` tokens (up to max_tokens); firing a hedge
+    spends one. ratio=0.1 allows at most ~10% extra provider calls over time,
+    plus a burst of max_tokens. Thread-safe; share one per use-case.
+    """
+
+    def __init__(self, ratio: float = 0.1, max_tokens: float = 5.0):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.hedges = 0
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self.hedges += 1
+            return True
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ratio": self.ratio,
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "tokens": round(self._tokens, 3),
+        }
+
+
 @dataclass
 class ProviderStatus:
     """Health status and metrics for a provider."""
@@ -48,7 +152,10 @@ class ProviderStatus:
     consecutive_failures: int = 0
     consecutive_successes: int = 0
     latency_ms: Optional[float] = None  # Most recent operation latency
-    avg_latency_ms: Optional[float] = None  # Rolling average
+    avg_latency_ms: Optional[float] = None  # Rolling average (EWMA)
+    error_rate: float = 0.0  # EWMA of failures (0.0 = never fails, 1.0 = always fails)
+    total_calls: int = 0
+    total_failures: int = 0
     error_message: Optional[str] = None
     
     def is_healthy(self) -> bool:
@@ -97,6 +204,7 @@ class ProviderWrapper:
         is_dry_run: bool = False,
         health_threshold_failures: int = 3,
         health_threshold_successes: int = 5,
+        timeout_seconds: Optional[float] = None,
     ):
         """
         Initialize provider wrapper.
@@ -107,14 +215,44 @@ class ProviderWrapper:
             is_dry_run: If True, operations are simulated only
             health_threshold_failures: Mark unhealthy after N consecutive failures
             health_threshold_successes: Mark healthy after N consecutive successes
+            timeout_seconds: Deadline per invocation; None waits indefinitely.
+                A sync method that misses it keeps running in its worker
+                thread, but the chain fails over without waiting for it.
         """
         self.provider = provider
         self.provider_name = provider_name
         self.is_dry_run = is_dry_run
         self.health_threshold_failures = health_threshold_failures
         self.health_threshold_successes = health_threshold_successes
+        self.timeout_seconds = timeout_seconds
         
         self.status = ProviderStatus(provider_name=provider_name)
+        self._latencies: deque = deque(maxlen=LATENCY_WINDOW)
+        # Metrics label; set by the ProviderChain this wrapper is added to
+        self.capability_name = "unassigned"
+    
+    def record_cancelled_latency(self, elapsed_ms: float) -> None:
+        """
+        Count a call cancelled after elapsed_ms as a latency sample.
+
+        A hedged call's loser would have taken at least this long; leaving
+        it out would bias the window (and the p95 hedge trigger) low.
+        """
+        self._latencies.append(elapsed_ms)
+
+    def latency_percentile(self, q: float) -> Optional[float]:
+        """q-th percentile (ms) of recent successful call latencies."""
+        return _percentile(sorted(self._latencies), q)
+    
+    def latency_percentiles(self) -> Dict[str, Optional[float]]:
+        """p50/p95/p99 (ms) of recent successful call latencies."""
+        ordered = sorted(self._latencies)
+        return {
+            "p50": _percentile(ordered, 50),
+            "p95": _percentile(ordered, 95),
+            "p99": _percentile(ordered, 99),
+            "samples": len(ordered),
+        }
     
     async def invoke(
         self,
@@ -132,7 +270,24 @@ class ProviderWrapper:
             logger.info(f"[DRY_RUN] {self.provider_name}.{method_name}()")
             return (True, None, None)
         
-        start_time = datetime.now()
+        with tracing.span(
+            "provider.call",
+            capability=self.capability_name,
+            provider=self.provider_name,
+            method=method_name,
+        ) as span:
+            success, result, error_msg = await self._invoke(method_name, *args, **kwargs)
+            if not success:
+                span.set_attribute("error", error_msg)
+            return (success, result, error_msg)
+
+    async def _invoke(
+        self,
+        method_name: str,
+        *args,
+        **kwargs,
+    ) -> tuple[bool, Any, Optional[str]]:
+        start_time = time.perf_counter()
         try:
             # Use getattr for dynamic method dispatch (operator-first, flexible)
             method = getattr(self.provider, method_name, None)
@@ -141,14 +296,18 @@ class ProviderWrapper:
                 logger.error(error_msg)
                 return (False, None, error_msg)
             
-            # Call method - supports both async and sync
+            # Call method - supports both async and sync (sync ones off the loop)
             if asyncio.iscoroutinefunction(method):
-                result = await method(*args, **kwargs)
+                call = method(*args, **kwargs)
+            else:
+                call = _run_sync(method, *args, **kwargs)
+            if self.timeout_seconds is None:
+                result = await call
             else:
-                result = method(*args, **kwargs)
+                result = await asyncio.wait_for(call, timeout=self.timeout_seconds)
             
             # Record success
-            latency_ms = (datetime.now() - start_time).total_seconds() * 1000
+            latency_ms = (time.perf_counter() - start_time) * 1000
             self._record_success(latency_ms)
             
             logger.info(
@@ -157,6 +316,14 @@ class ProviderWrapper:
             )
             return (True, result, None)
         
+        except asyncio.TimeoutError:
+            error_msg = f"TimeoutError: no response within {self.timeout_seconds}s"
+            self._record_failure(error_msg)
+            logger.warning(
+                f"✗ {self.provider_name}.{method_name}() timed out, failing over"
+            )
+            return (False, None, error_msg)
+
         except Exception as e:
             error_msg = f"{type(e).__name__}: {str(e)}"
             self._record_failure(error_msg)
@@ -171,6 +338,12 @@ class ProviderWrapper:
         self.status.consecutive_successes += 1
         self.status.consecutive_failures = 0
         self.status.latency_ms = latency_ms
+        self.status.total_calls += 1
+        self.status.error_rate *= 1 - EWMA_ALPHA
+        self._latencies.append(latency_ms)
+        metrics.record_provider_call(
+            self.capability_name, self.provider_name, True, latency_ms / 1000
+        )
         
         # Update running average latency
         if self.status.avg_latency_ms is None:
@@ -178,7 +351,7 @@ class ProviderWrapper:
         else:
             # Exponential moving average (weight: 70% old, 30% new)
             self.status.avg_latency_ms = (
-                0.7 * self.status.avg_latency_ms + 0.3 * latency_ms
+                (1 - EWMA_ALPHA) * self.status.avg_latency_ms + EWMA_ALPHA * latency_ms
             )
         
         # Update health status
@@ -196,6 +369,10 @@ class ProviderWrapper:
         self.status.consecutive_failures += 1
         self.status.consecutive_successes = 0
         self.status.error_message = error_message
+        self.status.total_calls += 1
+        self.status.total_failures += 1
+        self.status.error_rate += EWMA_ALPHA * (1 - self.status.error_rate)
+        metrics.record_provider_call(self.capability_name, self.provider_name, False)
         
         if self.status.consecutive_failures >= self.health_threshold_failures:
             self.status.health = ProviderHealth.UNHEALTHY
@@ -216,6 +393,8 @@ class ProviderChain:
     THREAD-SAFE: Uses local lists for provider sorting, never mutates shared state.
     DRY-RUN: All operations support dry_run mode for testing.
     OPERATOR-FIRST: Every operation logs status for CAM visibility.
+    LONG-LIVED: Health and the (bounded) operation log accumulate across calls,
+    so a chain is meant to be reused rather than rebuilt per request.
     """
     
     def __init__(
@@ -224,6 +403,10 @@ class ProviderChain:
         providers: List[ProviderWrapper],
         is_dry_run: bool = False,
         max_fallback_attempts: int = None,
+        operation_log_size: int = DEFAULT_OPERATION_LOG_SIZE,
+        hedge_budget: Optional[HedgeBudget] = None,
+        hedge_min_samples: int = 20,
+        response_cache: Any = None,
     ):
         """
         Initialize provider chain for a capability.
@@ -233,21 +416,39 @@ class ProviderChain:
             providers: List of ProviderWrapper instances in priority order
             is_dry_run: If True, simulate all operations
             max_fallback_attempts: If None, try all providers; otherwise limit attempts
+            operation_log_size: Most recent operations kept for status reports
+            hedge_budget: Enables hedging; caps how many hedges may be fired
+            hedge_min_samples: Latency samples a primary needs before its p95
+                is trusted as the hedge trigger
+            response_cache: Object with enabled_for(kwargs, cache),
+                lookup(provider_names, method_name, kwargs) and
+                store(provider_name, method_name, kwargs, result)
         """
         self.capability_name = capability_name
         self.providers = providers
+        for wrapper in providers:
+            wrapper.capability_name = capability_name
         self.is_dry_run = is_dry_run
         self.max_fallback_attempts = (
             max_fallback_attempts if max_fallback_attempts is not None
             else len(providers)
         )
         
-        self._operation_log: List[Dict[str, Any]] = []
+        self._operation_log: deque = deque(maxlen=operation_log_size)
+        self._total_operations = 0
+        
+        self.hedge_budget = hedge_budget
+        self.hedge_min_samples = hedge_min_samples
+        self._hedges_fired = 0
+        self._hedges_won = 0
+        
+        self.response_cache = response_cache
     
     async def invoke(
         self,
         method_name: str,
         *args,
+        cache: Optional[bool] = None,
         **kwargs,
     ) -> tuple[bool, Any, str]:
         """
@@ -256,8 +457,15 @@ class ProviderChain:
         Process:
         1. Sort providers by health (prioritize healthy)
         2. Attempt on primary provider
-        3. If fails, try secondary providers
-        4. If all fail or unavailable, return failure with last error
+        3. If hedging is enabled and the primary is still running after its
+           p95 latency, race the next healthy provider (first success wins,
+           the loser is cancelled)
+        4. If fails, try secondary providers
+        5. If all fail or unavailable, return failure with last error
+        
+        With a response_cache, a cached answer from any provider (in priority
+        order) is returned without calling it; cache=False/True overrides the
+        cache's policy for this call.
         
         Returns:
             Tuple of (success: bool, result: Any, provider_name: str used)
@@ -267,16 +475,28 @@ class ProviderChain:
             return (False, None, "NO_PROVIDERS")
         
         # Create local list (thread-safe, no mutation of shared state)
-        # Sort by: 1) health status, 2) consecutive successes, 3) latency
+        # Sort by: 1) health status, 2) error rate, 3) consecutive successes, 4) latency
         sorted_providers = self._get_sorted_providers()
         
+        use_cache = self.response_cache is not None and self.response_cache.enabled_for(kwargs, cache)
+        if use_cache:
+            cached = self.response_cache.lookup(
+                [p.provider_name for p in sorted_providers], method_name, kwargs
+            )
+            if cached is not None:
+                provider_name, result = cached
+                logger.info(f"✓ [{self.capability_name}] Cache hit for {provider_name}")
+                return (True, result, provider_name)
+        
+        if self.hedge_budget is not None:
+            self.hedge_budget.record_request()
+        
         last_error = "No providers attempted"
         attempts = 0
+        remaining = list(sorted_providers)
         
-        for wrapper in sorted_providers:
-            if attempts >= self.max_fallback_attempts:
-                break
-            
+        while remaining and attempts < self.max_fallback_attempts:
+            wrapper = remaining.pop(0)
             attempts += 1
             provider_name = wrapper.provider_name
             
@@ -285,17 +505,22 @@ class ProviderChain:
                 f"invoking {provider_name}.{method_name}()"
             )
             
-            success, result, error = await wrapper.invoke(method_name, *args, **kwargs)
+            backup = None
+            hedge_delay = self._hedge_delay(wrapper)
+            if hedge_delay is not None and attempts < self.max_fallback_attempts:
+                backup = next((p for p in remaining if p.status.is_healthy()), None)
             
-            # Log operation for audit trail
-            self._operation_log.append({
-                "capability": self.capability_name,
-                "method": method_name,
-                "provider": provider_name,
-                "success": success,
-                "timestamp": datetime.now(),
-                "error": error,
-            })
+            if backup is None:
+                success, result, error = await self._attempt(
+                    wrapper, method_name, args, kwargs, use_cache
+                )
+            else:
+                success, result, error, provider_name, hedged = await self._invoke_hedged(
+                    wrapper, backup, hedge_delay, method_name, args, kwargs, use_cache
+                )
+                if hedged:
+                    remaining.remove(backup)
+                    attempts += 1
             
             if success:
                 logger.info(
@@ -314,12 +539,109 @@ class ProviderChain:
         )
         return (False, None, f"ALL_FAILED ({attempts} attempts)")
     
+    async def _attempt(
+        self,
+        wrapper: ProviderWrapper,
+        method_name: str,
+        args: tuple,
+        kwargs: Dict[str, Any],
+        use_cache: bool = False,
+    ) -> tuple:
+        """One provider call, recorded in the operation log (and cached on success)."""
+        success, result, error = await wrapper.invoke(method_name, *args, **kwargs)
+        if success and use_cache:
+            self.response_cache.store(wrapper.provider_name, method_name, kwargs, result)
+        
+        # Log operation for audit trail
+        self._total_operations += 1
+        self._operation_log.append({
+            "capability": self.capability_name,
+            "method": method_name,
+            "provider": wrapper.provider_name,
+            "success": success,
+            "timestamp": datetime.now(),
+            "error": error,
+        })
+        return success, result, error
+    
+    def _hedge_delay(self, wrapper: ProviderWrapper) -> Optional[float]:
+        """Seconds to wait on wrapper before hedging, or None if hedging is off for it."""
+        if self.hedge_budget is None or len(wrapper._latencies) < self.hedge_min_samples:
+            return None
+        return wrapper.latency_percentile(95) / 1000
+    
+    async def _invoke_hedged(
+        self,
+        primary: ProviderWrapper,
+        backup: ProviderWrapper,
+        delay: float,
+        method_name: str,
+        args: tuple,
+        kwargs: Dict[str, Any],
+        use_cache: bool = False,
+    ) -> tuple:
+        """
+        Run primary; if it hasn't finished after delay (and the budget allows),
+        race backup against it.
+        
+        The loser is cancelled and its elapsed time recorded as a latency
+        sample (a lower bound of what it would have taken). A sync loser
+        can't be interrupted: it is abandoned in its worker thread and its
+        result discarded.
+        
+        Returns:
+            (success, result, error, provider_name, hedged) where hedged tells
+            the caller backup was used.
+        """
+        tasks = {
+            asyncio.ensure_future(self._attempt(primary, method_name, args, kwargs, use_cache)): primary
+        }
+        started = {wrapper: time.perf_counter() for wrapper in tasks.values()}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done and self.hedge_budget.try_spend():
+                self._hedges_fired += 1
+                logger.info(
+                    f"[{self.capability_name}] {primary.provider_name} slower than "
+                    f"p95 ({delay * 1000:.0f}ms), hedging with {backup.provider_name}"
+                )
+                tasks[asyncio.ensure_future(
+                    self._attempt(backup, method_name, args, kwargs, use_cache)
+                )] = backup
+                started[backup] = time.perf_counter()
+            
+            hedged = len(tasks) > 1
+            pending = set(tasks)
+            last_error, last_name = None, primary.provider_name
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    success, result, error = task.result()
+                    if success:
+                        if tasks[task] is backup:
+                            self._hedges_won += 1
+                        return (True, result, None, tasks[task].provider_name, hedged)
+                    last_error, last_name = error, tasks[task].provider_name
+            return (False, None, last_error, last_name, hedged)
+        finally:
+            # Cancel the loser (or everything, if we were cancelled ourselves)
+            now = time.perf_counter()
+            for task, wrapper in tasks.items():
+                if not task.done():
+                    task.cancel()
+                    wrapper.record_cancelled_latency((now - started[wrapper]) * 1000)
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def get_latency_stats(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """p50/p95/p99 latency (ms) per provider."""
+        return {p.provider_name: p.latency_percentiles() for p in self.providers}
+    
     def _get_sorted_providers(self) -> List[ProviderWrapper]:
         """
         Get providers sorted by health priority.
         
         Priority order:
-        1. Healthy providers (by consecutive successes, then by latency)
+        1. Healthy providers (by error rate, consecutive successes, latency)
         2. Degraded providers
         3. Unhealthy providers (might recover)
         4. Unknown health providers
@@ -343,7 +665,8 @@ class ProviderChain:
         Generate sort key for provider prioritization.
         
         Higher values = higher priority.
-        Returns tuple: (health_priority, consecutive_successes, negative_latency)
+        Returns tuple: (health_priority, negative_error_rate, consecutive_successes,
+        negative_latency)
         """
         # Health priority: HEALTHY=3, DEGRADED=2, UNHEALTHY=1, UNKNOWN=0
         health_priority = {
@@ -356,10 +679,13 @@ class ProviderChain:
         # Use consecutive successes (higher = better)
         successes = wrapper.status.consecutive_successes
         
+        # Error rate in 10% bands so noise doesn't reshuffle near-equal providers
+        error_rate = -round(wrapper.status.error_rate, 1)
+        
         # Use negative latency (lower latency = higher priority, so negate)
-        latency = -(wrapper.status.latency_ms or 9999.0)
+        latency = -(wrapper.status.avg_latency_ms or 9999.0)
         
-        return (health_priority, successes, latency)
+        return (health_priority, error_rate, successes, latency)
     
     def get_status_report(self) -> Dict[str, Any]:
         """
@@ -378,6 +704,9 @@ class ProviderChain:
                 "consecutive_failures": p.status.consecutive_failures,
                 "consecutive_successes": p.status.consecutive_successes,
                 "avg_latency_ms": p.status.avg_latency_ms,
+                "error_rate": round(p.status.error_rate, 4),
+                "total_calls": p.status.total_calls,
+                "total_failures": p.status.total_failures,
                 "last_success": (
                     p.status.last_success_time.isoformat()
                     if p.status.last_success_time
@@ -389,6 +718,7 @@ class ProviderChain:
                     else None
                 ),
                 "error": p.status.error_message,
+                "latency_ms": p.latency_percentiles(),
             }
             for p in self.providers
         ]
@@ -404,8 +734,19 @@ class ProviderChain:
             "capability": self.capability_name,
             "overall_health": overall_health,
             "providers": provider_statuses,
-            "recent_operations": self._operation_log[-10:],  # Last 10 ops
-            "total_operations": len(self._operation_log),
+            "recent_operations": list(
+                islice(self._operation_log, max(len(self._operation_log) - 10, 0), None)
+            ),  # Last 10 ops
+            "total_operations": self._total_operations,
+            "hedging": (
+                {
+                    **self.hedge_budget.to_dict(),
+                    "fired": self._hedges_fired,
+                    "won": self._hedges_won,
+                }
+                if self.hedge_budget is not None
+                else None
+            ),
         }
 
 
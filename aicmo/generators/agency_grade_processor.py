@@ -15,10 +15,12 @@ from aicmo.io.client_reports import AICMOOutputReport
 from aicmo.presets.framework_fusion import inject_frameworks
 from aicmo.generators.language_filters import apply_all_filters
 from aicmo.generators.reasoning_trace import attach_reasoning_trace, strip_reasoning_trace
+from aicmo.shared.tracing import traced
 
 logger = logging.getLogger("aicmo.agency_grade")
 
 
+@traced("stage.agency_grade_processor")
 def process_report_for_agency_grade(
     report: AICMOOutputReport,
     brief_text: str,
@@ -5,17 +5,25 @@ Replaces "Hook idea for day X" with dynamic, channel-aware hooks based on brief
 
 🔥 MICRO-PASS IMPLEMENTATION:
 Pass 1 – Skeleton: Day index, platform, theme/angle
-Pass 2 – Captions & CTAs: Generate captions per day with per-day fallback if generation fails
+Pass 2 – Captions & CTAs: One structured-JSON request per chunk of days
+(up to AICMO_LLM_CALENDAR_BATCH_DAYS), chunks run concurrently under a
+process-wide limit (AICMO_LLM_MAX_CONCURRENCY), per-day fallback for any
+day missing or malformed in the response
 Never blocks: per-day fallback ensures calendar is always complete
 """
 
+import asyncio
 import json
 import logging
 import os
+import re
+import threading
+from contextlib import asynccontextmanager
 from datetime import date, timedelta
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from aicmo.io.client_reports import ClientInputBrief, CalendarPostView
+from aicmo.shared.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -84,16 +92,21 @@ def _generate_social_calendar_with_llm_micro_passes(
     days: int,
     themes: List[str],
     platforms: List[str],
+    chain: Any = None,
 ) -> Optional[List[CalendarPostView]]:
     """
     Generate Social Calendar posts using LLM with 2-pass approach.
-    
+
     Pass 1 – Skeleton: Generate day structure with day index, platform, theme
-    Pass 2 – Captions & CTAs: For each day, generate caption with per-day fallback
-    
+    Pass 2 – Captions & CTAs: Batched requests (one per chunk of days, run
+    concurrently), then per-day assembly with stub fallback
+
     Per-day fallback ensures calendar never fails entirely - if a single day fails,
     that day gets stub content, but the rest of the calendar continues.
 
+    Args:
+        chain: ProviderChain to use (defaults to the SOCIAL_CONTENT chain)
+
     Returns:
         List of CalendarPostView, or None if skeleton generation fails
     """
@@ -101,8 +114,11 @@ def _generate_social_calendar_with_llm_micro_passes(
         # PASS 1: Generate skeleton (day structure, no LLM call needed)
         # We can use a simpler approach: just assign platform and theme to each day
         skeleton = _generate_skeleton(days, themes, platforms)
-        
-        # PASS 2: Generate captions & CTAs per day with fallback
+
+        # PASS 2a: Hooks & CTAs for all days in a few concurrent batched requests
+        captions = _generate_llm_captions_batched(skeleton, brief, chain=chain)
+
+        # PASS 2b: Assemble posts with per-day fallback
         posts = []
         for day_info in skeleton:
             post = _generate_caption_for_day(
@@ -111,6 +127,7 @@ def _generate_social_calendar_with_llm_micro_passes(
                 start_date=start_date,
                 themes=themes,
                 fallback_platforms=platforms,
+                llm_caption=captions.get(day_info["day"]),
             )
             if post:
                 posts.append(post)
@@ -153,26 +170,21 @@ def _generate_caption_for_day(
     start_date: date,
     themes: List[str],
     fallback_platforms: List[str],
+    llm_caption: Optional[dict] = None,
 ) -> Optional[CalendarPostView]:
     """
-    PASS 2: Generate caption & CTA for a single day.
-    
-    Per-day fallback: if LLM generation fails, use stub content for that day only.
-    This ensures the calendar never blocks - worst case, a day gets stub content.
+    PASS 2: Build the post for a single day from its LLM caption & CTA.
+
+    llm_caption is the day's entry from the batched pass; None (day missing
+    or malformed in the response) falls through to stub content for that
+    day only. This ensures the calendar never blocks - worst case, a day
+    gets stub content.
     """
     try:
         day_num = day_info.get("day", 1)
         platform = day_info.get("platform", "Instagram")
         theme = day_info.get("theme", "Content")
-        
-        # Try LLM caption first
-        llm_caption = _generate_llm_caption_for_day(
-            day_num=day_num,
-            platform=platform,
-            theme=theme,
-            brief=brief,
-        )
-        
+
         if llm_caption and "hook" in llm_caption and "cta" in llm_caption:
             # LLM success - use it
             post = CalendarPostView(
@@ -209,93 +221,205 @@ def _generate_caption_for_day(
         )
 
 
-def _generate_llm_caption_for_day(
-    day_num: int,
-    platform: str,
-    theme: str,
+# ==============================================================================
+# BATCHED CAPTIONS (PASS 2)
+# ==============================================================================
+
+# One limiter for the whole process: every calendar runs its batches on its
+# own asyncio.run() loop, so a per-loop semaphore would cap nothing
+_llm_limiter: Optional[Tuple[int, threading.BoundedSemaphore]] = None
+_llm_limiter_lock = threading.Lock()
+
+# How often a batch waiting for a free slot checks again
+_LLM_SLOT_POLL_SECONDS = 0.01
+
+
+def _get_llm_limiter() -> threading.BoundedSemaphore:
+    """Semaphore capping concurrent LLM requests (rebuilt if the limit changes)."""
+    global _llm_limiter
+    limit = max(1, settings.LLM_MAX_CONCURRENCY)
+    with _llm_limiter_lock:
+        if _llm_limiter is None or _llm_limiter[0] != limit:
+            _llm_limiter = (limit, threading.BoundedSemaphore(limit))
+        return _llm_limiter[1]
+
+
+@asynccontextmanager
+async def _llm_slot() -> AsyncIterator[None]:
+    """
+    Hold one of the AICMO_LLM_MAX_CONCURRENCY slots. Waits without blocking
+    the loop and can be cancelled without leaking the slot.
+    """
+    limiter = _get_llm_limiter()
+    while not limiter.acquire(blocking=False):
+        await asyncio.sleep(_LLM_SLOT_POLL_SECONDS)
+    try:
+        yield
+    finally:
+        limiter.release()
+
+
+def _chunk_skeleton(skeleton: List[dict], max_days: int) -> List[List[dict]]:
+    """
+    Split the skeleton into the fewest chunks of at most max_days days,
+    balanced in size (30 days / 10 -> 3 x 10, 31 days -> 8/8/8/7).
+    """
+    if not skeleton:
+        return []
+    max_days = max(1, max_days)
+    chunk_count = -(-len(skeleton) // max_days)
+    size = -(-len(skeleton) // chunk_count)
+    return [skeleton[i : i + size] for i in range(0, len(skeleton), size)]
+
+
+def _generate_llm_captions_batched(
+    skeleton: List[dict],
     brief: ClientInputBrief,
-) -> Optional[dict]:
+    chain: Any = None,
+) -> Dict[int, dict]:
     """
-    Generate caption & CTA for a single day using LLM.
-    
-    Returns dict with "hook" and "cta" keys, or None if generation fails.
+    Generate hooks & CTAs for every skeleton day with batched LLM requests.
+
+    Returns {day_num: {"hook", "cta"}} for the days the LLM answered
+    correctly; failed chunks and malformed days are simply absent.
     """
     try:
-        from aicmo.llm.router import get_llm_client, LLMUseCase
-        import asyncio
+        if chain is None:
+            from aicmo.llm.router import get_llm_client, LLMUseCase
+
+            chain = get_llm_client(
+                use_case=LLMUseCase.SOCIAL_CONTENT,
+                profile_override=None,
+                deep_research=False,
+                multimodal=False,
+            )
+        return asyncio.run(_generate_llm_captions_async(skeleton, brief, chain))
+    except Exception as e:
+        logger.debug(f"Batched LLM captions failed: {e}")
+        return {}
 
-        brand_name = brief.brand.brand_name
-        category = brief.brand.industry or "their category"
-        audience = brief.audience.primary_customer or "their audience"
-        goals = brief.goal.primary_goal or "achieve business growth"
-        
-        # Build focused prompt for single day
-        prompt = f"""Generate ONE compelling social media post hook and CTA for day {day_num}.
 
-Brand: {brand_name}
-Category: {category}
-Target Audience: {audience}
-Primary Goal: {goals}
-Platform: {platform}
-Theme: {theme}
+async def _generate_llm_captions_async(
+    skeleton: List[dict],
+    brief: ClientInputBrief,
+    chain: Any,
+) -> Dict[int, dict]:
+    """Run one request per chunk concurrently and merge the per-day results."""
+    chunks = _chunk_skeleton(skeleton, settings.LLM_CALENDAR_BATCH_DAYS)
+    results = await asyncio.gather(
+        *(_generate_llm_captions_for_chunk(chunk, brief, chain) for chunk in chunks),
+        return_exceptions=True,
+    )
+    captions: Dict[int, dict] = {}
+    for chunk, result in zip(chunks, results):
+        if isinstance(result, BaseException):
+            logger.debug(
+                f"LLM batch for days {chunk[0]['day']}-{chunk[-1]['day']} failed: {result}"
+            )
+            continue
+        captions.update(result)
+    return captions
 
-Generate a hook (1-2 sentences) and CTA (2-4 words) that:
+
+async def _generate_llm_captions_for_chunk(
+    chunk: List[dict],
+    brief: ClientInputBrief,
+    chain: Any,
+) -> Dict[int, dict]:
+    """One structured-JSON request covering every day in chunk."""
+    day_lines = "\n".join(
+        f"- Day {d['day']}: platform={d['platform']}, theme={d['theme']}" for d in chunk
+    )
+    prompt = f"""Generate a compelling social media post hook and CTA for EACH of the {len(chunk)} days below.
+
+{_brief_context(brief)}
+
+Days:
+{day_lines}
+
+For every day, generate a hook (1-2 sentences) and CTA (2-4 words) that:
 1. Is specific to the brand and audience, not generic
-2. Fits the theme and platform
+2. Fits that day's theme and platform
 3. Has a compelling call-to-action
+4. Does not repeat another day's hook
 
-Return ONLY valid JSON:
+Return ONLY valid JSON with one entry per day:
 {{
-  "hook": "Your compelling hook here",
-  "cta": "Action words here"
+  "days": [
+    {{"day": {chunk[0]['day']}, "hook": "Your compelling hook here", "cta": "Action words here"}}
+  ]
 }}"""
 
-        # Get LLM client for SOCIAL_CONTENT use-case
-        chain = get_llm_client(
-            use_case=LLMUseCase.SOCIAL_CONTENT,
-            profile_override=None,
-            deep_research=False,
-            multimodal=False
-        )
-
-        # Call the chain via ProviderChain.invoke
-        success, result, provider_name = asyncio.run(
-            chain.invoke(
-                "generate",
-                prompt=prompt
-            )
-        )
-
-        if not success or not result:
-            logger.warning(f"Social Calendar: LLM returned failure via {provider_name}")
-            return None
-
-        # Extract response text
-        response_text = result if isinstance(result, str) else result.get("content", "")
+    async with _llm_slot():
+        success, result, provider_name = await chain.invoke("generate", prompt=prompt)
+
+    if not success or not result:
+        logger.warning(f"Social Calendar: LLM batch returned failure via {provider_name}")
+        return {}
+
+    data = _parse_json_response(result)
+    entries = data.get("days") if isinstance(data, dict) else data
+    if not isinstance(entries, list):
+        return {}
+
+    wanted = {d["day"] for d in chunk}
+    captions: Dict[int, dict] = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        try:
+            day_num = int(entry.get("day"))
+        except (TypeError, ValueError):
+            continue
+        caption = _parse_caption(entry)
+        if day_num in wanted and caption and day_num not in captions:
+            captions[day_num] = caption
+    return captions
+
+
+def _brief_context(brief: ClientInputBrief) -> str:
+    """Brand/audience/goal block for the caption prompts."""
+    brand_name = brief.brand.brand_name
+    category = brief.brand.industry or "their category"
+    audience = brief.audience.primary_customer or "their audience"
+    goals = brief.goal.primary_goal or "achieve business growth"
+    return f"""Brand: {brand_name}
+Category: {category}
+Target Audience: {audience}
+Primary Goal: {goals}"""
 
-        if not response_text or not response_text.strip():
-            return None
 
-        # Parse JSON response
-        response_text = response_text.strip()
-        if response_text.startswith("```"):
-            response_text = response_text[response_text.find("{") : response_text.rfind("}") + 1]
+# ```json / ```JSON / bare ``` fences around a response body
+_CODE_FENCE = re.compile(r"^```[a-z]*\s*(.*?)\s*```$", re.S | re.I)
 
-        data = json.loads(response_text)
-        if not isinstance(data, dict):
-            return None
 
-        hook = data.get("hook", "").strip()
-        cta = data.get("cta", "").strip()
+def _parse_json_response(result: Any) -> Any:
+    """Decode a chain result (str or {"content": str}), tolerating code fences."""
+    response_text = result if isinstance(result, str) else result.get("content", "")
+    if not response_text or not response_text.strip():
+        return None
 
-        if hook and cta:
-            return {"hook": hook, "cta": cta}
+    response_text = response_text.strip()
+    fenced = _CODE_FENCE.match(response_text)
+    if fenced:
+        response_text = fenced.group(1)
 
+    try:
+        return json.loads(response_text)
+    except ValueError:
         return None
 
-    except Exception as e:
-        logger.debug(f"LLM caption generation failed for day {day_num}: {e}")
+
+def _parse_caption(data: dict) -> Optional[dict]:
+    """Validated {"hook", "cta"} from one response object, or None."""
+    hook = data.get("hook")
+    cta = data.get("cta")
+    if not isinstance(hook, str) or not isinstance(cta, str):
         return None
+    hook, cta = hook.strip(), cta.strip()
+    if hook and cta:
+        return {"hook": hook, "cta": cta}
+    return None
 
 
 def _generate_stub_caption_for_day(
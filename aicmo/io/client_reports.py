@@ -343,6 +343,8 @@ class AICMOOutputReport(BaseModel):
     competitor_visual_benchmark: Optional[List[Dict]] = None
     # WOW: Optional markdown wrapped in WOW template
     wow_markdown: Optional[str] = None
+    # WOW: section map rendered with wow_markdown (id, title, body, content per section)
+    wow_sections: Optional[List[Dict[str, str]]] = None
     wow_package_key: Optional[str] = None
 
 
@@ -13,6 +13,7 @@ import os
 from datetime import datetime, timedelta
 
 from aicmo.memory.engine import DEFAULT_DB_PATH
+from aicmo.shared.db import get_sqlite_connection
 
 
 class KaizenContext(BaseModel):
@@ -74,8 +75,8 @@ class KaizenService:
         self.db_path = db_path or os.getenv("AICMO_MEMORY_DB", DEFAULT_DB_PATH)
     
     def _get_conn(self) -> sqlite3.Connection:
-        """Get database connection."""
-        return sqlite3.connect(self.db_path)
+        """Get this thread's long-lived connection to the memory database."""
+        return get_sqlite_connection(self.db_path)
     
     def _query_events(
         self,
@@ -0,0 +1,361 @@
+"""
+LLM response cache shared by every generator.
+
+Responses are stored in SQLite (AICMO_LLM_CACHE_PATH, by default under
+~/.cache/aicmo) keyed by a hash of (provider, model, normalised prompt,
+temperature, max_tokens and every other request option that can change the
+output), with a TTL and least-recently-used eviction beyond
+AICMO_LLM_CACHE_MAX_ENTRIES.
+
+Whether a call is cached (should_cache):
+1. Per call: cache=True / cache=False always wins
+2. Per use-case: LLM_CACHE_OPT_OUT_USE_CASES are never cached
+3. AICMO_LLM_CACHE_MODE:
+   - "deterministic" (default): temperature-0 calls and LLM_CACHE_USE_CASES
+   - "all": every call
+   - "off": nothing
+
+Wired into:
+- ProviderChain.invoke (chains from aicmo.llm.router.get_llm_client)
+- backend.services.llm_client.LLMClient.generate
+- aicmo.llm.client._rewrite_text_block
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+from aicmo.shared.config import settings
+from aicmo.shared import metrics
+from aicmo.shared.db import get_sqlite_connection
+
+logger = logging.getLogger(__name__)
+
+# Entries written between LRU/TTL sweeps
+_EVICT_EVERY = 64
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_response_cache (
+    key TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    tokens INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_llm_response_cache_last_access
+    ON llm_response_cache (last_access);
+"""
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Collapse whitespace so formatting-only differences share an entry."""
+    return " ".join(prompt.split())
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token)."""
+    return (len(text) + 3) // 4
+
+
+# Call kwargs that never change a response; every other kwarg is part of the key
+NON_OUTPUT_KWARGS = frozenset({
+    "prompt", "temperature", "max_tokens",  # keyed explicitly
+    "timeout", "request_timeout", "user", "request_id", "trace_id", "metadata", "stream",
+})
+
+
+def make_cache_key(
+    provider: str,
+    model: str,
+    prompt: str,
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+    options: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Content address of one LLM request.
+
+    options holds any other request parameters (system prompt, top_p,
+    response format, tools, ...); non-JSON values are keyed by repr().
+    """
+    parts = [provider, model, normalize_prompt(prompt), temperature, max_tokens]
+    if options:
+        parts.append(options)
+    payload = json.dumps(parts, separators=(",", ":"), sort_keys=True, default=repr)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _use_case_set(value: str) -> set:
+    return {item.strip().upper() for item in value.split(",") if item.strip()}
+
+
+def should_cache(
+    use_case: Optional[str] = None,
+    temperature: Optional[float] = None,
+    cache: Optional[bool] = None,
+) -> bool:
+    """Apply the per-call, per-use-case and mode policy (see module docstring)."""
+    mode = settings.LLM_CACHE_MODE.lower()
+    if mode == "off":
+        return False
+    if cache is not None:
+        return cache
+    use_case = str(getattr(use_case, "value", use_case or "")).upper()
+    if use_case and use_case in _use_case_set(settings.LLM_CACHE_OPT_OUT_USE_CASES):
+        return False
+    if mode == "all":
+        return True
+    if temperature is not None and temperature <= 0:
+        return True
+    return bool(use_case) and use_case in _use_case_set(settings.LLM_CACHE_USE_CASES)
+
+
+class LLMResponseCache:
+    """
+    SQLite-backed response store with TTL, LRU eviction and hit/miss counters.
+
+    Counters are per process: hits, misses, stores, evictions and
+    saved_tokens (estimated prompt + completion tokens of every hit).
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+    ):
+        self.path = os.path.expanduser(path or settings.LLM_CACHE_PATH)
+        self.max_entries = max_entries if max_entries is not None else settings.LLM_CACHE_MAX_ENTRIES
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.LLM_CACHE_TTL_SECONDS
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "saved_tokens": 0}
+        self._writes_since_sweep = 0
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._conn()
+        conn.executescript(_SCHEMA)
+        conn.commit()
+
+    def _conn(self):
+        return get_sqlite_connection(self.path)
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += amount
+
+    def get(self, *keys: str) -> Optional[Tuple[str, str]]:
+        """
+        First live entry among keys, as (key, response); counts one hit or miss.
+        """
+        now = time.time()
+        conn = self._conn()
+        try:
+            for key in keys:
+                row = conn.execute(
+                    "SELECT response, tokens, created_at FROM llm_response_cache WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    continue
+                response, tokens, created_at = row
+                if self.ttl_seconds and created_at + self.ttl_seconds < now:
+                    conn.execute("DELETE FROM llm_response_cache WHERE key = ?", (key,))
+                    conn.commit()
+                    continue
+                conn.execute(
+                    "UPDATE llm_response_cache SET last_access = ?, hits = hits + 1 WHERE key = ?",
+                    (now, key),
+                )
+                conn.commit()
+                self._count("hits")
+                self._count("saved_tokens", tokens)
+                metrics.record_cache("llm", hits=1)
+                return key, response
+        except Exception as e:
+            logger.debug(f"LLM cache lookup failed: {e}")
+            conn.rollback()
+        self._count("misses")
+        metrics.record_cache("llm", misses=1)
+        return None
+
+    def put(
+        self,
+        key: str,
+        response: str,
+        provider: str = "",
+        model: str = "",
+        tokens: Optional[int] = None,
+    ) -> None:
+        """Store (or refresh) a response."""
+        now = time.time()
+        conn = self._conn()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_response_cache "
+                "(key, provider, model, response, tokens, created_at, last_access, hits) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, 0)",
+                (key, provider, model, response,
+                 tokens if tokens is not None else estimate_tokens(response), now, now),
+            )
+            conn.commit()
+        except Exception as e:
+            logger.debug(f"LLM cache store failed: {e}")
+            conn.rollback()
+            return
+        self._count("stores")
+
+        with self._lock:
+            self._writes_since_sweep += 1
+            sweep = self._writes_since_sweep >= _EVICT_EVERY
+            if sweep:
+                self._writes_since_sweep = 0
+        if sweep:
+            self.evict()
+
+    def evict(self) -> int:
+        """Drop expired entries and the least recently used beyond max_entries."""
+        conn = self._conn()
+        removed = 0
+        try:
+            if self.ttl_seconds:
+                removed += conn.execute(
+                    "DELETE FROM llm_response_cache WHERE created_at < ?",
+                    (time.time() - self.ttl_seconds,),
+                ).rowcount
+            if self.max_entries:
+                (total,) = conn.execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()
+                if total > self.max_entries:
+                    removed += conn.execute(
+                        "DELETE FROM llm_response_cache WHERE key IN ("
+                        "SELECT key FROM llm_response_cache ORDER BY last_access LIMIT ?)",
+                        (total - self.max_entries,),
+                    ).rowcount
+            conn.commit()
+        except Exception as e:
+            logger.debug(f"LLM cache eviction failed: {e}")
+            conn.rollback()
+            return 0
+        self._count("evictions", removed)
+        return removed
+
+    def clear(self) -> None:
+        conn = self._conn()
+        conn.execute("DELETE FROM llm_response_cache")
+        conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+        lookups = counters["hits"] + counters["misses"]
+        counters["hit_rate"] = round(counters["hits"] / lookups, 4) if lookups else 0.0
+        try:
+            (counters["entries"],) = self._conn().execute(
+                "SELECT COUNT(*) FROM llm_response_cache"
+            ).fetchone()
+        except Exception:
+            counters["entries"] = None
+        return counters
+
+
+_cache: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[LLMResponseCache]:
+    """Process-wide cache, or None when AICMO_LLM_CACHE_MODE=off or unavailable."""
+    global _cache
+    if settings.LLM_CACHE_MODE.lower() == "off":
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                try:
+                    _cache = LLMResponseCache()
+                except Exception as e:
+                    logger.warning(f"LLM response cache unavailable: {e}")
+                    return None
+    return _cache
+
+
+def reset_response_cache() -> None:
+    """Forget the process-wide cache (tests, path changes)."""
+    global _cache
+    with _cache_lock:
+        _cache = None
+
+
+class ChainResponseCache:
+    """
+    ProviderChain adapter: caches results of one use-case's chain.
+
+    Keys use the provider wrapper name ("provider/model") and every call
+    kwarg except NON_OUTPUT_KWARGS (transport-only options such as timeout).
+    Results are stored as JSON so both str and dict responses round-trip.
+    """
+
+    def __init__(self, use_case: str, cache: Optional[LLMResponseCache] = None):
+        self.use_case = str(getattr(use_case, "value", use_case)).upper()
+        self._cache = cache
+
+    @property
+    def cache(self) -> Optional[LLMResponseCache]:
+        return self._cache or get_response_cache()
+
+    def enabled_for(self, kwargs: Dict[str, Any], cache: Optional[bool] = None) -> bool:
+        if not isinstance(kwargs.get("prompt"), str) or self.cache is None:
+            return False
+        return should_cache(self.use_case, kwargs.get("temperature"), cache)
+
+    def _key(self, provider_name: str, method_name: str, kwargs: Dict[str, Any]) -> str:
+        provider, _, model = provider_name.partition("/")
+        options = {k: v for k, v in kwargs.items() if k not in NON_OUTPUT_KWARGS}
+        return make_cache_key(
+            f"{provider}:{method_name}", model, kwargs["prompt"],
+            kwargs.get("temperature"), kwargs.get("max_tokens"), options,
+        )
+
+    def lookup(
+        self, provider_names: Sequence[str], method_name: str, kwargs: Dict[str, Any]
+    ) -> Optional[Tuple[str, Any]]:
+        """(provider_name, result) of the first provider with a cached answer."""
+        keys = {self._key(name, method_name, kwargs): name for name in provider_names}
+        found = self.cache.get(*keys)
+        if found is None:
+            return None
+        key, response = found
+        return keys[key], json.loads(response)
+
+    def store(self, provider_name: str, method_name: str, kwargs: Dict[str, Any], result: Any) -> None:
+        if result is None:
+            return
+        try:
+            payload = json.dumps(result)
+        except (TypeError, ValueError):
+            return
+        provider, _, model = provider_name.partition("/")
+        self.cache.put(
+            self._key(provider_name, method_name, kwargs), payload, provider=provider, model=model,
+            tokens=estimate_tokens(kwargs["prompt"]) + estimate_tokens(payload),
+        )
+
+
+__all__ = [
+    "LLMResponseCache",
+    "ChainResponseCache",
+    "get_response_cache",
+    "reset_response_cache",
+    "make_cache_key",
+    "NON_OUTPUT_KWARGS",
+    "normalize_prompt",
+    "estimate_tokens",
+    "should_cache",
+]
@@ -6,6 +6,10 @@ import os
 from typing import Any, Optional, Literal
 
 from aicmo.io.client_reports import ClientInputBrief, AICMOOutputReport
+from aicmo.llm.cache import get_response_cache, make_cache_key, should_cache
+
+_SYSTEM_PROMPT = "You are a senior marketing strategist helping refine marketing copy."
+_OPENAI_TEMPERATURE = 0.7
 
 
 def _get_llm_provider() -> Literal["claude", "openai"]:
@@ -58,12 +62,15 @@ def _rewrite_text_block(
     original_text: str,
     max_tokens: int = 600,
     provider: Literal["claude", "openai"] = "claude",
+    cache: Optional[bool] = None,
 ) -> str:
     """
     Ask the LLM to refine / polish a single text block.
 
     If anything goes wrong, returns the original text unchanged.
     Supports both Claude (via Anthropic) and OpenAI APIs.
+    Rewrites go through the shared response cache when its policy (or
+    cache=True) allows.
     """
     if not original_text or not original_text.strip():
         return original_text
@@ -94,12 +101,22 @@ IMPORTANT:
 - Output ONLY the rewritten text, no explanations.
 """.strip()
 
+        temperature = None if provider == "claude" else _OPENAI_TEMPERATURE
+        response_cache = get_response_cache() if should_cache(temperature=temperature, cache=cache) else None
+        if response_cache is not None:
+            cache_key = make_cache_key(
+                provider, model, f"{_SYSTEM_PROMPT}\n{prompt}", temperature, max_tokens
+            )
+            cached = response_cache.get(cache_key)
+            if cached is not None:
+                return cached[1]
+
         if provider == "claude":
             # Use Anthropic Claude API
             response = client.messages.create(
                 model=model,
                 max_tokens=max_tokens,
-                system="You are a senior marketing strategist helping refine marketing copy.",
+                system=_SYSTEM_PROMPT,
                 messages=[
                     {"role": "user", "content": prompt},
                 ],
@@ -112,18 +129,21 @@ IMPORTANT:
                 messages=[
                     {
                         "role": "system",
-                        "content": "You are a senior marketing strategist helping refine marketing copy.",
+                        "content": _SYSTEM_PROMPT,
                     },
                     {"role": "user", "content": prompt},
                 ],
                 max_tokens=max_tokens,
-                temperature=0.7,
+                temperature=_OPENAI_TEMPERATURE,
             )
             new_text = response.choices[0].message.content
 
         if not new_text:
             return original_text
-        return str(new_text).strip()
+        new_text = str(new_text).strip()
+        if response_cache is not None:
+            response_cache.put(cache_key, new_text, provider=provider, model=model)
+        return new_text
     except Exception:
         # Fallback: never break the flow if the LLM call fails
         return original_text
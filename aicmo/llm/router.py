@@ -10,12 +10,19 @@ Profiles (cost/capability tradeoff):
 - research: Web search + deep reasoning (perplexity, sonar, gemini-pro)
 
 Use-cases map to default profiles + override from environment.
+
+Chains are long-lived: get_llm_client() returns the same ProviderChain for the
+same (use-case, profile, flags, provider list), and adapters are shared across
+chains, so provider health and HTTP connection pools survive between calls.
 """
 
 from enum import Enum
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 import os
 import logging
+import threading
+
+from aicmo.shared.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -137,6 +144,27 @@ def get_profile_for_usecase(use_case: str, profile_override: Optional[str] = Non
     return default
 
 
+def get_hedge_budget_ratio(use_case: str) -> float:
+    """
+    Hedging budget (extra provider calls per request) for a use-case.
+    
+    Priority:
+    1. LLM_HEDGE_BUDGET_<USE_CASE> env var (if set)
+    2. AICMO_LLM_HEDGE_BUDGET_RATIO
+    
+    Returns 0.0 (no hedging) unless AICMO_LLM_HEDGE_ENABLED is set.
+    """
+    if not settings.LLM_HEDGE_ENABLED:
+        return 0.0
+    env_ratio = os.getenv(f"LLM_HEDGE_BUDGET_{use_case.upper()}")
+    if env_ratio:
+        try:
+            return max(float(env_ratio), 0.0)
+        except ValueError:
+            logger.warning(f"Ignoring invalid LLM_HEDGE_BUDGET_{use_case.upper()}={env_ratio!r}")
+    return max(settings.LLM_HEDGE_BUDGET_RATIO, 0.0)
+
+
 # ==============================================================================
 # PROVIDER CONFIGURATION & FILTERING
 # ==============================================================================
@@ -252,6 +280,35 @@ def _instantiate_adapter(provider: str, api_key: Optional[str] = None) -> Option
         return None
 
 
+# Process-wide registries: chains by routing key, wrappers by provider/model
+# (so health is shared by every chain using that model), adapters by provider
+_llm_chains: Dict[Tuple, Any] = {}
+_llm_wrappers: Dict[str, Any] = {}
+_llm_adapters: Dict[str, Any] = {}
+_llm_hedge_budgets: Dict[str, Any] = {}
+_llm_registry_lock = threading.Lock()
+
+
+def _get_adapter(provider: str) -> Optional[Any]:
+    """Shared adapter instance for provider (created on first use)."""
+    key = provider.lower()
+    adapter = _llm_adapters.get(key)
+    if adapter is None:
+        adapter = _instantiate_adapter(provider)
+        if adapter is not None:
+            _llm_adapters[key] = adapter
+    return adapter
+
+
+def reset_llm_clients() -> None:
+    """Forget cached chains and adapters (tests, API key rotation)."""
+    with _llm_registry_lock:
+        _llm_chains.clear()
+        _llm_wrappers.clear()
+        _llm_adapters.clear()
+        _llm_hedge_budgets.clear()
+
+
 def get_llm_client(
     use_case: str,
     profile_override: Optional[str] = None,
@@ -264,10 +321,10 @@ def get_llm_client(
     Steps:
     1. Determine effective profile (override → env var → default)
     2. Build provider config from profile
-    3. Instantiate adapters for each provider
-    4. Wrap adapters in ProviderWrapper
-    5. Register with self_check_registry (if available)
-    6. Create & return ProviderChain
+    3. Reuse the registered chain for this configuration, if any
+    4. Otherwise instantiate (or reuse) adapters for each provider
+    5. Wrap adapters in ProviderWrapper
+    6. Create, register & return ProviderChain
     
     Args:
         use_case: Use-case string (e.g., "SOCIAL_CONTENT")
@@ -276,15 +333,10 @@ def get_llm_client(
         multimodal: If True, prioritize multimodal-capable models
     
     Returns:
-        ProviderChain instance configured for the use-case
+        ProviderChain instance configured for the use-case (shared across calls)
     """
     effective_profile = get_profile_for_usecase(use_case, profile_override)
     
-    logger.info(
-        f"Creating LLM chain for {use_case} with profile={effective_profile} "
-        f"(deep_research={deep_research}, multimodal={multimodal})"
-    )
-    
     # Build provider configuration
     providers_config = build_provider_config(
         profile=effective_profile,
@@ -298,20 +350,57 @@ def get_llm_client(
         # TODO: Return no-op chain or raise error depending on requirements
         raise ValueError(f"No LLM providers available for profile {effective_profile}")
     
+    # The provider list is part of the key, so env-driven changes get a new chain
+    key = (
+        str(getattr(use_case, "value", use_case)).upper(),
+        str(getattr(effective_profile, "value", effective_profile)),
+        bool(deep_research),
+        bool(multimodal),
+        tuple((c.get("provider"), c.get("model")) for c in providers_config),
+    )
+    chain = _llm_chains.get(key)
+    if chain is not None:
+        return chain
+    
+    with _llm_registry_lock:
+        chain = _llm_chains.get(key)
+        if chain is None:
+            chain = _create_llm_chain(use_case, effective_profile, providers_config, deep_research, multimodal)
+            _llm_chains[key] = chain
+    return chain
+
+
+def _create_llm_chain(
+    use_case: str,
+    effective_profile: str,
+    providers_config: List[Dict[str, str]],
+    deep_research: bool,
+    multimodal: bool,
+):
+    """Build a ProviderChain from shared adapters (caller holds the registry lock)."""
+    logger.info(
+        f"Creating LLM chain for {use_case} with profile={effective_profile} "
+        f"(deep_research={deep_research}, multimodal={multimodal})"
+    )
+    
     # Instantiate and wrap adapters
     wrappers = []
     for provider_config in providers_config:
         provider_name = provider_config.get("provider")
         model = provider_config.get("model")
         
-        # Instantiate adapter
-        adapter = _instantiate_adapter(provider_name)
+        # Reuse the adapter (and its connection pool) across chains
+        adapter = _get_adapter(provider_name)
         if adapter is None:
             logger.debug(f"Skipping {provider_name}: adapter not available")
             continue
         
-        # Wrap in ProviderWrapper for chain integration
-        wrapper = _wrap_adapter(adapter, provider_name, model)
+        # Wrap in ProviderWrapper for chain integration (one per provider/model)
+        wrapper_key = f"{provider_name}/{model}"
+        wrapper = _llm_wrappers.get(wrapper_key)
+        if wrapper is None or wrapper.provider is not adapter:
+            wrapper = _wrap_adapter(adapter, provider_name, model)
+            _llm_wrappers[wrapper_key] = wrapper
         wrappers.append(wrapper)
     
     if not wrappers:
@@ -325,12 +414,25 @@ def get_llm_client(
     
     # Create and return ProviderChain
     try:
-        from aicmo.gateways.provider_chain import ProviderChain
+        from aicmo.gateways.provider_chain import HedgeBudget, ProviderChain
+        
+        # One hedging budget per use-case, shared by its chains
+        use_case_name = str(getattr(use_case, "value", use_case)).upper()
+        hedge_budget = _llm_hedge_budgets.get(use_case_name)
+        if hedge_budget is None:
+            ratio = get_hedge_budget_ratio(use_case_name)
+            if ratio > 0:
+                hedge_budget = _llm_hedge_budgets[use_case_name] = HedgeBudget(ratio=ratio)
+        
+        from aicmo.llm.cache import ChainResponseCache
+        
         chain = ProviderChain(
             capability_name="llm",  # ← Correct parameter name
             providers=wrappers,
             is_dry_run=False,
             max_fallback_attempts=None,  # Try all providers
+            hedge_budget=hedge_budget,
+            response_cache=ChainResponseCache(use_case_name),
         )
         return chain
     except ImportError:
@@ -361,6 +463,7 @@ def _wrap_adapter(adapter: Any, provider_name: str, model: str):
         is_dry_run=adapter.dry_run,  # Respect adapter's dry_run setting
         health_threshold_failures=3,  # Mark unhealthy after 3 consecutive failures
         health_threshold_successes=5,  # Mark healthy after 5 consecutive successes
+        timeout_seconds=settings.LLM_ATTEMPT_TIMEOUT_SECONDS or None,  # Fail over from hung providers
     )
     
     return wrapper
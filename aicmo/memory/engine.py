@@ -15,6 +15,8 @@ from typing import Iterable, List, Optional, Sequence, Tuple
 import numpy as np
 from openai import OpenAI
 
+from aicmo.shared.db import get_sqlite_connection
+
 # Config
 
 logger = logging.getLogger(__name__)
@@ -101,7 +103,7 @@ class MemoryItem:
 def _ensure_db(db_path: str = DEFAULT_DB_PATH) -> None:
     """Create memory DB and table if they don't exist."""
     Path(db_path).parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(db_path)
+    conn = get_sqlite_connection(db_path)
     try:
         cur = conn.cursor()
         cur.execute(
@@ -124,9 +126,13 @@ def _ensure_db(db_path: str = DEFAULT_DB_PATH) -> None:
 
 
 def _get_conn(db_path: str = DEFAULT_DB_PATH) -> sqlite3.Connection:
-    """Get a connection to the memory DB, creating it if needed."""
+    """Get a connection to the memory DB, creating it if needed.
+
+    The connection is long-lived per thread (aicmo.shared.db); close() only
+    rolls back uncommitted work.
+    """
     _ensure_db(db_path)
-    return sqlite3.connect(db_path)
+    return get_sqlite_connection(db_path)
 
 
 # -------------------------------------------------------------------
@@ -193,6 +199,39 @@ def _embed_texts(
 # -------------------------------------------------------------------
 
 
+def _insert_items(
+    conn: sqlite3.Connection,
+    kind: str,
+    titles: Sequence[str],
+    texts: Sequence[str],
+    embeddings: Sequence[Sequence[float]],
+    project_id: Optional[str],
+    tags: Sequence[str],
+    created_at: str,
+) -> List[int]:
+    """Insert embedded blocks without committing; returns the new row ids."""
+    cur = conn.cursor()
+    ids: List[int] = []
+    for title, text, emb in zip(titles, texts, embeddings):
+        cur.execute(
+            """
+            INSERT INTO memory_items (kind, project_id, title, text, tags, created_at, embedding)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                kind,
+                project_id,
+                title,
+                text,
+                json.dumps(list(tags)),
+                created_at,
+                json.dumps(emb),
+            ),
+        )
+        ids.append(cur.lastrowid)
+    return ids
+
+
 def learn_from_blocks(
     kind: str,
     blocks: Sequence[Tuple[str, str]],
@@ -226,23 +265,7 @@ def learn_from_blocks(
 
     conn = _get_conn(db_path)
     try:
-        cur = conn.cursor()
-        for title, text, emb in zip(titles, texts, embeddings):
-            cur.execute(
-                """
-                INSERT INTO memory_items (kind, project_id, title, text, tags, created_at, embedding)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    kind,
-                    project_id,
-                    title,
-                    text,
-                    json.dumps(tags),
-                    now,
-                    json.dumps(emb),
-                ),
-            )
+        _insert_items(conn, kind, titles, texts, embeddings, project_id, tags, now)
         conn.commit()
 
         # Enforce retention policy
@@ -604,58 +627,14 @@ def preload_training_materials() -> None:
     """
     Hard-bind the training ZIP structure into AICMO's runtime memory.
 
-    This ensures AICMO learns from required training materials at startup.
-    Called during app initialization to pre-populate the memory engine
-    with foundational knowledge from the training library.
-    """
-    REQUIRED_FOLDERS = [
-        "01_Frameworks",
-        "02_Agency_Standards",
-        "03_Writing_Systems",
-        "04_Case_Studies",
-        "05_Report_Library",
-        "06_Creative_Library",
-        "07_Messaging_Architecture",
-        "08_Presentation_and_Decks",
-    ]
-
-    data_path = Path("data/training")
-    if not data_path.exists():
-        logger.warning(
-            f"Training materials not found at {data_path}. "
-            "AICMO will proceed without pre-loaded training data. "
-            "To enable training, create data/training/ with required folders."
-        )
-        return
-
-    logger.info(f"🔄 Pre-loading training materials from {data_path}...")
-
-    for folder in REQUIRED_FOLDERS:
-        folder_path = data_path / folder
-        if folder_path.exists():
-            logger.debug(f"📚 Loading {folder}...")
-            blocks = []
-            # Collect all text files in this folder
-            for file_path in folder_path.glob("**/*.txt"):
-                try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        content = f.read()
-                    blocks.append((f"{folder}: {file_path.stem}", content))
-                except Exception as e:
-                    logger.debug(f"Could not load {file_path}: {e}")
-
-            # Learn from collected blocks
-            if blocks:
-                learn_from_blocks(
-                    kind="training_material",
-                    blocks=blocks,
-                    project_id="default",
-                    tags=[folder, "training"],
-                )
-        else:
-            logger.debug(f"⏭️  Folder not found: {folder}")
+    Synchronous, incremental sync of data/training (see aicmo.memory.training):
+    only new or changed files are embedded, rows of removed files are dropped.
+    The API runs the same sync in the background at startup.
+    """
+    from aicmo.memory.training import sync_training_materials
 
-    logger.info("✅ Training materials pre-loaded into memory engine")
+    logger.info("🔄 Syncing training materials into memory engine...")
+    sync_training_materials()
 
 
 def sample_training_pattern(pattern_type: str = "copywriting") -> str:
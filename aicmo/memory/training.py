@@ -0,0 +1,277 @@
+"""
+Incremental ingestion of the training library (data/training) into memory.
+
+A manifest table in the memory DB records (path, mtime, size, sha256, row
+ids) for every ingested file, so a sync only:
+- embeds and inserts files that are new or whose content changed
+- deletes memory_items rows of files that changed or were removed
+- stats unchanged files (no read, no embedding call)
+
+Repeated syncs are idempotent. Restart cost is one stat per file plus two
+queries, independent of how much text the library holds.
+
+The API starts a sync in a background thread (start_background_sync) and
+reports progress through get_ingest_status().
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime as dt
+import hashlib
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from aicmo.memory import engine
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TRAINING_PATH = "data/training"
+TRAINING_KIND = "training_material"
+TRAINING_PROJECT_ID = "default"
+
+TRAINING_FOLDERS = [
+    "01_Frameworks",
+    "02_Agency_Standards",
+    "03_Writing_Systems",
+    "04_Case_Studies",
+    "05_Report_Library",
+    "06_Creative_Library",
+    "07_Messaging_Architecture",
+    "08_Presentation_and_Decks",
+]
+
+_MANIFEST_SCHEMA = """
+CREATE TABLE IF NOT EXISTS training_manifest (
+    path TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    item_ids TEXT NOT NULL,
+    ingested_at TEXT NOT NULL
+)
+"""
+
+
+@dataclasses.dataclass
+class IngestProgress:
+    """Progress of the current (or last) training sync."""
+
+    state: str = "idle"  # idle | running | completed | failed
+    total_files: int = 0
+    processed_files: int = 0
+    added: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    failed: int = 0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = dataclasses.asdict(self)
+        if self.started_at is not None:
+            end = self.finished_at or time.time()
+            data["duration_seconds"] = round(end - self.started_at, 3)
+        return data
+
+
+_progress = IngestProgress()
+_progress_lock = threading.Lock()
+_sync_thread: Optional[threading.Thread] = None
+
+
+def _update(**changes: Any) -> None:
+    with _progress_lock:
+        for name, value in changes.items():
+            setattr(_progress, name, value)
+
+
+def _bump(name: str) -> None:
+    with _progress_lock:
+        setattr(_progress, name, getattr(_progress, name) + 1)
+
+
+def get_ingest_status() -> Dict[str, Any]:
+    """Snapshot of the training sync progress."""
+    with _progress_lock:
+        return _progress.to_dict()
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _scan(data_path: Path) -> Dict[str, Path]:
+    """Training files keyed by their path relative to data_path."""
+    files: Dict[str, Path] = {}
+    for folder in TRAINING_FOLDERS:
+        folder_path = data_path / folder
+        if not folder_path.exists():
+            logger.debug(f"⏭️  Folder not found: {folder}")
+            continue
+        for file_path in sorted(folder_path.glob("**/*.txt")):
+            files[file_path.relative_to(data_path).as_posix()] = file_path
+    return files
+
+
+def _delete_items(conn, item_ids: List[int]) -> None:
+    if item_ids:
+        conn.executemany("DELETE FROM memory_items WHERE id = ?", [(i,) for i in item_ids])
+
+
+def _ingest_file(conn, rel_path: str, file_path: Path, stat, sha256: str, old_ids: List[int]) -> None:
+    """Embed one file and swap its rows and manifest entry in one transaction."""
+    folder = rel_path.split("/", 1)[0]
+    text = file_path.read_text(encoding="utf-8")
+    embeddings = engine._embed_texts([text])
+    now = dt.datetime.now(dt.timezone.utc).isoformat()
+    try:
+        _delete_items(conn, old_ids)
+        ids = engine._insert_items(
+            conn,
+            TRAINING_KIND,
+            [f"{folder}: {file_path.stem}"],
+            [text],
+            embeddings,
+            TRAINING_PROJECT_ID,
+            [folder, "training"],
+            now,
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO training_manifest "
+            "(path, mtime, size, sha256, item_ids, ingested_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (rel_path, stat.st_mtime, stat.st_size, sha256, json.dumps(ids), now),
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def sync_training_materials(
+    data_path: str = DEFAULT_TRAINING_PATH,
+    db_path: str = engine.DEFAULT_DB_PATH,
+) -> Dict[str, Any]:
+    """
+    Bring memory_items in line with the training library on disk.
+
+    Returns the final progress snapshot (see get_ingest_status).
+    """
+    root = Path(data_path)
+    _update(**dataclasses.asdict(IngestProgress(state="running", started_at=time.time())))
+
+    if not root.exists():
+        logger.warning(
+            f"Training materials not found at {root}. "
+            "AICMO will proceed without pre-loaded training data. "
+            "To enable training, create data/training/ with required folders."
+        )
+        _update(state="completed", finished_at=time.time())
+        return get_ingest_status()
+
+    try:
+        conn = engine._get_conn(db_path)
+        conn.execute(_MANIFEST_SCHEMA)
+        conn.commit()
+
+        manifest = {
+            row[0]: {"mtime": row[1], "size": row[2], "sha256": row[3], "item_ids": json.loads(row[4])}
+            for row in conn.execute(
+                "SELECT path, mtime, size, sha256, item_ids FROM training_manifest"
+            )
+        }
+        live_ids = {
+            row[0]
+            for row in conn.execute("SELECT id FROM memory_items WHERE kind = ?", (TRAINING_KIND,))
+        }
+        files = _scan(root)
+        _update(total_files=len(files))
+
+        # Rows of removed files, plus untracked training rows left by earlier
+        # full re-ingests (duplicates)
+        removed = [path for path in manifest if path not in files]
+        for path in removed:
+            _delete_items(conn, manifest.pop(path)["item_ids"])
+            conn.execute("DELETE FROM training_manifest WHERE path = ?", (path,))
+        tracked = {i for entry in manifest.values() for i in entry["item_ids"]}
+        _delete_items(conn, sorted(live_ids - tracked))
+        conn.commit()
+        _update(removed=len(removed))
+
+        for rel_path, file_path in files.items():
+            entry = manifest.get(rel_path)
+            try:
+                stat = file_path.stat()
+                # Rows may have been evicted by the retention policy
+                intact = entry is not None and set(entry["item_ids"]) <= live_ids
+                if intact and entry["mtime"] == stat.st_mtime and entry["size"] == stat.st_size:
+                    _bump("unchanged")
+                    continue
+                sha256 = _sha256(file_path)
+                if intact and entry["sha256"] == sha256:
+                    conn.execute(
+                        "UPDATE training_manifest SET mtime = ?, size = ? WHERE path = ?",
+                        (stat.st_mtime, stat.st_size, rel_path),
+                    )
+                    conn.commit()
+                    _bump("unchanged")
+                    continue
+                _ingest_file(
+                    conn, rel_path, file_path, stat, sha256, entry["item_ids"] if entry else []
+                )
+                _bump("updated" if entry else "added")
+            except Exception as e:
+                logger.debug(f"Could not load {file_path}: {e}")
+                _bump("failed")
+            finally:
+                _bump("processed_files")
+
+        _update(state="completed", finished_at=time.time())
+    except Exception as e:
+        logger.error(f"Training sync failed: {e}")
+        _update(state="failed", error=str(e), finished_at=time.time())
+
+    status = get_ingest_status()
+    logger.info(
+        "✅ Training sync: %s added, %s updated, %s unchanged, %s removed",
+        status["added"], status["updated"], status["unchanged"], status["removed"],
+    )
+    return status
+
+
+def start_background_sync(
+    data_path: str = DEFAULT_TRAINING_PATH,
+    db_path: str = engine.DEFAULT_DB_PATH,
+) -> threading.Thread:
+    """Run sync_training_materials in a daemon thread; reuses a sync already running."""
+    global _sync_thread
+    with _progress_lock:
+        if _sync_thread is not None and _sync_thread.is_alive():
+            return _sync_thread
+        _sync_thread = threading.Thread(
+            target=sync_training_materials,
+            args=(data_path, db_path),
+            name="aicmo-training-sync",
+            daemon=True,
+        )
+        _sync_thread.start()
+        return _sync_thread
+
+
+__all__ = [
+    "IngestProgress",
+    "TRAINING_FOLDERS",
+    "get_ingest_status",
+    "start_background_sync",
+    "sync_training_materials",
+]
@@ -11,7 +11,7 @@ Phase 4 Lane B: Supports dual-mode (inmemory/db) via AICMO_PERSISTENCE_MODE.
 """
 
 from aicmo.shared import settings, is_db_mode
-from aicmo.orchestration.internal.event_bus import InProcessEventBus
+from aicmo.orchestration.internal.event_bus import create_event_bus
 from aicmo.orchestration.internal.saga import SagaCoordinator
 from aicmo.orchestration.internal.workflows.client_to_delivery import ClientToDeliveryWorkflow
 
@@ -64,7 +64,7 @@ class CompositionRoot:
     
     def __init__(self):
         # Orchestration primitives
-        self.event_bus = InProcessEventBus()
+        self.event_bus = create_event_bus()
         self.saga_coordinator = SagaCoordinator()
         
         # Repos - select based on persistence mode
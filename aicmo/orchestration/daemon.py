@@ -4,34 +4,57 @@ Autonomy Orchestration Layer Daemon - Main loop runner.
 Behavior:
 1. Acquire lease (exit if failed)
 2. Read control flags
-3. If paused: sleep and re-loop
+3. If paused: wait and re-loop
 4. If killed: release lease and exit
-5. Process up to MAX_ACTIONS_PER_TICK actions
-6. Enforce MAX_TICK_SECONDS limit (abort if exceeded)
-7. Write tick ledger row
-8. Repeat
+5. Atomically claim up to max_actions_per_tick actions (status → RUNNING),
+   but never more than there are free worker slots
+6. Execute claimed actions concurrently on a bounded worker pool
+7. Enforce MAX_TICK_SECONDS limit (tick is PARTIAL if exceeded; the
+   unfinished actions keep running and keep their worker slots)
+8. Write tick ledger row, update metrics and push a metrics snapshot
+   (aicmo.shared.metrics.push_snapshot, job "aol_daemon")
+9. If the queue is drained, block until an enqueue notification arrives
+   (or IDLE_WAIT_SECONDS elapses), then repeat
 
-Safety limits:
-- MAX_ACTIONS_PER_TICK = 3
+Scaling:
+- Claims are atomic (UPDATE ... RETURNING, SKIP LOCKED on PostgreSQL), so
+  several daemons can share one queue. Set AOL_EXCLUSIVE_LEASE=1 to restore
+  the single-daemon lease.
+- A claim heartbeat extends claim_expires_utc for every action this daemon
+  has claimed and not finished, however long it runs. Only a crashed
+  worker's claims expire (after VISIBILITY_TIMEOUT_SECONDS) and are
+  re-claimed by any live daemon.
+- Dispatch goes through aicmo.orchestration.handlers.ACTION_HANDLERS.
+
+Safety limits (env overrides in brackets):
+- MAX_ACTIONS_PER_TICK = 3 [AOL_MAX_ACTIONS_PER_TICK]
+- WORKER_CONCURRENCY = 4 [AOL_WORKER_CONCURRENCY]
 - MAX_TICK_SECONDS = 20
 - MAX_RETRIES = 3 (per action)
 - HEARTBEAT_INTERVAL_SECONDS = 5 (renew lease)
 """
 
+import json
 import os
 import signal
 import sys
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 
-from sqlalchemy import create_engine, select
+from sqlalchemy import select
 from sqlalchemy.orm import sessionmaker, Session
 
-from aicmo.orchestration.models import AOLControlFlags, AOLTickLedger
+from aicmo.orchestration.models import AOLAction, AOLControlFlags, AOLTickLedger
 from aicmo.orchestration.queue import ActionQueue
 from aicmo.orchestration.lease import LeaseManager
-from aicmo.orchestration.adapters.social_adapter import handle_post_social, RealRunUnconfigured
+from aicmo.orchestration.handlers import get_action_handler
+from aicmo.orchestration.notify import EnqueueWaiter
+from aicmo.orchestration.adapters.social_adapter import RealRunUnconfigured
+from aicmo.shared import metrics
+from aicmo.shared.db import get_engine, track_queries
 
 
 class AOLDaemon:
@@ -40,14 +63,44 @@ class AOLDaemon:
     MAX_ACTIONS_PER_TICK = 3
     MAX_TICK_SECONDS = 20
     HEARTBEAT_INTERVAL_SECONDS = 5
+    WORKER_CONCURRENCY = 4
+    IDLE_WAIT_SECONDS = 1.0
     
-    def __init__(self, db_url: str):
-        """Initialize daemon with database URL."""
+    def __init__(
+        self,
+        db_url: str,
+        worker_concurrency: Optional[int] = None,
+        max_actions_per_tick: Optional[int] = None,
+        exclusive: Optional[bool] = None,
+        visibility_timeout_seconds: Optional[float] = None,
+    ):
+        """Initialize daemon with database URL (pool sizes default from env)."""
         self.db_url = db_url
-        self.engine = create_engine(db_url, future=True)
+        self.engine = get_engine(db_url)
         self.session_maker = sessionmaker(bind=self.engine, expire_on_commit=False)
-        self.lease_manager = LeaseManager(db_url)
+        if exclusive is None:
+            exclusive = os.getenv("AOL_EXCLUSIVE_LEASE", "0") == "1"
+        self.lease_manager = LeaseManager(db_url, exclusive=exclusive)
+        self.owner = self.lease_manager.owner
+        self.worker_concurrency = max(1, worker_concurrency or int(
+            os.getenv("AOL_WORKER_CONCURRENCY", self.WORKER_CONCURRENCY)
+        ))
+        self.max_actions_per_tick = max(1, max_actions_per_tick or int(
+            os.getenv("AOL_MAX_ACTIONS_PER_TICK", self.MAX_ACTIONS_PER_TICK)
+        ))
+        self.visibility_timeout_seconds = (
+            visibility_timeout_seconds or ActionQueue.VISIBILITY_TIMEOUT_SECONDS
+        )
+        # Renew claims well inside the visibility timeout
+        self.claim_heartbeat_seconds = self.visibility_timeout_seconds / 3
         self.running = True
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._last_claimed = 0
+        # Claimed, unfinished actions (queued or running on the pool)
+        self._inflight: Dict[int, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self._heartbeat_stop = threading.Event()
+        self._heartbeat_thread: Optional[threading.Thread] = None
         
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -77,6 +130,7 @@ class AOLDaemon:
         
         tick_count = 0
         session = self.session_maker()
+        waiter = EnqueueWaiter(self.engine)
         
         try:
             while self.running:
@@ -97,24 +151,87 @@ class AOLDaemon:
                     break
                 
                 tick_count += 1
+                if max_ticks and tick_count >= max_ticks:
+                    break
                 
-                # Brief sleep before next tick
-                time.sleep(0.1)
+                # Full batch: more work is likely waiting, claim again immediately.
+                # Otherwise block until an enqueue notification (or idle timeout,
+                # which also picks up scheduled not_before actions).
+                if self._last_claimed < self.max_actions_per_tick:
+                    waiter.wait(self.IDLE_WAIT_SECONDS)
             
             # Clean shutdown
+            self._shutdown_executor()
             self.lease_manager.release(session)
             return 0
         
         except KeyboardInterrupt:
             print("[AOL] Interrupted by user.", file=sys.stderr)
+            self._shutdown_executor()
             self.lease_manager.release(session)
             return 1
         
         except Exception as e:
             print(f"[AOL] Fatal error: {str(e)}", file=sys.stderr)
+            self._shutdown_executor()
             self.lease_manager.release(session)
             return 1
         
+        finally:
+            waiter.close()
+            session.close()
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.worker_concurrency, thread_name_prefix="aol-worker"
+            )
+            self._heartbeat_stop.clear()
+            self._heartbeat_thread = threading.Thread(
+                target=self._claim_heartbeat_loop, name="aol-claim-heartbeat", daemon=True
+            )
+            self._heartbeat_thread.start()
+        return self._executor
+    
+    def _shutdown_executor(self) -> None:
+        """Wait for in-flight actions, then drop the pool (recreated lazily)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            # Claims are only safe to stop renewing once nothing is in flight
+            self._heartbeat_stop.set()
+            self._heartbeat_thread.join()
+            self._heartbeat_thread = None
+    
+    def _free_slots(self) -> int:
+        with self._inflight_lock:
+            return self.worker_concurrency - len(self._inflight)
+    
+    def _track(self, action_id: int, future: Future) -> None:
+        with self._inflight_lock:
+            self._inflight[action_id] = future
+        future.add_done_callback(lambda _: self._untrack(action_id))
+    
+    def _untrack(self, action_id: int) -> None:
+        with self._inflight_lock:
+            self._inflight.pop(action_id, None)
+    
+    def _claim_heartbeat_loop(self) -> None:
+        """Extend the claims of in-flight actions until the pool shuts down."""
+        session = self.session_maker()
+        try:
+            while not self._heartbeat_stop.wait(self.claim_heartbeat_seconds):
+                with self._inflight_lock:
+                    action_ids = list(self._inflight)
+                if not action_ids:
+                    continue
+                try:
+                    ActionQueue.extend_claims(
+                        session, self.owner, action_ids, self.visibility_timeout_seconds
+                    )
+                except Exception as e:
+                    session.rollback()
+                    print(f"[AOL] Claim heartbeat failed: {e}", file=sys.stderr)
         finally:
             session.close()
     
@@ -126,10 +243,12 @@ class AOLDaemon:
             "NORMAL" or "KILLED"
         """
         tick_started = datetime.utcnow()
+        tick_clock = time.perf_counter()
         actions_attempted = 0
         actions_succeeded = 0
         tick_status = "SUCCESS"
         tick_notes = ""
+        self._last_claimed = 0
         
         try:
             # Read control flags
@@ -153,69 +272,59 @@ class AOLDaemon:
             # Read control again to get proof_mode
             proof_mode = flags.proof_mode
             
-            # Dequeue next actions
-            actions = ActionQueue.dequeue_next(session, max_actions=self.MAX_ACTIONS_PER_TICK)
+            executor = self._get_executor()
+            
+            # Actions left running by an earlier PARTIAL tick hold their slots;
+            # wait for one to free up rather than claiming work nobody can start
+            free_slots = self._free_slots()
+            if free_slots <= 0:
+                with self._inflight_lock:
+                    inflight = list(self._inflight.values())
+                remaining = self.MAX_TICK_SECONDS - (datetime.utcnow() - tick_started).total_seconds()
+                wait(inflight, timeout=max(0.0, remaining), return_when=FIRST_COMPLETED)
+                free_slots = self._free_slots()
+            
+            # Atomically claim the next batch (other daemons skip these rows)
+            actions = []
+            if free_slots > 0:
+                actions = ActionQueue.claim_next(
+                    session,
+                    self.owner,
+                    max_actions=min(self.max_actions_per_tick, free_slots),
+                    visibility_timeout_seconds=self.visibility_timeout_seconds,
+                )
+            self._last_claimed = len(actions)
+            actions_attempted = len(actions)
             
+            futures = []
             for action in actions:
-                # Check tick timeout
+                future = executor.submit(
+                    self._execute_action,
+                    action.id,
+                    action.action_type,
+                    action.payload_json,
+                    action.idempotency_key,
+                    proof_mode,
+                )
+                self._track(action.id, future)
+                futures.append(future)
+            
+            remaining = self.MAX_TICK_SECONDS - (datetime.utcnow() - tick_started).total_seconds()
+            done, not_done = wait(futures, timeout=max(0.0, remaining))
+            actions_succeeded = sum(1 for f in done if f.result())
+            
+            if not_done:
                 elapsed = (datetime.utcnow() - tick_started).total_seconds()
-                if elapsed >= self.MAX_TICK_SECONDS:
-                    tick_notes = f"Tick timeout reached after {elapsed:.1f}s. Stopping action processing."
-                    tick_status = "PARTIAL"
-                    break
-                
-                actions_attempted += 1
-                
-                try:
-                    # Dispatch action
-                    if action.action_type == "POST_SOCIAL":
-                        import json
-                        payload = json.loads(action.payload_json) if action.payload_json else {}
-                        payload["idempotency_key"] = action.idempotency_key
-                        handle_post_social(session, action.id, payload, proof_mode=proof_mode)
-                        actions_succeeded += 1
-                    # AICMO_CAMPAIGN_OPS_WIRING_START
-                    elif action.action_type == "CAMPAIGN_TICK":
-                        import json
-                        from aicmo.campaign_ops.actions import handle_campaign_tick
-                        payload = json.loads(action.payload_json) if action.payload_json else {}
-                        payload["idempotency_key"] = action.idempotency_key
-                        handle_campaign_tick(session, action.id, payload, proof_mode=proof_mode)
-                        actions_succeeded += 1
-                    elif action.action_type == "ESCALATE_OVERDUE_TASKS":
-                        import json
-                        from aicmo.campaign_ops.actions import handle_escalate_overdue_tasks
-                        payload = json.loads(action.payload_json) if action.payload_json else {}
-                        payload["idempotency_key"] = action.idempotency_key
-                        handle_escalate_overdue_tasks(session, action.id, payload, proof_mode=proof_mode)
-                        actions_succeeded += 1
-                    elif action.action_type == "WEEKLY_CAMPAIGN_SUMMARY":
-                        import json
-                        from aicmo.campaign_ops.actions import handle_weekly_campaign_summary
-                        payload = json.loads(action.payload_json) if action.payload_json else {}
-                        payload["idempotency_key"] = action.idempotency_key
-                        handle_weekly_campaign_summary(session, action.id, payload, proof_mode=proof_mode)
-                        actions_succeeded += 1
-                    # AICMO_CAMPAIGN_OPS_WIRING_END
-                    else:
-                        # Unknown action type
-                        error_msg = f"Unknown action type: {action.action_type}"
-                        ActionQueue.log_execution(session, action.id, "ERROR", error_msg)
-                        ActionQueue.mark_failed(session, action.id, error_msg)
-                
-                except RealRunUnconfigured:
-                    # Expected error in REAL mode
-                    pass
-                
-                except Exception as e:
-                    # Action failed
-                    error_msg = f"Action execution error: {str(e)}"
-                    ActionQueue.log_execution(session, action.id, "ERROR", error_msg)
-                    ActionQueue.mark_retry(session, action.id, error_msg)
+                tick_notes = (
+                    f"Tick timeout reached after {elapsed:.1f}s. "
+                    f"{len(not_done)} action(s) still running."
+                )
+                tick_status = "PARTIAL"
         
         except Exception as e:
             tick_status = "FAIL"
             tick_notes = f"Tick critical error: {str(e)}"
+            session.rollback()
         
         finally:
             # Write tick ledger
@@ -231,6 +340,7 @@ class AOLDaemon:
             )
             session.add(ledger)
             session.commit()
+            self._record_tick_metrics(session, tick_status, time.perf_counter() - tick_clock)
             
             print(
                 f"[AOL Tick {tick_number}] {tick_status} | "
@@ -240,7 +350,66 @@ class AOLDaemon:
             )
             
             return "NORMAL"
-
+    
+    def _record_tick_metrics(self, session: Session, tick_status: str, seconds: float) -> None:
+        """Tick duration and queue depth, then push the process's metrics snapshot."""
+        metrics.WORKER_CYCLE_SECONDS.labels("aol_daemon", tick_status).observe(seconds)
+        try:
+            metrics.QUEUE_DEPTH.labels("aol_actions").set(ActionQueue.count_runnable(session))
+        except Exception:
+            session.rollback()
+        metrics.push_snapshot("aol_daemon")
+    
+    def _execute_action(
+        self,
+        action_id: int,
+        action_type: str,
+        payload_json: Optional[str],
+        idempotency_key: str,
+        proof_mode: bool,
+    ) -> bool:
+        """
+        Run one claimed action on a pool thread with its own session.
+        
+        Returns:
+            True if the handler completed without raising
+        """
+        # Query counts / N+1 warnings are reported per action type
+        with track_queries(f"aol:{action_type}"):
+            session = self.session_maker()
+            try:
+                handler = get_action_handler(action_type)
+                if handler is None:
+                    error_msg = f"Unknown action type: {action_type}"
+                    ActionQueue.log_execution(session, action_id, "ERROR", error_msg)
+                    ActionQueue.mark_failed(session, action_id, error_msg)
+                    return False
+            
+                payload = json.loads(payload_json) if payload_json else {}
+                payload["idempotency_key"] = idempotency_key
+                handler(session, action_id, payload, proof_mode=proof_mode)
+            
+                # Handlers normally finalize their own action; never leave a
+                # completed action claimed (it would be re-run after the timeout)
+                action = session.get(AOLAction, action_id)
+                if action is not None and action.status == "RUNNING":
+                    ActionQueue.mark_success(session, action_id)
+                return True
+        
+            except RealRunUnconfigured:
+                # Expected error in REAL mode (handler already marked FAILED)
+                return False
+        
+            except Exception as e:
+                # Action failed
+                session.rollback()
+                error_msg = f"Action execution error: {str(e)}"
+                ActionQueue.log_execution(session, action_id, "ERROR", error_msg)
+                ActionQueue.mark_retry(session, action_id, error_msg)
+                return False
+        
+            finally:
+                session.close()
 
 if __name__ == "__main__":
     db_url = os.getenv("DATABASE_URL", "sqlite:////tmp/aol.db")
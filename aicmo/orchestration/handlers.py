@@ -0,0 +1,64 @@
+"""
+AOL Action Handler Registry - action_type → handler dispatch.
+
+Every handler has the signature:
+
+    handler(session, action_id, payload, proof_mode=False) -> None
+
+and is responsible for marking its action SUCCESS/FAILED via ActionQueue.
+Raising an exception sends the action to RETRY (DLQ after MAX_RETRIES);
+RealRunUnconfigured is treated as already handled.
+
+New action types register with @register_action_handler("TYPE") instead of
+growing an if/elif chain in the daemon.
+"""
+
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from aicmo.orchestration.adapters.social_adapter import handle_post_social
+
+
+ActionHandler = Callable[..., None]
+
+ACTION_HANDLERS: Dict[str, ActionHandler] = {}
+
+
+def register_action_handler(action_type: str) -> Callable[[ActionHandler], ActionHandler]:
+    """Decorator registering a handler for an action type."""
+    def decorator(func: ActionHandler) -> ActionHandler:
+        ACTION_HANDLERS[action_type] = func
+        return func
+    return decorator
+
+
+def get_action_handler(action_type: str) -> Optional[ActionHandler]:
+    """Return the handler for action_type, or None if unregistered."""
+    return ACTION_HANDLERS.get(action_type)
+
+
+register_action_handler("POST_SOCIAL")(handle_post_social)
+
+
+# AICMO_CAMPAIGN_OPS_WIRING_START
+# campaign_ops is imported lazily so the AOL stays importable without it.
+
+@register_action_handler("CAMPAIGN_TICK")
+def _campaign_tick(session: Session, action_id: int, payload: Dict[str, Any], proof_mode: bool = False) -> None:
+    from aicmo.campaign_ops.actions import handle_campaign_tick
+    handle_campaign_tick(session, action_id, payload, proof_mode=proof_mode)
+
+
+@register_action_handler("ESCALATE_OVERDUE_TASKS")
+def _escalate_overdue_tasks(session: Session, action_id: int, payload: Dict[str, Any], proof_mode: bool = False) -> None:
+    from aicmo.campaign_ops.actions import handle_escalate_overdue_tasks
+    handle_escalate_overdue_tasks(session, action_id, payload, proof_mode=proof_mode)
+
+
+@register_action_handler("WEEKLY_CAMPAIGN_SUMMARY")
+def _weekly_campaign_summary(session: Session, action_id: int, payload: Dict[str, Any], proof_mode: bool = False) -> None:
+    from aicmo.campaign_ops.actions import handle_weekly_campaign_summary
+    handle_weekly_campaign_summary(session, action_id, payload, proof_mode=proof_mode)
+
+# AICMO_CAMPAIGN_OPS_WIRING_END
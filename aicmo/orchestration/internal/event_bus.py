@@ -1,23 +1,61 @@
-"""In-process event bus implementation."""
-from typing import Callable, Dict, List
+"""
+In-process event bus implementations.
+
+- InProcessEventBus: synchronous dispatch inside publish() (Phase 3 default)
+- BoundedEventBus: production mode. publish() only enqueues; each subscriber
+  has a bounded queue drained by its own worker thread, so a slow subscriber
+  cannot stall the publisher or other subscribers. Replay history is a ring
+  buffer, high-volume event types can be delivered in batches, and an
+  optional SQL outbox (aol_event_outbox) makes events survive restarts:
+  events a crash, a failing handler or a full queue left undelivered are
+  re-delivered by a periodic outbox replay (at-least-once).
+
+Subscriber lag and delivery counts are exported as aicmo_event_bus_*
+metrics and served by GET /health/event_bus (event_bus_stats()).
+
+Select the mode with AICMO_EVENT_BUS_MODE ("inprocess" or "bounded"), see
+create_event_bus().
+"""
+import json
+import logging
+import queue
+import threading
+import time
+import weakref
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Callable, Deque, Dict, List, Optional, Set
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+
 from aicmo.orchestration.api.ports import EventBusPort
+from aicmo.orchestration.models import AOLEventOutbox
+from aicmo.shared import metrics
+from aicmo.shared.config import settings
+from aicmo.shared.db import get_engine
 from aicmo.shared.ids import EventId
 
+logger = logging.getLogger(__name__)
+
 
 class InProcessEventBus(EventBusPort):
     """
     Simple in-memory event bus for Phase 3.
     Supports synchronous publish/subscribe within a single process.
+
+    max_history bounds the replay history (None keeps every event).
     """
 
-    def __init__(self):
+    def __init__(self, max_history: Optional[int] = None):
         self._handlers: Dict[str, List[Callable]] = {}
-        self._published_events: List[tuple[EventId, dict]] = []
+        self._published_events: Deque[tuple[EventId, dict]] = deque(maxlen=max_history)
 
     def publish(self, event_id: EventId, event_data: dict) -> None:
         """
         Publish an event to all subscribed handlers.
-        
+
         Args:
             event_id: Unique identifier for this event instance
             event_data: Event payload (must contain 'event_type' key)
@@ -25,10 +63,10 @@ class InProcessEventBus(EventBusPort):
         event_type = event_data.get("event_type")
         if not event_type:
             raise ValueError("event_data must contain 'event_type' key")
-        
+
         # Store for replay/debugging
         self._published_events.append((event_id, event_data))
-        
+
         # Invoke all handlers for this event type
         handlers = self._handlers.get(event_type, [])
         for handler in handlers:
@@ -37,7 +75,7 @@ class InProcessEventBus(EventBusPort):
     def subscribe(self, event_type: str, handler_fn: Callable) -> None:
         """
         Subscribe a handler to an event type.
-        
+
         Args:
             event_type: The type of event to listen for
             handler_fn: Callable with signature (event_id: EventId, event_data: dict) -> None
@@ -48,7 +86,7 @@ class InProcessEventBus(EventBusPort):
 
     def get_published_events(self) -> List[tuple[EventId, dict]]:
         """Get all published events (for testing/debugging)."""
-        return self._published_events.copy()
+        return list(self._published_events)
 
     def clear_events(self) -> None:
         """Clear event history (for testing)."""
@@ -57,3 +95,540 @@ class InProcessEventBus(EventBusPort):
     def clear_handlers(self) -> None:
         """Clear all handlers (for testing)."""
         self._handlers.clear()
+
+
+# Queue overflow policies for BoundedEventBus
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_DROP_NEWEST = "drop_newest"
+OVERFLOW_BLOCK = "block"
+OVERFLOW_POLICIES = (OVERFLOW_DROP_OLDEST, OVERFLOW_DROP_NEWEST, OVERFLOW_BLOCK)
+
+
+class SqlEventOutbox:
+    """Durable event log backed by the aol_event_outbox table."""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self._session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+        AOLEventOutbox.__table__.create(bind=engine, checkfirst=True)
+
+    def append(self, event_id: EventId, event_data: dict) -> int:
+        """Persist an event and return its outbox row id."""
+        with self._session_factory() as session:
+            row = AOLEventOutbox(
+                event_id=str(event_id),
+                event_type=event_data["event_type"],
+                payload_json=json.dumps(event_data, default=str),
+            )
+            session.add(row)
+            session.commit()
+            return row.id
+
+    def mark_dispatched(self, outbox_id: int) -> None:
+        with self._session_factory() as session:
+            row = session.get(AOLEventOutbox, outbox_id)
+            if row is not None and row.dispatched_at_utc is None:
+                row.dispatched_at_utc = datetime.utcnow()
+                session.commit()
+
+    def pending(
+        self, limit: Optional[int] = None, min_age_seconds: float = 0.0
+    ) -> List[tuple[int, EventId, dict]]:
+        """Undispatched events at least min_age_seconds old, oldest first."""
+        with self._session_factory() as session:
+            stmt = (
+                select(AOLEventOutbox)
+                .where(AOLEventOutbox.dispatched_at_utc.is_(None))
+                .order_by(AOLEventOutbox.id)
+            )
+            if min_age_seconds > 0:
+                cutoff = datetime.utcnow() - timedelta(seconds=min_age_seconds)
+                stmt = stmt.where(AOLEventOutbox.created_at_utc <= cutoff)
+            if limit is not None:
+                stmt = stmt.limit(limit)
+            rows = session.execute(stmt).scalars().all()
+            return [(row.id, EventId(row.event_id), json.loads(row.payload_json)) for row in rows]
+
+    def count_pending(self) -> int:
+        with self._session_factory() as session:
+            stmt = select(func.count(AOLEventOutbox.id)).where(AOLEventOutbox.dispatched_at_utc.is_(None))
+            return session.execute(stmt).scalar_one()
+
+
+class _OutboxDelivery:
+    """
+    Counts outstanding subscriber deliveries for one outbox row.
+
+    The row is marked dispatched only if every subscriber handled the event;
+    if any handler failed or dropped it, it stays pending for replay_outbox().
+    """
+
+    def __init__(self, outbox: SqlEventOutbox, outbox_id: int, remaining: int,
+                 on_settled: Callable[[int], None]):
+        self.outbox = outbox
+        self.outbox_id = outbox_id
+        self.remaining = remaining
+        self.on_settled = on_settled
+        self.failed = False
+        self._lock = threading.Lock()
+
+    def done(self, ok: bool = True) -> None:
+        with self._lock:
+            self.remaining -= 1
+            self.failed = self.failed or not ok
+            finished = self.remaining == 0
+            failed = self.failed
+        if not finished:
+            return
+        if not failed:
+            try:
+                self.outbox.mark_dispatched(self.outbox_id)
+            except Exception:
+                # Left pending; re-delivered by replay_outbox()
+                logger.exception("Failed to mark outbox event %s dispatched", self.outbox_id)
+        self.on_settled(self.outbox_id)
+
+
+class _Subscription:
+    """One subscriber: bounded queue, worker thread and counters."""
+
+    def __init__(self, name: str, event_type: str, handler: Callable,
+                 queue_size: int, batch_size: int, batch_wait_seconds: float):
+        self.name = name
+        self.event_type = event_type
+        self.handler = handler
+        self.batch_size = batch_size
+        self.batch_wait_seconds = batch_wait_seconds
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.delivered = 0
+        self.dropped = 0
+        self.failed = 0
+        self.thread: Optional[threading.Thread] = None
+        self._counter_lock = threading.Lock()
+
+    def count(self, delivered: int = 0, dropped: int = 0, failed: int = 0) -> None:
+        with self._counter_lock:
+            self.delivered += delivered
+            self.dropped += dropped
+            self.failed += failed
+        for outcome, n in (("delivered", delivered), ("dropped", dropped), ("failed", failed)):
+            if n:
+                metrics.EVENT_BUS_EVENTS.labels(self.name, outcome).inc(n)
+
+    def lag_seconds(self) -> float:
+        """Age of the oldest queued event."""
+        with self.queue.mutex:
+            if not self.queue.queue:
+                return 0.0
+            head = self.queue.queue[0]
+        if head is _STOP:
+            return 0.0
+        return max(0.0, time.monotonic() - head[3])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "event_type": self.event_type,
+            "batch_size": self.batch_size,
+            "queue_capacity": self.queue.maxsize,
+            "lag": self.queue.qsize(),
+            "lag_seconds": round(self.lag_seconds(), 6),
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+
+_STOP = object()
+
+
+class BoundedEventBus(EventBusPort):
+    """
+    Asynchronous event bus with per-subscriber back-pressure.
+
+    publish() records the event in a ring buffer (history_size), writes it to
+    the outbox if one is configured, and offers it to each subscriber's
+    bounded queue. When a queue is full the overflow policy applies:
+    - drop_oldest (default): evict the oldest queued event
+    - drop_newest: discard the event being published
+    - block: wait up to block_timeout_seconds for space, then drop it
+    Drops are counted per subscriber.
+
+    Handlers run on the subscriber's worker thread. A handler exception is
+    logged and counted as failed; it does not stop the subscriber.
+
+    With an outbox, events that were dropped or whose handler failed stay
+    pending and are re-delivered by replay_outbox(), which
+    start_outbox_replay() runs periodically (at-least-once: subscribers that
+    did handle a replayed event see it again).
+    """
+
+    def __init__(
+        self,
+        history_size: int = 1000,
+        queue_size: int = 1000,
+        overflow: str = OVERFLOW_DROP_OLDEST,
+        block_timeout_seconds: Optional[float] = None,
+        outbox: Optional[SqlEventOutbox] = None,
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}, got {overflow!r}")
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.block_timeout_seconds = block_timeout_seconds
+        self.outbox = outbox
+        self._history: Deque[tuple[EventId, dict]] = deque(maxlen=history_size)
+        self._subscriptions: Dict[str, List[_Subscription]] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        self._inflight_outbox: Set[int] = set()  # outbox rows queued or being handled here
+        self._replayed = 0
+        self._replay_stop = threading.Event()
+        self._replay_thread: Optional[threading.Thread] = None
+        _BUSES.add(self)
+
+    # ------------------------------------------------------------------
+    # EventBusPort
+    # ------------------------------------------------------------------
+
+    def publish(self, event_id: EventId, event_data: dict) -> None:
+        """
+        Queue an event for all subscribers of its event_type.
+
+        Args:
+            event_id: Unique identifier for this event instance
+            event_data: Event payload (must contain 'event_type' key)
+        """
+        event_type = event_data.get("event_type")
+        if not event_type:
+            raise ValueError("event_data must contain 'event_type' key")
+        if self._closed:
+            raise RuntimeError("event bus is closed")
+
+        outbox_id = self.outbox.append(event_id, event_data) if self.outbox else None
+        self._dispatch(event_id, event_data, outbox_id)
+
+    def subscribe(self, event_type: str, handler_fn: Callable, name: Optional[str] = None) -> None:
+        """
+        Subscribe a handler to an event type.
+
+        Args:
+            event_type: The type of event to listen for
+            handler_fn: Callable with signature (event_id: EventId, event_data: dict) -> None
+            name: Label used in subscriber_stats() (defaults to the handler name)
+        """
+        self._add_subscription(event_type, handler_fn, name, batch_size=1, batch_wait_seconds=0.0)
+
+    def subscribe_batch(
+        self,
+        event_type: str,
+        handler_fn: Callable,
+        max_batch: int = 100,
+        max_wait_seconds: float = 0.05,
+        name: Optional[str] = None,
+    ) -> None:
+        """
+        Subscribe a batch handler for a high-volume event type.
+
+        handler_fn receives a list of (event_id, event_data) tuples: up to
+        max_batch events, collected for at most max_wait_seconds after the
+        first one arrives.
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch must be >= 1")
+        self._add_subscription(event_type, handler_fn, name, batch_size=max_batch,
+                               batch_wait_seconds=max_wait_seconds, batched=True)
+
+    # ------------------------------------------------------------------
+    # Replay / outbox
+    # ------------------------------------------------------------------
+
+    def get_published_events(self) -> List[tuple[EventId, dict]]:
+        """Events still in the replay ring buffer, oldest first."""
+        with self._lock:
+            return list(self._history)
+
+    def replay(self, handler_fn: Callable, event_type: Optional[str] = None) -> int:
+        """Synchronously feed buffered events to handler_fn; returns the count."""
+        count = 0
+        for event_id, event_data in self.get_published_events():
+            if event_type is None or event_data.get("event_type") == event_type:
+                handler_fn(event_id, event_data)
+                count += 1
+        return count
+
+    def replay_outbox(self, limit: Optional[int] = None, min_age_seconds: float = 0.0) -> int:
+        """
+        Re-deliver outbox events that were never fully dispatched.
+
+        Events still queued or being handled by this bus are skipped, and so
+        are event types with no subscriber here (they stay pending).
+        min_age_seconds skips recent rows that another process may still be
+        delivering. Returns the number of events re-queued.
+        """
+        if self.outbox is None or self._closed:
+            return 0
+        pending = self.outbox.pending(limit=limit, min_age_seconds=min_age_seconds)
+        replayed = 0
+        for outbox_id, event_id, event_data in pending:
+            with self._lock:
+                if outbox_id in self._inflight_outbox:
+                    continue
+            if self._dispatch(event_id, event_data, outbox_id, replay=True):
+                replayed += 1
+        if replayed:
+            logger.info("Re-delivered %d pending outbox event(s)", replayed)
+            with self._lock:
+                self._replayed += replayed
+        return replayed
+
+    def start_outbox_replay(self, interval_seconds: float, initial_delay_seconds: float = 1.0) -> None:
+        """
+        Run replay_outbox() in a background thread.
+
+        The first pass runs initial_delay_seconds after start (once startup
+        code has registered its subscribers), then every interval_seconds.
+        Periodic passes skip events younger than interval_seconds.
+        """
+        if self.outbox is None or self._replay_thread is not None:
+            return
+
+        def loop() -> None:
+            delay = initial_delay_seconds
+            while not self._replay_stop.wait(delay):
+                try:
+                    self.replay_outbox(min_age_seconds=interval_seconds)
+                except Exception:
+                    logger.exception("Event bus outbox replay failed")
+                delay = interval_seconds
+
+        self._replay_thread = threading.Thread(target=loop, name="event-bus-outbox-replay", daemon=True)
+        self._replay_thread.start()
+
+    def clear_events(self) -> None:
+        """Clear the replay buffer (for testing)."""
+        with self._lock:
+            self._history.clear()
+
+    # ------------------------------------------------------------------
+    # Observability / lifecycle
+    # ------------------------------------------------------------------
+
+    def subscriber_stats(self) -> List[Dict[str, Any]]:
+        """Per-subscriber lag (queued events and oldest age), delivered, dropped and failed counts."""
+        with self._lock:
+            subs = [sub for subs in self._subscriptions.values() for sub in subs]
+        stats = [sub.to_dict() for sub in subs]
+        for entry in stats:
+            metrics.EVENT_BUS_QUEUED.labels(entry["name"]).set(entry["lag"])
+            metrics.EVENT_BUS_LAG_SECONDS.labels(entry["name"]).set(entry["lag_seconds"])
+        return stats
+
+    def stats(self) -> Dict[str, Any]:
+        """subscriber_stats() plus outbox backlog and replay counts."""
+        result: Dict[str, Any] = {"subscribers": self.subscriber_stats(), "outbox": None}
+        if self.outbox is not None:
+            pending = self.outbox.count_pending()
+            metrics.EVENT_BUS_OUTBOX_PENDING.set(pending)
+            with self._lock:
+                result["outbox"] = {
+                    "pending": pending,
+                    "in_flight": len(self._inflight_outbox),
+                    "replayed": self._replayed,
+                    "replay_running": self._replay_thread is not None,
+                }
+        return result
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued event has been handled. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            subs = [sub for subs in self._subscriptions.values() for sub in subs]
+        for sub in subs:
+            with sub.queue.all_tasks_done:
+                while sub.queue.unfinished_tasks:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    sub.queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Drain queues (up to timeout) and stop worker threads."""
+        if self._closed:
+            return
+        self._closed = True
+        self._replay_stop.set()
+        self.flush(timeout)
+        with self._lock:
+            subs = [sub for subs in self._subscriptions.values() for sub in subs]
+        for sub in subs:
+            try:
+                sub.queue.put(_STOP, timeout=timeout)
+            except queue.Full:
+                logger.warning("Event bus subscriber %s did not drain before close", sub.name)
+        for sub in subs:
+            if sub.thread is not None:
+                sub.thread.join(timeout)
+
+    def clear_handlers(self) -> None:
+        """Stop and remove all subscribers (for testing)."""
+        with self._lock:
+            subs = [sub for subs in self._subscriptions.values() for sub in subs]
+            self._subscriptions.clear()
+        for sub in subs:
+            sub.queue.put(_STOP)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _add_subscription(self, event_type: str, handler_fn: Callable, name: Optional[str],
+                          batch_size: int, batch_wait_seconds: float, batched: bool = False) -> None:
+        if self._closed:
+            raise RuntimeError("event bus is closed")
+        label = name or getattr(handler_fn, "__name__", repr(handler_fn))
+        sub = _Subscription(label, event_type, handler_fn, self.queue_size, batch_size, batch_wait_seconds)
+        sub.thread = threading.Thread(
+            target=self._worker, args=(sub, batched), name=f"event-bus-{label}", daemon=True
+        )
+        with self._lock:
+            self._subscriptions.setdefault(event_type, []).append(sub)
+        sub.thread.start()
+
+    def _dispatch(self, event_id: EventId, event_data: dict, outbox_id: Optional[int],
+                  replay: bool = False) -> bool:
+        """Queue an event to its subscribers; False if a replayed event has none here."""
+        with self._lock:
+            subs = list(self._subscriptions.get(event_data["event_type"], []))
+            if replay and not subs:
+                return False
+            self._history.append((event_id, event_data))
+            if outbox_id is not None and subs:
+                self._inflight_outbox.add(outbox_id)
+
+        delivery = None
+        if outbox_id is not None:
+            if not subs:
+                self.outbox.mark_dispatched(outbox_id)
+            else:
+                delivery = _OutboxDelivery(self.outbox, outbox_id, len(subs), self._settled)
+
+        enqueued_at = time.monotonic()
+        for sub in subs:
+            self._offer(sub, (event_id, event_data, delivery, enqueued_at))
+        return True
+
+    def _settled(self, outbox_id: int) -> None:
+        with self._lock:
+            self._inflight_outbox.discard(outbox_id)
+
+    @staticmethod
+    def _drop(sub: _Subscription, item: tuple) -> None:
+        sub.count(dropped=1)
+        if item[2] is not None:
+            item[2].done(ok=False)
+
+    def _offer(self, sub: _Subscription, item: tuple) -> None:
+        if self.overflow == OVERFLOW_BLOCK:
+            try:
+                sub.queue.put(item, timeout=self.block_timeout_seconds)
+            except queue.Full:
+                self._drop(sub, item)
+            return
+
+        while True:
+            try:
+                sub.queue.put_nowait(item)
+                return
+            except queue.Full:
+                if self.overflow == OVERFLOW_DROP_NEWEST:
+                    self._drop(sub, item)
+                    return
+            try:
+                evicted = sub.queue.get_nowait()
+                sub.queue.task_done()
+            except queue.Empty:
+                continue
+            if evicted is _STOP:
+                # Never evict the stop marker; put it back and drop this event
+                sub.queue.put_nowait(evicted)
+                self._drop(sub, item)
+                return
+            self._drop(sub, evicted)
+
+    def _worker(self, sub: _Subscription, batched: bool) -> None:
+        while True:
+            item = sub.queue.get()
+            if item is _STOP:
+                sub.queue.task_done()
+                return
+
+            items = [item]
+            stop = False
+            if batched:
+                deadline = time.monotonic() + sub.batch_wait_seconds
+                while len(items) < sub.batch_size:
+                    remaining = deadline - time.monotonic()
+                    try:
+                        nxt = sub.queue.get(timeout=remaining) if remaining > 0 else sub.queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if nxt is _STOP:
+                        stop = True
+                        break
+                    items.append(nxt)
+
+            ok = True
+            try:
+                if batched:
+                    sub.handler([(event_id, event_data) for event_id, event_data, _, _ in items])
+                else:
+                    sub.handler(item[0], item[1])
+                sub.count(delivered=len(items))
+            except Exception:
+                ok = False
+                sub.count(failed=len(items))
+                logger.exception("Event bus subscriber %s failed on %d event(s)", sub.name, len(items))
+
+            for _, _, delivery, _ in items:
+                if delivery is not None:
+                    delivery.done(ok)
+                sub.queue.task_done()
+            if stop:
+                sub.queue.task_done()
+                return
+
+
+_BUSES: "weakref.WeakSet[BoundedEventBus]" = weakref.WeakSet()
+
+
+def event_bus_stats() -> List[Dict[str, Any]]:
+    """stats() of every open BoundedEventBus in this process (GET /health/event_bus)."""
+    return [bus.stats() for bus in list(_BUSES) if not bus._closed]
+
+
+def create_event_bus() -> EventBusPort:
+    """
+    Build the event bus selected by AICMO_EVENT_BUS_MODE.
+
+    - inprocess (default): InProcessEventBus with AICMO_EVENT_BUS_HISTORY_SIZE history
+    - bounded: BoundedEventBus; AICMO_EVENT_BUS_OUTBOX_URL enables the SQL outbox,
+      replayed every AICMO_EVENT_BUS_REPLAY_INTERVAL_SECONDS
+    """
+    mode = settings.EVENT_BUS_MODE.lower()
+    if mode == "inprocess":
+        return InProcessEventBus(max_history=settings.EVENT_BUS_HISTORY_SIZE)
+    if mode == "bounded":
+        outbox = None
+        if settings.EVENT_BUS_OUTBOX_URL:
+            outbox = SqlEventOutbox(get_engine(settings.EVENT_BUS_OUTBOX_URL))
+        bus = BoundedEventBus(
+            history_size=settings.EVENT_BUS_HISTORY_SIZE,
+            queue_size=settings.EVENT_BUS_QUEUE_SIZE,
+            outbox=outbox,
+        )
+        if outbox is not None and settings.EVENT_BUS_REPLAY_INTERVAL_SECONDS > 0:
+            bus.start_outbox_replay(settings.EVENT_BUS_REPLAY_INTERVAL_SECONDS)
+        return bus
+    raise ValueError(f"Unknown AICMO_EVENT_BUS_MODE: {settings.EVENT_BUS_MODE!r}")
@@ -0,0 +1,560 @@
+"""
+Asynchronous Job Runner - Long-running API work off the request path.
+
+Report generation, PDF/PPTX export and project packaging can take minutes.
+Instead of tying up an HTTP worker, the API persists an aol_jobs row and
+returns its id immediately; a bounded thread pool executes the job and the
+client polls GET /jobs/{id} for progress and the persisted result.
+
+Status lifecycle:
+QUEUED (accepted, waiting for a worker slot)
+  ↓
+RUNNING (executing on the pool)
+  ├→ SUCCEEDED (terminal, result_json set)
+  └→ FAILED (terminal, error set)
+
+Several processes can run a JobRunner on the same database:
+- a job moves QUEUED -> RUNNING through a conditional UPDATE that records the
+  runner as claimed_by, so only one runner executes it
+- the owner renews lease_expires_utc from a heartbeat while the job runs; a
+  RUNNING job whose lease expired belongs to a dead runner and is re-claimed
+- every heartbeat also picks up QUEUED jobs submitted to other processes
+
+Safety limits:
+- max_workers bounds total concurrent jobs in this process
+- per_tenant_limit bounds concurrent jobs per tenant across all runners
+  (checked in the claim); extra jobs stay QUEUED
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Callable, Deque, Dict, List, Optional, Set
+
+from sqlalchemy import and_, func, or_, select, text, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, aliased, sessionmaker
+
+from aicmo.orchestration.lease import get_daemon_owner
+from aicmo.orchestration.models import AOLJob
+from aicmo.shared import metrics, tracing
+from aicmo.shared.db import track_queries
+
+logger = logging.getLogger(__name__)
+
+
+TERMINAL_JOB_STATUSES = ("SUCCEEDED", "FAILED")
+
+
+class UnknownJobKind(ValueError):
+    """Raised when a job is submitted for a kind with no registered handler."""
+    pass
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# HANDLER REGISTRY
+# ═══════════════════════════════════════════════════════════════════════
+
+
+class JobContext:
+    """Handle passed to job handlers for progress reporting."""
+
+    def __init__(self, job_id: str, session_maker: sessionmaker):
+        self.job_id = job_id
+        self._session_maker = session_maker
+
+    def report_progress(self, fraction: float, message: Optional[str] = None) -> None:
+        """Persist progress (0.0-1.0) so pollers can see it."""
+        session = self._session_maker()
+        try:
+            JobStore.update_progress(session, self.job_id, fraction, message)
+        finally:
+            session.close()
+
+
+JobHandler = Callable[[Dict[str, Any], JobContext], Dict[str, Any]]
+
+JOB_HANDLERS: Dict[str, JobHandler] = {}
+
+
+def register_job_handler(kind: str) -> Callable[[JobHandler], JobHandler]:
+    """Decorator registering a handler for a job kind.
+
+    Handlers receive (payload, ctx) and return a JSON-serializable dict.
+    """
+    def decorator(func: JobHandler) -> JobHandler:
+        JOB_HANDLERS[kind] = func
+        return func
+    return decorator
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# PERSISTENCE
+# ═══════════════════════════════════════════════════════════════════════
+
+
+class JobStore:
+    """
+    Persistence helpers for aol_jobs (mirrors ActionQueue's static style).
+    """
+
+    @staticmethod
+    def create_job(
+        session: Session,
+        kind: str,
+        payload: Dict[str, Any],
+        tenant_id: str = "default",
+    ) -> AOLJob:
+        """Insert a QUEUED job and return it."""
+        job = AOLJob(
+            kind=kind,
+            tenant_id=tenant_id,
+            status="QUEUED",
+            progress=0.0,
+            payload_json=json.dumps(payload) if payload else None,
+        )
+        session.add(job)
+        session.commit()
+        return job
+
+    @staticmethod
+    def get_job(session: Session, job_id: str) -> Optional[AOLJob]:
+        return session.get(AOLJob, job_id)
+
+    @staticmethod
+    def claim(
+        session: Session,
+        job_id: str,
+        owner: str,
+        lease_seconds: float,
+        per_tenant_limit: Optional[int] = None,
+    ) -> bool:
+        """Atomically move a job to RUNNING for owner; True if owner now holds it.
+
+        Claimable = QUEUED, or RUNNING with an expired (or missing) lease. With
+        per_tenant_limit, the claim also fails while the job's tenant already
+        has that many RUNNING jobs with live leases, on any runner.
+        """
+        job = session.get(AOLJob, job_id)
+        if job is None:
+            return False
+        tenant_id = job.tenant_id
+        now = datetime.utcnow()
+
+        if session.get_bind().dialect.name == "postgresql":
+            # Serialize claims per tenant so concurrent claims can't both pass the limit check
+            session.execute(text("SELECT pg_advisory_xact_lock(hashtext(:tenant))"), {"tenant": tenant_id})
+
+        conditions = [
+            AOLJob.id == job_id,
+            or_(
+                AOLJob.status == "QUEUED",
+                and_(
+                    AOLJob.status == "RUNNING",
+                    or_(AOLJob.lease_expires_utc.is_(None), AOLJob.lease_expires_utc < now),
+                ),
+            ),
+        ]
+        if per_tenant_limit:
+            live = aliased(AOLJob)
+            running = (
+                select(func.count(live.id))
+                .where(
+                    live.tenant_id == tenant_id,
+                    live.status == "RUNNING",
+                    live.lease_expires_utc >= now,
+                )
+                .scalar_subquery()
+            )
+            conditions.append(running < per_tenant_limit)
+
+        result = session.execute(
+            update(AOLJob)
+            .where(*conditions)
+            .values(
+                status="RUNNING",
+                claimed_by=owner,
+                lease_expires_utc=now + timedelta(seconds=lease_seconds),
+                started_at_utc=now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
+        return result.rowcount == 1
+
+    @staticmethod
+    def renew_leases(session: Session, owner: str, job_ids: List[str], lease_seconds: float) -> int:
+        """Extend owner's leases on job_ids; returns how many are still held."""
+        if not job_ids:
+            return 0
+        result = session.execute(
+            update(AOLJob)
+            .where(
+                AOLJob.id.in_(job_ids),
+                AOLJob.status == "RUNNING",
+                AOLJob.claimed_by == owner,
+            )
+            .values(lease_expires_utc=datetime.utcnow() + timedelta(seconds=lease_seconds))
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
+        return result.rowcount
+
+    @staticmethod
+    def update_progress(
+        session: Session, job_id: str, fraction: float, message: Optional[str] = None
+    ) -> None:
+        job = session.get(AOLJob, job_id)
+        if job:
+            job.progress = max(0.0, min(1.0, float(fraction)))
+            if message is not None:
+                job.progress_message = message
+            session.commit()
+
+    @staticmethod
+    def mark_succeeded(
+        session: Session, job_id: str, result: Dict[str, Any], owner: Optional[str] = None
+    ) -> bool:
+        """Finish a job; with owner, only if owner still holds its claim."""
+        return JobStore._finish(session, job_id, owner, {
+            "status": "SUCCEEDED",
+            "progress": 1.0,
+            "result_json": json.dumps(result, default=str),
+        })
+
+    @staticmethod
+    def mark_failed(
+        session: Session, job_id: str, error_msg: str, owner: Optional[str] = None
+    ) -> bool:
+        """Fail a job; with owner, only if owner still holds its claim."""
+        return JobStore._finish(session, job_id, owner, {"status": "FAILED", "error": error_msg})
+
+    @staticmethod
+    def _finish(session: Session, job_id: str, owner: Optional[str], values: Dict[str, Any]) -> bool:
+        stmt = update(AOLJob).where(AOLJob.id == job_id)
+        if owner is not None:
+            stmt = stmt.where(AOLJob.claimed_by == owner)
+        result = session.execute(
+            stmt.values(finished_at_utc=datetime.utcnow(), lease_expires_utc=None, **values)
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
+        return result.rowcount == 1
+
+    @staticmethod
+    def recoverable_jobs(session: Session) -> List[AOLJob]:
+        """QUEUED jobs, and RUNNING jobs whose lease expired (their runner died)."""
+        now = datetime.utcnow()
+        stmt = (
+            select(AOLJob)
+            .where(
+                or_(
+                    AOLJob.status == "QUEUED",
+                    and_(
+                        AOLJob.status == "RUNNING",
+                        or_(AOLJob.lease_expires_utc.is_(None), AOLJob.lease_expires_utc < now),
+                    ),
+                )
+            )
+            .order_by(AOLJob.created_at_utc)
+        )
+        return list(session.execute(stmt).scalars().all())
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# LATENCY HISTOGRAM
+# ═══════════════════════════════════════════════════════════════════════
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (seconds), cumulative like Prometheus."""
+
+    DEFAULT_BUCKETS = (0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot = +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        cumulative = 0
+        buckets = {}
+        for bound, n in zip(self.buckets, self.counts):
+            cumulative += n
+            buckets[str(bound)] = cumulative
+        buckets["+Inf"] = self.count
+        return {"count": self.count, "sum": round(self.sum, 6), "buckets": buckets}
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# RUNNER
+# ═══════════════════════════════════════════════════════════════════════
+
+
+class JobRunner:
+    """
+    Bounded worker pool with per-tenant concurrency limits.
+
+    Scheduling is event-driven: a pending job is dispatched when it is
+    submitted or when a running job finishes. A heartbeat thread renews the
+    leases of running jobs and picks up jobs other runners can't finish.
+    """
+
+    DEFAULT_MAX_WORKERS = 4
+    DEFAULT_PER_TENANT_LIMIT = 2
+    DEFAULT_LEASE_SECONDS = 60
+
+    def __init__(
+        self,
+        engine: Engine,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        per_tenant_limit: int = DEFAULT_PER_TENANT_LIMIT,
+        handlers: Optional[Dict[str, JobHandler]] = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        heartbeat_seconds: Optional[float] = None,
+    ):
+        self.engine = engine
+        self.session_maker = sessionmaker(bind=engine, expire_on_commit=False)
+        self.max_workers = max(1, max_workers)
+        self.per_tenant_limit = max(1, per_tenant_limit)
+        self.handlers = handlers if handlers is not None else JOB_HANDLERS
+        self.lease_seconds = lease_seconds
+        self.heartbeat_seconds = heartbeat_seconds or lease_seconds / 4
+        self.owner = f"{get_daemon_owner()}:{uuid.uuid4().hex[:8]}"
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="aicmo-job"
+        )
+        self._lock = threading.Lock()
+        self._pending: Deque[tuple] = deque()  # (job_id, tenant_id, kind)
+        self._running_by_tenant: Dict[str, int] = {}
+        self._running_total = 0
+        self._tracked: Set[str] = set()  # pending or running in this runner
+        self._running_ids: Set[str] = set()
+        self._latency: Dict[str, LatencyHistogram] = {}
+        self._outcomes: Dict[str, Dict[str, int]] = {}
+
+        AOLJob.__table__.create(engine, checkfirst=True)
+        self._stop = threading.Event()
+        self._poll_store()
+        self._heartbeat = threading.Thread(
+            target=self._heartbeat_loop, name="aicmo-job-heartbeat", daemon=True
+        )
+        self._heartbeat.start()
+
+    # -- public API -----------------------------------------------------
+
+    def submit(self, kind: str, payload: Dict[str, Any], tenant_id: str = "default") -> str:
+        """Persist a QUEUED job, schedule it, and return its id."""
+        if kind not in self.handlers:
+            raise UnknownJobKind(f"Unknown job kind: {kind}")
+
+        session = self.session_maker()
+        try:
+            job = JobStore.create_job(session, kind, payload, tenant_id=tenant_id)
+            job_id = job.id
+        finally:
+            session.close()
+
+        with self._lock:
+            if job_id not in self._tracked:  # a heartbeat poll may have seen it first
+                self._tracked.add(job_id)
+                self._pending.append((job_id, tenant_id, kind))
+        self._dispatch()
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the persisted job as a dict, or None."""
+        session = self.session_maker()
+        try:
+            job = JobStore.get_job(session, job_id)
+            return job.to_dict() if job else None
+        finally:
+            session.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, running counts, and per-kind latency histograms."""
+        with self._lock:
+            return {
+                "owner": self.owner,
+                "max_workers": self.max_workers,
+                "per_tenant_limit": self.per_tenant_limit,
+                "queued": len(self._pending),
+                "running": self._running_total,
+                "running_by_tenant": dict(self._running_by_tenant),
+                "outcomes": {k: dict(v) for k, v in self._outcomes.items()},
+                "latency_seconds": {k: h.to_dict() for k, h in self._latency.items()},
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._stop.set()
+        self._executor.shutdown(wait=wait)
+        if wait:
+            self._heartbeat.join()
+
+    # -- internals ------------------------------------------------------
+
+    def _poll_store(self) -> None:
+        """Schedule QUEUED jobs and RUNNING jobs with expired leases not already tracked here."""
+        session = self.session_maker()
+        try:
+            jobs = JobStore.recoverable_jobs(session)
+        finally:
+            session.close()
+        added = 0
+        with self._lock:
+            for job in jobs:
+                if job.id in self._tracked:
+                    continue
+                self._tracked.add(job.id)
+                self._pending.append((job.id, job.tenant_id, job.kind))
+                added += 1
+        if added:
+            logger.info("Picked up %d unfinished job(s) from the job store", added)
+            self._dispatch()
+
+    def _heartbeat_loop(self) -> None:
+        while not self._stop.wait(self.heartbeat_seconds):
+            try:
+                with self._lock:
+                    running = list(self._running_ids)
+                session = self.session_maker()
+                try:
+                    held = JobStore.renew_leases(session, self.owner, running, self.lease_seconds)
+                finally:
+                    session.close()
+                if held < len(running):
+                    logger.warning(
+                        "Runner %s lost the lease on %d running job(s)", self.owner, len(running) - held
+                    )
+                self._poll_store()
+            except Exception:
+                logger.exception("Job runner heartbeat failed")
+
+    def _dispatch(self) -> None:
+        """Start as many pending jobs as worker and tenant limits allow."""
+        to_start = []
+        with self._lock:
+            skipped: Deque[tuple] = deque()
+            while self._pending and self._running_total < self.max_workers:
+                item = self._pending.popleft()
+                tenant_id = item[1]
+                if self._running_by_tenant.get(tenant_id, 0) >= self.per_tenant_limit:
+                    skipped.append(item)
+                    continue
+                self._running_by_tenant[tenant_id] = self._running_by_tenant.get(tenant_id, 0) + 1
+                self._running_total += 1
+                to_start.append(item)
+            # Preserve FIFO order for jobs that were held back by tenant limits
+            skipped.extend(self._pending)
+            self._pending = skipped
+            metrics.QUEUE_DEPTH.labels("jobs").set(len(self._pending))
+
+        for job_id, tenant_id, kind in to_start:
+            self._executor.submit(self._execute, job_id, tenant_id, kind)
+
+    def _execute(self, job_id: str, tenant_id: str, kind: str) -> None:
+        started = time.monotonic()
+        outcome: Optional[str] = None
+        session = self.session_maker()
+        try:
+            job = JobStore.get_job(session, job_id)
+            if job is None:
+                return
+            payload = json.loads(job.payload_json) if job.payload_json else {}
+            # Another runner may have claimed it, or the tenant is at its limit
+            # elsewhere; either way the next store poll sees its current state
+            if not JobStore.claim(session, job_id, self.owner, self.lease_seconds, self.per_tenant_limit):
+                return
+            with self._lock:
+                self._running_ids.add(job_id)
+            outcome = "failed"
+
+            handler = self.handlers.get(kind)
+            if handler is None:
+                raise UnknownJobKind(f"Unknown job kind: {kind}")
+
+            with track_queries(f"job:{kind}"), tracing.start_trace(
+                f"job:{kind}", kind=tracing.KIND_INTERNAL, job_id=job_id, tenant_id=tenant_id
+            ):
+                result = handler(payload, JobContext(job_id, self.session_maker))
+            if not JobStore.mark_succeeded(session, job_id, result or {}, owner=self.owner):
+                logger.warning("Job %s finished after its lease passed to another runner", job_id)
+            outcome = "succeeded"
+        except Exception as e:
+            logger.exception("Job %s (%s) failed", job_id, kind)
+            try:
+                session.rollback()
+                JobStore.mark_failed(session, job_id, f"{type(e).__name__}: {e}", owner=self.owner)
+            except Exception:
+                logger.exception("Could not persist failure for job %s", job_id)
+        finally:
+            session.close()
+            elapsed = time.monotonic() - started
+            with self._lock:
+                self._tracked.discard(job_id)
+                self._running_ids.discard(job_id)
+                self._running_total -= 1
+                self._running_by_tenant[tenant_id] -= 1
+                if self._running_by_tenant[tenant_id] <= 0:
+                    del self._running_by_tenant[tenant_id]
+                if outcome is not None:
+                    self._latency.setdefault(kind, LatencyHistogram()).observe(elapsed)
+                    counts = self._outcomes.setdefault(kind, {})
+                    counts[outcome] = counts.get(outcome, 0) + 1
+            self._dispatch()
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# PROCESS-WIDE RUNNER
+# ═══════════════════════════════════════════════════════════════════════
+
+
+_RUNNER: Optional[JobRunner] = None
+_RUNNER_LOCK = threading.Lock()
+
+
+def get_job_runner(engine_factory: Callable[[], Engine]) -> JobRunner:
+    """Return the process-wide JobRunner, creating it on first use.
+
+    Pool sizes come from AICMO_JOBS_MAX_WORKERS / AICMO_JOBS_PER_TENANT_LIMIT,
+    the claim lease from AICMO_JOBS_LEASE_SECONDS.
+    """
+    global _RUNNER
+    with _RUNNER_LOCK:
+        if _RUNNER is None:
+            _RUNNER = JobRunner(
+                engine_factory(),
+                max_workers=int(
+                    os.getenv("AICMO_JOBS_MAX_WORKERS", JobRunner.DEFAULT_MAX_WORKERS)
+                ),
+                per_tenant_limit=int(
+                    os.getenv("AICMO_JOBS_PER_TENANT_LIMIT", JobRunner.DEFAULT_PER_TENANT_LIMIT)
+                ),
+                lease_seconds=float(
+                    os.getenv("AICMO_JOBS_LEASE_SECONDS", JobRunner.DEFAULT_LEASE_SECONDS)
+                ),
+            )
+        return _RUNNER
+
+
+def reset_job_runner() -> None:
+    """Shut down and forget the process-wide runner (tests)."""
+    global _RUNNER
+    with _RUNNER_LOCK:
+        if _RUNNER is not None:
+            _RUNNER.shutdown(wait=True)
+        _RUNNER = None
@@ -1,7 +1,11 @@
 """
-Distributed Lease Manager - Ensures only one daemon runs at a time.
+Distributed Lease Manager - Daemon liveness and (optional) exclusivity.
 
-Atomic acquire: Try to claim or renew lease. Fail safely if another daemon holds it.
+Exclusive mode: only one daemon runs at a time. Atomic acquire: try to claim
+or renew the lease; fail safely if another daemon holds it.
+
+Shared mode: every daemon keeps its own lease row as a heartbeat. Actions are
+claimed atomically by the queue, so daemons can scale horizontally.
 """
 
 import os
@@ -9,10 +13,11 @@ import socket
 from datetime import datetime, timedelta
 from typing import Optional, Tuple
 
-from sqlalchemy import create_engine, select, and_
+from sqlalchemy import select, and_
 from sqlalchemy.orm import Session, sessionmaker
 
 from aicmo.orchestration.models import AOLLease
+from aicmo.shared.db import get_engine
 
 
 def get_daemon_owner() -> str:
@@ -26,7 +31,7 @@ class LeaseManager:
     """
     Manages distributed lock via AOL lease table.
     
-    Safety rules:
+    Safety rules (exclusive mode):
     - Lease expires after LEASE_TIMEOUT_SECONDS
     - Renewal must happen before expiration
     - Failed renewal = another daemon owns it (bail out gracefully)
@@ -35,11 +40,12 @@ class LeaseManager:
     # Lease duration: 30 seconds (must renew every ~10 seconds in normal tick)
     LEASE_TIMEOUT_SECONDS = 30
     
-    def __init__(self, db_url: str):
+    def __init__(self, db_url: str, exclusive: bool = True):
         """Initialize with database connection."""
         self.db_url = db_url
+        self.exclusive = exclusive
         self.owner = get_daemon_owner()
-        self.engine = create_engine(db_url, future=True)
+        self.engine = get_engine(db_url)
         self.session_maker = sessionmaker(bind=self.engine, expire_on_commit=False)
     
     def acquire_or_renew(self, session: Session) -> Tuple[bool, str]:
@@ -57,8 +63,11 @@ class LeaseManager:
             now = datetime.utcnow()
             expires_at = now + timedelta(seconds=self.LEASE_TIMEOUT_SECONDS)
             
-            # Query existing lease
-            stmt = select(AOLLease).limit(1)
+            # Query existing lease (shared mode: only this daemon's own row)
+            stmt = select(AOLLease)
+            if not self.exclusive:
+                stmt = stmt.where(AOLLease.owner == self.owner)
+            stmt = stmt.limit(1)
             existing_lease = session.execute(stmt).scalar_one_or_none()
             
             if existing_lease is None:
@@ -8,6 +8,10 @@ Autonomy Orchestration Layer (AOL) Database Models.
 4. aol_actions - Task queue (PENDING → SUCCESS/FAILED/DLQ)
 5. aol_execution_logs - Detailed action execution traces
 
+Plus:
+6. aol_jobs - Long-running API jobs (QUEUED → RUNNING → SUCCEEDED/FAILED)
+7. aol_event_outbox - Durable orchestration events awaiting delivery
+
 NO interpretation allowed. Exact ORM definition only.
 """
 
@@ -124,6 +128,7 @@ class AOLAction(Base):
     - PENDING: Awaiting execution (not_before_utc not reached)
     - READY: Available for immediate execution
     - RETRY: Failed, eligible for retry (attempts < MAX_RETRIES)
+    - RUNNING: Claimed by a daemon worker (see claimed_by / claim_expires_utc)
     - DLQ: Dead Letter Queue (max retries exhausted)
     - SUCCESS: Completed successfully
     - FAILED: Terminal failure (no retry)
@@ -138,6 +143,9 @@ class AOLAction(Base):
     - attempts: Retry counter
     - last_error: Most recent error message
     - created_at_utc: Action creation time
+    - claimed_by: Daemon owner currently executing the action (status RUNNING)
+    - claim_expires_utc: Visibility timeout; an expired RUNNING claim is
+      re-claimable (the worker that held it is presumed crashed)
     """
     __tablename__ = "aol_actions"
 
@@ -145,16 +153,19 @@ class AOLAction(Base):
     idempotency_key = Column(String(255), nullable=False, unique=True)
     action_type = Column(String(100), nullable=False)
     payload_json = Column(Text, nullable=True)  # JSON string
-    status = Column(String(20), nullable=False)  # PENDING, READY, RETRY, DLQ, SUCCESS, FAILED, CANCELLED
+    status = Column(String(20), nullable=False)  # PENDING, READY, RUNNING, RETRY, DLQ, SUCCESS, FAILED, CANCELLED
     not_before_utc = Column(DateTime, nullable=True)
     attempts = Column(Integer, default=0, nullable=False)
     last_error = Column(Text, nullable=True)
     created_at_utc = Column(DateTime, default=datetime.utcnow, nullable=False)
+    claimed_by = Column(String(255), nullable=True)
+    claim_expires_utc = Column(DateTime, nullable=True)
 
     __table_args__ = (
         Index("idx_aol_actions_status", "status"),
         Index("idx_aol_actions_not_before", "not_before_utc"),
         Index("idx_aol_actions_idempotency", "idempotency_key"),
+        Index("idx_aol_actions_status_not_before", "status", "not_before_utc"),
     )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -168,6 +179,8 @@ class AOLAction(Base):
             "attempts": self.attempts,
             "last_error": self.last_error,
             "created_at_utc": self.created_at_utc.isoformat() if self.created_at_utc else None,
+            "claimed_by": self.claimed_by,
+            "claim_expires_utc": self.claim_expires_utc.isoformat() if self.claim_expires_utc else None,
         }
 
 
@@ -207,3 +220,97 @@ class AOLExecutionLog(Base):
             "artifact_ref": self.artifact_ref,
             "artifact_sha256": self.artifact_sha256,
         }
+
+
+class AOLJob(Base):
+    """Long-running API job (report generation, exports, project packaging).
+    
+    Status flow:
+    - QUEUED: Accepted by POST /jobs, waiting for a worker slot
+    - RUNNING: Claimed by a runner (claimed_by) and executing on its pool
+    - SUCCEEDED: Completed; result_json holds the handler result
+    - FAILED: Handler raised; error holds the message
+    
+    Fields:
+    - id: UUID string returned to the client as job id
+    - tenant_id: Owner used for per-tenant concurrency limits
+    - kind: Handler key, e.g. "generate_report", "export_pdf", "project_package"
+    - progress: 0.0-1.0 completion fraction reported by the handler
+    - progress_message: Human-readable current step
+    - payload_json / result_json: JSON strings
+    - claimed_by: JobRunner owner executing the job (status RUNNING)
+    - lease_expires_utc: Renewed by the owner's heartbeat; a RUNNING job whose
+      lease expired is re-claimable (the runner that held it is presumed dead)
+    """
+    __tablename__ = "aol_jobs"
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    tenant_id = Column(String(255), nullable=False, default="default")
+    kind = Column(String(100), nullable=False)
+    status = Column(String(20), nullable=False)  # QUEUED, RUNNING, SUCCEEDED, FAILED
+    progress = Column(Float, default=0.0, nullable=False)
+    progress_message = Column(Text, nullable=True)
+    payload_json = Column(Text, nullable=True)
+    result_json = Column(Text, nullable=True)
+    error = Column(Text, nullable=True)
+    created_at_utc = Column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at_utc = Column(DateTime, nullable=True)
+    finished_at_utc = Column(DateTime, nullable=True)
+    claimed_by = Column(String(255), nullable=True)
+    lease_expires_utc = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("idx_aol_jobs_status", "status"),
+        Index("idx_aol_jobs_tenant_status", "tenant_id", "status"),
+    )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "tenant_id": self.tenant_id,
+            "kind": self.kind,
+            "status": self.status,
+            "progress": self.progress,
+            "progress_message": self.progress_message,
+            "result": json.loads(self.result_json) if self.result_json else None,
+            "error": self.error,
+            "created_at_utc": self.created_at_utc.isoformat() if self.created_at_utc else None,
+            "started_at_utc": self.started_at_utc.isoformat() if self.started_at_utc else None,
+            "finished_at_utc": self.finished_at_utc.isoformat() if self.finished_at_utc else None,
+        }
+
+
+class AOLEventOutbox(Base):
+    """Durable outbox for orchestration events (BoundedEventBus).
+    
+    Events are written here before they are queued to subscribers, and
+    dispatched_at_utc is set once every subscriber has handled them. Rows
+    with dispatched_at_utc NULL are re-published on restart.
+    
+    Fields:
+    - event_id: Caller-supplied EventId
+    - event_type: Routing key (event_data["event_type"])
+    - payload_json: JSON-encoded event_data
+    """
+    __tablename__ = "aol_event_outbox"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    event_id = Column(String(255), nullable=False)
+    event_type = Column(String(255), nullable=False)
+    payload_json = Column(Text, nullable=False)
+    created_at_utc = Column(DateTime, default=datetime.utcnow, nullable=False)
+    dispatched_at_utc = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("idx_aol_event_outbox_dispatched", "dispatched_at_utc"),
+    )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "event_id": self.event_id,
+            "event_type": self.event_type,
+            "payload": json.loads(self.payload_json),
+            "created_at_utc": self.created_at_utc.isoformat() if self.created_at_utc else None,
+            "dispatched_at_utc": self.dispatched_at_utc.isoformat() if self.dispatched_at_utc else None,
+        }
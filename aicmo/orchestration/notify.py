@@ -0,0 +1,83 @@
+"""
+Enqueue Notifications - Wake idle AOL daemons when new actions arrive.
+
+Instead of sleep-polling an empty queue, daemons block on an EnqueueWaiter:
+- In-process: ActionQueue.enqueue_action sets a shared threading.Event
+- PostgreSQL: enqueue also issues NOTIFY on AOL_NOTIFY_CHANNEL inside the
+  enqueue transaction, and waiters LISTEN on a dedicated connection
+- Other databases: waiters fall back to the idle timeout (scheduled
+  not_before actions are picked up the same way)
+"""
+
+import select
+import threading
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+
+AOL_NOTIFY_CHANNEL = "aol_actions_enqueued"
+
+_local_enqueue_event = threading.Event()
+
+
+def notify_enqueued(session: Session) -> None:
+    """Signal waiters that an action was enqueued.
+
+    Must be called before the enqueue commit so the NOTIFY is delivered
+    only if the row becomes visible.
+    """
+    _local_enqueue_event.set()
+    bind = session.get_bind()
+    if bind is not None and bind.dialect.name == "postgresql":
+        session.execute(text("SELECT pg_notify(:channel, '')"), {"channel": AOL_NOTIFY_CHANNEL})
+
+
+class EnqueueWaiter:
+    """Blocks until an enqueue notification arrives or the timeout elapses."""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self._listen_conn = None
+        if engine.dialect.name == "postgresql":
+            try:
+                self._listen_conn = engine.raw_connection()
+                self._listen_conn.driver_connection.autocommit = True
+                cursor = self._listen_conn.cursor()
+                cursor.execute(f"LISTEN {AOL_NOTIFY_CHANNEL}")
+                cursor.close()
+            except Exception:
+                # Fall back to local event + timeout
+                self.close()
+
+    def wait(self, timeout: float) -> bool:
+        """Return True if woken by a notification, False on timeout."""
+        if self._listen_conn is not None:
+            driver_conn = self._listen_conn.driver_connection
+            if _local_enqueue_event.is_set():
+                _local_enqueue_event.clear()
+                return True
+            try:
+                ready, _, _ = select.select([driver_conn], [], [], timeout)
+                if not ready:
+                    return False
+                driver_conn.poll()
+                driver_conn.notifies.clear()
+            except Exception:
+                # A spurious wake-up only costs one empty claim query
+                pass
+            return True
+
+        woke = _local_enqueue_event.wait(timeout)
+        _local_enqueue_event.clear()
+        return woke
+
+    def close(self) -> None:
+        if self._listen_conn is not None:
+            try:
+                self._listen_conn.close()
+            except Exception:
+                pass
+            self._listen_conn = None
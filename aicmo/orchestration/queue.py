@@ -6,6 +6,9 @@ PENDING (not_before_utc not reached)
   ↓
 READY (available for processing)
   ↓
+RUNNING (claimed atomically by one daemon worker; claim_expires_utc is the
+         visibility timeout - an expired claim is re-claimable)
+  ↓
 (execute action)
   ├→ SUCCESS (terminal)
   ├→ FAILED (terminal, no retry)
@@ -24,10 +27,11 @@ import uuid
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 
-from sqlalchemy import select, and_
+from sqlalchemy import func, select, and_, or_, update
 from sqlalchemy.orm import Session
 
 from aicmo.orchestration.models import AOLAction, AOLExecutionLog
+from aicmo.orchestration.notify import notify_enqueued
 
 
 class ActionQueue:
@@ -37,6 +41,8 @@ class ActionQueue:
     
     MAX_RETRIES = 3
     RETRY_DELAY_SECONDS = 5
+    VISIBILITY_TIMEOUT_SECONDS = 60
+    CLAIMABLE_STATUSES = ("READY", "PENDING", "RETRY")
     
     @staticmethod
     def enqueue_action(
@@ -73,6 +79,8 @@ class ActionQueue:
             attempts=0,
         )
         session.add(action)
+        session.flush()
+        notify_enqueued(session)
         session.commit()
         return action
     
@@ -83,6 +91,8 @@ class ActionQueue:
         
         Ready = status is "READY" or "PENDING" with not_before_utc <= now
         
+        Read-only peek: rows are NOT claimed. Daemons must use claim_next.
+        
         Args:
             session: SQLAlchemy session
             max_actions: Max actions to fetch per call
@@ -108,12 +118,129 @@ class ActionQueue:
         return actions
     
     @staticmethod
-    def mark_success(session: Session, action_id: int) -> None:
-        """Mark action as successfully completed."""
+    def count_runnable(session: Session) -> int:
+        """Number of claimable actions whose not_before_utc has passed (queue depth)."""
+        now = datetime.utcnow()
+        stmt = select(func.count(AOLAction.id)).where(
+            AOLAction.status.in_(ActionQueue.CLAIMABLE_STATUSES),
+            (AOLAction.not_before_utc.is_(None) | (AOLAction.not_before_utc <= now)),
+        )
+        return session.execute(stmt).scalar_one()
+    
+    @staticmethod
+    def claim_next(
+        session: Session,
+        owner: str,
+        max_actions: int = 3,
+        visibility_timeout_seconds: Optional[int] = None,
+    ) -> List[AOLAction]:
+        """
+        Atomically claim up to max_actions runnable actions for owner.
+        
+        Runnable = READY/PENDING/RETRY with not_before_utc <= now, or RUNNING
+        whose claim expired (the worker holding it is presumed crashed).
+        
+        The claim is a single UPDATE ... RETURNING status transition, so two
+        daemons can never claim the same row:
+        - PostgreSQL: candidate rows are locked with FOR UPDATE SKIP LOCKED
+        - SQLite: the UPDATE holds the database write lock
+        
+        Args:
+            session: SQLAlchemy session
+            owner: Daemon owner identifier (see lease.get_daemon_owner)
+            max_actions: Max actions to claim per call
+            visibility_timeout_seconds: Claim lifetime (default VISIBILITY_TIMEOUT_SECONDS)
+        
+        Returns:
+            List of claimed AOLAction records (status RUNNING)
+        """
+        now = datetime.utcnow()
+        timeout = visibility_timeout_seconds or ActionQueue.VISIBILITY_TIMEOUT_SECONDS
+        
+        candidates = (
+            select(AOLAction.id)
+            .where(
+                or_(
+                    and_(
+                        AOLAction.status.in_(ActionQueue.CLAIMABLE_STATUSES),
+                        (AOLAction.not_before_utc.is_(None) | (AOLAction.not_before_utc <= now)),
+                    ),
+                    and_(
+                        AOLAction.status == "RUNNING",
+                        AOLAction.claim_expires_utc < now,
+                    ),
+                )
+            )
+            .order_by(AOLAction.id)
+            .limit(max_actions)
+        )
+        if session.get_bind().dialect.name == "postgresql":
+            candidates = candidates.with_for_update(skip_locked=True)
+        
+        stmt = (
+            update(AOLAction)
+            .where(AOLAction.id.in_(candidates.scalar_subquery()))
+            .values(
+                status="RUNNING",
+                claimed_by=owner,
+                claim_expires_utc=now + timedelta(seconds=timeout),
+            )
+            .returning(AOLAction)
+            .execution_options(synchronize_session="fetch")
+        )
+        actions = session.execute(stmt).scalars().all()
+        session.commit()
+        return sorted(actions, key=lambda a: a.id)
+    
+    @staticmethod
+    def extend_claims(
+        session: Session,
+        owner: str,
+        action_ids: List[int],
+        visibility_timeout_seconds: Optional[float] = None,
+    ) -> int:
+        """
+        Heartbeat: push back claim_expires_utc on owner's RUNNING claims.
+        
+        The daemon calls this for every action it has claimed but not yet
+        finished, so a long-running (or still queued) action is never
+        re-claimed by another worker.
+        
+        Returns:
+            Number of claims still held by owner
+        """
+        if not action_ids:
+            return 0
+        timeout = visibility_timeout_seconds or ActionQueue.VISIBILITY_TIMEOUT_SECONDS
+        stmt = (
+            update(AOLAction)
+            .where(
+                AOLAction.id.in_(action_ids),
+                AOLAction.status == "RUNNING",
+                AOLAction.claimed_by == owner,
+            )
+            .values(claim_expires_utc=datetime.utcnow() + timedelta(seconds=timeout))
+            .execution_options(synchronize_session=False)
+        )
+        result = session.execute(stmt)
+        session.commit()
+        return result.rowcount
+    
+    @staticmethod
+    def _release_claim(action: AOLAction) -> None:
+        action.claimed_by = None
+        action.claim_expires_utc = None
+    
+    @staticmethod
+    def mark_success(session: Session, action_id: int, notes: Optional[str] = None) -> None:
+        """Mark action as successfully completed (notes, if given, are logged at INFO)."""
         action = session.get(AOLAction, action_id)
         if action:
             action.status = "SUCCESS"
+            ActionQueue._release_claim(action)
             session.commit()
+            if notes:
+                ActionQueue.log_execution(session, action_id, "INFO", notes)
     
     @staticmethod
     def mark_failed(session: Session, action_id: int, error_msg: str) -> None:
@@ -122,6 +249,7 @@ class ActionQueue:
         if action:
             action.status = "FAILED"
             action.last_error = error_msg
+            ActionQueue._release_claim(action)
             session.commit()
     
     @staticmethod
@@ -133,6 +261,7 @@ class ActionQueue:
         
         action.attempts += 1
         action.last_error = error_msg
+        ActionQueue._release_claim(action)
         
         if action.attempts >= ActionQueue.MAX_RETRIES:
             action.status = "DLQ"
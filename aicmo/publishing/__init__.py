@@ -8,6 +8,8 @@ Multi-channel content distribution system that leverages:
 Key components:
 - models: Content, PublishingJob, PublishingCampaign
 - pipeline: Publishing orchestration across channels
+- store: Durable PublishingJob state, queryable by campaign
+- channels: Channel adapters (SocialPoster gateways, FakeChannelPoster)
 
 Supported channels:
 - LinkedIn, Twitter/X, Instagram (via SocialPoster chains)
@@ -48,6 +50,10 @@ from aicmo.publishing.models import (
     PublishingCampaign,
 )
 
+from aicmo.publishing.store import PublishingJobStore
+
+from aicmo.publishing.channels import FakeChannelPoster, get_channel_poster
+
 from aicmo.publishing.pipeline import (
     PublishingPipeline,
     get_publishing_pipeline,
@@ -67,6 +73,10 @@ __all__ = [
     "Content",
     "PublishingJob",
     "PublishingCampaign",
+    # Job store and channels
+    "PublishingJobStore",
+    "FakeChannelPoster",
+    "get_channel_poster",
     # Pipeline
     "PublishingPipeline",
     "get_publishing_pipeline",
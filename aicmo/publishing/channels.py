@@ -0,0 +1,101 @@
+"""
+Channel adapters for the publishing pipeline.
+
+Channels publish through the gateway SocialPoster interface
+(aicmo.gateways.interfaces): real LinkedIn/Twitter/Instagram posters when
+configured, no-op posters otherwise. FakeChannelPoster publishes nowhere
+and is meant for offline tests and dry runs: it records every post and can
+simulate latency and failures.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from aicmo.domain.execution import ContentItem, ExecutionResult, ExecutionStatus
+from aicmo.gateways.interfaces import SocialPoster
+from aicmo.publishing.models import Channel, ContentVersion
+
+
+def get_channel_poster(channel: Channel) -> SocialPoster:
+    """The configured gateway for a channel (no-op unless real gateways are enabled)."""
+    from aicmo.gateways.factory import get_social_poster
+
+    return get_social_poster(channel.value)
+
+
+def to_content_item(channel: Channel, version: ContentVersion) -> ContentItem:
+    """Gateway payload for one platform version of a content item."""
+    body = version.body
+    if version.hashtags:
+        body = f"{body}\n\n{' '.join('#' + tag.lstrip('#') for tag in version.hashtags)}"
+    return ContentItem(
+        platform=channel.value,
+        title=version.title,
+        body_text=body,
+        caption=version.description,
+        cta=version.cta_text,
+    )
+
+
+class FakeChannelPoster(SocialPoster):
+    """
+    Offline channel: succeeds after latency_seconds unless a failure is scripted.
+
+    failures maps a content title to how many attempts at it fail before one
+    succeeds (use a large number for a permanent failure). in_flight and
+    max_in_flight record concurrency for tests.
+    """
+
+    def __init__(
+        self,
+        platform: str = "fake",
+        latency_seconds: float = 0.0,
+        failures: Optional[Dict[str, int]] = None,
+    ):
+        self.platform = platform
+        self.latency_seconds = latency_seconds
+        self.failures = dict(failures or {})
+        self.posts: List[ContentItem] = []
+        self.attempts = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def post(self, content: ContentItem) -> ExecutionResult:
+        self.attempts += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.latency_seconds:
+                await asyncio.sleep(self.latency_seconds)
+        finally:
+            self.in_flight -= 1
+
+        if self.failures.get(content.title or "", 0) > 0:
+            self.failures[content.title] -= 1
+            return ExecutionResult(
+                status=ExecutionStatus.FAILED,
+                platform=self.platform,
+                error_message=f"Simulated {self.platform} failure",
+                executed_at=datetime.utcnow(),
+            )
+
+        self.posts.append(content)
+        post_id = f"{self.platform}_{uuid.uuid4().hex[:8]}"
+        return ExecutionResult(
+            status=ExecutionStatus.SUCCESS,
+            platform=self.platform,
+            platform_post_id=post_id,
+            metadata={"url": f"https://{self.platform}.example/posts/{post_id}"},
+            executed_at=datetime.utcnow(),
+        )
+
+    async def validate_credentials(self) -> bool:
+        return True
+
+    def get_platform_name(self) -> str:
+        return self.platform
+
+
+__all__ = ["FakeChannelPoster", "get_channel_poster", "to_content_item"]
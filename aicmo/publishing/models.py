@@ -76,6 +76,8 @@ class PublishingJob:
     content_id: str = ""
     channel: Channel = Channel.LINKEDIN
     status: PublishingStatus = PublishingStatus.DRAFT
+    campaign_id: Optional[str] = None
+    attempts: int = 0
     scheduled_time: Optional[datetime] = None
     published_time: Optional[datetime] = None
     external_post_id: Optional[str] = None
@@ -84,18 +86,52 @@ class PublishingJob:
     error_message: Optional[str] = None
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
+    owner: Optional[str] = None  # publisher holding the PUBLISHING claim
+    lease_until: Optional[datetime] = None  # claim expiry; an expired claim can be taken over
+    
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (PublishingStatus.PUBLISHED, PublishingStatus.FAILED)
+    
+    def is_leased(self, now: Optional[datetime] = None) -> bool:
+        """PUBLISHING under a claim that has not expired yet."""
+        return (
+            self.status == PublishingStatus.PUBLISHING
+            and self.lease_until is not None
+            and self.lease_until > (now or datetime.now())
+        )
+    
+    def _release(self):
+        self.owner = None
+        self.lease_until = None
+    
+    def mark_queued(self, error: Optional[str] = None):
+        self.status = PublishingStatus.QUEUED
+        self.error_message = error
+        self._release()
+        self.updated_at = datetime.now()
+    
+    def mark_publishing(self):
+        self.status = PublishingStatus.PUBLISHING
+        self.attempts += 1
+        self.updated_at = datetime.now()
     
     def mark_published(self, external_post_id: Optional[str] = None, external_url: Optional[str] = None):
         self.status = PublishingStatus.PUBLISHED
         self.published_time = datetime.now()
         self.external_post_id = external_post_id
         self.external_url = external_url
+        self.error_message = None
+        self._release()
+        self.updated_at = self.published_time
     
     def mark_failed(self, error: str, details: Optional[str] = None):
         self.status = PublishingStatus.FAILED
         self.error_message = error
         if details:
             self.error_message += f": {details}"
+        self._release()
+        self.updated_at = datetime.now()
     
     def get_metric(self, metric: PublishingMetrics) -> int:
         return self.metrics.get(metric, 0)
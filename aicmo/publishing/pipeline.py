@@ -1,54 +1,337 @@
-"""Phase 2: Publishing Pipeline"""
-from typing import Optional, List, Dict, Any
+"""
+Phase 2: Publishing Pipeline
+
+Campaigns fan out into one PublishingJob per (content item, channel), and all
+jobs are published concurrently through the channels' SocialPoster adapters:
+- at most AICMO_PUBLISHING_MAX_CONCURRENCY posts in flight overall and
+  AICMO_PUBLISHING_CHANNEL_CONCURRENCY per channel
+- each channel paced by a token bucket (AICMO_PUBLISHING_CHANNEL_RATE_PER_SECOND)
+- failed posts retried up to AICMO_PUBLISHING_MAX_ATTEMPTS times with
+  exponential backoff (AICMO_PUBLISHING_RETRY_BACKOFF_SECONDS)
+
+Job state is written through to PublishingJobStore, so jobs are queryable by
+campaign and survive restarts: publishing a campaign again skips what was
+published, resumes interrupted jobs and retries failed ones.
+
+Every post is preceded by an atomic claim in the store (one lease of
+AICMO_PUBLISHING_LEASE_SECONDS per attempt), so several processes can
+publish the same campaign without posting a job twice; a PUBLISHING job is
+only resumed once its lease has expired.
+"""
+from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Any, Iterable, Tuple
 import asyncio
 import logging
+import os
+import socket
+import time
+import uuid
+from aicmo.domain.execution import ExecutionStatus
+from aicmo.gateways.interfaces import SocialPoster
+from aicmo.publishing.channels import get_channel_poster, to_content_item
 from aicmo.publishing.models import (
     Content, PublishingJob, PublishingCampaign,
     Channel, PublishingStatus
 )
+from aicmo.publishing.store import PublishingJobStore
+from aicmo.shared import metrics
+from aicmo.shared.config import settings
+from aicmo.shared.rate_limit import TokenBucket
 
 logger = logging.getLogger(__name__)
 
 class PublishingPipeline:
     """Orchestrates publishing across channels"""
-    
-    def __init__(self):
+
+    def __init__(
+        self,
+        store: Optional[PublishingJobStore] = None,
+        posters: Optional[Dict[Channel, SocialPoster]] = None,
+    ):
         try:
             from aicmo.crm import get_crm_repository
             self.crm = get_crm_repository()
         except:
             self.crm = None
+        self.store = store if store is not None else self._default_store()
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.posters: Dict[Channel, SocialPoster] = dict(posters or {})
+        self.limiters: Dict[Channel, TokenBucket] = {}
+        self.contents: Dict[str, Content] = {}
         self.publishing_jobs: Dict[str, PublishingJob] = {}
-    
-    async def publish_content(self, content: Content, channels: List[Channel], created_by: Optional[str] = None):
-        """Publish content to channels"""
+
+    @staticmethod
+    def _default_store() -> Optional[PublishingJobStore]:
+        if not settings.PUBLISHING_JOBS_PATH:
+            return None
+        try:
+            return PublishingJobStore()
+        except Exception as e:
+            logger.warning(f"Publishing job store unavailable, jobs are kept in memory only: {e}")
+            return None
+
+    # ── publishing ───────────────────────────────────────────────
+
+    async def publish_content(
+        self,
+        content: Content,
+        channels: List[Channel],
+        created_by: Optional[str] = None,
+        campaign_id: Optional[str] = None,
+    ):
+        """Publish content to channels concurrently; returns {channel: job}"""
         results = {}
-        
+
         if not content.is_approved:
             return results
-        
-        for channel in channels:
-            job = PublishingJob(content_id=content.content_id, channel=channel)
-            version = content.get_version_for_platform(channel)
-            
-            if not version:
-                job.mark_failed(f"No content version for {channel.value}")
-            else:
-                job.mark_published()
-            
-            self.publishing_jobs[job.job_id] = job
-            results[channel] = job
-        
+
+        self.contents[content.content_id] = content
+        for channel in dict.fromkeys(channels):
+            results[channel] = PublishingJob(
+                content_id=content.content_id,
+                channel=channel,
+                campaign_id=campaign_id,
+                status=PublishingStatus.QUEUED,
+            )
+
+        self._add_new(results.values())
+        await self._publish_jobs([(job, content) for job in results.values()])
         return results
-    
-    async def publish_campaign(self, campaign: PublishingCampaign, created_by: Optional[str] = None):
-        results = {}
+
+    async def publish_campaign(
+        self,
+        campaign: PublishingCampaign,
+        created_by: Optional[str] = None,
+        contents: Optional[Iterable[Content]] = None,
+    ):
+        """
+        Publish every content item of a campaign to every campaign channel.
+
+        Content is looked up in contents, then among content this pipeline has
+        published before. Returns {content_id: {channel: job}}.
+        """
+        for content in contents or ():
+            self.contents[content.content_id] = content
+        existing = self._campaign_targets(campaign.campaign_id)
+        missing = [
+            PublishingJob(
+                content_id=content_id,
+                channel=channel,
+                campaign_id=campaign.campaign_id,
+                status=PublishingStatus.QUEUED,
+            )
+            for content_id in campaign.content_ids
+            for channel in campaign.channels
+            if (content_id, channel) not in existing
+        ]
+        if missing:
+            # Every job is on record before the first post goes out. A concurrent
+            # publisher may have inserted the same targets first; its jobs win.
+            self._add_new(missing)
+            existing = {
+                **{(job.content_id, job.channel): job for job in missing},
+                **self._campaign_targets(campaign.campaign_id),
+            }
+
+        now = datetime.now()
+        results: Dict[str, Dict[Channel, PublishingJob]] = {}
+        work: List[Tuple[PublishingJob, Content]] = []
+        changed: List[PublishingJob] = []
         for content_id in campaign.content_ids:
+            content = self.contents.get(content_id)
             results[content_id] = {}
+            for channel in campaign.channels:
+                job = existing[(content_id, channel)]
+                results[content_id][channel] = job
+
+                # Published, or being posted right now by another publisher
+                if job.status == PublishingStatus.PUBLISHED or job.is_leased(now):
+                    continue
+                if job.status == PublishingStatus.FAILED:
+                    job.attempts = 0  # a new run gets a fresh retry budget
+
+                if content is None:
+                    job.mark_failed("Content not found", content_id)
+                    changed.append(job)
+                elif not content.is_approved:
+                    job.mark_failed("Content not approved")
+                    changed.append(job)
+                else:
+                    # QUEUED jobs and PUBLISHING jobs whose lease ran out (e.g. the
+                    # publisher crashed) are resumed; the claim decides who posts
+                    if job.status not in (PublishingStatus.QUEUED, PublishingStatus.PUBLISHING):
+                        job.mark_queued()
+                        changed.append(job)
+                    work.append((job, content))
+
+        self._save_many(changed)
+        logger.info(
+            f"Publishing campaign {campaign.campaign_id}: {len(work)} jobs across "
+            f"{len(campaign.channels)} channels"
+        )
+        await self._publish_jobs(work)
         return results
-    
+
+    async def _publish_jobs(self, work: List[Tuple[PublishingJob, Content]]) -> None:
+        """Publish jobs concurrently within the overall and per-channel limits."""
+        if not work:
+            return
+        overall = asyncio.Semaphore(max(1, settings.PUBLISHING_MAX_CONCURRENCY))
+        per_channel = {
+            channel: asyncio.Semaphore(max(1, settings.PUBLISHING_CHANNEL_CONCURRENCY))
+            for channel in {job.channel for job, _ in work}
+        }
+        await asyncio.gather(*(
+            self._publish_job(job, content, overall, per_channel[job.channel])
+            for job, content in work
+        ))
+
+    async def _publish_job(
+        self,
+        job: PublishingJob,
+        content: Content,
+        overall: asyncio.Semaphore,
+        channel_slots: asyncio.Semaphore,
+    ) -> None:
+        version = content.get_version_for_platform(job.channel)
+        if not version:
+            job.mark_failed(f"No content version for {job.channel.value}")
+            self._save(job)
+            return
+
+        item = to_content_item(job.channel, version)
+        poster = self._poster(job.channel)
+        limiter = self._limiter(job.channel)
+        max_attempts = max(1, settings.PUBLISHING_MAX_ATTEMPTS)
+
+        while True:
+            async with channel_slots:
+                await limiter.acquire()
+                async with overall:
+                    if not self._claim(job):
+                        return
+                    started = time.perf_counter()
+                    try:
+                        result = await poster.post(item)
+                        error = None if result.status == ExecutionStatus.SUCCESS else (
+                            result.error_message or f"Post {result.status.value}"
+                        )
+                    except Exception as e:
+                        result, error = None, f"{type(e).__name__}: {e}"
+                    metrics.record_provider_call(
+                        "publishing", job.channel.value, error is None, time.perf_counter() - started
+                    )
+
+            if error is None:
+                job.mark_published(result.platform_post_id, (result.metadata or {}).get("url"))
+                self._save(job)
+                return
+            if job.attempts >= max_attempts:
+                logger.warning(f"Publishing job {job.job_id} ({job.channel.value}) failed: {error}")
+                job.mark_failed(error, f"gave up after {job.attempts} attempts")
+                self._save(job)
+                return
+
+            # Back off outside the concurrency slots so other jobs keep going
+            job.mark_queued(error)
+            self._save(job)
+            await asyncio.sleep(settings.PUBLISHING_RETRY_BACKOFF_SECONDS * 2 ** (job.attempts - 1))
+
+    def _poster(self, channel: Channel) -> SocialPoster:
+        poster = self.posters.get(channel)
+        if poster is None:
+            poster = self.posters[channel] = get_channel_poster(channel)
+        return poster
+
+    def _limiter(self, channel: Channel) -> TokenBucket:
+        limiter = self.limiters.get(channel)
+        if limiter is None:
+            limiter = self.limiters[channel] = TokenBucket(settings.PUBLISHING_CHANNEL_RATE_PER_SECOND)
+        return limiter
+
+    # ── job state ────────────────────────────────────────────────
+
+    def _claim(self, job: PublishingJob) -> bool:
+        """Claim job for this pipeline before posting; False if it is not ours to post."""
+        lease_seconds = settings.PUBLISHING_LEASE_SECONDS
+        if self.store is None:
+            if job.is_finished or job.is_leased():
+                return False
+            job.mark_publishing()
+            job.owner = self.owner
+            job.lease_until = datetime.now() + timedelta(seconds=lease_seconds)
+            self.publishing_jobs[job.job_id] = job
+            return True
+        try:
+            claimed = self.store.claim(job.job_id, self.owner, lease_seconds)
+        except Exception as e:
+            logger.error(f"Failed to claim publishing job {job.job_id}: {e}")
+            return False
+        if claimed is None:
+            logger.info(f"Publishing job {job.job_id} was finished or claimed by another publisher")
+            return False
+        for name in ("status", "attempts", "owner", "lease_until", "updated_at"):
+            setattr(job, name, getattr(claimed, name))
+        self.publishing_jobs[job.job_id] = job
+        return True
+
+    def _save(self, job: PublishingJob) -> None:
+        self._save_many([job])
+
+    def _save_many(self, jobs: Iterable[PublishingJob]) -> None:
+        """Write jobs through; rows another publisher has claimed are left alone."""
+        jobs = list(jobs)
+        for job in jobs:
+            self.publishing_jobs[job.job_id] = job
+        if self.store is None or not jobs:
+            return
+        try:
+            self.store.save_many(jobs, owner=self.owner)
+        except Exception as e:
+            logger.error(f"Failed to persist {len(jobs)} publishing job(s): {e}")
+
+    def _add_new(self, jobs: Iterable[PublishingJob]) -> None:
+        jobs = list(jobs)
+        for job in jobs:
+            self.publishing_jobs[job.job_id] = job
+        if self.store is None:
+            return
+        try:
+            self.store.add_new(jobs)
+        except Exception as e:
+            logger.error(f"Failed to persist {len(jobs)} publishing job(s): {e}")
+
+    def _campaign_targets(self, campaign_id: str) -> Dict[Tuple[str, Channel], PublishingJob]:
+        return {(job.content_id, job.channel): job for job in self.get_campaign_jobs(campaign_id)}
+
     def get_publishing_job(self, job_id: str) -> Optional[PublishingJob]:
-        return self.publishing_jobs.get(job_id)
+        job = self.publishing_jobs.get(job_id)
+        if job is None and self.store is not None:
+            job = self.store.get(job_id)
+        return job
+
+    def get_campaign_jobs(
+        self,
+        campaign_id: str,
+        status: Optional[PublishingStatus] = None,
+    ) -> List[PublishingJob]:
+        """A campaign's jobs, from the store when there is one."""
+        if self.store is not None:
+            return self.store.jobs_for_campaign(campaign_id, status)
+        return [
+            job for job in self.publishing_jobs.values()
+            if job.campaign_id == campaign_id and (status is None or job.status == status)
+        ]
+
+    def get_campaign_summary(self, campaign_id: str) -> Dict[str, Dict[str, int]]:
+        """{channel: {status: count}} for a campaign."""
+        if self.store is not None:
+            return self.store.campaign_summary(campaign_id)
+        summary: Dict[str, Dict[str, int]] = {}
+        for job in self.get_campaign_jobs(campaign_id):
+            by_status = summary.setdefault(job.channel.value, {})
+            by_status[job.status.value] = by_status.get(job.status.value, 0) + 1
+        return summary
 
 _pipeline_instance: Optional[PublishingPipeline] = None
 
@@ -58,14 +341,19 @@ def get_publishing_pipeline() -> PublishingPipeline:
         _pipeline_instance = PublishingPipeline()
     return _pipeline_instance
 
-def reset_publishing_pipeline():
+def reset_publishing_pipeline(pipeline: Optional[PublishingPipeline] = None):
+    """Drop the shared pipeline, or replace it (e.g. with one on a test store)."""
     global _pipeline_instance
-    _pipeline_instance = None
+    _pipeline_instance = pipeline
 
 async def publish_content(content: Content, channels: List[Channel], created_by: Optional[str] = None):
     pipeline = get_publishing_pipeline()
     return await pipeline.publish_content(content, channels, created_by)
 
-async def publish_campaign(campaign: PublishingCampaign, created_by: Optional[str] = None):
+async def publish_campaign(
+    campaign: PublishingCampaign,
+    created_by: Optional[str] = None,
+    contents: Optional[Iterable[Content]] = None,
+):
     pipeline = get_publishing_pipeline()
-    return await pipeline.publish_campaign(campaign, created_by)
+    return await pipeline.publish_campaign(campaign, created_by, contents)
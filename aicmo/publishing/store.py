@@ -0,0 +1,266 @@
+"""
+Durable publishing job state.
+
+Jobs live in SQLite (AICMO_PUBLISHING_JOBS_PATH). A campaign's jobs are
+written as QUEUED before any of them is published, and every status change
+is written through, so after a restart the unfinished jobs of a campaign
+are still on record and publish_campaign() resumes them.
+
+A job is unique per (campaign, content, channel): publishing a campaign
+again reuses its jobs instead of creating duplicates.
+
+Before a post goes out the publisher claims the job with one conditional
+UPDATE (claim()): QUEUED jobs, and PUBLISHING jobs whose lease has run out,
+become PUBLISHING under the publisher's owner id until lease_until. Writes
+made with save_many(owner=...) never overwrite another publisher's live
+claim, so two processes publishing the same campaign post each job once.
+"""
+
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from aicmo.publishing.models import Channel, PublishingJob, PublishingMetrics, PublishingStatus
+from aicmo.shared.config import settings
+from aicmo.shared.db import get_sqlite_connection
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS publishing_jobs (
+        job_id TEXT PRIMARY KEY,
+        campaign_id TEXT,
+        content_id TEXT NOT NULL,
+        channel TEXT NOT NULL,
+        status TEXT NOT NULL,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        scheduled_time TEXT,
+        published_time TEXT,
+        external_post_id TEXT,
+        external_url TEXT,
+        metrics TEXT,
+        error_message TEXT,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        owner TEXT,
+        lease_until TEXT
+    )
+    """,
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_publishing_job_target
+    ON publishing_jobs (campaign_id, content_id, channel) WHERE campaign_id IS NOT NULL
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_publishing_job_status ON publishing_jobs (campaign_id, status)",
+)
+
+_COLUMNS = (
+    "job_id", "campaign_id", "content_id", "channel", "status", "attempts",
+    "scheduled_time", "published_time", "external_post_id", "external_url",
+    "metrics", "error_message", "created_at", "updated_at", "owner", "lease_until",
+)
+
+# Columns added after the first release; ALTERed into existing databases
+_ADDED_COLUMNS = (("owner", "TEXT"), ("lease_until", "TEXT"))
+
+_VALUES = f"({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})"
+
+_UPSERT = f"INSERT OR REPLACE INTO publishing_jobs {_VALUES}"
+
+_INSERT_NEW = f"INSERT OR IGNORE INTO publishing_jobs {_VALUES}"
+
+# Upsert that leaves rows claimed by another owner (with a live lease) untouched
+_GUARDED_UPSERT = (
+    f"INSERT INTO publishing_jobs {_VALUES} ON CONFLICT(job_id) DO UPDATE SET "
+    + ", ".join(f"{c} = excluded.{c}" for c in _COLUMNS if c != "job_id")
+    + " WHERE publishing_jobs.status != 'publishing' OR publishing_jobs.owner IS NULL"
+    " OR publishing_jobs.owner = ? OR publishing_jobs.lease_until IS NULL"
+    " OR publishing_jobs.lease_until < ?"
+)
+
+# Pre-lease rows (lease_until NULL) left PUBLISHING by a crash are claimable too
+_CLAIM = (
+    "UPDATE publishing_jobs SET status = 'publishing', owner = ?, lease_until = ?, "
+    "attempts = attempts + 1, updated_at = ? "
+    "WHERE job_id = ? AND (status = 'queued' OR (status = 'publishing' "
+    "AND (lease_until IS NULL OR lease_until < ?)))"
+)
+
+_UNFINISHED = (PublishingStatus.QUEUED.value, PublishingStatus.PUBLISHING.value)
+
+
+def _time(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _to_row(job: PublishingJob) -> tuple:
+    return (
+        job.job_id,
+        job.campaign_id,
+        job.content_id,
+        job.channel.value,
+        job.status.value,
+        job.attempts,
+        _time(job.scheduled_time),
+        _time(job.published_time),
+        job.external_post_id,
+        job.external_url,
+        json.dumps({m.value: v for m, v in job.metrics.items()}) if job.metrics else None,
+        job.error_message,
+        _time(job.created_at),
+        _time(job.updated_at),
+        job.owner,
+        _time(job.lease_until),
+    )
+
+
+def _from_row(row) -> PublishingJob:
+    values = dict(zip(_COLUMNS, row))
+    metrics = json.loads(values["metrics"]) if values["metrics"] else {}
+    return PublishingJob(
+        job_id=values["job_id"],
+        campaign_id=values["campaign_id"],
+        content_id=values["content_id"],
+        channel=Channel(values["channel"]),
+        status=PublishingStatus(values["status"]),
+        attempts=values["attempts"],
+        scheduled_time=_parse_time(values["scheduled_time"]),
+        published_time=_parse_time(values["published_time"]),
+        external_post_id=values["external_post_id"],
+        external_url=values["external_url"],
+        metrics={PublishingMetrics(m): v for m, v in metrics.items()},
+        error_message=values["error_message"],
+        created_at=_parse_time(values["created_at"]),
+        updated_at=_parse_time(values["updated_at"]),
+        owner=values["owner"],
+        lease_until=_parse_time(values["lease_until"]),
+    )
+
+
+class PublishingJobStore:
+    """SQLite store of PublishingJob records, queryable by campaign."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = os.path.expanduser(path or settings.PUBLISHING_JOBS_PATH)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._conn()
+        for statement in _SCHEMA:
+            conn.execute(statement)
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(publishing_jobs)")}
+        for column, kind in _ADDED_COLUMNS:
+            if column not in existing:
+                conn.execute(f"ALTER TABLE publishing_jobs ADD COLUMN {column} {kind}")
+        conn.commit()
+
+    def _conn(self):
+        return get_sqlite_connection(self.path)
+
+    def save(self, job: PublishingJob) -> None:
+        self.save_many([job])
+
+    def save_many(self, jobs: Iterable[PublishingJob], owner: Optional[str] = None) -> None:
+        """
+        Insert or update jobs in one transaction.
+
+        With owner, a job that another owner has claimed (PUBLISHING with a
+        live lease) is left as it is in the store.
+        """
+        rows = [_to_row(job) for job in jobs]
+        if not rows:
+            return
+        if owner is None:
+            self._write(_UPSERT, rows)
+        else:
+            now = _time(datetime.now())
+            self._write(_GUARDED_UPSERT, [row + (owner, now) for row in rows])
+
+    def add_new(self, jobs: Iterable[PublishingJob]) -> None:
+        """Insert jobs; a job whose (campaign, content, channel) is already stored is skipped."""
+        rows = [_to_row(job) for job in jobs]
+        if rows:
+            self._write(_INSERT_NEW, rows)
+
+    def _write(self, sql: str, rows: List[tuple]) -> None:
+        conn = self._conn()
+        try:
+            conn.executemany(sql, rows)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def claim(self, job_id: str, owner: str, lease_seconds: float) -> Optional[PublishingJob]:
+        """
+        Atomically make a QUEUED (or lease-expired PUBLISHING) job PUBLISHING
+        for owner, counting an attempt. Returns the claimed job, or None if it
+        is finished or claimed by someone else.
+        """
+        now = datetime.now()
+        conn = self._conn()
+        try:
+            cursor = conn.execute(
+                _CLAIM,
+                (owner, _time(now + timedelta(seconds=lease_seconds)), _time(now), job_id, _time(now)),
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        return self.get(job_id) if cursor.rowcount == 1 else None
+
+    def get(self, job_id: str) -> Optional[PublishingJob]:
+        row = self._conn().execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM publishing_jobs WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        return _from_row(row) if row else None
+
+    def jobs_for_campaign(
+        self,
+        campaign_id: str,
+        status: Optional[PublishingStatus] = None,
+    ) -> List[PublishingJob]:
+        """A campaign's jobs (optionally with one status), oldest first."""
+        sql = f"SELECT {', '.join(_COLUMNS)} FROM publishing_jobs WHERE campaign_id = ?"
+        params: tuple = (campaign_id,)
+        if status is not None:
+            sql += " AND status = ?"
+            params += (status.value,)
+        rows = self._conn().execute(sql + " ORDER BY created_at, job_id", params).fetchall()
+        return [_from_row(row) for row in rows]
+
+    def unfinished_campaigns(self) -> List[str]:
+        """Campaigns with jobs still QUEUED or PUBLISHING (e.g. interrupted by a restart)."""
+        rows = self._conn().execute(
+            "SELECT DISTINCT campaign_id FROM publishing_jobs "
+            "WHERE campaign_id IS NOT NULL AND status IN (?, ?)",
+            _UNFINISHED,
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def campaign_summary(self, campaign_id: str) -> Dict[str, Dict[str, int]]:
+        """{channel: {status: count}} for a campaign, from one aggregate query."""
+        rows = self._conn().execute(
+            "SELECT channel, status, COUNT(*) FROM publishing_jobs "
+            "WHERE campaign_id = ? GROUP BY channel, status",
+            (campaign_id,),
+        ).fetchall()
+        summary: Dict[str, Dict[str, int]] = {}
+        for channel, status, count in rows:
+            summary.setdefault(channel, {})[status] = count
+        return summary
+
+    def clear(self) -> None:
+        conn = self._conn()
+        conn.execute("DELETE FROM publishing_jobs")
+        conn.commit()
+
+
+__all__ = ["PublishingJobStore"]
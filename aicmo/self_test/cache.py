@@ -0,0 +1,134 @@
+"""
+Self-Test Engine Result Cache
+
+Generator scenario results keyed by a content hash of everything that
+determines them: the generator module's source, the self-test harness
+(checkers, validators, result models), the brief and the run options. A
+generator whose source and inputs are unchanged is not re-run; editing the
+generator, a checker or a brief changes the key. Changes in modules the
+generator imports are not part of the key; clear the cache (or run with
+caching disabled) after changing shared generator helpers.
+
+Only passing and skipped scenarios are cached, so failures are always
+re-run.
+"""
+
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import pickle
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from aicmo.shared.db import get_sqlite_connection
+
+
+logger = logging.getLogger(__name__)
+
+# Self-test modules whose code shapes a cached result
+HARNESS_MODULES = (
+    "aicmo.self_test.format_checkers",
+    "aicmo.self_test.models",
+    "aicmo.self_test.quality_checkers",
+    "aicmo.self_test.security_checkers",
+    "aicmo.self_test.semantic_checkers",
+    "aicmo.self_test.validators",
+    "aicmo.self_test.workers",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS self_test_results (
+    key TEXT PRIMARY KEY,
+    feature TEXT NOT NULL,
+    result BLOB NOT NULL,
+    created_at TEXT NOT NULL
+)
+"""
+
+
+def source_fingerprint(module_path: str) -> Optional[str]:
+    """SHA-256 of a module's source file, or None if it cannot be located."""
+    try:
+        spec = importlib.util.find_spec(module_path)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.origin or not os.path.isfile(spec.origin):
+        return None
+    with open(spec.origin, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def harness_fingerprint() -> str:
+    """Combined fingerprint of the self-test harness modules."""
+    digest = hashlib.sha256()
+    for module_path in HARNESS_MODULES:
+        digest.update(module_path.encode())
+        digest.update((source_fingerprint(module_path) or "").encode())
+    return digest.hexdigest()
+
+
+def scenario_key(generator_fingerprint: str, brief: Any, options: Dict[str, Any]) -> str:
+    """Cache key for one generator run on one brief with the given options."""
+    if hasattr(brief, "model_dump_json"):
+        brief_json = brief.model_dump_json()
+    else:
+        brief_json = json.dumps(brief, sort_keys=True, default=str)
+    digest = hashlib.sha256()
+    for part in (
+        generator_fingerprint,
+        harness_fingerprint(),
+        brief_json,
+        json.dumps(options, sort_keys=True, default=str),
+    ):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class SelfTestCache:
+    """SQLite store of cached self-test results."""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._conn()
+        conn.execute(_SCHEMA)
+        conn.commit()
+
+    def _conn(self):
+        return get_sqlite_connection(self.path)
+
+    def get(self, key: str) -> Optional[Any]:
+        """The cached result for key, or None (also if it can no longer be loaded)."""
+        row = self._conn().execute(
+            "SELECT result FROM self_test_results WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            return pickle.loads(row[0])
+        except Exception as e:
+            logger.debug(f"Discarding unreadable self-test cache entry {key[:12]}: {e}")
+            return None
+
+    def put(self, key: str, feature: str, result: Any) -> None:
+        conn = self._conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO self_test_results (key, feature, result, created_at) VALUES (?, ?, ?, ?)",
+            (key, feature, pickle.dumps(result), datetime.utcnow().isoformat()),
+        )
+        conn.commit()
+
+    def clear(self) -> None:
+        conn = self._conn()
+        conn.execute("DELETE FROM self_test_results")
+        conn.commit()
+
+
+__all__ = ["SelfTestCache", "harness_fingerprint", "scenario_key", "source_fingerprint"]
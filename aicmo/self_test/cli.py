@@ -24,6 +24,8 @@ def main(
     project_rehearsal: bool = False,
     deterministic: bool = False,
     flakiness_check: bool = False,
+    workers: Optional[int] = None,
+    use_cache: Optional[bool] = None,
 ) -> int:
     """
     Run self-test engine from CLI.
@@ -39,6 +41,8 @@ def main(
         project_rehearsal: If True, run full project rehearsal simulations
         deterministic: If True, use stub/fixed-seed mode for reproducibility
         flakiness_check: If True, run 2-3 iterations in deterministic mode to check for flakiness
+        workers: Worker processes for generators/packagers; None = env var or CPU count
+        use_cache: If False, re-run unchanged generators; None = env var or default
 
     Returns:
         Exit code (0 for success, 1 for failures)
@@ -52,10 +56,16 @@ def main(
         enable_layout = os.getenv("AICMO_SELF_TEST_ENABLE_LAYOUT", "true").lower() == "true"
     if enable_format is None:
         enable_format = os.getenv("AICMO_SELF_TEST_ENABLE_FORMAT", "true").lower() == "true"
+    if workers is None and os.getenv("AICMO_SELF_TEST_WORKERS"):
+        workers = int(os.getenv("AICMO_SELF_TEST_WORKERS"))
+    if use_cache is None:
+        use_cache = os.getenv("AICMO_SELF_TEST_CACHE", "true").lower() == "true"
+    if flakiness_check:
+        use_cache = False  # Cached results would hide run-to-run differences
 
     try:
         # Initialize orchestrator
-        orchestrator = SelfTestOrchestrator()
+        orchestrator = SelfTestOrchestrator(max_workers=workers, use_cache=use_cache)
 
         # Run self-test
         print("⏳ Running discovery and tests...")
@@ -64,6 +74,8 @@ def main(
             print(f"   - Layout checks: {'enabled' if enable_layout else 'disabled'}")
             print(f"   - Format checks: {'enabled' if enable_format else 'disabled'}")
             print(f"   - Benchmarks only: {benchmarks_only}")
+            print(f"   - Workers: {orchestrator.max_workers}")
+            print(f"   - Result cache: {'enabled' if orchestrator.cache else 'disabled'}")
             if deterministic:
                 print(f"   - Deterministic mode: ENABLED (stub outputs, fixed seeds)")
             if flakiness_check:
@@ -214,6 +226,8 @@ if __name__ == "__main__":
 Environment Variables:
   AICMO_SELF_TEST_ENABLE_QUALITY  Set to 'false' to disable quality checks (default: true)
   AICMO_SELF_TEST_ENABLE_LAYOUT   Set to 'false' to disable layout checks (default: true)
+  AICMO_SELF_TEST_WORKERS         Worker processes for generators/packagers (default: CPU count)
+  AICMO_SELF_TEST_CACHE           Set to 'false' to re-run unchanged generators (default: true)
 
 Examples:
   python -m aicmo.self_test.cli --full
@@ -284,6 +298,19 @@ Examples:
         action="store_true",
         help="Run 2-3 iterations in deterministic mode to detect flaky features"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for generators/packagers (default: CPU count; 1 = in-process)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_false",
+        dest="use_cache",
+        default=None,
+        help="Re-run every generator even if its source and inputs are unchanged"
+    )
     parser.add_argument(
         "--output",
         default="/workspaces/AICMO/self_test_artifacts",
@@ -308,6 +335,8 @@ Examples:
         project_rehearsal=args.project_rehearsal,
         deterministic=args.deterministic,
         flakiness_check=args.flakiness_check,
+        workers=args.workers,
+        use_cache=args.use_cache,
     )
     sys.exit(exit_code)
 
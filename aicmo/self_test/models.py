@@ -10,6 +10,8 @@ from enum import Enum
 from typing import Any, Dict, List, Optional, Set, TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from aicmo.self_test.format_checkers import TextFormatCheckResult
+    from aicmo.self_test.quality_checkers import ContentQualityCheckResult
     from aicmo.self_test.layout_checkers import (
         HtmlLayoutCheckResult,
         PptxLayoutCheckResult,
@@ -178,6 +180,22 @@ class GeneratorStatus:
         return self.scenarios_passed + self.scenarios_failed + self.scenarios_skipped
 
 
+@dataclass
+class GeneratorScenarioResult:
+    """Outcome of running one generator on one test brief (one worker task)."""
+    generator: str
+    scenario_id: str
+    outcome: str  # "passed", "failed", "skipped"
+    errors: List[str] = field(default_factory=list)
+    format_check_result: Optional["TextFormatCheckResult"] = None
+    quality_check_result: Optional["ContentQualityCheckResult"] = None
+    semantic_alignment_result: Optional["SemanticAlignmentResult"] = None
+    security_scan_result: Optional["SecurityScanResult"] = None
+    snapshot: Optional[Dict[str, Any]] = None
+    runtime_seconds: float = 0.0
+    cached: bool = False  # True if reused from the result cache instead of re-run
+
+
 @dataclass
 class GatewayStatus:
     """Status of a gateway or adapter."""
@@ -247,6 +265,11 @@ class SelfTestResult:
     flakiness_check_results: Dict[str, List[str]] = field(default_factory=dict)  # feature_name -> list of flaky runs
     # 4.0 External Integrations Health Fields
     external_services: List[ExternalServiceStatus] = field(default_factory=list)  # Health status of external integrations
+    # 5.0 Parallel Execution Fields
+    workers: int = 1  # Size of the worker pool generators and packagers ran in
+    wall_time_seconds: Optional[float] = None
+    phase_timings: Dict[str, float] = field(default_factory=dict)  # phase -> wall time in seconds
+    cache_hits: int = 0  # Generator scenarios reused from the result cache
 
     @property
     def total_features(self) -> int:
@@ -285,6 +308,7 @@ class SnapshotDiffResult:
     removed_keys: List[str] = field(default_factory=list)
     changed_keys: List[str] = field(default_factory=list)
     length_diffs: Dict[str, tuple] = field(default_factory=dict)  # key -> (old_len, new_len)
+    message: str = ""
 
 
 # ============================================================================
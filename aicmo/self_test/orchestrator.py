@@ -2,12 +2,20 @@
 Self-Test Engine Orchestrator
 
 Main orchestrator for running end-to-end self-tests.
+
+Generator scenarios and packager checks run in a process pool
+(max_workers, default: one worker per CPU), and generator scenario results
+are cached by content hash (see aicmo.self_test.cache), so a rerun only
+re-executes generators whose source or inputs changed.
 """
 
 import asyncio
 import logging
+import os
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 import time
 
 from aicmo.io.client_reports import ClientInputBrief
@@ -17,16 +25,14 @@ from aicmo.self_test.discovery import (
     discover_adapters,
     discover_packagers,
 )
+from aicmo.self_test.cache import SelfTestCache, scenario_key, source_fingerprint
 from aicmo.self_test.external_integrations_health import get_external_services_health
-from aicmo.self_test.format_checkers import check_text_format
-from aicmo.self_test.quality_checkers import check_content_quality
-from aicmo.self_test.semantic_checkers import check_semantic_alignment
-from aicmo.self_test.security_checkers import scan_security
 from aicmo.self_test.models import (
     CRITICAL_FEATURES,
     FeatureCategory,
     FeatureStatus,
     GatewayStatus,
+    GeneratorScenarioResult,
     GeneratorStatus,
     LayoutCheckResults,
     PackagerStatus,
@@ -38,6 +44,11 @@ from aicmo.self_test.models import (
 from aicmo.self_test.snapshots import SnapshotManager
 from aicmo.self_test.test_inputs import get_quick_test_briefs
 from aicmo.self_test.validators import ValidatorWrapper
+from aicmo.self_test.workers import (
+    run_generator_scenario,
+    run_packager_check,
+    run_tasks,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -50,9 +61,28 @@ class SelfTestOrchestrator:
         self,
         snapshots_dir: str = "/workspaces/AICMO/self_test_artifacts/snapshots",
         base_path: str = "/workspaces/AICMO",
+        max_workers: Optional[int] = None,
+        use_cache: bool = True,
+        cache_path: Optional[str] = None,
     ):
+        """
+        Args:
+            snapshots_dir: Directory for regression snapshots
+            base_path: Repository root to discover components in
+            max_workers: Worker processes for generators/packagers (None = CPU count, 1 = in-process)
+            use_cache: If False, re-run every generator scenario
+            cache_path: Result cache database (default: self_test_cache.db next to snapshots_dir)
+        """
         self.snapshots = SnapshotManager(snapshots_dir)
         self.base_path = base_path
+        self.max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        self.cache: Optional[SelfTestCache] = None
+        if use_cache:
+            cache_path = cache_path or str(Path(snapshots_dir).resolve().parent / "self_test_cache.db")
+            try:
+                self.cache = SelfTestCache(cache_path)
+            except Exception as e:
+                logger.warning(f"Self-test result cache unavailable: {e}")
         self.result = SelfTestResult(timestamp=datetime.utcnow())
 
     def run_self_test(
@@ -80,7 +110,8 @@ class SelfTestOrchestrator:
         Returns:
             SelfTestResult with all test outcomes
         """
-        self.result = SelfTestResult(timestamp=datetime.utcnow())
+        run_start = time.perf_counter()
+        self.result = SelfTestResult(timestamp=datetime.utcnow(), workers=self.max_workers)
 
         # Store check settings for later use
         self._enable_quality_checks = enable_quality_checks
@@ -106,183 +137,117 @@ class SelfTestOrchestrator:
             os.environ["AICMO_USE_LLM"] = "0"
 
         # Discover all components
-        discoveries = get_all_discoveries(self.base_path)
+        with self._timed("discovery"):
+            discoveries = get_all_discoveries(self.base_path)
 
-        # Discover benchmarks (2.0)
-        from aicmo.self_test.benchmarks_harvester import discover_all_benchmarks
-        benchmarks = discover_all_benchmarks(self.base_path)
+            # Discover benchmarks (2.0)
+            from aicmo.self_test.benchmarks_harvester import discover_all_benchmarks
+            benchmarks = discover_all_benchmarks(self.base_path)
 
         # If benchmarks-only mode, just check coverage and return
         if benchmarks_only:
-            self._check_benchmark_coverage(benchmarks, discoveries["generators"])
+            with self._timed("benchmarks"):
+                self._check_benchmark_coverage(benchmarks, discoveries["generators"])
             self._create_summary()
+            self.result.wall_time_seconds = time.perf_counter() - run_start
             return self.result
 
         # Test generators
-        self._test_generators(discoveries["generators"], quick_mode)
+        with self._timed("generators"):
+            self._test_generators(discoveries["generators"], quick_mode)
 
         # Test packagers
-        self._test_packagers(discoveries["packagers"], quick_mode)
+        with self._timed("packagers"):
+            self._test_packagers(discoveries["packagers"], quick_mode)
 
         # Test gateways
-        self._test_gateways(discoveries["adapters"])
+        with self._timed("gateways"):
+            self._test_gateways(discoveries["adapters"])
 
         # Create coverage summary (2.0)
-        self._create_coverage_summary(benchmarks)
+        with self._timed("benchmarks"):
+            self._create_coverage_summary(benchmarks)
 
         # Check external integrations health (4.0)
-        self._check_external_integrations_health()
+        with self._timed("external_services"):
+            self._check_external_integrations_health()
 
         # Create summary
         self._create_summary()
+        self.result.wall_time_seconds = time.perf_counter() - run_start
 
         return self.result
 
+    @contextmanager
+    def _timed(self, phase: str):
+        """Record the wall time of a phase in result.phase_timings."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.result.phase_timings[phase] = time.perf_counter() - started
+
     def _test_generators(self, generators: List[Any], quick_mode: bool) -> None:
-        """Test all discovered generators."""
+        """
+        Test all discovered generators.
+
+        Every (generator, brief) scenario is a separate task for the worker
+        pool; scenarios whose generator source and inputs are unchanged since
+        a cached run are not re-run.
+        """
         if not generators:
             return
 
-        test_briefs = get_quick_test_briefs(2 if quick_mode else 6)
+        test_briefs = get_quick_test_briefs(2 if quick_mode else 6)[:2]  # Limit to 2 briefs per generator
+        checks = {
+            "format": self._enable_format_checks,
+            "quality": self._enable_quality_checks,
+            "semantic": self._enable_semantic_checks,
+        }
+        options = {
+            "checks": checks,
+            "deterministic": self._deterministic,
+            "use_llm": os.getenv("AICMO_USE_LLM", ""),
+        }
+
+        outcomes: Dict[Tuple[int, int], GeneratorScenarioResult] = {}
+        tasks, slots = [], []
+        for gi, gen_discovery in enumerate(generators):
+            if gen_discovery.callable is None:
+                continue
+            fingerprint = source_fingerprint(gen_discovery.module_path) if self.cache else None
+            for si, brief in enumerate(test_briefs):
+                key = scenario_key(fingerprint, brief, options) if fingerprint else None
+                started = time.perf_counter()
+                cached = self.cache.get(key) if key else None
+                if cached is not None:
+                    cached.cached = True
+                    cached.runtime_seconds = time.perf_counter() - started
+                    outcomes[(gi, si)] = cached
+                    self.result.cache_hits += 1
+                else:
+                    tasks.append((gen_discovery.name, gen_discovery.module_path, brief, checks, self._deterministic))
+                    slots.append((gi, si, key))
 
-        for gen_discovery in generators:
+        for (gi, si, key), outcome in zip(slots, run_tasks(run_generator_scenario, tasks, self.max_workers)):
+            outcomes[(gi, si)] = outcome
+            if key and outcome.outcome != "failed":
+                self.cache.put(key, outcome.generator, outcome)
+
+        for gi, gen_discovery in enumerate(generators):
             generator_status = GeneratorStatus(
                 name=gen_discovery.name,
                 module_path=gen_discovery.module_path,
                 status=TestStatus.SKIP,  # Default
             )
-            
-            # Start timing
-            gen_start_time = time.perf_counter()
+            scenario_results = [outcomes[(gi, si)] for si in range(len(test_briefs)) if (gi, si) in outcomes]
 
             if gen_discovery.callable is None:
                 generator_status.status = TestStatus.SKIP
                 generator_status.errors.append("Module could not be imported")
             else:
-                # Try to run generator on test inputs
-                try:
-                    for brief in test_briefs[:2]:  # Limit to 2 briefs per generator
-                        try:
-                            # Look for a generate function in the module
-                            if hasattr(gen_discovery.callable, "generate"):
-                                output = gen_discovery.callable.generate(brief)
-                            else:
-                                # Try common function names
-                                func = self._find_generator_function(gen_discovery.callable)
-                                if func:
-                                    output = func(brief)
-                                else:
-                                    output = None
-
-                            if output:
-                                # Validate output
-                                validation = ValidatorWrapper.validate_generator_output(
-                                    generator_status.name, output
-                                )
-
-                                if validation["is_valid"]:
-                                    generator_status.scenarios_passed += 1
-                                    
-                                    # Run format checks if enabled
-                                    if self._enable_format_checks and not getattr(generator_status, 'format_check_result', None):
-                                        try:
-                                            format_result = check_text_format(data=output)
-                                            generator_status.format_check_result = format_result
-                                            if not format_result.is_valid:
-                                                logger.warning(
-                                                    f"{generator_status.name}: Format issues - "
-                                                    f"too_short: {format_result.too_short_fields}, "
-                                                    f"too_long: {format_result.too_long_fields}"
-                                                )
-                                        except Exception as e:
-                                            logger.debug(f"Format check error in {generator_status.name}: {e}")
-                                    
-                                    # Run quality checks if enabled
-                                    if self._enable_quality_checks and not getattr(generator_status, 'quality_check_result', None):
-                                        try:
-                                            texts = self._extract_text_fields(output)
-                                            if texts:
-                                                quality_result = check_content_quality(texts)
-                                                generator_status.quality_check_result = quality_result
-                                                if quality_result.placeholders_found or quality_result.warnings:
-                                                    logger.warning(
-                                                        f"{generator_status.name}: Quality issues - "
-                                                        f"genericity: {quality_result.genericity_score}, "
-                                                        f"placeholders: {quality_result.placeholders_found}"
-                                                    )
-                                        except Exception as e:
-                                            logger.debug(f"Quality check error in {generator_status.name}: {e}")
-                                    
-                                    # Run semantic alignment checks if enabled
-                                    if self._enable_semantic_checks and not getattr(generator_status, 'semantic_alignment_result', None):
-                                        try:
-                                            semantic_result = check_semantic_alignment(brief, output, generator_status.name)
-                                            generator_status.semantic_alignment_result = semantic_result
-                                            if semantic_result.mismatched_fields or semantic_result.notes:
-                                                logger.warning(
-                                                    f"{generator_status.name}: Semantic alignment issues - "
-                                                    f"mismatches: {semantic_result.mismatched_fields}, "
-                                                    f"notes: {semantic_result.notes[:2]}"
-                                                )
-                                        except Exception as e:
-                                            logger.debug(f"Semantic alignment check error in {generator_status.name}: {e}")
-                                    
-                                    # Run security & privacy scan on text outputs
-                                    if not getattr(generator_status, 'security_scan_result', None):
-                                        try:
-                                            texts = self._extract_text_fields(output)
-                                            if texts:
-                                                security_result = scan_security(texts)
-                                                generator_status.security_scan_result = security_result
-                                                if security_result.has_secret_like_patterns or security_result.has_env_like_patterns or security_result.has_prompt_injection_markers:
-                                                    logger.warning(
-                                                        f"{generator_status.name}: Security issues found - "
-                                                        f"secrets: {security_result.has_secret_like_patterns}, "
-                                                        f"env_vars: {security_result.has_env_like_patterns}, "
-                                                        f"injection_markers: {security_result.has_prompt_injection_markers}"
-                                                    )
-                                        except Exception as e:
-                                            logger.debug(f"Security scan error in {generator_status.name}: {e}")
-                                    
-                                    # Save snapshot - use brand name as scenario identifier
-                                    scenario_id = brief.brand.brand_name if hasattr(brief, 'brand') else "test_scenario"
-                                    self.snapshots.save_snapshot(
-                                        generator_status.name,
-                                        scenario_id,
-                                        {
-                                            "output_type": type(output).__name__,
-                                            "has_content": bool(output),
-                                        },
-                                    )
-                                else:
-                                    generator_status.scenarios_failed += 1
-                                    generator_status.errors.extend(validation["errors"])
-                            else:
-                                generator_status.scenarios_skipped += 1
-
-                        except Exception as e:
-                            scenario_id = brief.brand.brand_name if hasattr(brief, 'brand') else "unknown"
-                            generator_status.scenarios_failed += 1
-                            generator_status.errors.append(f"Error on {scenario_id}: {str(e)}")
-
-                    # Set status based on results
-                    if generator_status.scenarios_passed > 0:
-                        generator_status.status = (
-                            TestStatus.PASS
-                            if generator_status.scenarios_failed == 0
-                            else TestStatus.PARTIAL
-                        )
-                    elif generator_status.scenarios_failed > 0:
-                        generator_status.status = TestStatus.FAIL
-                    else:
-                        generator_status.status = TestStatus.SKIP
-                except Exception as e:
-                    generator_status.status = TestStatus.FAIL
-                    generator_status.errors.append(f"Critical error: {str(e)}")
+                self._merge_scenario_results(generator_status, scenario_results)
 
-            # Record runtime
-            gen_elapsed = time.perf_counter() - gen_start_time
-            
             self.result.generators.append(generator_status)
 
             # Create feature status for overall reporting
@@ -295,8 +260,12 @@ class SelfTestOrchestrator:
                 scenarios_failed=generator_status.scenarios_failed,
                 scenarios_skipped=generator_status.scenarios_skipped,
                 errors=generator_status.errors,
-                runtime_seconds=gen_elapsed,
+                # Time spent on this feature's scenarios, wherever they ran
+                runtime_seconds=sum(r.runtime_seconds for r in scenario_results),
             )
+            cached_scenarios = sum(1 for r in scenario_results if r.cached)
+            if cached_scenarios:
+                feature.details["cached_scenarios"] = cached_scenarios
             
             # Attach format checks if available
             if hasattr(generator_status, 'format_check_result') and generator_status.format_check_result:
@@ -316,96 +285,72 @@ class SelfTestOrchestrator:
             
             self.result.features.append(feature)
 
+    def _merge_scenario_results(
+        self,
+        generator_status: GeneratorStatus,
+        scenario_results: List[GeneratorScenarioResult],
+    ) -> None:
+        """Fold scenario results (in brief order) into a generator's status."""
+        for scenario in scenario_results:
+            if scenario.outcome == "passed":
+                generator_status.scenarios_passed += 1
+
+                # Check results come from the first passing scenario that produced them
+                for attr in (
+                    "format_check_result",
+                    "quality_check_result",
+                    "semantic_alignment_result",
+                    "security_scan_result",
+                ):
+                    value = getattr(scenario, attr)
+                    if value is not None and not getattr(generator_status, attr, None):
+                        setattr(generator_status, attr, value)
+
+                # Save snapshot - use brand name as scenario identifier
+                if scenario.snapshot is not None:
+                    self.snapshots.save_snapshot(
+                        generator_status.name,
+                        scenario.scenario_id,
+                        scenario.snapshot,
+                    )
+            elif scenario.outcome == "failed":
+                generator_status.scenarios_failed += 1
+                generator_status.errors.extend(scenario.errors)
+            else:
+                generator_status.scenarios_skipped += 1
+
+        # Set status based on results
+        if generator_status.scenarios_passed > 0:
+            generator_status.status = (
+                TestStatus.PASS
+                if generator_status.scenarios_failed == 0
+                else TestStatus.PARTIAL
+            )
+        elif generator_status.scenarios_failed > 0:
+            generator_status.status = TestStatus.FAIL
+        else:
+            generator_status.status = TestStatus.SKIP
+
     def _test_packagers(self, packagers: List[Any], quick_mode: bool) -> None:
-        """Test all discovered packagers."""
+        """Test all discovered packagers, one worker task per packager."""
         if not packagers:
             return
 
-        from aicmo.self_test.layout_checkers import (
-            check_html_layout,
-            check_pptx_layout,
-            check_pdf_layout,
-        )
-
         # For packagers, we do lighter testing - just check they're callable
         # If layout checks are enabled, we try to run them and validate output
-        for pkg_discovery in packagers:
-            pkg_start_time = time.perf_counter()
-            
-            packager_status = PackagerStatus(
-                name=pkg_discovery.name,
-                module_path=pkg_discovery.module_path,
-                status=TestStatus.SKIP,
+        tasks = [
+            (
+                pkg_discovery.name,
+                pkg_discovery.module_path,
+                pkg_discovery.callable is not None,
+                callable(pkg_discovery.callable),
+                self._enable_layout_checks,
             )
+            for pkg_discovery in packagers
+        ]
+        results = run_tasks(run_packager_check, tasks, self.max_workers)
 
-            if pkg_discovery.callable is None:
-                packager_status.status = TestStatus.SKIP
-                packager_status.error_message = "Could not import module"
-            else:
-                # Check if it's callable
-                if callable(pkg_discovery.callable):
-                    packager_status.status = TestStatus.PASS
-                    
-                    # If layout checks enabled, try to run the packager and validate
-                    if self._enable_layout_checks:
-                        try:
-                            # Build minimal project_data for layout testing
-                            project_data = {
-                                "project_name": "Test Project",
-                                "objective": "Test objective",
-                                "overview": "Project overview section with content",
-                                "strategy": "Project strategy with planning details",
-                                "platforms": {"LinkedIn": 10, "Twitter": 5},
-                                "calendar": [
-                                    {"date": "2024-01-01", "platform": "linkedin", "hook": "Post 1"},
-                                    {"date": "2024-01-02", "platform": "twitter", "hook": "Post 2"},
-                                ],
-                                "deliverables": ["Brief", "Calendar", "Report"]
-                            }
-                            
-                            # Map packager names to function calls
-                            if "html" in pkg_discovery.name.lower():
-                                try:
-                                    from aicmo.delivery.output_packager import generate_html_summary
-                                    html_path = generate_html_summary(project_data)
-                                    if html_path:
-                                        # Run layout check
-                                        result = check_html_layout(file_path=html_path)
-                                        packager_status.html_layout_result = result
-                                except Exception as e:
-                                    logger.debug(f"HTML layout check error: {e}")
-                            
-                            elif "pptx" in pkg_discovery.name.lower():
-                                try:
-                                    from aicmo.delivery.output_packager import generate_full_deck_pptx
-                                    pptx_path = generate_full_deck_pptx(project_data)
-                                    if pptx_path:
-                                        # Run layout check
-                                        result = check_pptx_layout(pptx_path)
-                                        packager_status.pptx_layout_result = result
-                                except Exception as e:
-                                    logger.debug(f"PPTX layout check error: {e}")
-                            
-                            elif "pdf" in pkg_discovery.name.lower():
-                                try:
-                                    from aicmo.delivery.output_packager import generate_strategy_pdf
-                                    pdf_path = generate_strategy_pdf(project_data)
-                                    if pdf_path:
-                                        # Run layout check
-                                        result = check_pdf_layout(pdf_path)
-                                        packager_status.pdf_layout_result = result
-                                except Exception as e:
-                                    logger.debug(f"PDF layout check error: {e}")
-                        
-                        except Exception as e:
-                            logger.debug(f"Packager layout check failed: {e}")
-                else:
-                    packager_status.status = TestStatus.SKIP
-                    packager_status.error_message = "Object is not callable"
-
-            # Record runtime
-            pkg_elapsed = time.perf_counter() - pkg_start_time
-            
+        for pkg_discovery, (packager_status, pkg_elapsed) in zip(packagers, results):
             self.result.packagers.append(packager_status)
 
             # Create feature status
@@ -475,49 +420,6 @@ class SelfTestOrchestrator:
             )
             self.result.features.append(feature)
 
-    def _find_generator_function(self, module: Any) -> Optional[callable]:
-        """
-        Find a generator function in a module.
-
-        Prioritizes generate_<module_name>, then looks for common patterns.
-        Filters out imported types (like Optional, Dict, etc).
-        """
-        import inspect
-        import types
-
-        if not hasattr(module, "__dict__"):
-            return None
-
-        module_name = module.__name__.split(".")[-1]
-        
-        # Priority 1: Look for generate_<module_name>
-        generate_func_name = f"generate_{module_name}"
-        if hasattr(module, generate_func_name):
-            obj = getattr(module, generate_func_name)
-            if isinstance(obj, types.FunctionType):
-                return obj
-
-        # Priority 2: Look for common generator function names
-        for name in ["generate", "process", "run", "create", "build"]:
-            if hasattr(module, name):
-                obj = getattr(module, name)
-                if isinstance(obj, types.FunctionType) and not name.startswith("_"):
-                    return obj
-
-        # Priority 3: Look for any main function defined in this module
-        # (Skip imported types and classes)
-        for name, obj in module.__dict__.items():
-            if not name.startswith("_") and isinstance(obj, types.FunctionType):
-                # Prefer functions that take one argument (the brief/input)
-                try:
-                    sig = inspect.signature(obj)
-                    if len(sig.parameters) >= 1:
-                        return obj
-                except (ValueError, TypeError):
-                    pass
-
-        return None
-
     def _check_external_integrations_health(self) -> None:
         """
         Check health of all external integrations/services.
@@ -592,49 +494,6 @@ class SelfTestOrchestrator:
                     feature.benchmark_coverage = coverage
                     break
 
-
-    def _extract_text_fields(self, obj: Any, max_depth: int = 3, current_depth: int = 0) -> List[str]:
-        """
-        Extract text fields from a Pydantic model or dict for quality checking.
-        
-        Args:
-            obj: Object to extract from (Pydantic model, dict, etc.)
-            max_depth: Maximum recursion depth
-            current_depth: Current recursion depth
-        
-        Returns:
-            List of text strings to analyze
-        """
-        texts = []
-        
-        if current_depth >= max_depth:
-            return texts
-        
-        # Handle Pydantic models
-        if hasattr(obj, "model_dump"):
-            try:
-                obj = obj.model_dump()
-            except Exception:
-                pass
-        
-        # Handle dicts
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                if isinstance(value, str) and value.strip():
-                    texts.append(value)
-                elif isinstance(value, (dict, list)):
-                    texts.extend(self._extract_text_fields(value, max_depth, current_depth + 1))
-        
-        # Handle lists
-        elif isinstance(obj, list):
-            for item in obj[:10]:  # Limit to first 10 items
-                if isinstance(item, str) and item.strip():
-                    texts.append(item)
-                elif isinstance(item, (dict, list)):
-                    texts.extend(self._extract_text_fields(item, max_depth, current_depth + 1))
-        
-        return texts
-
     def _create_coverage_summary(self, benchmarks: List[Any]) -> None:
         """
         Create coverage summary for 2.0.
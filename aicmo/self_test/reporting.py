@@ -38,10 +38,20 @@ class ReportGenerator:
 
         # Performance & Flakiness (3.0)
         lines.append("## Performance & Flakiness\n")
+        if result.wall_time_seconds is not None:
+            lines.append(
+                f"**Wall Time:** {result.wall_time_seconds:.2f}s "
+                f"({result.workers} workers, {result.cache_hits} cached scenarios)\n"
+            )
+            for phase, seconds in result.phase_timings.items():
+                lines.append(f"- {phase}: {seconds:.3f}s")
+            lines.append("")
         lines.append("**Feature Runtimes:**\n")
         for feature in sorted(result.features, key=lambda f: f.runtime_seconds or 0, reverse=True):
             if feature.runtime_seconds is not None:
                 runtime_str = f"{feature.runtime_seconds:.3f}s"
+                if feature.details.get("cached_scenarios"):
+                    runtime_str += f" ({feature.details['cached_scenarios']} cached)"
                 lines.append(f"- {feature.name}: {runtime_str}")
         lines.append("")
         
@@ -2,15 +2,51 @@
 Self-Test Engine Snapshots
 
 Save and compare snapshots for regression detection.
+
+Payloads are stored content-addressed: each distinct payload is written
+once, as gzip-compressed canonical JSON under objects/<hash[:2]>/, and a
+small SQLite index (index.db) maps every feature/scenario to the hashes of
+its snapshot history. Comparing an unchanged output is a hash lookup; the
+old payload is only loaded and diffed when the hashes differ.
+
+Snapshots written by the previous one-JSON-file-per-scenario layout are
+imported into the store the first time it is opened.
 """
 
+import gzip
+import hashlib
 import json
+import logging
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from aicmo.self_test.models import SnapshotDiffResult
+from aicmo.shared.db import get_sqlite_connection
+
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS snapshots (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        feature TEXT NOT NULL,
+        scenario TEXT NOT NULL,
+        hash TEXT NOT NULL,
+        metadata TEXT,
+        created_at TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_snapshot_target ON snapshots (feature, scenario, id)",
+    "CREATE INDEX IF NOT EXISTS idx_snapshot_hash ON snapshots (hash)",
+)
+
+
+def _canonical(payload: Any) -> bytes:
+    """Compact, key-sorted JSON, so equal payloads hash equal."""
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode()
 
 
 class SnapshotManager:
@@ -18,13 +54,52 @@ class SnapshotManager:
 
     def __init__(self, snapshots_dir: str = "/workspaces/AICMO/self_test_artifacts/snapshots"):
         self.snapshots_dir = Path(snapshots_dir)
-        self.snapshots_dir.mkdir(parents=True, exist_ok=True)
-
-    def _get_snapshot_path(self, feature_name: str, scenario_name: str) -> Path:
-        """Get the path for a snapshot file."""
-        feature_dir = self.snapshots_dir / feature_name
-        feature_dir.mkdir(parents=True, exist_ok=True)
-        return feature_dir / f"{scenario_name}.json"
+        self.objects_dir = self.snapshots_dir / "objects"
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.snapshots_dir / "index.db"
+
+        conn = self._conn()
+        for statement in _SCHEMA:
+            conn.execute(statement)
+        conn.commit()
+
+        # (feature, scenario) -> latest payload hash, loaded on first use
+        self._latest: Optional[Dict[Tuple[str, str], str]] = None
+        self._import_legacy_snapshots()
+
+    def _conn(self):
+        return get_sqlite_connection(str(self.index_path))
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest[2:]}.json.gz"
+
+    def _latest_hashes(self) -> Dict[Tuple[str, str], str]:
+        if self._latest is None:
+            rows = self._conn().execute(
+                "SELECT feature, scenario, hash FROM snapshots WHERE id IN "
+                "(SELECT MAX(id) FROM snapshots GROUP BY feature, scenario)"
+            ).fetchall()
+            self._latest = {(feature, scenario): digest for feature, scenario, digest in rows}
+        return self._latest
+
+    def _write_object(self, data: bytes) -> Tuple[str, Path]:
+        """Store a canonical payload once; returns (hash, object path)."""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with gzip.open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        return digest, path
+
+    def _read_object(self, digest: str) -> Optional[Any]:
+        path = self._object_path(digest)
+        if not path.exists():
+            return None
+        with gzip.open(path, "rb") as f:
+            return json.loads(f.read())
 
     def save_snapshot(
         self,
@@ -36,6 +111,9 @@ class SnapshotManager:
         """
         Save a snapshot for a feature/scenario combination.
 
+        A payload identical to the latest snapshot adds nothing; a changed
+        payload becomes the latest entry of the scenario's history.
+
         Args:
             feature_name: Generator, packager, or other feature name
             scenario_name: Test scenario name
@@ -43,22 +121,36 @@ class SnapshotManager:
             metadata: Optional metadata (timestamp, version, etc)
 
         Returns:
-            Path to saved snapshot file
+            Path to the stored payload object
         """
-        snapshot_path = self._get_snapshot_path(feature_name, scenario_name)
-
-        snapshot_data = {
-            "feature": feature_name,
-            "scenario": scenario_name,
-            "timestamp": datetime.utcnow().isoformat(),
-            "metadata": metadata or {},
-            "payload": payload,
-        }
-
-        with open(snapshot_path, "w") as f:
-            json.dump(snapshot_data, f, indent=2, default=str)
-
-        return snapshot_path
+        digest, path = self._write_object(_canonical(payload))
+        latest = self._latest_hashes()
+        key = (feature_name, scenario_name)
+        if latest.get(key) != digest:
+            self._record(feature_name, scenario_name, digest, metadata)
+            latest[key] = digest
+        return path
+
+    def _record(
+        self,
+        feature_name: str,
+        scenario_name: str,
+        digest: str,
+        metadata: Optional[Dict[str, Any]],
+        created_at: Optional[str] = None,
+    ) -> None:
+        conn = self._conn()
+        conn.execute(
+            "INSERT INTO snapshots (feature, scenario, hash, metadata, created_at) VALUES (?, ?, ?, ?, ?)",
+            (
+                feature_name,
+                scenario_name,
+                digest,
+                json.dumps(metadata, default=str) if metadata else None,
+                created_at or datetime.utcnow().isoformat(),
+            ),
+        )
+        conn.commit()
 
     def load_snapshot(self, feature_name: str, scenario_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -69,15 +161,50 @@ class SnapshotManager:
             scenario_name: Test scenario name
 
         Returns:
-            Snapshot data or None if not found
+            Snapshot data (feature, scenario, timestamp, metadata, hash,
+            payload) or None if not found
         """
-        snapshot_path = self._get_snapshot_path(feature_name, scenario_name)
+        row = self._conn().execute(
+            "SELECT hash, metadata, created_at FROM snapshots "
+            "WHERE feature = ? AND scenario = ? ORDER BY id DESC LIMIT 1",
+            (feature_name, scenario_name),
+        ).fetchone()
+        if row is None:
+            return None
 
-        if not snapshot_path.exists():
+        digest, metadata, created_at = row
+        payload = self._read_object(digest)
+        if payload is None:
+            logger.warning(f"Snapshot object {digest[:12]} for {feature_name}/{scenario_name} is missing")
             return None
+        return {
+            "feature": feature_name,
+            "scenario": scenario_name,
+            "timestamp": created_at,
+            "metadata": json.loads(metadata) if metadata else {},
+            "hash": digest,
+            "payload": payload,
+        }
 
-        with open(snapshot_path, "r") as f:
-            return json.load(f)
+    def get_history(self, feature_name: str, scenario_name: str) -> List[Dict[str, Any]]:
+        """Snapshot versions of a feature/scenario (hash, timestamp, metadata), newest first."""
+        rows = self._conn().execute(
+            "SELECT hash, metadata, created_at FROM snapshots "
+            "WHERE feature = ? AND scenario = ? ORDER BY id DESC",
+            (feature_name, scenario_name),
+        ).fetchall()
+        return [
+            {
+                "hash": digest,
+                "timestamp": created_at,
+                "metadata": json.loads(metadata) if metadata else {},
+            }
+            for digest, metadata, created_at in rows
+        ]
+
+    def load_payload(self, digest: str) -> Optional[Any]:
+        """The payload stored under a hash (e.g. one from get_history)."""
+        return self._read_object(digest)
 
     def compare_with_snapshot(
         self,
@@ -98,16 +225,28 @@ class SnapshotManager:
         Returns:
             SnapshotDiffResult with diff information
         """
-        old_snapshot = self.load_snapshot(feature_name, scenario_name)
+        old_digest = self._latest_hashes().get((feature_name, scenario_name))
 
-        if old_snapshot is None:
+        if old_digest is None:
             return SnapshotDiffResult(
                 has_diff=False,
                 severity="none",
                 message="No existing snapshot (first run)",
             )
 
-        old_payload = old_snapshot.get("payload", {})
+        # Unchanged output: the hashes match, nothing to load or diff
+        if hashlib.sha256(_canonical(new_payload)).hexdigest() == old_digest:
+            return SnapshotDiffResult(has_diff=False, severity="none")
+
+        old_payload = self._read_object(old_digest)
+        if old_payload is None:
+            return SnapshotDiffResult(
+                has_diff=False,
+                severity="none",
+                message="Snapshot payload missing (treated as first run)",
+            )
+        # Compare in the stored (JSON) form so non-JSON values don't count as changes
+        new_payload = json.loads(_canonical(new_payload))
 
         # Soft comparison: detect structural changes but allow minor value changes
         added_keys = set(new_payload.keys()) - set(old_payload.keys())
@@ -166,14 +305,75 @@ class SnapshotManager:
             message=message.strip(),
         )
 
-    def get_snapshot_stats(self) -> Dict[str, int]:
-        """Get statistics about snapshots."""
-        stats = {"total_snapshots": 0, "features": set()}
+    def collect_garbage(self, keep_history: int = 5) -> Dict[str, int]:
+        """
+        Trim history and delete unreferenced payload objects.
 
-        for feature_dir in self.snapshots_dir.iterdir():
-            if feature_dir.is_dir():
-                stats["features"].add(feature_dir.name)
-                stats["total_snapshots"] += len(list(feature_dir.glob("*.json")))
+        Args:
+            keep_history: Versions to keep per feature/scenario (at least the latest)
+
+        Returns:
+            {"entries_removed": n, "objects_removed": n}
+        """
+        keep_history = max(1, keep_history)
+        conn = self._conn()
+        cursor = conn.execute(
+            "DELETE FROM snapshots WHERE id IN ("
+            "  SELECT id FROM ("
+            "    SELECT id, ROW_NUMBER() OVER (PARTITION BY feature, scenario ORDER BY id DESC) AS version"
+            "    FROM snapshots"
+            "  ) WHERE version > ?"
+            ")",
+            (keep_history,),
+        )
+        entries_removed = cursor.rowcount
+        conn.commit()
+
+        referenced = {row[0] for row in conn.execute("SELECT DISTINCT hash FROM snapshots")}
+        objects_removed = 0
+        for path in self.objects_dir.glob("*/*.json.gz"):
+            if f"{path.parent.name}{path.name[:-len('.json.gz')]}" not in referenced:
+                path.unlink()
+                objects_removed += 1
+
+        return {"entries_removed": entries_removed, "objects_removed": objects_removed}
+
+    def _import_legacy_snapshots(self) -> None:
+        """Import <feature>/<scenario>.json snapshots not yet in the index."""
+        legacy_files = [
+            path
+            for feature_dir in self.snapshots_dir.iterdir()
+            if feature_dir.is_dir() and feature_dir != self.objects_dir
+            for path in sorted(feature_dir.glob("*.json"))
+        ]
+        if not legacy_files:
+            return
+
+        latest = self._latest_hashes()
+        imported = 0
+        for path in legacy_files:
+            key = (path.parent.name, path.stem)
+            if key in latest:
+                continue
+            try:
+                with open(path, "r") as f:
+                    snapshot = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable legacy snapshot {path}: {e}")
+                continue
+            digest, _ = self._write_object(_canonical(snapshot.get("payload", {})))
+            self._record(key[0], key[1], digest, snapshot.get("metadata"), snapshot.get("timestamp"))
+            latest[key] = digest
+            imported += 1
+
+        if imported:
+            logger.info(f"Imported {imported} legacy snapshots into {self.snapshots_dir}")
 
-        stats["features"] = len(stats["features"])
-        return stats
+    def get_snapshot_stats(self) -> Dict[str, int]:
+        """Get statistics about snapshots."""
+        latest = self._latest_hashes()
+        return {
+            "total_snapshots": len(latest),
+            "features": len({feature for feature, _ in latest}),
+            "objects": sum(1 for _ in self.objects_dir.glob("*/*.json.gz")),
+        }
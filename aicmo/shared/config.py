@@ -28,7 +28,104 @@ class AicmoSettings(BaseSettings):
     DB_POOL_SIZE: int = 5
     DB_MAX_OVERFLOW: int = 10
     DB_POOL_TIMEOUT: int = 30  # seconds
+    DB_POOL_RECYCLE: int = 1800  # seconds
     
+    # SQLite tuning applied by aicmo.shared.db to every file database
+    SQLITE_WAL: bool = True  # journal_mode=WAL + synchronous=NORMAL
+    SQLITE_MMAP_SIZE: int = 268435456  # bytes (256 MiB); 0 disables
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    
+    # Log a possible N+1 when one SELECT repeats this often in a request/worker step
+    QUERY_N_PLUS_ONE_THRESHOLD: int = 10
+    
+    # Orchestration event bus: "inprocess" (synchronous) or "bounded" (queued, back-pressured)
+    EVENT_BUS_MODE: str = "inprocess"
+    EVENT_BUS_HISTORY_SIZE: int = 1000  # replay ring buffer
+    EVENT_BUS_QUEUE_SIZE: int = 1000  # per-subscriber queue (bounded mode)
+    EVENT_BUS_OUTBOX_URL: str = ""  # SQL outbox for bounded mode (empty = disabled)
+    EVENT_BUS_REPLAY_INTERVAL_SECONDS: float = 30.0  # re-deliver pending outbox events (0 = only on demand)
+
+    # LLM calls (aicmo.llm.router chains, batched generator micro-passes)
+    LLM_CALENDAR_BATCH_DAYS: int = 10  # max days per structured-JSON request
+    LLM_MAX_CONCURRENCY: int = 4  # concurrent batched LLM requests per process
+    LLM_ATTEMPT_TIMEOUT_SECONDS: float = 90.0  # per provider attempt before failing over; 0 = no deadline
+    LLM_HEDGE_ENABLED: bool = False  # race the next provider when the primary exceeds its p95
+    LLM_HEDGE_BUDGET_RATIO: float = 0.1  # max extra calls per request; per use-case: LLM_HEDGE_BUDGET_<USE_CASE>
+
+    # LLM response cache (aicmo.llm.cache): "off", "deterministic" (temperature 0 and
+    # LLM_CACHE_USE_CASES only) or "all" (everything except LLM_CACHE_OPT_OUT_USE_CASES)
+    LLM_CACHE_MODE: str = "deterministic"
+    LLM_CACHE_PATH: str = "~/.cache/aicmo/llm_cache.db"  # outside the working tree
+    LLM_CACHE_MAX_ENTRIES: int = 10000  # least recently used entries evicted beyond this
+    LLM_CACHE_TTL_SECONDS: int = 604800  # 7 days; 0 = never expire
+    LLM_CACHE_USE_CASES: str = "KAIZEN_QA,LEAD_REASONING"  # comma-separated, cached in deterministic mode
+    LLM_CACHE_OPT_OUT_USE_CASES: str = "CREATIVE_IDEATION"  # comma-separated, never cached
+
+    # Contact enrichment (aicmo.crm.enrichment): pooled async HTTP, per-provider rate limits
+    ENRICHMENT_MAX_CONCURRENCY: int = 8  # in-flight provider requests (and pooled connections)
+    ENRICHMENT_APOLLO_RATE_PER_SECOND: float = 5.0
+    ENRICHMENT_DROPCONTACT_RATE_PER_SECOND: float = 10.0
+    ENRICHMENT_BULK_MIN: int = 5  # from this many contacts on, use bulk endpoints
+    ENRICHMENT_APOLLO_BULK_SIZE: int = 10  # emails per Apollo People Search request
+    ENRICHMENT_CACHE_PATH: str = "~/.cache/aicmo/enrichment_cache.db"  # empty = no cache
+    ENRICHMENT_CACHE_TTL_SECONDS: int = 2592000  # 30 days; 0 = never expire
+
+    # Unified Kaizen flow (aicmo.delivery.kaizen_orchestrator): independent subsystem
+    # steps run concurrently, each bounded by this timeout
+    KAIZEN_STEP_TIMEOUT_SECONDS: float = 120.0
+    KAIZEN_MAX_CONCURRENCY: int = 8
+
+    # Publishing pipeline (aicmo.publishing.pipeline): campaigns fan out over content
+    # items and channels; job state is persisted so a restart resumes unfinished jobs
+    PUBLISHING_JOBS_PATH: str = "~/.cache/aicmo/publishing_jobs.db"
+    PUBLISHING_LEASE_SECONDS: float = 300.0  # a post's claim; expired claims are resumed by any publisher
+    PUBLISHING_MAX_CONCURRENCY: int = 32  # in-flight posts across all channels
+    PUBLISHING_CHANNEL_CONCURRENCY: int = 4  # in-flight posts per channel
+    PUBLISHING_CHANNEL_RATE_PER_SECOND: float = 10.0  # posts per second per channel; 0 = unlimited
+    PUBLISHING_MAX_ATTEMPTS: int = 3
+    PUBLISHING_RETRY_BACKOFF_SECONDS: float = 1.0  # doubled after every failed attempt
+
+    # Streamlit UI backend client (aicmo.ui_v2.api_client): one pooled keep-alive
+    # client per process, conditional-GET cache for reads, background calls for long requests
+    UI_HTTP_TIMEOUT_SECONDS: float = 10.0  # endpoints not listed in UI_HTTP_ENDPOINT_TIMEOUTS
+    UI_HTTP_ENDPOINT_TIMEOUTS: str = "/aicmo/generate=120,/health=3"  # path-prefix=seconds
+    UI_HTTP_RETRIES: int = 2  # connection retries; GETs are also retried on 502/503/504
+    UI_HTTP_MAX_CONNECTIONS: int = 20  # pooled keep-alive connections
+    UI_HTTP_CACHE_TTL_SECONDS: float = 5.0  # repeat GETs within this window skip the request; 0 = always revalidate
+    UI_HTTP_BACKGROUND_WORKERS: int = 4  # threads running background calls
+
+    # Living Brand Brain (aicmo.brand.repository): ranked insight summaries persisted
+    # per brand and generator type, refreshed when a new generation record is saved
+    BRAND_INSIGHT_SUMMARY_SIZE: int = 25  # ranked insights kept per summary
+    BRAND_INSIGHT_SUMMARY_MAX_INSIGHTS: int = 5  # lines in the prompt context
+    BRAND_INSIGHT_SUMMARY_MAX_TOKENS: int = 300  # token budget of the prompt context
+
+    # Metrics (aicmo.shared.metrics): scraped from GET /metrics; worker processes
+    # (CAM worker, AOL daemon) push a snapshot after every cycle
+    METRICS_PUSHGATEWAY_URL: str = ""  # e.g. "localhost:9091" (empty = no push)
+    METRICS_TEXTFILE_DIR: str = ""  # node_exporter textfile collector dir (empty = none)
+
+    # Tracing (aicmo.shared.tracing): per-request span trees, tail-sampled when
+    # the request ends and exported as OTLP/JSON off the request path; slow or
+    # failed traces are always kept
+    TRACING_ENABLED: bool = True
+    TRACE_EXPORTERS: str = "file"  # comma-separated: "file", "console"
+    TRACE_FILE_PATH: str = "~/.cache/aicmo/traces.jsonl"  # one OTLP trace per line
+    TRACE_FILE_MAX_BYTES: int = 20000000  # rotated to <path>.1 beyond this
+    TRACE_SLOW_MS: float = 8000.0  # traces at least this long are always kept
+    TRACE_SAMPLE_RATE: float = 0.01  # fraction of fast, successful traces kept
+    TRACE_MAX_SPANS: int = 2000  # per trace; further spans are counted as dropped
+    TRACE_RECENT_SIZE: int = 50  # kept traces held in memory for GET /traces
+
+    # Sampling profiler (aicmo.shared.profiling): on demand via POST /admin/profiling/sample,
+    # SIGUSR2 in workers, and automatically for requests slower than SLOW_THRESHOLD_MS
+    PROFILE_SLOW_REQUESTS: bool = False  # sample every request, keep slow ones
+    PROFILE_INTERVAL_MS: float = 10.0  # stack sampling interval
+    PROFILE_DIR: str = "~/.cache/aicmo/profiles"
+    PROFILE_MAX_FILES: int = 50  # oldest saved profiles deleted beyond this
+    PROFILE_MAX_SECONDS: int = 120  # longest on-demand profile
+    PROFILE_SIGNAL_SECONDS: float = 30.0  # profile length on SIGUSR2
+
     # Test mode detection
     TESTING: bool = False  # Set to True in test fixtures
 
@@ -0,0 +1,373 @@
+"""
+Shared database engine and connection registry.
+
+Every subsystem obtains database handles here instead of calling
+create_engine() / sqlite3.connect() itself:
+
+- get_engine(url): one pooled SQLAlchemy Engine per URL. PostgreSQL uses
+  AICMO_DB_POOL_SIZE / AICMO_DB_MAX_OVERFLOW / AICMO_DB_POOL_TIMEOUT with
+  pre-ping and recycling; SQLite files get WAL, synchronous=NORMAL, mmap
+  and busy_timeout pragmas.
+- get_sqlite_connection(path): a long-lived, per-thread sqlite3 connection
+  with the same pragmas for modules that use sqlite3 directly. Its close()
+  only rolls back uncommitted work, so existing open/close call sites keep
+  working without reconnecting.
+- track_queries(label): counts and times every statement executed through
+  either kind of handle inside the block and logs likely N+1 patterns
+  against the label (FastAPI route or worker step). Inside a trace
+  (aicmo.shared.tracing), every statement is also recorded as a span.
+
+SQLite handles are re-opened automatically if the database file is
+replaced (deleted and re-created) underneath them.
+"""
+
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import DisconnectionError
+
+from aicmo.shared import tracing
+from aicmo.shared.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# QUERY INSTRUMENTATION
+# ═══════════════════════════════════════════════════════════════════════
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*(?:\?|%\(\w+\)s|:\w+)(?:\s*,\s*(?:\?|%\(\w+\)s|:\w+))*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def normalize_sql(statement: str) -> str:
+    """Collapse literals and parameter lists so repeated statements compare equal."""
+    sql = _STRING_LITERAL.sub("?", statement)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _IN_LIST.sub("(?)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+class QueryStats:
+    """Query count, time and per-statement counts for one request or worker step."""
+
+    def __init__(self, label: str, parent: Optional["QueryStats"] = None):
+        self.label = label
+        self.parent = parent
+        self.count = 0
+        self.total_seconds = 0.0
+        self.statements: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, seconds: float) -> None:
+        normalized = normalize_sql(statement)
+        stats: Optional[QueryStats] = self
+        while stats is not None:
+            with stats._lock:
+                stats.count += 1
+                stats.total_seconds += seconds
+                stats.statements[normalized] += 1
+            stats = stats.parent
+
+    def n_plus_one(self, threshold: Optional[int] = None) -> List[Tuple[str, int]]:
+        """SELECT statements executed at least threshold times in this scope."""
+        threshold = threshold or settings.QUERY_N_PLUS_ONE_THRESHOLD
+        with self._lock:
+            repeated = self.statements.most_common()
+        return [
+            (sql, n) for sql, n in repeated
+            if n >= threshold and sql.lstrip("( ").upper().startswith("SELECT")
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "label": self.label,
+            "count": self.count,
+            "total_ms": round(self.total_seconds * 1000, 3),
+            "n_plus_one": [{"statement": sql, "count": n} for sql, n in self.n_plus_one()],
+        }
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("aicmo_query_stats", default=None)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """The innermost active track_queries() scope, if any."""
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries(label: str) -> Iterator[QueryStats]:
+    """
+    Count and time queries executed in this block.
+
+    Nested scopes also count towards their parents. On exit, statements
+    repeated QUERY_N_PLUS_ONE_THRESHOLD times or more are logged as a
+    possible N+1 against label.
+    """
+    stats = QueryStats(label, parent=_current_stats.get())
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+        _report(stats)
+
+
+def _report(stats: QueryStats) -> None:
+    for sql, n in stats.n_plus_one():
+        logger.warning("Possible N+1 query in %s: %d executions of %s", stats.label, n, sql[:300])
+    if stats.count:
+        logger.debug(
+            "%s executed %d queries in %.1fms", stats.label, stats.count, stats.total_seconds * 1000
+        )
+
+
+def _tracking() -> bool:
+    return _current_stats.get() is not None or tracing.is_recording()
+
+
+def _record(statement: str, started: float) -> None:
+    seconds = time.perf_counter() - started
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, seconds)
+    if tracing.is_recording():
+        tracing.record_span("db.query", seconds, **{"db.statement": normalize_sql(statement)[:500]})
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# SQLITE TUNING
+# ═══════════════════════════════════════════════════════════════════════
+
+def _is_sqlite_memory(database: Optional[str]) -> bool:
+    return not database or database == ":memory:" or "mode=memory" in database
+
+
+def _file_identity(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+def apply_sqlite_pragmas(dbapi_conn: Any) -> None:
+    """Apply journal/sync/mmap/busy pragmas from settings to a raw sqlite3 connection."""
+    pragmas = [f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}"]
+    if settings.SQLITE_WAL:
+        pragmas += ["PRAGMA journal_mode=WAL", "PRAGMA synchronous=NORMAL"]
+    if settings.SQLITE_MMAP_SIZE:
+        pragmas.append(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+    cursor = dbapi_conn.cursor()
+    try:
+        for pragma in pragmas:
+            try:
+                cursor.execute(pragma)
+            except sqlite3.DatabaseError as exc:
+                # e.g. read-only media; the defaults still work
+                logger.debug("SQLite pragma %r not applied: %s", pragma, exc)
+    finally:
+        cursor.close()
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# SQLALCHEMY ENGINE REGISTRY
+# ═══════════════════════════════════════════════════════════════════════
+
+_engines: Dict[str, Engine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_engine(url: Optional[str] = None) -> Engine:
+    """Return the shared Engine for url (defaults to AICMO_DATABASE_URL)."""
+    url = url or settings.DATABASE_URL
+    engine = _engines.get(url)
+    if engine is None:
+        with _engines_lock:
+            engine = _engines.get(url)
+            if engine is None:
+                engine = _create_engine(url)
+                _engines[url] = engine
+    return engine
+
+
+def dispose_engines() -> None:
+    """Dispose and forget every registered Engine (tests / shutdown)."""
+    with _engines_lock:
+        engines = list(_engines.values())
+        _engines.clear()
+    for engine in engines:
+        engine.dispose()
+
+
+def _create_engine(url: str) -> Engine:
+    parsed = make_url(url)
+    kwargs: Dict[str, Any] = {"future": True}
+    backend = parsed.get_backend_name()
+
+    if backend == "sqlite":
+        kwargs["connect_args"] = {"check_same_thread": False}
+    elif backend == "postgresql":
+        kwargs.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=True,
+        )
+    else:
+        kwargs["pool_pre_ping"] = True
+
+    engine = create_engine(url, **kwargs)
+    if backend == "sqlite" and not _is_sqlite_memory(parsed.database):
+        _install_sqlite_hooks(engine, parsed.database)
+    _install_query_hooks(engine)
+    return engine
+
+
+def _install_sqlite_hooks(engine: Engine, path: str) -> None:
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_conn, connection_record):
+        apply_sqlite_pragmas(dbapi_conn)
+        connection_record.info["sqlite_identity"] = _file_identity(path)
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_conn, connection_record, connection_proxy):
+        identity = connection_record.info.get("sqlite_identity")
+        if identity is not None and identity != _file_identity(path):
+            # File was replaced; the pool reconnects to the new one
+            raise DisconnectionError("SQLite database file was replaced")
+
+
+def _install_query_hooks(engine: Engine) -> None:
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if _tracking():
+            conn.info.setdefault("aicmo_query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get("aicmo_query_started")
+        if started:
+            _record(statement, started.pop())
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# LONG-LIVED SQLITE3 CONNECTIONS
+# ═══════════════════════════════════════════════════════════════════════
+
+class _TrackedCursor(sqlite3.Cursor):
+    def execute(self, sql, parameters=()):
+        if not _tracking():
+            return super().execute(sql, parameters)
+        started = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            _record(sql, started)
+
+    def executemany(self, sql, seq_of_parameters):
+        if not _tracking():
+            return super().executemany(sql, seq_of_parameters)
+        started = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            _record(sql, started)
+
+
+class PooledSQLiteConnection(sqlite3.Connection):
+    """
+    Thread-owned sqlite3 connection handed out by get_sqlite_connection().
+
+    close() rolls back uncommitted work (as a real close would) but keeps
+    the handle open for the next caller on this thread.
+    """
+
+    def cursor(self, factory=None):
+        return super().cursor(factory or _TrackedCursor)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def close(self) -> None:
+        self.rollback()
+
+    def close_connection(self) -> None:
+        """Really close the underlying handle."""
+        super().close()
+
+
+_sqlite_local = threading.local()
+
+
+def get_sqlite_connection(db_path: str) -> sqlite3.Connection:
+    """
+    Return this thread's long-lived connection to db_path.
+
+    The connection has pragmas applied once, row_factory reset to the
+    default on every checkout, and is re-opened if the file was replaced.
+    ":memory:" paths get a fresh, unshared connection each call.
+    """
+    if _is_sqlite_memory(db_path):
+        return sqlite3.connect(db_path, factory=PooledSQLiteConnection)
+
+    key = os.path.abspath(db_path)
+    conns: Dict[str, Tuple[PooledSQLiteConnection, Optional[Tuple[int, int]]]] = getattr(
+        _sqlite_local, "connections", None
+    )
+    if conns is None:
+        conns = _sqlite_local.connections = {}
+
+    cached = conns.get(key)
+    if cached is not None:
+        conn, identity = cached
+        if identity is not None and identity == _file_identity(key):
+            conn.row_factory = None
+            return conn
+        conn.close_connection()
+
+    conn = sqlite3.connect(key, factory=PooledSQLiteConnection)
+    apply_sqlite_pragmas(conn)
+    conns[key] = (conn, _file_identity(key))
+    return conn
+
+
+def close_sqlite_connections() -> None:
+    """Close this thread's cached sqlite3 connections."""
+    conns = getattr(_sqlite_local, "connections", None) or {}
+    for conn, _ in conns.values():
+        conn.close_connection()
+    conns.clear()
+
+
+__all__ = [
+    "get_engine",
+    "dispose_engines",
+    "get_sqlite_connection",
+    "close_sqlite_connections",
+    "apply_sqlite_pragmas",
+    "track_queries",
+    "current_query_stats",
+    "normalize_sql",
+    "QueryStats",
+    "PooledSQLiteConnection",
+]
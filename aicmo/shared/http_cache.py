@@ -0,0 +1,110 @@
+"""
+Conditional GET support for the FastAPI apps.
+
+ConditionalGetMiddleware gives successful JSON GET responses a weak ETag
+(a BLAKE2b digest of the body) and answers a request whose If-None-Match
+matches it with an empty 304, so clients that revalidate their cached reads
+(aicmo.ui_v2.api_client) skip the transfer and decoding of unchanged lists.
+The handler still runs; this saves bandwidth and client work, not backend
+work. Responses that already carry an ETag, that are not JSON, or whose body
+is larger than max_body_bytes pass through untouched.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+def compute_etag(body: bytes) -> str:
+    """Weak ETag for a response body."""
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header value against etag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+class ConditionalGetMiddleware:
+    def __init__(self, app: ASGIApp, max_body_bytes: int = 1024 * 1024) -> None:
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope.get("method") != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+        size = 0
+        passthrough = False
+
+        async def flush() -> None:
+            nonlocal passthrough
+            passthrough = True
+            await send(start)
+            for chunk in chunks:
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            chunks.clear()
+
+        async def send_with_etag(message: Message) -> None:
+            nonlocal start, size
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                start = message
+                headers = Headers(raw=message.get("headers", []))
+                if (
+                    message.get("status", 200) != 200
+                    or "etag" in headers
+                    or not headers.get("content-type", "").startswith("application/json")
+                ):
+                    await flush()
+                return
+
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            size += len(body)
+            if size > self.max_body_bytes:
+                await flush()
+                await send(message)
+                return
+            chunks.append(body)
+            if message.get("more_body", False):
+                return
+
+            payload = b"".join(chunks)
+            etag = compute_etag(payload)
+            headers = MutableHeaders(scope=start)
+            headers["ETag"] = etag
+            if etag_matches(if_none_match, etag):
+                del headers["content-length"]
+                del headers["content-type"]
+                start["status"] = 304
+                payload = b""
+            await send(start)
+            await send({"type": "http.response.body", "body": payload})
+
+        await self.app(scope, receive, send_with_etag)
+
+
+__all__ = ["ConditionalGetMiddleware", "compute_etag", "etag_matches"]
@@ -0,0 +1,236 @@
+"""
+Process-wide Prometheus metrics for the hot paths.
+
+All metrics live on the prometheus_client default registry, so they are
+exported by GET /metrics on the backend app (backend/main.py) for whatever
+process serves it. Histograms use fixed buckets:
+memory per label set is constant no matter how many observations are made.
+
+Instrumented:
+- aicmo_http_request_seconds / aicmo_request_db_seconds / aicmo_request_db_queries
+  (QueryStatsMiddleware, labelled by route template)
+- aicmo_section_generation_seconds (backend.main.generate_sections)
+- aicmo_report_generation_seconds (POST /api/aicmo/generate_report)
+- aicmo_provider_calls_total / aicmo_provider_call_seconds (ProviderWrapper
+  and backend.services.llm_client.LLMClient; capability "llm" = LLM calls)
+- aicmo_pdf_render_seconds (backend.pdf_renderer WeasyPrint renders)
+- aicmo_cache_requests_total (LLM response cache, enrichment cache)
+- aicmo_queue_depth (JobRunner, AOL action queue)
+- aicmo_event_bus_* (BoundedEventBus subscriber lag and delivery outcomes,
+  outbox backlog)
+- aicmo_worker_cycle_seconds / aicmo_cam_job_* (CAM worker, AOL daemon, cron)
+
+Worker processes are not scraped; they call push_snapshot() after each
+cycle, which pushes to AICMO_METRICS_PUSHGATEWAY_URL and/or writes
+<job>.prom into AICMO_METRICS_TEXTFILE_DIR.
+"""
+
+import logging
+import os
+import socket
+from contextlib import contextmanager
+from typing import Iterator, Optional, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    push_to_gateway,
+    write_to_textfile,
+)
+
+from aicmo.shared.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Seconds. 8.0 is the "slow request" threshold of POST /api/aicmo/generate_report.
+REQUEST_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 8.0, 15.0, 30.0, 60.0)
+DB_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 250)
+SECTION_BUCKETS = (0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+PROVIDER_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+PDF_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0)
+CYCLE_BUCKETS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "aicmo_http_request_seconds",
+    "HTTP request duration by route template",
+    ["method", "route", "status"],
+    buckets=REQUEST_BUCKETS,
+)
+REQUEST_DB_SECONDS = Histogram(
+    "aicmo_request_db_seconds",
+    "Time spent executing SQL per HTTP request",
+    ["route"],
+    buckets=DB_BUCKETS,
+)
+REQUEST_DB_QUERIES = Histogram(
+    "aicmo_request_db_queries",
+    "SQL statements executed per HTTP request",
+    ["route"],
+    buckets=QUERY_COUNT_BUCKETS,
+)
+SECTION_GENERATION_SECONDS = Histogram(
+    "aicmo_section_generation_seconds",
+    "Time to generate one report section",
+    ["pack", "section"],
+    buckets=SECTION_BUCKETS,
+)
+REPORT_GENERATION_SECONDS = Histogram(
+    "aicmo_report_generation_seconds",
+    "End-to-end report generation time",
+    ["status"],
+    buckets=REQUEST_BUCKETS,
+)
+PROVIDER_CALLS = Counter(
+    "aicmo_provider_calls_total",
+    "External provider calls (capability 'llm' for LLM calls)",
+    ["capability", "provider", "outcome"],
+)
+PROVIDER_CALL_SECONDS = Histogram(
+    "aicmo_provider_call_seconds",
+    "Latency of successful provider calls",
+    ["capability", "provider"],
+    buckets=PROVIDER_BUCKETS,
+)
+PDF_RENDER_SECONDS = Histogram(
+    "aicmo_pdf_render_seconds",
+    "HTML to PDF render time",
+    ["template"],
+    buckets=PDF_BUCKETS,
+)
+CACHE_REQUESTS = Counter(
+    "aicmo_cache_requests_total",
+    "Cache lookups by outcome (hit rate = hit / (hit + miss))",
+    ["cache", "result"],
+)
+QUEUE_DEPTH = Gauge(
+    "aicmo_queue_depth",
+    "Items waiting in a work queue",
+    ["queue"],
+)
+EVENT_BUS_EVENTS = Counter(
+    "aicmo_event_bus_events_total",
+    "Events handled per event bus subscriber by outcome (delivered, failed, dropped)",
+    ["subscriber", "outcome"],
+)
+EVENT_BUS_QUEUED = Gauge(
+    "aicmo_event_bus_queued",
+    "Events waiting in an event bus subscriber's queue",
+    ["subscriber"],
+)
+EVENT_BUS_LAG_SECONDS = Gauge(
+    "aicmo_event_bus_lag_seconds",
+    "Age of the oldest event waiting in an event bus subscriber's queue",
+    ["subscriber"],
+)
+EVENT_BUS_OUTBOX_PENDING = Gauge(
+    "aicmo_event_bus_outbox_pending",
+    "Outbox events not yet delivered to every subscriber",
+)
+WORKER_CYCLE_SECONDS = Histogram(
+    "aicmo_worker_cycle_seconds",
+    "Duration of one worker cycle / daemon tick",
+    ["worker", "status"],
+    buckets=CYCLE_BUCKETS,
+)
+CAM_JOB_RUNS = Counter(
+    "aicmo_cam_job_runs_total",
+    "CAM cron and harvest runs by job type and status",
+    ["job_type", "status"],
+)
+CAM_JOB_SECONDS = Histogram(
+    "aicmo_cam_job_seconds",
+    "CAM cron and harvest run duration",
+    ["job_type"],
+    buckets=CYCLE_BUCKETS,
+)
+
+
+def record_provider_call(
+    capability: str, provider: str, success: bool, seconds: Optional[float] = None
+) -> None:
+    """Count one provider call; latency is recorded for successes only."""
+    PROVIDER_CALLS.labels(capability, provider, "success" if success else "failure").inc()
+    if success and seconds is not None:
+        PROVIDER_CALL_SECONDS.labels(capability, provider).observe(seconds)
+
+
+def record_cache(cache: str, hits: int = 0, misses: int = 0) -> None:
+    if hits:
+        CACHE_REQUESTS.labels(cache, "hit").inc(hits)
+    if misses:
+        CACHE_REQUESTS.labels(cache, "miss").inc(misses)
+
+
+@contextmanager
+def time_pdf_render(template: str) -> Iterator[None]:
+    with PDF_RENDER_SECONDS.labels(template).time():
+        yield
+
+
+def render_latest(registry: CollectorRegistry = REGISTRY) -> Tuple[bytes, str]:
+    """Text exposition of registry and its content type (for GET /metrics)."""
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def push_snapshot(job: str, registry: CollectorRegistry = REGISTRY) -> bool:
+    """
+    Publish the current metrics of a worker process.
+
+    Pushes to AICMO_METRICS_PUSHGATEWAY_URL (grouped by host and pid) and/or
+    writes AICMO_METRICS_TEXTFILE_DIR/<job>.prom. Failures are logged, never
+    raised: metrics must not take a worker down. Returns True if anything
+    was published.
+    """
+    published = False
+    if settings.METRICS_PUSHGATEWAY_URL:
+        try:
+            push_to_gateway(
+                settings.METRICS_PUSHGATEWAY_URL,
+                job=job,
+                registry=registry,
+                grouping_key={"instance": f"{socket.gethostname()}:{os.getpid()}"},
+                timeout=5,
+            )
+            published = True
+        except Exception as e:
+            logger.warning(f"Metrics push to {settings.METRICS_PUSHGATEWAY_URL} failed: {e}")
+    if settings.METRICS_TEXTFILE_DIR:
+        try:
+            os.makedirs(settings.METRICS_TEXTFILE_DIR, exist_ok=True)
+            write_to_textfile(os.path.join(settings.METRICS_TEXTFILE_DIR, f"{job}.prom"), registry)
+            published = True
+        except Exception as e:
+            logger.warning(f"Metrics textfile write failed: {e}")
+    return published
+
+
+__all__ = [
+    "CACHE_REQUESTS",
+    "CAM_JOB_RUNS",
+    "CAM_JOB_SECONDS",
+    "EVENT_BUS_EVENTS",
+    "EVENT_BUS_LAG_SECONDS",
+    "EVENT_BUS_OUTBOX_PENDING",
+    "EVENT_BUS_QUEUED",
+    "HTTP_REQUEST_SECONDS",
+    "PDF_RENDER_SECONDS",
+    "PROVIDER_CALLS",
+    "PROVIDER_CALL_SECONDS",
+    "QUEUE_DEPTH",
+    "REPORT_GENERATION_SECONDS",
+    "REQUEST_DB_QUERIES",
+    "REQUEST_DB_SECONDS",
+    "SECTION_GENERATION_SECONDS",
+    "WORKER_CYCLE_SECONDS",
+    "push_snapshot",
+    "record_cache",
+    "record_provider_call",
+    "render_latest",
+    "time_pdf_render",
+]
@@ -0,0 +1,493 @@
+"""
+Built-in sampling profiler for the API process and workers.
+
+A single sampler thread reads every thread's Python stack
+(sys._current_frames) each AICMO_PROFILE_INTERVAL_MS while at least one
+capture is active; with nothing to capture it blocks on an Event, so the
+idle cost is one parked thread.
+
+- profile_for(seconds): sample the whole process (POST /admin/profiling/sample).
+  mode="wall" keeps every stack; mode="cpu" drops threads parked in a
+  lock/queue/selector wait, approximating on-CPU time.
+- SlowRequestProfiler (ASGI): with AICMO_PROFILE_SLOW_REQUESTS on, samples
+  while each HTTP request runs and keeps the profile only if the request
+  took longer than the threshold. Endpoints can attach the request
+  fingerprint with annotate_request(). Concurrent requests share the
+  process, so their samples overlap; the profile records how many ran.
+- install_signal_handler(name): SIGUSR2 profiles a worker (e.g. the CAM
+  worker) for AICMO_PROFILE_SIGNAL_SECONDS in the background.
+
+Profiles are saved under AICMO_PROFILE_DIR (newest AICMO_PROFILE_MAX_FILES
+kept) and export to speedscope JSON, pstats (pstats.Stats / snakeviz) or
+collapsed stacks (flamegraph.pl). pstats times are sample estimates: call
+counts are sample counts.
+"""
+
+import json
+import logging
+import marshal
+import os
+import re
+import secrets
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from aicmo.shared.config import settings
+
+logger = logging.getLogger(__name__)
+
+# (filename, first line, function name): the pstats function key
+Frame = Tuple[str, int, str]
+Stack = Tuple[Frame, ...]  # root first
+
+MODES = ("wall", "cpu")
+FORMATS = ("speedscope", "pstats", "collapsed")
+
+# Leaf frames that mean "thread is parked", dropped in cpu mode
+_IDLE_FILES = ("threading.py", "queue.py", "selectors.py", "thread.py", "socket.py", "ssl.py")
+_IDLE_FUNCTIONS = {"wait", "get", "select", "poll", "_worker", "accept", "recv", "recv_into", "read", "sleep"}
+
+_PROFILE_ID = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+
+def _stack(frame: Any) -> Stack:
+    frames = []
+    while frame is not None:
+        code = frame.f_code
+        frames.append((code.co_filename, code.co_firstlineno, code.co_name))
+        frame = frame.f_back
+    frames.reverse()
+    return tuple(frames)
+
+
+def _is_idle(stack: Stack) -> bool:
+    if not stack:
+        return True
+    filename, _, name = stack[-1]
+    return name in _IDLE_FUNCTIONS and filename.endswith(_IDLE_FILES)
+
+
+def _frame_label(frame: Frame) -> str:
+    filename, line, name = frame
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+class SampledProfile:
+    """Stack samples of one capture, keyed by (thread name, stack)."""
+
+    def __init__(self, name: str, mode: str = "wall", interval: Optional[float] = None):
+        if mode not in MODES:
+            raise ValueError(f"Unknown profile mode {mode!r}; expected one of {MODES}")
+        self.name = name
+        self.mode = mode
+        self.interval = interval if interval is not None else settings.PROFILE_INTERVAL_MS / 1000.0
+        self.stacks: Counter = Counter()
+        self.ticks = 0
+        self.started_at = time.time()
+        self.duration = 0.0
+        self.meta: Dict[str, Any] = {}
+        self._perf_start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def add(self, stacks: List[Tuple[str, Stack]]) -> None:
+        with self._lock:
+            self.ticks += 1
+            for thread_name, stack in stacks:
+                if self.mode == "cpu" and _is_idle(stack):
+                    continue
+                self.stacks[(thread_name, stack)] += 1
+
+    def stop(self) -> None:
+        self.duration = time.perf_counter() - self._perf_start
+
+    @property
+    def samples(self) -> int:
+        return sum(self.stacks.values())
+
+    # ── storage ──────────────────────────────────────────────────────────
+
+    def to_dict(self) -> Dict[str, Any]:
+        frames: Dict[Frame, int] = {}
+        stacks = []
+        with self._lock:
+            items = list(self.stacks.items())
+        for (thread_name, stack), count in items:
+            stacks.append({
+                "thread": thread_name,
+                "frames": [frames.setdefault(f, len(frames)) for f in stack],
+                "count": count,
+            })
+        return {
+            "name": self.name,
+            "mode": self.mode,
+            "interval": self.interval,
+            "started_at": self.started_at,
+            "duration": round(self.duration, 6),
+            "ticks": self.ticks,
+            "meta": self.meta,
+            "frames": [list(f) for f in frames],
+            "stacks": stacks,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SampledProfile":
+        profile = cls(data["name"], data.get("mode", "wall"), data["interval"])
+        profile.started_at = data["started_at"]
+        profile.duration = data["duration"]
+        profile.ticks = data.get("ticks", 0)
+        profile.meta = data.get("meta", {})
+        frames = [tuple(f) for f in data["frames"]]
+        for item in data["stacks"]:
+            stack = tuple(frames[i] for i in item["frames"])
+            profile.stacks[(item["thread"], stack)] += item["count"]
+        return profile
+
+    # ── exports ──────────────────────────────────────────────────────────
+
+    def to_speedscope(self) -> Dict[str, Any]:
+        """speedscope file: one sampled profile per thread, weights in seconds."""
+        frame_index: Dict[Frame, int] = {}
+        per_thread: Dict[str, Dict[str, list]] = {}
+        with self._lock:
+            items = sorted(self.stacks.items(), key=lambda kv: kv[0][0])
+        for (thread_name, stack), count in items:
+            entry = per_thread.setdefault(thread_name, {"samples": [], "weights": []})
+            entry["samples"].append([frame_index.setdefault(f, len(frame_index)) for f in stack])
+            entry["weights"].append(count * self.interval)
+        profiles = [
+            {
+                "type": "sampled",
+                "name": f"{self.name} [{thread_name}]",
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(entry["weights"]),
+                "samples": entry["samples"],
+                "weights": entry["weights"],
+            }
+            for thread_name, entry in per_thread.items()
+        ]
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {
+                "frames": [
+                    {"name": name, "file": filename, "line": line}
+                    for (filename, line, name) in frame_index
+                ]
+            },
+            "profiles": profiles,
+            "name": self.name,
+            "activeProfileIndex": 0,
+            "exporter": "aicmo.shared.profiling",
+        }
+
+    def to_collapsed(self) -> str:
+        """Collapsed stacks ("thread;root;...;leaf count"), one line per stack."""
+        with self._lock:
+            items = list(self.stacks.items())
+        return "".join(
+            ";".join([thread_name] + [_frame_label(f) for f in stack]) + f" {count}\n"
+            for (thread_name, stack), count in items
+        )
+
+    def to_pstats(self) -> bytes:
+        """marshal-ed stats dict loadable by pstats.Stats (times estimated from samples)."""
+        self_counts: Counter = Counter()
+        total_counts: Counter = Counter()
+        edges: Counter = Counter()
+        with self._lock:
+            items = list(self.stacks.items())
+        for (_, stack), count in items:
+            if not stack:
+                continue
+            self_counts[stack[-1]] += count
+            for f in set(stack):
+                total_counts[f] += count
+            for caller, callee in set(zip(stack, stack[1:])):
+                edges[(caller, callee)] += count
+
+        callers: Dict[Frame, Dict[Frame, tuple]] = {}
+        for (caller, callee), count in edges.items():
+            seconds = count * self.interval
+            callers.setdefault(callee, {})[caller] = (count, count, seconds, seconds)
+
+        stats = {
+            f: (
+                total,
+                total,
+                self_counts.get(f, 0) * self.interval,
+                total * self.interval,
+                callers.get(f, {}),
+            )
+            for f, total in total_counts.items()
+        }
+        return marshal.dumps(stats)
+
+    def export(self, fmt: str) -> Tuple[bytes, str, str]:
+        """(body, media type, file extension) for fmt in FORMATS."""
+        if fmt == "speedscope":
+            return json.dumps(self.to_speedscope()).encode(), "application/json", "speedscope.json"
+        if fmt == "pstats":
+            return self.to_pstats(), "application/octet-stream", "pstats"
+        if fmt == "collapsed":
+            return self.to_collapsed().encode(), "text/plain", "collapsed.txt"
+        raise ValueError(f"Unknown profile format {fmt!r}; expected one of {FORMATS}")
+
+
+class StackSampler:
+    """The process-wide sampler thread; it only wakes while captures are active."""
+
+    def __init__(self) -> None:
+        self._captures: Set[SampledProfile] = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, profile: SampledProfile) -> None:
+        with self._lock:
+            self._captures.add(profile)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="aicmo-profiler", daemon=True)
+                self._thread.start()
+            self._wake.set()
+
+    def remove(self, profile: SampledProfile) -> None:
+        with self._lock:
+            self._captures.discard(profile)
+            if not self._captures:
+                self._wake.clear()
+        profile.stop()
+
+    def active(self) -> int:
+        with self._lock:
+            return len(self._captures)
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while True:
+            self._wake.wait()
+            with self._lock:
+                captures = list(self._captures)
+            if not captures:
+                continue
+            # Thread idents are reused, so names are looked up on every tick
+            names = {t.ident: t.name for t in threading.enumerate()}
+            stacks = [
+                (names.get(ident, str(ident)), _stack(frame))
+                for ident, frame in sys._current_frames().items()
+                if ident != own
+            ]
+            for capture in captures:
+                capture.add(stacks)
+            del stacks
+            time.sleep(min(c.interval for c in captures))
+
+
+_sampler = StackSampler()
+
+
+def start_capture(name: str, mode: str = "wall") -> SampledProfile:
+    profile = SampledProfile(name, mode)
+    _sampler.add(profile)
+    return profile
+
+
+def stop_capture(profile: SampledProfile) -> SampledProfile:
+    _sampler.remove(profile)
+    return profile
+
+
+def profile_for(seconds: float, mode: str = "wall", name: str = "process") -> SampledProfile:
+    """Sample the whole process for seconds (blocks the calling thread)."""
+    profile = start_capture(name, mode)
+    try:
+        time.sleep(seconds)
+    finally:
+        stop_capture(profile)
+    return profile
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# STORAGE
+# ═══════════════════════════════════════════════════════════════════════
+
+_store_lock = threading.Lock()
+
+
+def _profile_dir() -> str:
+    return os.path.expanduser(settings.PROFILE_DIR)
+
+
+def save_profile(profile: SampledProfile, key: str = "") -> str:
+    """Write profile to AICMO_PROFILE_DIR and prune old ones; returns its id."""
+    stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime(profile.started_at))
+    slug = re.sub(r"[^A-Za-z0-9_-]+", "_", key or profile.name)[:40].strip("_") or "profile"
+    profile_id = f"{stamp}-{slug}-{secrets.token_hex(3)}"
+    directory = _profile_dir()
+    with _store_lock:
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f"{profile_id}.json"), "w", encoding="utf-8") as f:
+            json.dump(profile.to_dict(), f, separators=(",", ":"))
+        files = sorted(n for n in os.listdir(directory) if n.endswith(".json"))
+        for stale in files[: max(0, len(files) - settings.PROFILE_MAX_FILES)]:
+            try:
+                os.remove(os.path.join(directory, stale))
+            except OSError:
+                pass
+    return profile_id
+
+
+def load_profile(profile_id: str) -> Optional[SampledProfile]:
+    if not _PROFILE_ID.match(profile_id):
+        return None
+    path = os.path.join(_profile_dir(), f"{profile_id}.json")
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return SampledProfile.from_dict(json.load(f))
+
+
+def list_profiles() -> List[Dict[str, Any]]:
+    """Saved profiles, newest first."""
+    directory = _profile_dir()
+    if not os.path.isdir(directory):
+        return []
+    summaries = []
+    for filename in sorted(os.listdir(directory), reverse=True):
+        if not filename.endswith(".json"):
+            continue
+        try:
+            with open(os.path.join(directory, filename), encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue
+        summaries.append({
+            "id": filename[: -len(".json")],
+            "name": data["name"],
+            "mode": data.get("mode", "wall"),
+            "started_at": data["started_at"],
+            "duration": data["duration"],
+            "samples": sum(s["count"] for s in data["stacks"]),
+            "meta": data.get("meta", {}),
+        })
+    return summaries
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# SLOW REQUEST CAPTURE
+# ═══════════════════════════════════════════════════════════════════════
+
+_request_profile: ContextVar[Optional[SampledProfile]] = ContextVar("aicmo_request_profile", default=None)
+
+
+def annotate_request(**meta: Any) -> None:
+    """Attach metadata (e.g. fingerprint) to the current request's profile, if any."""
+    profile = _request_profile.get()
+    if profile is not None:
+        profile.meta.update({k: v for k, v in meta.items() if v is not None})
+
+
+class SlowRequestProfiler:
+    """
+    Profile each HTTP request while it runs; keep it when slower than threshold_ms.
+
+    Does nothing unless AICMO_PROFILE_SLOW_REQUESTS is on. Paths under
+    skip_prefixes (the profiling API itself) are never captured.
+    """
+
+    def __init__(self, app: Any, threshold_ms: float, skip_prefixes: Tuple[str, ...] = ("/admin/profiling",)):
+        self.app = app
+        self.threshold_ms = threshold_ms
+        self.skip_prefixes = skip_prefixes
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        path = scope.get("path", "")
+        if (
+            scope["type"] != "http"
+            or not settings.PROFILE_SLOW_REQUESTS
+            or path.startswith(self.skip_prefixes)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        method = scope.get("method", "GET")
+        profile = start_capture(f"{method} {path}")
+        profile.meta.update({"method": method, "path": path, "concurrent": _sampler.active()})
+        token = _request_profile.set(profile)
+
+        async def send_with_profile(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                profile.meta["status"] = message.get("status", 200)
+                for name, value in message.get("headers") or []:
+                    if name == b"x-trace-id":
+                        profile.meta["trace_id"] = value.decode()
+                route = scope.get("route")
+                if route is not None and getattr(route, "path", None):
+                    profile.meta["route"] = route.path
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_profile)
+        finally:
+            _request_profile.reset(token)
+            stop_capture(profile)
+            duration_ms = profile.duration * 1000.0
+            if duration_ms > self.threshold_ms:
+                profile.meta["duration_ms"] = round(duration_ms, 1)
+                profile.meta["concurrent"] = max(profile.meta["concurrent"], _sampler.active() + 1)
+                try:
+                    profile_id = save_profile(profile, profile.meta.get("fingerprint", ""))
+                    logger.warning(
+                        "Slow request %s %s took %.0fms; profile %s saved", method, path, duration_ms, profile_id
+                    )
+                except OSError as e:
+                    logger.warning(f"Could not save slow request profile: {e}")
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# WORKERS
+# ═══════════════════════════════════════════════════════════════════════
+
+
+def install_signal_handler(name: str, signum: int = getattr(signal, "SIGUSR2", 0)) -> bool:
+    """
+    On signum (SIGUSR2), profile this process for AICMO_PROFILE_SIGNAL_SECONDS
+    in a background thread and save the result. Main thread only; returns
+    False where the signal is unavailable.
+    """
+    if not signum or threading.current_thread() is not threading.main_thread():
+        return False
+
+    def capture() -> None:
+        try:
+            profile = profile_for(settings.PROFILE_SIGNAL_SECONDS, name=name)
+            profile.meta["pid"] = os.getpid()
+            logger.info("Profile %s saved", save_profile(profile))
+        except Exception as e:
+            logger.warning(f"Signal-triggered profile failed: {e}")
+
+    def handler(signo: int, frame: Any) -> None:
+        threading.Thread(target=capture, name="aicmo-profile-capture", daemon=True).start()
+
+    signal.signal(signum, handler)
+    return True
+
+
+__all__ = [
+    "FORMATS",
+    "MODES",
+    "SampledProfile",
+    "SlowRequestProfiler",
+    "annotate_request",
+    "install_signal_handler",
+    "list_profiles",
+    "load_profile",
+    "profile_for",
+    "save_profile",
+    "start_capture",
+    "stop_capture",
+]
@@ -0,0 +1,45 @@
+"""
+Async token-bucket rate limiting for outbound provider calls.
+
+Used to pace enrichment providers (aicmo.crm.enrichment) and publishing
+channels (aicmo.publishing.pipeline).
+"""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Async rate limiter: `rate` requests per second, bursts of up to `burst`.
+    
+    Not bound to an event loop, so one bucket paces a provider across every
+    batch in the process.
+    """
+    
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            await asyncio.sleep(wait)
+
+
+__all__ = ["TokenBucket"]
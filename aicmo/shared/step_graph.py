@@ -0,0 +1,187 @@
+"""
+Run a declared dependency graph of steps on a thread pool.
+
+Each Step names the steps it depends on and receives their values as a
+dict. A step starts as soon as all of its dependencies have succeeded, so
+independent branches run concurrently and the wall time approaches the
+slowest branch rather than the sum of all steps.
+
+- A failing step is captured in its StepResult (status "failed") instead of
+  aborting the graph; steps that depend on it are "skipped" unless it is
+  marked optional, in which case they run with None as its value.
+- A step that exceeds its timeout is reported as "timed_out" and its
+  dependents are skipped. Python threads cannot be interrupted, so the
+  call keeps running in the background and its result is discarded.
+- Steps run in a copy of the caller's contextvars (trace spans nest under
+  the caller's span) and each gets a "step.<name>" span.
+"""
+
+import contextvars
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from aicmo.shared import tracing
+
+logger = logging.getLogger(__name__)
+
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+TIMED_OUT = "timed_out"
+SKIPPED = "skipped"
+
+
+@dataclass
+class Step:
+    """One unit of work; fn receives {dependency name: value}."""
+
+    name: str
+    fn: Callable[[Dict[str, Any]], Any]
+    depends_on: Tuple[str, ...] = ()
+    timeout: Optional[float] = None  # seconds; None = the graph default
+    optional: bool = False  # on failure, dependents still run (with None)
+
+
+@dataclass
+class StepResult:
+    name: str
+    status: str
+    value: Any = None
+    error: Optional[str] = None
+    started_at: float = 0.0  # seconds after the graph started
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.status == SUCCEEDED
+
+    def timing(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "started_at": round(self.started_at, 4),
+            "seconds": round(self.seconds, 4),
+            **({"error": self.error} if self.error else {}),
+        }
+
+
+def _validate(steps: List[Step]) -> None:
+    names = [s.name for s in steps]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate step names in {names}")
+    known = set(names)
+    for s in steps:
+        missing = [d for d in s.depends_on if d not in known]
+        if missing:
+            raise ValueError(f"Step {s.name!r} depends on unknown steps {missing}")
+
+    # Kahn's algorithm: anything left over is on a cycle
+    remaining = {s.name: set(s.depends_on) for s in steps}
+    while True:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            break
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+    if remaining:
+        raise ValueError(f"Dependency cycle between steps {sorted(remaining)}")
+
+
+def run_step_graph(
+    steps: Iterable[Step],
+    max_workers: Optional[int] = None,
+    default_timeout: Optional[float] = None,
+) -> Dict[str, StepResult]:
+    """Run steps respecting depends_on; returns a StepResult per step, in declaration order."""
+    steps = list(steps)
+    _validate(steps)
+    by_name = {s.name: s for s in steps}
+    results: Dict[str, StepResult] = {}
+    running: Dict[Future, Tuple[Step, float, Optional[float]]] = {}
+    submitted = set()
+    graph_start = time.perf_counter()
+
+    def run(step: Step, inputs: Dict[str, Any]) -> Any:
+        with tracing.span(f"step.{step.name}"):
+            return step.fn(inputs)
+
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers or max(1, len(steps)), thread_name_prefix="step-graph"
+    )
+    try:
+        while len(results) < len(steps):
+            # Settle steps whose dependencies are done
+            for s in steps:
+                if s.name in submitted:
+                    continue
+                dep_results = [results.get(d) for d in s.depends_on]
+                blocked = [
+                    r.name for r in dep_results
+                    if r is not None and not r.ok and not by_name[r.name].optional
+                ]
+                if blocked:
+                    results[s.name] = StepResult(
+                        s.name, SKIPPED, error=f"Dependencies did not succeed: {blocked}"
+                    )
+                    submitted.add(s.name)
+                elif all(r is not None for r in dep_results):
+                    inputs = {r.name: r.value for r in dep_results}
+                    timeout = s.timeout if s.timeout is not None else default_timeout
+                    started = time.perf_counter()
+                    future = executor.submit(contextvars.copy_context().run, run, s, inputs)
+                    running[future] = (s, started, started + timeout if timeout else None)
+                    submitted.add(s.name)
+            if len(results) == len(steps):
+                break
+
+            deadlines = [d for _, _, d in running.values() if d is not None]
+            wait_for = max(0.0, min(deadlines) - time.perf_counter()) if deadlines else None
+            done, _ = wait(list(running), timeout=wait_for, return_when=FIRST_COMPLETED)
+
+            now = time.perf_counter()
+            for future in list(running):
+                s, started, deadline = running[future]
+                if future in done:
+                    del running[future]
+                    offset, seconds = started - graph_start, now - started
+                    exc = future.exception()
+                    if exc is None:
+                        results[s.name] = StepResult(s.name, SUCCEEDED, future.result(), None, offset, seconds)
+                    else:
+                        logger.warning(f"Step {s.name} failed: {type(exc).__name__}: {exc}")
+                        results[s.name] = StepResult(
+                            s.name, FAILED, None, f"{type(exc).__name__}: {exc}", offset, seconds
+                        )
+                elif deadline is not None and now >= deadline:
+                    del running[future]
+                    future.cancel()
+                    logger.warning(f"Step {s.name} timed out after {deadline - started:.1f}s")
+                    results[s.name] = StepResult(
+                        s.name, TIMED_OUT, None, f"Timed out after {deadline - started:.1f}s",
+                        started - graph_start, now - started,
+                    )
+    finally:
+        # Don't wait for timed-out steps still running in their threads
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return {name: results[name] for name in by_name}
+
+
+def step_timings(results: Dict[str, StepResult]) -> Dict[str, Dict[str, Any]]:
+    """{step name: {status, started_at, seconds[, error]}} for result payloads."""
+    return {name: r.timing() for name, r in results.items()}
+
+
+__all__ = [
+    "FAILED",
+    "SKIPPED",
+    "SUCCEEDED",
+    "TIMED_OUT",
+    "Step",
+    "StepResult",
+    "run_step_graph",
+    "step_timings",
+]
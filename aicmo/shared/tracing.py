@@ -0,0 +1,599 @@
+"""
+Lightweight in-process tracing with OpenTelemetry-compatible output.
+
+A trace is a tree of timed spans for one unit of work (an HTTP request, a
+background job). No collector or SDK is needed:
+
+- start_trace(name) opens the root span; span(name) / @traced open children
+  of whatever span is current (a contextvar, so asyncio tasks inherit it).
+  Outside a trace, span() is a no-op, so library code can be instrumented
+  unconditionally.
+- record_span() adds an already-finished child (used for DB statements,
+  which are timed by aicmo.shared.db).
+- Every trace buffers its spans (at most AICMO_TRACE_MAX_SPANS) and is
+  tail-sampled when the root ends: traces slower than AICMO_TRACE_SLOW_MS
+  or ending in an error are always kept with their full breakdown, others
+  with probability AICMO_TRACE_SAMPLE_RATE.
+- Kept traces are exported as OTLP/JSON ("resourceSpans", one trace per
+  line) to AICMO_TRACE_FILE_PATH and/or logged as an indented breakdown
+  (AICMO_TRACE_EXPORTERS="file,console") by a background thread, so the
+  request that produced them never waits on serialization or the file.
+  The last AICMO_TRACE_RECENT_SIZE stay in memory for GET /traces and the
+  operator UI's flame view.
+
+The OTLP lines can be replayed into any OpenTelemetry backend (e.g. with an
+OTLP/HTTP JSON POST to a collector's /v1/traces).
+"""
+
+import atexit
+import functools
+import inspect
+import json
+import logging
+import os
+import queue
+import random
+import secrets
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from aicmo.shared.config import settings
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "aicmo"
+
+# OTLP span kinds / status codes
+KIND_INTERNAL = 1
+KIND_SERVER = 2
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+class Span:
+    """One timed operation. Attributes must be str, bool, int or float."""
+
+    __slots__ = (
+        "trace", "span_id", "parent_id", "name", "kind", "attributes",
+        "start_ns", "end_ns", "status", "status_message", "_perf_start",
+    )
+
+    def __init__(self, trace: "Trace", name: str, parent_id: str = "", kind: int = KIND_INTERNAL,
+                 attributes: Optional[Dict[str, Any]] = None):
+        self.trace = trace
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.attributes: Dict[str, Any] = {k: v for k, v in (attributes or {}).items() if v is not None}
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.status = STATUS_UNSET
+        self.status_message = ""
+        self._perf_start = time.perf_counter_ns()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if value is not None:
+            self.attributes[key] = value
+
+    def set_error(self, exc: BaseException) -> None:
+        self.status = STATUS_ERROR
+        self.status_message = f"{type(exc).__name__}: {exc}"[:500]
+
+    def end(self) -> None:
+        if not self.end_ns:
+            self.end_ns = self.start_ns + (time.perf_counter_ns() - self._perf_start)
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6 if self.end_ns else 0.0
+
+
+class _NoopSpan:
+    """Returned outside a trace (or with tracing disabled); ignores everything."""
+
+    span_id = ""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_error(self, exc: BaseException) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Trace:
+    """Spans of one trace; at most AICMO_TRACE_MAX_SPANS are kept."""
+
+    def __init__(self, max_spans: int):
+        self.trace_id = secrets.token_hex(16)
+        self.spans: List[Span] = []
+        self.dropped = 0
+        self.max_spans = max_spans
+        self.otlp: Optional[Dict[str, Any]] = None  # set once the trace is kept and converted
+        self._lock = threading.Lock()
+
+    def add(self, span: Span) -> bool:
+        with self._lock:
+            if len(self.spans) >= self.max_spans:
+                self.dropped += 1
+                return False
+            self.spans.append(span)
+            return True
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("aicmo_trace_span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def current_trace_id() -> Optional[str]:
+    span = _current_span.get()
+    return span.trace.trace_id if span is not None else None
+
+
+def is_recording() -> bool:
+    """True inside a trace, i.e. when child spans are being recorded."""
+    return _current_span.get() is not None
+
+
+@contextmanager
+def _activate(span: Span) -> Iterator[Span]:
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as exc:
+        span.set_error(exc)
+        raise
+    finally:
+        span.end()
+        _current_span.reset(token)
+
+
+@contextmanager
+def start_trace(name: str, kind: int = KIND_SERVER, **attributes: Any) -> Iterator[Any]:
+    """
+    Root span of a new trace (a child span if a trace is already active).
+
+    When the block exits the trace is tail-sampled and, if kept, handed to
+    the background exporter.
+    """
+    if _current_span.get() is not None:
+        with span(name, **attributes) as child:
+            yield child
+        return
+    if not settings.TRACING_ENABLED:
+        yield NOOP_SPAN
+        return
+
+    trace = Trace(settings.TRACE_MAX_SPANS)
+    root = Span(trace, name, kind=kind, attributes=attributes)
+    trace.add(root)
+    try:
+        with _activate(root):
+            yield root
+    finally:
+        _finish(trace, root)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Any]:
+    """Child of the current span; a no-op outside a trace."""
+    parent = _current_span.get()
+    if parent is None:
+        yield NOOP_SPAN
+        return
+    child = Span(parent.trace, name, parent.span_id, attributes=attributes)
+    if not parent.trace.add(child):
+        yield NOOP_SPAN
+        return
+    with _activate(child):
+        yield child
+
+
+def record_span(name: str, seconds: float, **attributes: Any) -> None:
+    """Add a child of the current span that has just finished after `seconds`."""
+    parent = _current_span.get()
+    if parent is None:
+        return
+    child = Span(parent.trace, name, parent.span_id, attributes=attributes)
+    child.end_ns = child.start_ns
+    child.start_ns -= int(seconds * 1e9)
+    parent.trace.add(child)
+
+
+def traced(name: Optional[str] = None, attrs: Sequence[str] = ()) -> Callable:
+    """
+    Decorator: run the function inside span(name). attrs names keyword
+    arguments whose values are recorded as span attributes (e.g. section_id).
+    Works for sync and async functions.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        span_name = name or fn.__qualname__
+
+        def span_attributes(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+            return {key: _attr_value(kwargs[key]) for key in attrs if key in kwargs}
+
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with span(span_name, **span_attributes(kwargs)):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(span_name, **span_attributes(kwargs)):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _attr_value(value: Any) -> Any:
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    return str(value)[:200]
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# SAMPLING AND EXPORT
+# ═══════════════════════════════════════════════════════════════════════
+
+_recent: Deque[Trace] = deque(maxlen=max(1, settings.TRACE_RECENT_SIZE))
+_recent_lock = threading.Lock()
+_file_lock = threading.Lock()
+
+_EXPORT_QUEUE_SIZE = 1000
+_export_queue: "queue.Queue[tuple]" = queue.Queue(maxsize=_EXPORT_QUEUE_SIZE)
+_export_thread: Optional[threading.Thread] = None
+_export_thread_lock = threading.Lock()
+_export_dropped = 0
+
+
+def should_keep(duration_ms: float, error: bool = False) -> bool:
+    """Tail sampling: slow and failed traces always, others at AICMO_TRACE_SAMPLE_RATE."""
+    if error or duration_ms >= settings.TRACE_SLOW_MS:
+        return True
+    return random.random() < settings.TRACE_SAMPLE_RATE
+
+
+def _finish(trace: Trace, root: Span) -> None:
+    global _export_dropped
+    try:
+        if not should_keep(root.duration_ms, root.status == STATUS_ERROR):
+            return
+        # Only the Trace object is kept here; OTLP conversion happens on the
+        # export thread (or on first read from GET /traces)
+        with _recent_lock:
+            _recent.append(trace)
+        # Exporters and path are resolved now, so the background write goes
+        # where the settings pointed when the trace ended
+        exporters = {e.strip() for e in settings.TRACE_EXPORTERS.split(",") if e.strip()}
+        path = trace_file_path() if "file" in exporters and settings.TRACE_FILE_PATH else ""
+        if not path and "console" not in exporters:
+            return
+        try:
+            _export_queue.put_nowait((trace, path, "console" in exporters))
+        except queue.Full:
+            _export_dropped += 1
+            return
+        _ensure_export_thread()
+    except Exception as e:
+        logger.debug(f"Trace export failed: {e}")
+
+
+def _ensure_export_thread() -> None:
+    global _export_thread
+    if _export_thread is not None and _export_thread.is_alive():
+        return
+    with _export_thread_lock:
+        if _export_thread is None or not _export_thread.is_alive():
+            _export_thread = threading.Thread(target=_export_loop, name="aicmo-trace-export", daemon=True)
+            _export_thread.start()
+
+
+def _export_loop() -> None:
+    while True:
+        trace, path, console = _export_queue.get()
+        try:
+            otlp = _trace_otlp(trace)
+            if path:
+                _export_file(otlp, path)
+            if console:
+                logger.info("Trace %s\n%s", summarize(otlp)["trace_id"], format_flame(flame(otlp)))
+        except Exception as e:
+            logger.debug(f"Trace export failed: {e}")
+        finally:
+            _export_queue.task_done()
+
+
+def flush_exports(timeout: float = 5.0) -> bool:
+    """Wait until queued traces are exported; False if `timeout` ran out first."""
+    deadline = time.monotonic() + timeout
+    while _export_queue.unfinished_tasks:
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+# Short-lived processes (workers run once, CLI jobs) still write their traces
+atexit.register(flush_exports, 2.0)
+
+
+def export_stats() -> Dict[str, int]:
+    """Traces waiting for the exporter, and traces dropped because the queue was full."""
+    return {"queued": _export_queue.qsize(), "dropped": _export_dropped}
+
+
+def trace_file_path(path: Optional[str] = None) -> str:
+    """AICMO_TRACE_FILE_PATH (or `path`) with ~ expanded."""
+    return os.path.expanduser(path or settings.TRACE_FILE_PATH)
+
+
+def _trace_otlp(trace: Trace) -> Dict[str, Any]:
+    """to_otlp(trace), converted once per kept trace."""
+    if trace.otlp is None:
+        trace.otlp = to_otlp(trace)
+    return trace.otlp
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _from_otlp_value(value: Dict[str, Any]) -> Any:
+    if "intValue" in value:
+        return int(value["intValue"])
+    for key in ("boolValue", "doubleValue", "stringValue"):
+        if key in value:
+            return value[key]
+    return None
+
+
+def to_otlp(trace: Trace) -> Dict[str, Any]:
+    """The trace as an OTLP/JSON ExportTraceServiceRequest."""
+    spans = []
+    for s in trace.spans:
+        s.end()
+        item = {
+            "traceId": trace.trace_id,
+            "spanId": s.span_id,
+            "name": s.name,
+            "kind": s.kind,
+            "startTimeUnixNano": str(s.start_ns),
+            "endTimeUnixNano": str(s.end_ns),
+            "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in s.attributes.items()],
+            "status": {"code": s.status, **({"message": s.status_message} if s.status_message else {})},
+        }
+        if s.parent_id:
+            item["parentSpanId"] = s.parent_id
+        spans.append(item)
+    resource_attributes = [
+        {"key": "service.name", "value": {"stringValue": SERVICE_NAME}},
+        {"key": "aicmo.dropped_spans", "value": {"intValue": str(trace.dropped)}},
+    ]
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": resource_attributes},
+            "scopeSpans": [{"scope": {"name": __name__}, "spans": spans}],
+        }]
+    }
+
+
+def _export_file(otlp: Dict[str, Any], path: str) -> None:
+    line = json.dumps(otlp, separators=(",", ":")) + "\n"
+    with _file_lock:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        try:
+            if os.path.getsize(path) + len(line) > settings.TRACE_FILE_MAX_BYTES:
+                os.replace(path, f"{path}.1")
+        except OSError:
+            pass
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+
+def _spans(otlp: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        s
+        for resource in otlp.get("resourceSpans", [])
+        for scope in resource.get("scopeSpans", [])
+        for s in scope.get("spans", [])
+    ]
+
+
+def summarize(otlp: Dict[str, Any]) -> Dict[str, Any]:
+    """trace_id, root name/attributes, start, duration and span count."""
+    spans = _spans(otlp)
+    root = next((s for s in spans if not s.get("parentSpanId")), spans[0] if spans else {})
+    start = int(root.get("startTimeUnixNano", 0))
+    end = int(root.get("endTimeUnixNano", 0))
+    return {
+        "trace_id": root.get("traceId", ""),
+        "name": root.get("name", ""),
+        "start_unix_ms": start // 1_000_000,
+        "duration_ms": round((end - start) / 1e6, 3),
+        "span_count": len(spans),
+        "error": any(s.get("status", {}).get("code") == STATUS_ERROR for s in spans),
+        "attributes": {a["key"]: _from_otlp_value(a["value"]) for a in root.get("attributes", [])},
+    }
+
+
+def flame(otlp: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Depth-first rows for a flame/icicle view: name, depth, offset and
+    duration (ms from the root start), self time and attributes.
+    """
+    spans = _spans(otlp)
+    children: Dict[str, List[Dict[str, Any]]] = {}
+    ids = {s["spanId"] for s in spans}
+    roots = []
+    for s in spans:
+        parent = s.get("parentSpanId")
+        if parent and parent in ids:
+            children.setdefault(parent, []).append(s)
+        else:
+            roots.append(s)
+    if not roots:
+        return []
+    origin = min(int(s["startTimeUnixNano"]) for s in roots)
+
+    rows: List[Dict[str, Any]] = []
+
+    def visit(s: Dict[str, Any], depth: int) -> None:
+        start, end = int(s["startTimeUnixNano"]), int(s["endTimeUnixNano"])
+        kids = sorted(children.get(s["spanId"], []), key=lambda c: int(c["startTimeUnixNano"]))
+        child_ns = sum(int(c["endTimeUnixNano"]) - int(c["startTimeUnixNano"]) for c in kids)
+        rows.append({
+            "name": s["name"],
+            "depth": depth,
+            "offset_ms": round((start - origin) / 1e6, 3),
+            "duration_ms": round((end - start) / 1e6, 3),
+            "self_ms": round(max(0, end - start - child_ns) / 1e6, 3),
+            "error": s.get("status", {}).get("code") == STATUS_ERROR,
+            "attributes": {a["key"]: _from_otlp_value(a["value"]) for a in s.get("attributes", [])},
+        })
+        for kid in kids:
+            visit(kid, depth + 1)
+
+    for root in sorted(roots, key=lambda r: int(r["startTimeUnixNano"])):
+        visit(root, 0)
+    return rows
+
+
+def format_flame(rows: Iterable[Dict[str, Any]]) -> str:
+    """Indented text breakdown (console exporter)."""
+    return "\n".join(
+        f"{'  ' * r['depth']}{r['name']} {r['duration_ms']:.1f}ms (self {r['self_ms']:.1f}ms)"
+        + (" ERROR" if r["error"] else "")
+        for r in rows
+    )
+
+
+def load_traces(path: Optional[str] = None) -> List[Dict[str, Any]]:
+    """OTLP traces from the file exporter (and its rotated .1 file), oldest first."""
+    flush_exports()
+    path = trace_file_path(path)
+    traces: List[Dict[str, Any]] = []
+    for candidate in (f"{path}.1", path):
+        if not os.path.exists(candidate):
+            continue
+        with open(candidate, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    traces.append(json.loads(line))
+                except ValueError:
+                    continue
+    return traces
+
+
+def recent_traces(limit: int = 20) -> List[Dict[str, Any]]:
+    """Summaries of the most recently kept traces in this process, newest first."""
+    with _recent_lock:
+        kept = list(_recent)
+    return [summarize(_trace_otlp(t)) for t in reversed(kept[-limit:])]
+
+
+def get_trace(trace_id: str) -> Optional[Dict[str, Any]]:
+    """A kept trace by id, from memory or the trace file."""
+    with _recent_lock:
+        kept = list(_recent)
+    for trace in reversed(kept):
+        if trace.trace_id == trace_id:
+            return _trace_otlp(trace)
+    for otlp in reversed(load_traces()):
+        if summarize(otlp)["trace_id"] == trace_id:
+            return otlp
+    return None
+
+
+def clear_recent() -> None:
+    with _recent_lock:
+        _recent.clear()
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# ASGI
+# ═══════════════════════════════════════════════════════════════════════
+
+
+class TracingMiddleware:
+    """Root span per HTTP request, named by method and route template."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope.get("method", "GET")
+        with start_trace(f"{method} {scope.get('path', '')}", **{"http.method": method}) as root:
+
+            async def send_with_trace(message: Dict[str, Any]) -> None:
+                if message["type"] == "http.response.start":
+                    route = scope.get("route")
+                    if route is not None and getattr(route, "path", None):
+                        root.set_attribute("http.route", route.path)
+                        if isinstance(root, Span):
+                            root.name = f"{method} {route.path}"
+                    root.set_attribute("http.status_code", message.get("status", 200))
+                    if root.span_id:
+                        message.setdefault("headers", [])
+                        message["headers"] = list(message["headers"]) + [
+                            (b"x-trace-id", root.trace.trace_id.encode())
+                        ]
+                await send(message)
+
+            await self.app(scope, receive, send_with_trace)
+
+
+__all__ = [
+    "NOOP_SPAN",
+    "Span",
+    "Trace",
+    "TracingMiddleware",
+    "clear_recent",
+    "current_span",
+    "current_trace_id",
+    "export_stats",
+    "flame",
+    "flush_exports",
+    "format_flame",
+    "get_trace",
+    "is_recording",
+    "load_traces",
+    "record_span",
+    "recent_traces",
+    "should_keep",
+    "span",
+    "start_trace",
+    "summarize",
+    "to_otlp",
+    "trace_file_path",
+    "traced",
+]
@@ -0,0 +1,340 @@
+"""
+AICMO V2 Backend API Client
+
+One BackendClient per backend URL, shared by every session and rerun of the
+Streamlit process (get_backend_client()):
+- a single httpx.Client, so reruns reuse pooled keep-alive connections
+  instead of opening a new connection per call; failed connects are retried
+- GET responses are kept with their ETag / Last-Modified and revalidated with
+  a conditional request (304 = reuse the cached body); within
+  AICMO_UI_HTTP_CACHE_TTL_SECONDS an identical GET is answered from memory,
+  so a widget change doesn't refetch every list on the page
+- any other request marks cached reads stale (they are revalidated next time)
+- timeouts per endpoint path prefix (AICMO_UI_HTTP_ENDPOINT_TIMEOUTS)
+- long calls run in a background thread (submit / poll), so a page can keep
+  rendering progress instead of blocking on the backend
+
+Calls return (success, data, error_msg) tuples like the helpers in
+aicmo.ui_v2.shared. This module does not import streamlit.
+"""
+
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+import httpx
+
+from aicmo.shared.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+ApiResult = Tuple[bool, Optional[Any], Optional[str]]
+
+# Gateway errors worth retrying for idempotent reads
+_RETRY_STATUSES = {502, 503, 504}
+
+
+def parse_endpoint_timeouts(spec: str) -> Dict[str, float]:
+    """Parse "/path=seconds,/other=seconds" into {path_prefix: seconds}."""
+    timeouts: Dict[str, float] = {}
+    for item in (spec or "").split(","):
+        prefix, sep, seconds = item.strip().partition("=")
+        if not sep:
+            continue
+        try:
+            timeouts[prefix.strip()] = float(seconds)
+        except ValueError:
+            logger.warning(f"Ignoring invalid endpoint timeout: {item!r}")
+    return timeouts
+
+
+@dataclass
+class _CachedRead:
+    data: Any
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+
+@dataclass
+class BackgroundCall:
+    """A request running in the client's background pool."""
+    call_id: str
+    method: str
+    path: str
+    timeout: float
+    started_at: float
+    future: Future
+
+    @property
+    def done(self) -> bool:
+        return self.future.done()
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the timeout used so far (1.0 once done)."""
+        if self.done:
+            return 1.0
+        return min(self.elapsed / self.timeout, 0.99) if self.timeout else 0.0
+
+    def result(self) -> Optional[ApiResult]:
+        """The call's (success, data, error_msg), or None while it is running."""
+        return self.future.result() if self.done else None
+
+
+class BackendClient:
+    """Pooled, caching HTTP client for the AICMO backend."""
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: Optional[float] = None,
+        endpoint_timeouts: Optional[Dict[str, float]] = None,
+        retries: Optional[int] = None,
+        max_connections: Optional[int] = None,
+        cache_ttl: Optional[float] = None,
+        background_workers: Optional[int] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = settings.UI_HTTP_TIMEOUT_SECONDS if timeout is None else timeout
+        self.endpoint_timeouts = (
+            parse_endpoint_timeouts(settings.UI_HTTP_ENDPOINT_TIMEOUTS)
+            if endpoint_timeouts is None else dict(endpoint_timeouts)
+        )
+        self.retries = settings.UI_HTTP_RETRIES if retries is None else retries
+        self.cache_ttl = settings.UI_HTTP_CACHE_TTL_SECONDS if cache_ttl is None else cache_ttl
+        max_connections = max_connections or settings.UI_HTTP_MAX_CONNECTIONS
+
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            transport=transport or httpx.HTTPTransport(retries=self.retries),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            follow_redirects=True,
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=background_workers or settings.UI_HTTP_BACKGROUND_WORKERS,
+            thread_name_prefix="ui-backend",
+        )
+        self._reads: Dict[str, _CachedRead] = {}
+        self._calls: Dict[str, BackgroundCall] = {}
+        self._lock = threading.Lock()
+
+    # ── requests ─────────────────────────────────────────────────
+
+    def timeout_for(self, path: str) -> float:
+        """Timeout for path: the longest matching endpoint prefix, else the default."""
+        matches = [prefix for prefix in self.endpoint_timeouts if path.startswith(prefix)]
+        if not matches:
+            return self.timeout
+        return self.endpoint_timeouts[max(matches, key=len)]
+
+    def request(self, method: str, path: str, timeout: Optional[float] = None, **kwargs) -> httpx.Response:
+        """
+        Send a request on the pooled connection; httpx errors propagate.
+
+        Anything but GET/HEAD marks cached reads stale.
+        """
+        method = method.upper()
+        if method not in ("GET", "HEAD"):
+            self.invalidate()
+        timeout = self.timeout_for(path) if timeout is None else timeout
+        return self._client.request(method, path, timeout=timeout, **kwargs)
+
+    def get_json(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        use_cache: bool = True,
+    ) -> ApiResult:
+        """GET path and decode JSON, revalidating cached responses with ETag / Last-Modified."""
+        timeout = self.timeout_for(path) if timeout is None else timeout
+        key = self._cache_key(path, params)
+        cached = self._reads.get(key) if use_cache else None
+        if cached is not None and time.monotonic() - cached.fetched_at < self.cache_ttl:
+            return True, cached.data, None
+
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        try:
+            response = self._get_with_retries(path, params, headers, timeout)
+            if response.status_code == 304 and cached is not None:
+                cached.fetched_at = time.monotonic()
+                return True, cached.data, None
+            if response.status_code != 200:
+                return False, None, f"Backend returned {response.status_code}: {response.text[:200]}"
+            data = response.json()
+        except Exception as e:
+            return _failure(e, timeout)
+
+        if use_cache:
+            with self._lock:
+                self._reads[key] = _CachedRead(
+                    data=data,
+                    etag=response.headers.get("etag"),
+                    last_modified=response.headers.get("last-modified"),
+                    fetched_at=time.monotonic(),
+                )
+        return True, data, None
+
+    def post_json(
+        self,
+        path: str,
+        payload: Dict[str, Any],
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> ApiResult:
+        """POST a JSON payload and decode the JSON response."""
+        timeout = self.timeout_for(path) if timeout is None else timeout
+        try:
+            response = self.request("POST", path, json=payload, headers=headers, timeout=timeout)
+            if response.status_code not in (200, 201, 202):
+                return False, None, f"Backend returned {response.status_code}: {response.text[:200]}"
+            return True, response.json(), None
+        except Exception as e:
+            return _failure(e, timeout)
+
+    def _get_with_retries(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        timeout: float,
+    ) -> httpx.Response:
+        attempt = 0
+        while True:
+            response = self._client.get(path, params=params, headers=headers, timeout=timeout)
+            if response.status_code not in _RETRY_STATUSES or attempt >= self.retries:
+                return response
+            attempt += 1
+            time.sleep(0.2 * 2 ** (attempt - 1))
+
+    # ── cache ────────────────────────────────────────────────────
+
+    @staticmethod
+    def _cache_key(path: str, params: Optional[Dict[str, Any]]) -> str:
+        if not params:
+            return path
+        return f"{path}?{urlencode(sorted((k, str(v)) for k, v in params.items()))}"
+
+    def invalidate(self, prefix: Optional[str] = None) -> None:
+        """Mark cached reads under prefix (all by default) stale; validators are kept."""
+        with self._lock:
+            for key, cached in self._reads.items():
+                if prefix is None or key.startswith(prefix):
+                    cached.fetched_at = float("-inf")
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._reads.clear()
+
+    # ── background calls ─────────────────────────────────────────
+
+    def submit(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """Start a JSON request in the background; returns a call id for poll()."""
+        method = method.upper()
+        timeout = self.timeout_for(path) if timeout is None else timeout
+        if method == "GET":
+            future = self._executor.submit(self.get_json, path, params, timeout)
+        elif method == "POST":
+            future = self._executor.submit(self.post_json, path, payload or {}, timeout, headers)
+        else:
+            raise ValueError(f"Unsupported background method: {method}")
+
+        call = BackgroundCall(
+            call_id=uuid.uuid4().hex,
+            method=method,
+            path=path,
+            timeout=timeout,
+            started_at=time.monotonic(),
+            future=future,
+        )
+        with self._lock:
+            self._calls[call.call_id] = call
+        return call.call_id
+
+    def poll(self, call_id: str) -> Optional[BackgroundCall]:
+        """The background call with this id, or None if unknown or forgotten."""
+        return self._calls.get(call_id)
+
+    def forget(self, call_id: str) -> None:
+        with self._lock:
+            self._calls.pop(call_id, None)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._client.close()
+
+
+def _failure(error: Exception, timeout: float) -> ApiResult:
+    if isinstance(error, httpx.TimeoutException):
+        return False, None, f"Request timeout after {timeout}s"
+    if isinstance(error, httpx.ConnectError):
+        return False, None, f"Cannot connect to backend: {str(error)[:100]}"
+    return False, None, f"HTTP error: {str(error)[:100]}"
+
+
+_clients: Dict[str, BackendClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_backend_client(base_url: Optional[str] = None) -> Optional[BackendClient]:
+    """
+    The shared client for base_url (default: AICMO_BACKEND_URL or BACKEND_URL).
+
+    Returns None if no backend URL is configured.
+    """
+    base_url = base_url or os.getenv("AICMO_BACKEND_URL") or os.getenv("BACKEND_URL")
+    if not base_url:
+        return None
+    base_url = base_url.rstrip("/")
+    with _clients_lock:
+        client = _clients.get(base_url)
+        if client is None:
+            client = _clients[base_url] = BackendClient(base_url)
+        return client
+
+
+def reset_backend_clients() -> None:
+    with _clients_lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
+
+
+__all__ = [
+    "ApiResult",
+    "BackendClient",
+    "BackgroundCall",
+    "get_backend_client",
+    "parse_endpoint_timeouts",
+    "reset_backend_clients",
+]
@@ -9,11 +9,13 @@ Provides:
 """
 
 import os
+import time
 import streamlit as st
-import httpx
 from typing import Optional, Dict, Any
 from contextlib import contextmanager
 
+from aicmo.ui_v2.api_client import get_backend_client
+
 # ===================================================================
 # BUILD MARKER (copied from operator_v2.py for reference)
 # ===================================================================
@@ -57,56 +59,109 @@ def backend_base_url() -> str:
     return base_url
 
 
-def http_get_json(path: str, timeout: int = 5) -> tuple[bool, Optional[Dict[str, Any]], Optional[str]]:
+def http_get_json(
+    path: str,
+    timeout: Optional[float] = None,
+    params: Optional[Dict[str, Any]] = None,
+    use_cache: bool = True,
+) -> tuple[bool, Optional[Dict[str, Any]], Optional[str]]:
     """
     Make HTTP GET request to backend.
-    
+
+    Goes through the shared pooled client (aicmo.ui_v2.api_client): repeat
+    reads are served from its cache or revalidated with the response's ETag.
+    timeout defaults to the endpoint's configured timeout.
+
     Returns:
         (success: bool, data: dict or None, error_msg: str or None)
     """
-    base_url = backend_base_url()
-    if not base_url:
+    client = get_backend_client(backend_base_url())
+    if client is None:
         return False, None, "Backend URL not configured"
-    
-    url = f"{base_url}{path}" if not path.startswith("http") else path
-    try:
-        response = httpx.get(url, timeout=timeout, follow_redirects=True)
-        if response.status_code == 200:
-            return True, response.json(), None
-        else:
-            return False, None, f"Backend returned {response.status_code}: {response.text[:200]}"
-    except httpx.TimeoutException:
-        return False, None, f"Request timeout after {timeout}s"
-    except httpx.ConnectError as e:
-        return False, None, f"Cannot connect to backend: {str(e)[:100]}"
-    except Exception as e:
-        return False, None, f"HTTP error: {str(e)[:100]}"
+    return client.get_json(path, params=params, timeout=timeout, use_cache=use_cache)
 
 
-def http_post_json(path: str, payload: Dict[str, Any], timeout: int = 5) -> tuple[bool, Optional[Dict[str, Any]], Optional[str]]:
+def http_post_json(
+    path: str,
+    payload: Dict[str, Any],
+    timeout: Optional[float] = None,
+) -> tuple[bool, Optional[Dict[str, Any]], Optional[str]]:
     """
     Make HTTP POST request to backend.
-    
+
+    Goes through the shared pooled client; timeout defaults to the endpoint's
+    configured timeout.
+
     Returns:
         (success: bool, data: dict or None, error_msg: str or None)
     """
-    base_url = backend_base_url()
-    if not base_url:
+    client = get_backend_client(backend_base_url())
+    if client is None:
         return False, None, "Backend URL not configured"
-    
-    url = f"{base_url}{path}" if not path.startswith("http") else path
-    try:
-        response = httpx.post(url, json=payload, timeout=timeout, follow_redirects=True)
-        if response.status_code in [200, 201]:
-            return True, response.json(), None
-        else:
-            return False, None, f"Backend returned {response.status_code}: {response.text[:200]}"
-    except httpx.TimeoutException:
-        return False, None, f"Request timeout after {timeout}s"
-    except httpx.ConnectError as e:
-        return False, None, f"Cannot connect to backend: {str(e)[:100]}"
-    except Exception as e:
-        return False, None, f"HTTP error: {str(e)[:100]}"
+    return client.post_json(path, payload, timeout=timeout)
+
+
+def _background_state_key(key: str) -> str:
+    return f"_bg_call_{key}"
+
+
+def has_background_call(key: str, base_url: Optional[str] = None) -> bool:
+    """True while a call started by http_post_json_in_background(key, ...) has not been collected."""
+    state_key = _background_state_key(key)
+    if state_key not in st.session_state:
+        return False
+    client = get_backend_client(base_url or backend_base_url())
+    return client is not None and client.poll(st.session_state[state_key]) is not None
+
+
+def http_post_json_in_background(
+    key: str,
+    path: str,
+    payload: Dict[str, Any],
+    timeout: Optional[float] = None,
+    label: str = "Waiting for backend...",
+    poll_interval: float = 0.5,
+    headers: Optional[Dict[str, str]] = None,
+    base_url: Optional[str] = None,
+) -> Optional[tuple[bool, Optional[Dict[str, Any]], Optional[str]]]:
+    """
+    Make a long HTTP POST request without blocking the page.
+
+    The first call starts the request in the shared client's background pool
+    and remembers it in session state under key; while it runs, each call
+    shows a progress bar and schedules a rerun. Returns None while running and
+    the (success, data, error_msg) tuple once it has finished.
+
+    A button is only True on the run it was clicked in, so the reruns must
+    keep calling this while has_background_call(key) is True:
+
+    Usage:
+        if st.button("Generate") or has_background_call("gen_call"):
+            result = http_post_json_in_background("gen_call", "/aicmo/generate", payload)
+            if result is not None:
+                success, data, error = result
+    """
+    client = get_backend_client(base_url or backend_base_url())
+    if client is None:
+        return False, None, "Backend URL not configured"
+
+    state_key = _background_state_key(key)
+    call = client.poll(st.session_state[state_key]) if state_key in st.session_state else None
+    if call is None:
+        st.session_state[state_key] = client.submit(
+            "POST", path, payload=payload, timeout=timeout, headers=headers
+        )
+        call = client.poll(st.session_state[state_key])
+
+    if call.done:
+        del st.session_state[state_key]
+        client.forget(call.call_id)
+        return call.result()
+
+    st.progress(call.progress, text=f"{label} ({call.elapsed:.0f}s)")
+    time.sleep(poll_interval)
+    st.rerun()
+    return None
 
 
 # ===================================================================
@@ -5,6 +5,7 @@ import json
 import logging
 import os
 from typing import Optional
+from aicmo.shared.tracing import traced
 
 try:
     from openai import OpenAI  # type: ignore
@@ -113,6 +114,7 @@ def _augment_with_phase_l(prompt: str, brief_text: str) -> str:
 # =====================================================================
 
 
+@traced("stage.agency_grade_enhancements")
 def apply_agency_grade_enhancements(brief, report) -> None:
     """
     AICMO TURBO:
@@ -0,0 +1,52 @@
+"""
+Create aol_jobs table for the asynchronous job API.
+
+Long-running work (report generation, PDF/PPTX export, project packaging)
+is accepted by POST /jobs and executed on a bounded worker pool. Job state
+and results are persisted here so a reconnecting client can fetch them.
+
+Evidence: aicmo/orchestration/models.py (AOLJob)
+
+Revision ID: 002_create_aol_jobs
+Revises: 001_create_aol_schema
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '002_create_aol_jobs'
+down_revision = '001_create_aol_schema'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create aol_jobs table."""
+    op.create_table(
+        'aol_jobs',
+        sa.Column('id', sa.String(36), nullable=False),
+        sa.Column('tenant_id', sa.String(255), nullable=False, server_default='default'),
+        sa.Column('kind', sa.String(100), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False),
+        sa.Column('progress', sa.Float(), nullable=False, server_default=sa.literal(0.0)),
+        sa.Column('progress_message', sa.Text(), nullable=True),
+        sa.Column('payload_json', sa.Text(), nullable=True),
+        sa.Column('result_json', sa.Text(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at_utc', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('started_at_utc', sa.DateTime(), nullable=True),
+        sa.Column('finished_at_utc', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('idx_aol_jobs_status', 'aol_jobs', ['status'])
+    op.create_index('idx_aol_jobs_tenant_status', 'aol_jobs', ['tenant_id', 'status'])
+
+
+def downgrade() -> None:
+    """Drop aol_jobs table."""
+    op.drop_index('idx_aol_jobs_tenant_status', table_name='aol_jobs')
+    op.drop_index('idx_aol_jobs_status', table_name='aol_jobs')
+    op.drop_table('aol_jobs')
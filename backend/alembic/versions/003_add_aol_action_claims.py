@@ -0,0 +1,38 @@
+"""
+Add claim columns to aol_actions for concurrent AOL daemons.
+
+Daemons now claim actions atomically (status -> RUNNING) instead of reading
+READY rows and executing them in place. claimed_by records the owner and
+claim_expires_utc is the visibility timeout after which a crashed worker's
+claim becomes re-claimable.
+
+Evidence: aicmo/orchestration/models.py (AOLAction), aicmo/orchestration/queue.py (claim_next)
+
+Revision ID: 003_add_aol_action_claims
+Revises: 002_create_aol_jobs
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '003_add_aol_action_claims'
+down_revision = '002_create_aol_jobs'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add claimed_by / claim_expires_utc to aol_actions."""
+    op.add_column('aol_actions', sa.Column('claimed_by', sa.String(255), nullable=True))
+    op.add_column('aol_actions', sa.Column('claim_expires_utc', sa.DateTime(), nullable=True))
+    op.create_index('idx_aol_actions_status_not_before', 'aol_actions', ['status', 'not_before_utc'])
+
+
+def downgrade() -> None:
+    """Drop claim columns."""
+    op.drop_index('idx_aol_actions_status_not_before', table_name='aol_actions')
+    op.drop_column('aol_actions', 'claim_expires_utc')
+    op.drop_column('aol_actions', 'claimed_by')
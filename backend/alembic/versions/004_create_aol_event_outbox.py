@@ -0,0 +1,44 @@
+"""
+Create aol_event_outbox table for the durable orchestration event bus.
+
+BoundedEventBus writes each event here before queueing it to subscribers and
+stamps dispatched_at_utc once all subscribers have handled it, so events
+published before a crash are re-delivered on restart.
+
+Evidence: aicmo/orchestration/models.py (AOLEventOutbox), aicmo/orchestration/internal/event_bus.py (SqlEventOutbox)
+
+Revision ID: 004_create_aol_event_outbox
+Revises: 003_add_aol_action_claims
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '004_create_aol_event_outbox'
+down_revision = '003_add_aol_action_claims'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create aol_event_outbox table."""
+    op.create_table(
+        'aol_event_outbox',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('event_id', sa.String(255), nullable=False),
+        sa.Column('event_type', sa.String(255), nullable=False),
+        sa.Column('payload_json', sa.Text(), nullable=False),
+        sa.Column('created_at_utc', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('dispatched_at_utc', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('idx_aol_event_outbox_dispatched', 'aol_event_outbox', ['dispatched_at_utc'])
+
+
+def downgrade() -> None:
+    """Drop aol_event_outbox table."""
+    op.drop_index('idx_aol_event_outbox_dispatched', table_name='aol_event_outbox')
+    op.drop_table('aol_event_outbox')
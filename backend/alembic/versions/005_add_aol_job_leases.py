@@ -0,0 +1,36 @@
+"""
+Add claim/lease columns to aol_jobs for multiple job runner processes.
+
+Runners now claim a job with a conditional UPDATE (QUEUED -> RUNNING, or an
+expired RUNNING lease) and renew lease_expires_utc from a heartbeat while it
+runs, so a job is executed by one process at a time and only jobs of dead
+runners are recovered.
+
+Evidence: aicmo/orchestration/models.py (AOLJob), aicmo/orchestration/jobs.py (JobStore.claim)
+
+Revision ID: 005_add_aol_job_leases
+Revises: 004_create_aol_event_outbox
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '005_add_aol_job_leases'
+down_revision = '004_create_aol_event_outbox'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add claimed_by / lease_expires_utc to aol_jobs."""
+    op.add_column('aol_jobs', sa.Column('claimed_by', sa.String(255), nullable=True))
+    op.add_column('aol_jobs', sa.Column('lease_expires_utc', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop claim columns."""
+    op.drop_column('aol_jobs', 'lease_expires_utc')
+    op.drop_column('aol_jobs', 'claimed_by')
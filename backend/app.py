@@ -18,6 +18,7 @@ from fastapi.responses import JSONResponse
 from prometheus_client import make_asgi_app
 from backend.core.config import settings
 from backend.db import ping_db
+from backend.db.query_stats import QueryStatsMiddleware
 from backend.routers.health import router as health_router
 from backend.routers.test import router as test_router
 
@@ -39,6 +40,7 @@ from backend.modules.taste.router import router as taste_router
 from backend.api.routes_learn import router as learn_router
 from backend.routers.cam import router as cam_router
 from backend.routers.aicmo import router as aicmo_router
+from backend.routers.jobs import router as jobs_router
 
 log = logging.getLogger("uvicorn.error")
 
@@ -64,6 +66,9 @@ async def lifespan(app: FastAPI):
 
 app = FastAPI(title=settings.APP_NAME, lifespan=lifespan)
 
+# Per-request query count/timing with N+1 warnings logged against the route
+app.add_middleware(QueryStatsMiddleware)
+
 # Include routers
 app.include_router(health_router, tags=["health"])
 app.include_router(test_router, tags=["test"])
@@ -95,6 +100,7 @@ app.include_router(taste_router)
 app.include_router(learn_router, tags=["learning"])
 app.include_router(cam_router)  # CAM router already has /api/cam prefix
 app.include_router(aicmo_router, tags=["aicmo"])  # AICMO router (provides /aicmo/generate)
+app.include_router(jobs_router)  # Async job API (/jobs) for long-running generation/export
 
 # Metrics endpoint
 metrics_app = make_asgi_app()
@@ -0,0 +1,63 @@
+"""Per-request database query counting for the FastAPI apps.
+
+QueryStatsMiddleware runs each HTTP request inside
+aicmo.shared.db.track_queries(), labelled with the matched route template
+(e.g. "GET /jobs/{job_id}"), so possible N+1 patterns are logged against the
+route. The totals are also returned to the client as X-DB-Query-Count and a
+Server-Timing "db" entry, and recorded in the aicmo_http_request_seconds,
+aicmo_request_db_seconds and aicmo_request_db_queries histograms
+(aicmo.shared.metrics). Unmatched paths are recorded as route "unmatched"
+so scanners cannot blow up label cardinality.
+"""
+
+from __future__ import annotations
+
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from aicmo.shared import metrics
+from aicmo.shared.db import track_queries
+
+
+class QueryStatsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope.get("method", "GET")
+        started = time.perf_counter()
+        route_path = "unmatched"
+        status = "500"
+        with track_queries(f"{method} {scope.get('path', '')}") as stats:
+
+            async def send_with_stats(message: Message) -> None:
+                nonlocal route_path, status
+                if message["type"] == "http.response.start":
+                    status = str(message.get("status", 200))
+                    # Routing has happened by now; label by template, not raw path
+                    route = scope.get("route")
+                    if route is not None and getattr(route, "path", None):
+                        route_path = route.path
+                        stats.label = f"{method} {route.path}"
+                    headers = MutableHeaders(scope=message)
+                    headers.append("X-DB-Query-Count", str(stats.count))
+                    headers.append(
+                        "Server-Timing",
+                        f'db;dur={stats.total_seconds * 1000:.1f};desc="{stats.count} queries"',
+                    )
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_stats)
+            finally:
+                metrics.HTTP_REQUEST_SECONDS.labels(method, route_path, status).observe(
+                    time.perf_counter() - started
+                )
+                metrics.REQUEST_DB_SECONDS.labels(route_path).observe(stats.total_seconds)
+                metrics.REQUEST_DB_QUERIES.labels(route_path).observe(stats.count)
@@ -3,12 +3,13 @@ from __future__ import annotations
 import os
 from typing import Generator, Optional
 
-from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 import sqlalchemy as sa
 from contextlib import contextmanager
 
+from aicmo.shared.db import get_engine as get_shared_engine
+
 
 # Small compatibility Session subclass: accept raw SQL strings in .execute()
 class SafeSession(Session):
@@ -36,9 +37,8 @@ def get_engine() -> Engine:
     if _ENGINE is not None:
         return _ENGINE
 
-    db_url = _resolve_db_url()
-    connect_args = {"check_same_thread": False} if db_url.startswith("sqlite") else {}
-    _ENGINE = create_engine(db_url, connect_args=connect_args, future=True)
+    # Pooling, SQLite pragmas and query instrumentation come from the shared registry
+    _ENGINE = get_shared_engine(_resolve_db_url())
     _SESSION_MAKER = None
     return _ENGINE
 
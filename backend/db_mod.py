@@ -106,10 +106,9 @@ SessionLocal = None
 
 if create_engine is not None and DATABASE_URL:
     try:
-        if DATABASE_URL.startswith("sqlite"):
-            ENGINE = create_engine(DATABASE_URL, future=True)
-        else:
-            ENGINE = create_engine(DATABASE_URL, pool_pre_ping=True, future=True)
+        from aicmo.shared.db import get_engine as _get_shared_engine
+
+        ENGINE = _get_shared_engine(DATABASE_URL)
         SessionLocal = sessionmaker(bind=ENGINE, autocommit=False, autoflush=False, future=True)
     except Exception:
         ENGINE = None
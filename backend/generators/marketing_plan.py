@@ -9,8 +9,10 @@ from aicmo.io.client_reports import (
 )
 from backend.dependencies import get_llm
 from backend.services.learning import augment_with_memory_for_brief
+from aicmo.shared.tracing import traced
 
 
+@traced("stage.marketing_plan")
 async def generate_marketing_plan(brief: ClientInputBrief) -> MarketingPlanView:
     """
     Generate a highly structured marketing plan using LLM.
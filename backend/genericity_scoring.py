@@ -82,10 +82,14 @@ marketing language. It doesn't rewrite anything; it just tells you when to
 ask the LLM for a less-generic rewrite.
 """
 
-from collections import Counter
 from functools import lru_cache
 from typing import Iterable, Pattern
 
+from backend.utils.ngram_index import NGramIndex
+
+# repetition_score tokens: runs of [a-z0-9] in the normalised text
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
 
 # Very small, curated list of phrases that often indicate generic / templated copy.
 GENERIC_PHRASES: tuple[str, ...] = (
@@ -144,14 +148,9 @@ def repetition_score(text: str, min_token_length: int = 3) -> float:
     Returns a score between 0 and 1 where higher means 'more repetitive'.
     """
     normalised = _normalise(text)
-    tokens = [t for t in re.split(r"[^a-z0-9]+", normalised) if len(t) >= min_token_length]
-    if not tokens:
-        return 0.0
-    counts = Counter(tokens)
-    total = sum(counts.values())
+    index = NGramIndex(normalised, token_pattern=_TOKEN_PATTERN, lowercase=False)
     # Proportion of tokens that belong to words used more than twice
-    repeated = sum(c for c in counts.values() if c > 2)
-    return repeated / total
+    return index.repeated_fraction(min_count=3, min_token_length=min_token_length)
 
 
 def genericity_score(text: str) -> float:
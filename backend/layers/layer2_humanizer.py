@@ -23,6 +23,7 @@ import os
 from typing import Optional, Callable
 
 from backend.layers.utils_context import apply_all_cleanup_passes
+from aicmo.shared.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,7 @@ logger = logging.getLogger(__name__)
 ENABLE_HUMANIZER = os.environ.get("AICMO_ENABLE_HUMANIZER", "true").lower() == "true"
 
 
+@traced("layer2.humanizer", attrs=("section_id",))
 def enhance_section_humanizer(
     section_id: str,
     raw_text: str,
@@ -25,6 +25,7 @@ Logging:
 import logging
 import re
 from typing import Tuple, List, Optional
+from aicmo.shared.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -183,6 +184,7 @@ def _check_length_bounds(text: str, section_id: str) -> Tuple[bool, List[str]]:
     return len(warnings) == 0, warnings
 
 
+@traced("layer3.soft_validators", attrs=("pack_key", "section_id"))
 def run_soft_validators(
     pack_key: str,
     section_id: str,
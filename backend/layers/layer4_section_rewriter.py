@@ -22,6 +22,7 @@ import logging
 from typing import Optional, List, Callable
 
 from backend.layers.utils_context import apply_all_cleanup_passes
+from aicmo.shared.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +30,7 @@ logger = logging.getLogger(__name__)
 REWRITE_THRESHOLD = 60
 
 
+@traced("layer4.section_rewriter", attrs=("pack_key", "section_id"))
 def rewrite_low_quality_section(
     pack_key: str,
     section_id: str,
@@ -23,6 +23,7 @@ import json
 import re
 
 from backend.learning_store import add_learning_example, LearningExample
+from aicmo.shared.tracing import traced
 
 if TYPE_CHECKING:
     from backend.schemas import ClientIntakeForm
@@ -110,6 +111,7 @@ def should_learn_block(text: str, min_length: int = 300) -> bool:
     return True
 
 
+@traced("learning.record_from_output")
 def record_learning_from_output(
     brief: "ClientIntakeForm",  # From backend.schemas
     output: Dict[str, Any],
@@ -49,7 +49,7 @@ warnings.filterwarnings("ignore", category=DeprecationWarning)
 
 # noqa: E402 - imports after load_dotenv are intentional (FastAPI pattern)
 from fastapi import FastAPI, UploadFile, File, HTTPException, Form  # noqa: E402
-from fastapi.responses import PlainTextResponse, JSONResponse, StreamingResponse  # noqa: E402
+from fastapi.responses import PlainTextResponse, JSONResponse, StreamingResponse, Response  # noqa: E402
 from pydantic import BaseModel  # noqa: E402
 
 # Phase 5: Learning store + industry presets + LLM enhancement
@@ -78,6 +78,9 @@ from aicmo.generators import (  # noqa: E402
 # Phase L: Vector-based memory learning
 from backend.services.learning import learn_from_report  # noqa: E402
 from aicmo.memory import engine as memory_engine  # noqa: E402
+from aicmo.memory import training as training_ingest  # noqa: E402
+from aicmo.shared import metrics, profiling, tracing  # noqa: E402
+from aicmo.shared.http_cache import ConditionalGetMiddleware  # noqa: E402
 from aicmo.presets.framework_fusion import structure_learning_context  # noqa: E402
 from aicmo.generators.agency_grade_processor import process_report_for_agency_grade  # noqa: E402
 
@@ -142,6 +145,10 @@ from backend.pdf_utils import text_to_pdf_bytes  # noqa: E402
 from backend.routers.health import router as health_router  # noqa: E402
 from backend.api.routes_learn import router as learn_router  # noqa: E402
 from backend.routers.cam import router as cam_router  # noqa: E402
+from backend.routers.jobs import router as jobs_router  # noqa: E402
+from backend.routers.traces import router as traces_router  # noqa: E402
+from backend.routers.profiling import router as profiling_router  # noqa: E402
+from backend.db.query_stats import QueryStatsMiddleware  # noqa: E402
 from aicmo.presets.package_presets import PACKAGE_PRESETS  # noqa: E402
 from backend.generators.social.video_script_generator import (  # noqa: E402
     generate_video_script_for_day,
@@ -404,12 +411,27 @@ class GenerateRequest(BaseModel):
 
 
 app = FastAPI(title="AICMO API")
+app.add_middleware(ConditionalGetMiddleware)  # ETag + 304 for unchanged JSON GETs
+app.add_middleware(QueryStatsMiddleware)  # Per-request query count + N+1 warnings
+app.add_middleware(tracing.TracingMiddleware)  # Root span per request (see GET /traces)
 app.include_router(health_router, tags=["health"])
 app.include_router(learn_router, tags=["learn"])
 app.include_router(cam_router)  # CAM Phases 7-9: Discovery, Pipeline, Safety
+app.include_router(jobs_router)  # Async job API: POST /jobs, GET /jobs/{id}
+app.include_router(traces_router)  # Sampled request traces: GET /traces, GET /traces/{id}
+app.include_router(profiling_router)  # Sampling profiler: /admin/profiling
 
 # Phase 3: Performance threshold for slow request flagging
 SLOW_THRESHOLD_MS = 8000.0  # 8 seconds
+# Profile of every request slower than this (AICMO_PROFILE_SLOW_REQUESTS=true)
+app.add_middleware(profiling.SlowRequestProfiler, threshold_ms=SLOW_THRESHOLD_MS)
+
+
+@app.get("/metrics", include_in_schema=False)
+def prometheus_metrics():
+    """Prometheus text exposition of aicmo.shared.metrics (and any other default-registry metrics)."""
+    body, content_type = metrics.render_latest()
+    return Response(content=body, media_type=content_type)
 
 
 # =====================
@@ -514,16 +536,20 @@ async def health_check_llm():
 # ✨ FIX #3: Pre-load training materials at startup
 @app.on_event("startup")
 async def startup_preload_training():
-    """Load training ZIP structure into memory engine at app startup."""
+    """Sync the training library into memory in the background (incremental)."""
     try:
-        logger.info("🚀 AICMO startup: Pre-loading training materials...")
-        memory_engine.preload_training_materials()
-        logger.info("✅ Training materials loaded successfully")
+        logger.info("🚀 AICMO startup: Syncing training materials in the background...")
+        training_ingest.start_background_sync()
     except Exception as e:
-        logger.error(f"⚠️  Could not pre-load training materials: {e}")
+        logger.error(f"⚠️  Could not start training materials sync: {e}")
         # Don't fail startup if training materials aren't available
 
 
+@app.get("/memory/training/status", summary="Progress of the training-library sync.")
+def training_ingest_status():
+    return training_ingest.get_ingest_status()
+
+
 # =====================
 # INPUT – CLIENT FORM
 # =====================
@@ -6869,6 +6895,7 @@ SECTION_GENERATORS: dict[str, callable] = {
 }
 
 
+@tracing.traced("stage.generate_sections")
 def generate_sections(
     section_ids: list[str],
     req: GenerateRequest,
@@ -6937,7 +6964,9 @@ def generate_sections(
         generator_fn = SECTION_GENERATORS.get(section_id)
         if generator_fn:
             try:
-                results[section_id] = generator_fn(**context)
+                with metrics.SECTION_GENERATION_SECONDS.labels(pack_key or "none", section_id).time(), \
+                        tracing.span("section.generate", pack_key=pack_key, section_id=section_id):
+                    results[section_id] = generator_fn(**context)
             except Exception as e:
                 # Log error internally for debugging, but don't leak to client
                 logger.error(f"Section generator failed for '{section_id}': {e}", exc_info=True)
@@ -7275,6 +7304,7 @@ def _generate_section_content(
     return section_map.get(section_id, f"[{section_id} content to be populated]")
 
 
+@tracing.traced("stage.stub_output")
 def _generate_stub_output(req: GenerateRequest) -> AICMOOutputReport:
     """
     Stub generator (internal).
@@ -7688,6 +7718,7 @@ def _generate_stub_output(req: GenerateRequest) -> AICMOOutputReport:
     return out
 
 
+@tracing.traced("stage.apply_wow")
 def _apply_wow_to_output(
     output: AICMOOutputReport,
     req: GenerateRequest,
@@ -7699,7 +7730,13 @@ def _apply_wow_to_output(
         → Returns output unchanged (pure pass-through)
 
     If wow_enabled=True and wow_package_key is set:
-        → Parses output.wow_markdown into sections
+        → If the output has no WOW markdown, renders the pack template from
+          the brief and the generated extra_sections (render_wow_report) and
+          attaches the markdown and its section map (wow_markdown,
+          wow_sections) for export, then returns; the gate below only judges
+          WOW markdown the generators produced themselves
+        → Uses output.wow_sections (rendered with the markdown), or parses
+          output.wow_markdown into sections and attaches them as wow_sections
         → Validates sections against pack benchmarks
         → If validation FAILS → raises ValueError (FATAL)
         → If validation PASSES → returns output unchanged
@@ -7715,7 +7752,19 @@ def _apply_wow_to_output(
     report_markdown = getattr(output, "wow_markdown", None) or getattr(
         output, "report_markdown", None
     )
-    if not report_markdown or not report_markdown.strip():
+    if not report_markdown and getattr(req, "brief", None) is not None:
+        # Template wrapping: keep the renderer's section map with the markdown
+        # so the PDF export never re-parses it
+        from backend.services.wow_reports import render_wow_report
+
+        rendered = render_wow_report(req, getattr(output, "extra_sections", None) or {})
+        output.wow_markdown = rendered.markdown
+        output.wow_sections = rendered.sections
+        return output
+    rendered_sections = getattr(output, "wow_sections", None)
+    if not isinstance(rendered_sections, list):
+        rendered_sections = None
+    if not rendered_sections and (not report_markdown or not report_markdown.strip()):
         logger.warning(
             "WOW validation skipped: no markdown content in output (wow_markdown or report_markdown empty)"
         )
@@ -7723,10 +7772,15 @@ def _apply_wow_to_output(
         return output
 
     try:
-        # 1. Parse markdown into sections
-        from backend.utils.wow_markdown_parser import parse_wow_markdown_to_sections
+        # 1. Section map from the renderer; parse markdown only when it has none
+        if rendered_sections:
+            sections = rendered_sections
+        else:
+            from backend.utils.wow_markdown_parser import parse_wow_markdown_to_sections
 
-        sections = parse_wow_markdown_to_sections(report_markdown)
+            sections = parse_wow_markdown_to_sections(report_markdown)
+            # Keep the map with the markdown so exports (PDF) reuse it
+            output.wow_sections = sections
 
         if not sections:
             logger.warning(
@@ -7850,6 +7904,7 @@ def _apply_wow_optional(output: AICMOOutputReport, req: GenerateRequest) -> AICM
     return result
 
 
+@tracing.traced("stage.retrieve_learning_context")
 def _retrieve_learning_context(brief_text: str) -> tuple[str, dict]:
     """
     Retrieve relevant learning context from memory database.
@@ -7880,6 +7935,7 @@ def _retrieve_learning_context(brief_text: str) -> tuple[str, dict]:
 
 
 @app.post("/aicmo/generate", response_model=AICMOOutputReport)
+@tracing.traced("aicmo_generate")
 async def aicmo_generate(req: GenerateRequest) -> AICMOOutputReport:
     """
     Public endpoint for AICMO generation.
@@ -8250,6 +8306,7 @@ def validate_client_brief(brief: "ClientInputBrief") -> None:
 
 
 @app.post("/api/aicmo/generate_report")
+@tracing.traced("generate_report")
 async def api_aicmo_generate_report(payload: dict, include_pdf: bool = True) -> dict:
     """
     Streamlit-compatible wrapper endpoint for /aicmo/generate.
@@ -8334,6 +8391,10 @@ async def api_aicmo_generate_report(payload: dict, include_pdf: bool = True) ->
 
         if not resolved_preset_key:
             resolved_preset_key = "unknown"
+        report_span = tracing.current_span()
+        if report_span is not None:
+            report_span.set_attribute("pack_key", resolved_preset_key)
+            report_span.set_attribute("stage", stage)
 
         logger.info(
             f"🔥 [PRESET MAPPING] {package_name or pack_key or wow_package_key} → {resolved_preset_key}"
@@ -8345,6 +8406,7 @@ async def api_aicmo_generate_report(payload: dict, include_pdf: bool = True) ->
             brief=client_brief_dict,
             constraints=constraints,
         )
+        profiling.annotate_request(fingerprint=fingerprint, pack_key=resolved_preset_key)
 
         # Phase 3: Check cache first
         cached = GLOBAL_REPORT_CACHE.get(fingerprint)
@@ -9020,6 +9082,7 @@ async def api_aicmo_generate_report(payload: dict, include_pdf: bool = True) ->
             status_label = "slow"
         else:
             status_label = status_flag
+        metrics.REPORT_GENERATION_SECONDS.labels(status_flag).observe(duration_ms / 1000.0)
 
         log_request(
             fingerprint=fingerprint if "fingerprint" in locals() else "unknown",
@@ -22,6 +22,7 @@ except Exception:
     CSS = None  # type: ignore
     WEASYPRINT_AVAILABLE = False
 
+from aicmo.shared import metrics, tracing
 from backend.agency_report_schema import AgencyReport, agency_report_to_pdf_context
 from backend.exceptions import BlankPdfError, PdfRenderError
 from backend.generators.brand_strategy_generator import strategy_dict_to_markdown
@@ -87,7 +88,8 @@ def render_pdf_from_context(
         if base_url is None:
             base_url = str(templates_dir)
 
-        pdf_bytes = HTML(string=html_str, base_url=base_url).write_pdf()
+        with metrics.time_pdf_render(template_name), tracing.span("pdf.render", template=template_name):
+            pdf_bytes = HTML(string=html_str, base_url=base_url).write_pdf()
 
         if not pdf_bytes:
             raise BlankPdfError("PDF generation returned empty bytes")
@@ -236,9 +238,10 @@ def render_html_template_to_pdf(template_name: str, context: Dict[str, Any]) ->
         if css_path.exists():
             stylesheets.append(CSS(filename=str(css_path)))
 
-        pdf_bytes = HTML(string=html_str, base_url=str(template_dir)).write_pdf(
-            stylesheets=stylesheets if stylesheets else None
-        )
+        with metrics.time_pdf_render(template_name), tracing.span("pdf.render", template=template_name):
+            pdf_bytes = HTML(string=html_str, base_url=str(template_dir)).write_pdf(
+                stylesheets=stylesheets if stylesheets else None
+            )
 
         if not pdf_bytes:
             raise RuntimeError("PDF generation returned empty bytes")
@@ -601,7 +604,14 @@ def build_pdf_context_for_wow_package(
     section_map = PACK_SECTION_MAPS.get(wow_package_key, {})
 
     # Process sections if available
-    sections = report_data.get("sections", [])
+    # Fall back to the section map rendered with the WOW markdown; reports
+    # that carry only the markdown are parsed here, once, on first export
+    sections = report_data.get("sections") or report_data.get("wow_sections") or []
+    if not sections and report_data.get("wow_markdown"):
+        from backend.services.wow_reports import wow_sections_from_markdown
+
+        sections = wow_sections_from_markdown(report_data["wow_markdown"])
+        report_data["wow_sections"] = sections
 
     if sections and section_map:
         # Get header map for this package (for WOW markdown parsing)
@@ -751,9 +761,10 @@ def render_agency_report_pdf(report: AgencyReport, template_name: str) -> bytes:
         stylesheets = []
         if css_path.exists():
             stylesheets.append(CSS(filename=str(css_path)))
-        pdf_bytes = HTML(string=html, base_url=str(template_dir)).write_pdf(
-            stylesheets=stylesheets if stylesheets else None
-        )
+        with metrics.time_pdf_render(template_name), tracing.span("pdf.render", template=template_name):
+            pdf_bytes = HTML(string=html, base_url=str(template_dir)).write_pdf(
+                stylesheets=stylesheets if stylesheets else None
+            )
     except Exception as e:
         logger.error(f"PDF generation failed: {e}")
         raise PdfRenderError(f"PDF generation failed: {e}") from e
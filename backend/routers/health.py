@@ -189,3 +189,28 @@ def health_aol(request: Request):
                 "server_time_utc": datetime.now(timezone.utc).isoformat(),
             }
         )
+
+
+@router.get("/health/event_bus")
+def health_event_bus():
+    """
+    Event Bus Status Endpoint
+
+    Returns one entry per bounded event bus in this process:
+    - subscribers: per-subscriber lag (queued events, oldest age in seconds),
+      delivered, dropped and failed counts
+    - outbox: pending / in-flight rows and replayed count (null without an outbox)
+    """
+    from aicmo.orchestration.internal.event_bus import event_bus_stats
+
+    try:
+        buses = event_bus_stats()
+    except Exception as e:
+        return JSONResponse(
+            status_code=503,
+            content={"status": "error", "detail": f"Cannot read event bus stats: {str(e)[:100]}"},
+        )
+    return {
+        "buses": buses,
+        "server_time_utc": datetime.now(timezone.utc).isoformat(),
+    }
@@ -0,0 +1,170 @@
+"""Asynchronous Job API Router
+
+POST /jobs           -> enqueue long-running work, returns job id immediately (202)
+GET  /jobs/stats     -> queue depth, running counts, latency histograms
+GET  /jobs/{id}      -> status, progress and persisted result
+GET  /jobs/{id}/artifact -> download the file produced by an export job
+
+Jobs run on the bounded pool in aicmo.orchestration.jobs. Tenant comes from
+the X-Tenant-Id header (falls back to "default") and is used for per-tenant
+concurrency limits.
+"""
+
+import asyncio
+import dataclasses
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import FileResponse, JSONResponse
+from pydantic import BaseModel, Field
+
+from aicmo.orchestration.jobs import (
+    JobContext,
+    UnknownJobKind,
+    get_job_runner,
+    register_job_handler,
+)
+from backend.db import get_engine
+
+log = logging.getLogger("aicmo_jobs")
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+ARTIFACT_DIR = Path(os.getenv("AICMO_JOBS_ARTIFACT_DIR", "artifacts/jobs"))
+
+
+class JobSubmitRequest(BaseModel):
+    kind: str
+    payload: Dict[str, Any] = Field(default_factory=dict)
+
+
+# =====================
+# JOB HANDLERS
+# =====================
+
+
+def _drain_response(response: Any) -> tuple[bytes, str]:
+    """Collect the body of a Starlette response returned by an export endpoint."""
+    status_code = getattr(response, "status_code", 200)
+    body_iterator = getattr(response, "body_iterator", None)
+    if body_iterator is not None:
+
+        async def _collect() -> bytes:
+            chunks = []
+            async for chunk in body_iterator:
+                chunks.append(chunk if isinstance(chunk, bytes) else chunk.encode())
+            return b"".join(chunks)
+
+        body = asyncio.run(_collect())
+    else:
+        body = getattr(response, "body", b"")
+
+    if status_code >= 400:
+        try:
+            message = json.loads(body).get("message", "")
+        except Exception:
+            message = body[:200].decode(errors="replace")
+        raise RuntimeError(f"Export failed ({status_code}): {message}")
+
+    return body, getattr(response, "media_type", None) or "application/octet-stream"
+
+
+def _export_job(endpoint_name: str, suffix: str, payload: Dict[str, Any], ctx: JobContext) -> dict:
+    from backend import main as backend_main
+
+    ctx.report_progress(0.1, f"Rendering {suffix.upper()}")
+    body, media_type = _drain_response(getattr(backend_main, endpoint_name)(payload))
+
+    ctx.report_progress(0.9, "Persisting artifact")
+    ARTIFACT_DIR.mkdir(parents=True, exist_ok=True)
+    path = ARTIFACT_DIR / f"{ctx.job_id}.{suffix}"
+    path.write_bytes(body)
+    return {"artifact_path": str(path), "media_type": media_type, "size_bytes": len(body)}
+
+
+@register_job_handler("generate_report")
+def _generate_report_job(payload: Dict[str, Any], ctx: JobContext) -> dict:
+    from backend.main import api_aicmo_generate_report
+
+    include_pdf = bool(payload.pop("include_pdf", True))
+    ctx.report_progress(0.05, "Generating report")
+    return asyncio.run(api_aicmo_generate_report(payload, include_pdf=include_pdf))
+
+
+@register_job_handler("export_pdf")
+def _export_pdf_job(payload: Dict[str, Any], ctx: JobContext) -> dict:
+    return _export_job("aicmo_export_pdf", "pdf", payload, ctx)
+
+
+@register_job_handler("export_pptx")
+def _export_pptx_job(payload: Dict[str, Any], ctx: JobContext) -> dict:
+    return _export_job("aicmo_export_pptx", "pptx", payload, ctx)
+
+
+@register_job_handler("export_zip")
+def _export_zip_job(payload: Dict[str, Any], ctx: JobContext) -> dict:
+    return _export_job("aicmo_export_zip", "zip", payload, ctx)
+
+
+@register_job_handler("project_package")
+def _project_package_job(payload: Dict[str, Any], ctx: JobContext) -> dict:
+    from aicmo.delivery.output_packager import build_project_package
+
+    project_id = payload.get("project_id")
+    if not project_id:
+        raise ValueError("project_package job requires payload.project_id")
+    ctx.report_progress(0.1, f"Packaging project {project_id}")
+    return dataclasses.asdict(build_project_package(str(project_id)))
+
+
+# =====================
+# ROUTES
+# =====================
+
+
+@router.post("", status_code=202)
+def submit_job(
+    request: JobSubmitRequest,
+    x_tenant_id: Optional[str] = Header(default=None),
+):
+    runner = get_job_runner(get_engine)
+    try:
+        job_id = runner.submit(request.kind, request.payload, tenant_id=x_tenant_id or "default")
+    except UnknownJobKind as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"job_id": job_id, "status": "QUEUED", "status_url": f"/jobs/{job_id}"}
+
+
+@router.get("/stats")
+def job_stats():
+    return get_job_runner(get_engine).stats()
+
+
+@router.get("/{job_id}")
+def get_job(job_id: str):
+    job = get_job_runner(get_engine).get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.get("/{job_id}/artifact")
+def get_job_artifact(job_id: str):
+    job = get_job_runner(get_engine).get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job["status"] != "SUCCEEDED":
+        return JSONResponse(status_code=409, content={"status": job["status"], "detail": "Job not finished"})
+
+    result = job.get("result") or {}
+    path = result.get("artifact_path")
+    if not path or not Path(path).exists():
+        raise HTTPException(status_code=404, detail="Job has no artifact")
+    return FileResponse(
+        path,
+        media_type=result.get("media_type") or "application/octet-stream",
+        filename=f"aicmo_{job['kind']}_{job_id[:8]}{Path(path).suffix}",
+    )
@@ -0,0 +1,65 @@
+"""Sampling Profiler Router (admin)
+
+POST /admin/profiling/sample      -> sample this API process for N seconds, save the profile
+GET  /admin/profiling/profiles    -> saved profiles (on-demand, slow requests, SIGUSR2 workers)
+GET  /admin/profiling/profiles/{id}?format=speedscope|pstats|collapsed -> download
+
+Guarded by ADMIN_TOKEN (x-admin-token header) when it is set. Profiles come
+from aicmo.shared.profiling and live in AICMO_PROFILE_DIR, so profiles
+written by a CAM worker on the same host are listed here too.
+"""
+
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response
+
+from aicmo.shared import profiling
+from aicmo.shared.config import settings
+from backend.security import require_admin
+
+router = APIRouter(prefix="/admin/profiling", tags=["profiling"], dependencies=[Depends(require_admin)])
+
+
+@router.post("/sample")
+async def sample_process(
+    seconds: float = Query(default=10.0, gt=0),
+    mode: str = Query(default="wall", pattern="^(wall|cpu)$"),
+):
+    if seconds > settings.PROFILE_MAX_SECONDS:
+        raise HTTPException(
+            status_code=400, detail=f"seconds must be at most {settings.PROFILE_MAX_SECONDS}"
+        )
+    profile = profiling.start_capture("api", mode)
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        profiling.stop_capture(profile)
+    profile_id = profiling.save_profile(profile)
+    return {
+        "id": profile_id,
+        "samples": profile.samples,
+        "duration": round(profile.duration, 3),
+        "download_url": f"{router.prefix}/profiles/{profile_id}",
+    }
+
+
+@router.get("/profiles")
+def list_profiles():
+    return {"profiles": profiling.list_profiles()}
+
+
+@router.get("/profiles/{profile_id}")
+def download_profile(
+    profile_id: str,
+    format: str = Query(default="speedscope", pattern="^(speedscope|pstats|collapsed)$"),
+):
+    profile = profiling.load_profile(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    body, media_type, extension = profile.export(format)
+    return Response(
+        content=body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{profile_id}.{extension}"'},
+    )
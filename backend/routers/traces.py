@@ -0,0 +1,37 @@
+"""Request Trace Router
+
+GET /traces          -> summaries of recently kept traces, newest first
+GET /traces/{id}     -> one trace: OTLP/JSON spans plus flame-graph rows
+
+Traces are recorded by aicmo.shared.tracing (root span per request and per
+background job) and tail-sampled when they end: slow and failed traces are
+always kept with every span, others at AICMO_TRACE_SAMPLE_RATE.
+source=memory lists this process's recent traces; source=file reads the
+OTLP file exporter output shared by all workers.
+"""
+
+from fastapi import APIRouter, HTTPException, Query
+
+from aicmo.shared import tracing
+
+router = APIRouter(prefix="/traces", tags=["traces"])
+
+
+@router.get("")
+def list_traces(
+    limit: int = Query(default=20, ge=1, le=500),
+    source: str = Query(default="memory", pattern="^(memory|file)$"),
+):
+    if source == "file":
+        summaries = [tracing.summarize(t) for t in reversed(tracing.load_traces()[-limit:])]
+    else:
+        summaries = tracing.recent_traces(limit)
+    return {"traces": summaries}
+
+
+@router.get("/{trace_id}")
+def get_trace(trace_id: str):
+    otlp = tracing.get_trace(trace_id)
+    if otlp is None:
+        raise HTTPException(status_code=404, detail="Trace not found")
+    return {"summary": tracing.summarize(otlp), "flame": tracing.flame(otlp), "otlp": otlp}
@@ -10,6 +10,7 @@ from aicmo.memory.engine import (
     learn_from_blocks,
     augment_prompt_with_memory,
 )
+from aicmo.shared.tracing import traced
 
 logger = logging.getLogger("aicmo.learning")
 
@@ -65,6 +66,7 @@ def _brief_to_text(brief: ClientInputBrief) -> str:
     return "\n".join(parts)
 
 
+@traced("learning.learn_from_report")
 def learn_from_report(
     report: AICMOOutputReport,
     project_id: Optional[str] = None,
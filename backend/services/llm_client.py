@@ -3,9 +3,13 @@
 import asyncio
 import logging
 import os
+import time
 from fastapi import HTTPException
 from openai import OpenAI, AuthenticationError, APIStatusError, APIConnectionError, RateLimitError
 
+from aicmo.llm.cache import get_response_cache, make_cache_key, should_cache
+from aicmo.shared import metrics, tracing
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +28,7 @@ class LLMClient:
       - timeout protection
       - unified call interface
       - structured error tracking
+      - shared response cache (aicmo.llm.cache)
     """
 
     def __init__(self, api_key: str, model: str = "gpt-4o-mini"):
@@ -33,7 +38,14 @@ class LLMClient:
         self.openai_key = api_key
         self.perplexity_key = os.getenv("PERPLEXITY_API_KEY", "").strip()
 
-    async def generate(self, prompt: str, temperature: float = 0.7, max_tokens: int = 2000) -> str:
+    @tracing.traced("llm.generate")
+    async def generate(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        cache: bool | None = None,
+    ) -> str:
         """
         Generate text from prompt with fallback chain: OpenAI → Perplexity → error.
 
@@ -41,6 +53,8 @@ class LLMClient:
             prompt: Input prompt for LLM
             temperature: Sampling temperature (0.0-1.0)
             max_tokens: Maximum output tokens
+            cache: Force (True) or skip (False) the response cache; None applies
+                the AICMO_LLM_CACHE_MODE policy (temperature 0 is cached by default)
 
         Returns:
             Generated text
@@ -53,23 +67,48 @@ class LLMClient:
         perplexity_status = "not_attempted"
         last_error = None
 
+        # Cached answer from either provider (keyed by provider + model)
+        response_cache = get_response_cache() if should_cache(temperature=temperature, cache=cache) else None
+        models = {"openai": self.model, "perplexity": "sonar"}
+        cache_keys = {
+            provider: make_cache_key(provider, model, prompt, temperature, max_tokens)
+            for provider, model in models.items()
+        }
+        if response_cache is not None:
+            cached = response_cache.get(*cache_keys.values())
+            if cached is not None:
+                return cached[1]
+
+        def remember(provider: str, result: str) -> str:
+            if response_cache is not None and result:
+                response_cache.put(cache_keys[provider], result, provider=provider, model=models[provider])
+            return result
+
         # Try OpenAI first
         if self.openai_key:
+            started = time.perf_counter()
             try:
-                result = await self._generate_with_openai(prompt, temperature, max_tokens)
-                return result
+                with tracing.span("llm.call", provider="openai", model=self.model):
+                    result = await self._generate_with_openai(prompt, temperature, max_tokens)
+                metrics.record_provider_call("llm", "openai", True, time.perf_counter() - started)
+                return remember("openai", result)
             except Exception as e:
+                metrics.record_provider_call("llm", "openai", False)
                 openai_status = f"failed: {type(e).__name__}"
                 last_error = e
                 logger.warning(f"OpenAI generation failed: {e}, attempting Perplexity fallback")
 
         # Fallback to Perplexity
         if self.perplexity_key:
+            started = time.perf_counter()
             try:
-                result = await self._generate_with_perplexity(prompt, temperature, max_tokens)
+                with tracing.span("llm.call", provider="perplexity", model="sonar"):
+                    result = await self._generate_with_perplexity(prompt, temperature, max_tokens)
+                metrics.record_provider_call("llm", "perplexity", True, time.perf_counter() - started)
                 logger.info("✅ Perplexity fallback successful after OpenAI failure")
-                return result
+                return remember("perplexity", result)
             except Exception as e:
+                metrics.record_provider_call("llm", "perplexity", False)
                 perplexity_status = f"failed: {type(e).__name__}"
                 last_error = e
                 logger.error(f"Perplexity generation failed: {e}")
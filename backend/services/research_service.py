@@ -24,6 +24,7 @@ from backend.external.perplexity_client import PerplexityClient
 from backend.research_models import BrandResearchResult, Competitor
 from backend.core.config import settings
 from aicmo.io.client_reports import ClientInputBrief
+from aicmo.shared.tracing import traced
 
 log = logging.getLogger("research_service")
 
@@ -133,6 +134,7 @@ class ResearchService:
         """Check if research service is enabled and configured."""
         return self.enabled and self.client.is_configured()
 
+    @traced("research.fetch_comprehensive")
     def fetch_comprehensive_research(
         self,
         brief: ClientInputBrief,
@@ -6,21 +6,129 @@ Provides safe, defensive placeholder replacement and rule access.
 
 Key functions:
 - build_default_placeholders: Create a generic placeholder map from brief + blocks
+- render_wow_template: Render a precompiled template to markdown + section map
+- wow_sections_from_markdown: Section map of markdown stored without one
 - apply_wow_template: Replace {{placeholders}} with values, strip unfilled ones
 - get_wow_rules_for_package: Wrapper around get_wow_rules() for locality
+
+Templates are compiled once per package key into literal / placeholder
+segments, grouped by their "## " sections, and rendered in a single pass.
+The section map (id, title, body, content) is what validation and PDF
+building consume, so rendered markdown never has to be parsed back.
 """
 
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, Mapping, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 
 from aicmo.presets.wow_templates import get_wow_template
 from aicmo.presets.wow_rules import get_wow_rules
+from backend.utils.wow_markdown_parser import title_to_section_id
 
 # Matches {{placeholder_name}} patterns
 _PLACEHOLDER_PATTERN = re.compile(r"{{\s*([a-zA-Z0-9_]+)\s*}}")
 
+# Level-2 section headers, line by line (same rule as parse_wow_markdown_to_sections)
+_SECTION_HEADER_PATTERN = re.compile(r"^##[^\S\n]+(.+)$", re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class _Slot:
+    """Placeholder segment: the name and the raw {{...}} text it replaces."""
+
+    name: str
+    raw: str
+
+
+_Segment = Union[str, _Slot]
+
+
+@dataclass(frozen=True)
+class _CompiledSection:
+    id: str
+    title: str
+    header: Tuple[_Segment, ...]  # the "## Title" line and its newline
+    body: Tuple[_Segment, ...]
+
+
+@dataclass(frozen=True)
+class CompiledWowTemplate:
+    """A WOW template split into a preamble and its "## " sections."""
+
+    preamble: Tuple[_Segment, ...]
+    sections: Tuple[_CompiledSection, ...]
+
+    @property
+    def placeholders(self) -> List[str]:
+        """Placeholder names in template order (unique)."""
+        segments = list(self.preamble)
+        for section in self.sections:
+            segments += [*section.header, *section.body]
+        return list(dict.fromkeys(s.name for s in segments if isinstance(s, _Slot)))
+
+
+@dataclass
+class RenderedWowReport:
+    """
+    Output of render_wow_template.
+
+    sections: one dict per "## " section, in order, with
+    - id: normalized section id (as used by WOW rules and benchmarks)
+    - title: header text
+    - body: rendered markdown below the header
+    - content: header + body (the shape validate_report_sections expects)
+    """
+
+    package_key: str
+    markdown: str
+    sections: List[Dict[str, str]]
+
+
+def _segments(text: str) -> Tuple[_Segment, ...]:
+    segments: List[_Segment] = []
+    position = 0
+    for match in _PLACEHOLDER_PATTERN.finditer(text):
+        if match.start() > position:
+            segments.append(text[position:match.start()])
+        segments.append(_Slot(match.group(1), match.group(0)))
+        position = match.end()
+    if position < len(text):
+        segments.append(text[position:])
+    return tuple(segments)
+
+
+def compile_wow_template(template: str) -> CompiledWowTemplate:
+    """Split a template into literal / placeholder segments per section."""
+    headers = list(_SECTION_HEADER_PATTERN.finditer(template))
+    if not headers:
+        return CompiledWowTemplate(preamble=_segments(template), sections=())
+
+    sections = []
+    for i, match in enumerate(headers):
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(template)
+        header_end = min(match.end() + 1, end)  # include the header's newline
+        title = match.group(1).strip()
+        sections.append(
+            _CompiledSection(
+                id=title_to_section_id(title),
+                title=title,
+                header=_segments(template[match.start():header_end]),
+                body=_segments(template[header_end:end]),
+            )
+        )
+    return CompiledWowTemplate(
+        preamble=_segments(template[:headers[0].start()]), sections=tuple(sections)
+    )
+
+
+@lru_cache(maxsize=None)
+def get_compiled_wow_template(package_key: str) -> CompiledWowTemplate:
+    """Compiled template for a package key (compiled on first use)."""
+    return compile_wow_template(get_wow_template(package_key))
+
 
 def build_default_placeholders(
     brief: Optional[Mapping[str, Any]] = None,
@@ -221,6 +329,110 @@ def build_default_placeholders(
     return placeholders
 
 
+def _resolve_package_key(package_key: str, placeholder_values: Mapping[str, Any]) -> str:
+    """Fall back to fallback_basic when the brief is critically incomplete."""
+    # Count non-empty required fields (brand_name is the most critical)
+    required_fields = ["brand_name", "category", "target_audience"]
+    provided_fields = sum(
+        1
+        for field in required_fields
+        if placeholder_values.get(field) and str(placeholder_values.get(field)).strip()
+    )
+
+    # Only use fallback if brand_name is missing (most critical) AND no category/audience
+    # This allows partial briefs to still generate their requested WOW pack instead of falling back
+    if not placeholder_values.get("brand_name", "").strip() and provided_fields < 1:
+        return "fallback_basic"
+    return package_key
+
+
+def render_wow_template(
+    package_key: str,
+    placeholder_values: Mapping[str, Any],
+    strip_unfilled: bool = True,
+) -> RenderedWowReport:
+    """
+    Render a WOW template in one pass over its compiled segments.
+
+    Same placeholder semantics as apply_wow_template; additionally returns
+    the section map built while rendering.
+
+    Args:
+        package_key: One of the WOW package keys (e.g., "quick_social_basic")
+        placeholder_values: Mapping of placeholder names to their values
+        strip_unfilled: If True, unfilled {{placeholder}} patterns render as ""
+
+    Returns:
+        RenderedWowReport with markdown and sections
+    """
+    package_key = _resolve_package_key(package_key, placeholder_values)
+    compiled = get_compiled_wow_template(package_key)
+
+    rendered_values: Dict[str, str] = {}
+
+    def render(segments: Tuple[_Segment, ...]) -> str:
+        parts = []
+        for segment in segments:
+            if isinstance(segment, str):
+                parts.append(segment)
+                continue
+            value = rendered_values.get(segment.name)
+            if value is None:
+                if segment.name in placeholder_values:
+                    raw = placeholder_values[segment.name]
+                    # Always coerce to string, but avoid 'None'
+                    value = "" if raw is None else str(raw)
+                    if strip_unfilled and "{{" in value:
+                        # Never leak template artifacts carried in values
+                        value = _PLACEHOLDER_PATTERN.sub("", value)
+                else:
+                    value = "" if strip_unfilled else segment.raw
+                rendered_values[segment.name] = value
+            parts.append(value)
+        return "".join(parts)
+
+    chunks = [render(compiled.preamble)]
+    sections: List[Dict[str, str]] = []
+    for section in compiled.sections:
+        header = render(section.header)
+        body = render(section.body)
+        chunks += [header, body]
+        sections.append(
+            {
+                "id": section.id,
+                "title": section.title,
+                "body": body.strip(),
+                "content": (header + body).strip(),
+            }
+        )
+
+    return RenderedWowReport(package_key=package_key, markdown="".join(chunks), sections=sections)
+
+
+def wow_sections_from_markdown(markdown: str) -> List[Dict[str, str]]:
+    """
+    Section map of already-rendered WOW markdown, in the shape of
+    RenderedWowReport.sections (id, title, body, content).
+
+    For reports stored without their map; rendered reports carry one.
+    """
+    def text(segments: Tuple[_Segment, ...]) -> str:
+        return "".join(s if isinstance(s, str) else s.raw for s in segments)
+
+    sections = []
+    for section in compile_wow_template(markdown or "").sections:
+        header, body = text(section.header), text(section.body)
+        sections.append(
+            {
+                "id": section.id,
+                "title": section.title,
+                "body": body.strip(),
+                "content": (header + body).strip(),
+            }
+        )
+    return sections
+
+
 def apply_wow_template(
     package_key: str,
     placeholder_values: Mapping[str, Any],
@@ -243,34 +455,7 @@ def apply_wow_template(
     Returns:
         Markdown string with placeholders replaced
     """
-    # Check if brief is critically incomplete; only fallback if almost nothing is provided
-    # Count non-empty required fields (brand_name is the most critical)
-    required_fields = ["brand_name", "category", "target_audience"]
-    provided_fields = sum(
-        1
-        for field in required_fields
-        if placeholder_values.get(field) and str(placeholder_values.get(field)).strip()
-    )
-
-    # Only use fallback if brand_name is missing (most critical) AND no category/audience
-    # This allows partial briefs to still generate their requested WOW pack instead of falling back
-    if not placeholder_values.get("brand_name", "").strip() and provided_fields < 1:
-        package_key = "fallback_basic"
-
-    template = get_wow_template(package_key)
-    result = template
-
-    # First pass: direct substitution for all known placeholder values.
-    for key, value in dict(placeholder_values).items():
-        # Always coerce to string, but avoid 'None'
-        safe_value = "" if value is None else str(value)
-        result = result.replace(f"{{{{{key}}}}}", safe_value)
-
-    if strip_unfilled:
-        # Remove any leftover {{placeholder}} patterns
-        result = _PLACEHOLDER_PATTERN.sub("", result)
-
-    return result
+    return render_wow_template(package_key, placeholder_values, strip_unfilled).markdown
 
 
 def get_wow_rules_for_package(package_key: str) -> Dict[str, Any]:
@@ -315,6 +500,31 @@ def resolve_wow_package_key(service_pack_label: Optional[str]) -> Optional[str]:
     return PACKAGE_KEY_BY_LABEL.get(service_pack_label)
 
 
+def render_wow_report(
+    req: Any,
+    extra_sections: Dict[str, str] = None,
+) -> RenderedWowReport:
+    """
+    Render the request's WOW package from its brief and generated sections.
+
+    Args:
+        req: GenerateRequest with brief, wow_package_key, etc.
+        extra_sections: Optional dict of section_id -> markdown content
+
+    Returns:
+        RenderedWowReport (markdown + section map)
+    """
+    placeholder_values = build_default_placeholders(
+        brief=req.brief.model_dump() if hasattr(req.brief, "model_dump") else req.brief,
+        base_blocks=extra_sections or {},
+    )
+    return render_wow_template(
+        package_key=req.wow_package_key,
+        placeholder_values=placeholder_values,
+        strip_unfilled=True,
+    )
+
+
 def build_wow_report(
     req: Any,
     wow_rule: Dict[str, Any],
@@ -336,19 +546,8 @@ def build_wow_report(
 
     Returns:
         Markdown string with placeholders replaced and ready for display
-    """
-    # Build placeholder map from brief + existing output blocks
-    base_blocks = extra_sections or {}
-    placeholder_values = build_default_placeholders(
-        brief=req.brief.model_dump() if hasattr(req.brief, "model_dump") else req.brief,
-        base_blocks=base_blocks,
-    )
 
-    # Apply WOW template with safe placeholder replacement
-    wow_markdown = apply_wow_template(
-        package_key=req.wow_package_key,
-        placeholder_values=placeholder_values,
-        strip_unfilled=True,
-    )
-
-    return wow_markdown
+    Callers that store the report on an output should use render_wow_report
+    and keep both its markdown (wow_markdown) and section map (wow_sections).
+    """
+    return render_wow_report(req, extra_sections).markdown
@@ -135,6 +135,16 @@ def ensure_runs_and_artifacts_tables():
     metadata.create_all(engine)
 
 
+@pytest.fixture(scope="session", autouse=True)
+def trace_file_in_tmp(tmp_path_factory):
+    """Export traces of requests made by the tests under a temp dir, not ~/.cache."""
+    from aicmo.shared.config import settings
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(settings, "TRACE_FILE_PATH", str(tmp_path_factory.mktemp("traces") / "traces.jsonl"))
+        yield
+
+
 @pytest.fixture(scope="session", autouse=True)
 def setup_cam_test_db():
     """
@@ -234,5 +234,61 @@ def test_unified_flow_no_empty_placeholders(sample_intake):
     assert "test-validation-001" in approval.asset_url  # Project ID in URL
 
 
+
+def test_unified_flow_runs_independent_steps_concurrently(sample_intake, monkeypatch):
+    """Independent subsystems overlap: wall time ~ slowest branch, not the sum."""
+    import time
+    from aicmo.delivery import kaizen_orchestrator as ko
+
+    def slow(fn, seconds=0.2):
+        def wrapper(*args, **kwargs):
+            time.sleep(seconds)
+            return fn(*args, **kwargs)
+        return wrapper
+
+    for name in ("generate_brand_core", "generate_brand_positioning", "generate_media_plan",
+                 "analyze_trends", "generate_performance_dashboard", "create_approval_request"):
+        monkeypatch.setattr(ko, name, slow(getattr(ko, name)))
+
+    result = KaizenOrchestrator().run_full_kaizen_flow_for_project(
+        intake=sample_intake, project_id="test-concurrency", skip_kaizen=True
+    )
+
+    # Six 0.2s steps (+ pm_tasks after media_plan) would take ~1.2s sequentially
+    assert result["execution_time_seconds"] < 0.8
+    timings = result["step_timings"]
+    assert set(timings) == {
+        "brand_core", "brand_positioning", "media_plan", "social_trends",
+        "analytics_dashboard", "approval_request", "pm_tasks", "creatives",
+    }
+    assert all(t["status"] == "succeeded" for t in timings.values())
+    assert timings["brand_core"]["seconds"] >= 0.2
+    assert timings["pm_tasks"]["started_at"] >= timings["media_plan"]["seconds"]
+    assert result["failed_steps"] == []
+
+
+def test_unified_flow_captures_partial_failures(sample_intake, monkeypatch):
+    """A failing subsystem leaves its output empty; the rest of the flow completes."""
+    from aicmo.delivery import kaizen_orchestrator as ko
+
+    def broken(*args, **kwargs):
+        raise RuntimeError("media service down")
+
+    monkeypatch.setattr(ko, "generate_media_plan", broken)
+
+    result = KaizenOrchestrator().run_full_kaizen_flow_for_project(
+        intake=sample_intake, project_id="test-partial", skip_kaizen=True
+    )
+
+    assert result["media_plan"] is None
+    assert result["pm_tasks"] == []  # depends on the media plan
+    assert result["brand_core"] is not None
+    assert result["approval_request"] is not None
+    assert sorted(result["failed_steps"]) == ["media_plan", "pm_tasks"]
+    assert result["step_timings"]["media_plan"]["status"] == "failed"
+    assert "media service down" in result["step_timings"]["media_plan"]["error"]
+    assert result["step_timings"]["pm_tasks"]["status"] == "skipped"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,66 @@
+"""Tests for the shared n-gram index and the repetition passes built on it."""
+import random
+import re
+from collections import Counter
+
+from backend.genericity_scoring import repetition_score
+from backend.utils.ngram_index import NGramIndex, remove_spans
+from backend.utils.text_cleanup import remove_excessive_repetition
+from backend.validators.benchmark_validator import _repetition_ratio
+
+LEGACY_PHRASE = re.compile(r"\b(\w+\s+\w+\s+\w+\s+\w+(?:\s+\w+)?)\b")
+
+
+def _random_text(rng: random.Random, words: int) -> str:
+    vocab = ["Coffee", "fresh", "daily", "roast", "beans", "we", "love", "great", "brew", "shop"]
+    seps = [" ", " ", " ", "  ", "\n", ". ", ", ", "-", " "]
+    return "".join(rng.choice(vocab) + rng.choice(seps) for _ in range(words))
+
+
+def test_chunked_phrases_match_legacy_regex_grid():
+    rng = random.Random(3)
+    for _ in range(50):
+        text = _random_text(rng, rng.randint(0, 80))
+        index = NGramIndex(text)
+        ours = Counter(" ".join(index.ngram(s, n)) for s, n in index.chunked_phrases(4, 5))
+        legacy = Counter(" ".join(p.split()) for p in LEGACY_PHRASE.findall(text.lower()))
+        assert ours == legacy
+
+
+def test_contiguity_and_spans():
+    text = "Great coffee here, great   coffee here today"
+    index = NGramIndex(text)
+    assert index.tokens[:3] == ["great", "coffee", "here"]
+    assert index.is_contiguous(0, 3)
+    assert not index.is_contiguous(1, 3)  # crosses the comma
+    start, end = index.char_span(3, 3)
+    assert text[start:end] == "great   coffee here"
+
+
+def test_find_all_is_non_overlapping_per_phrase():
+    index = NGramIndex("a a a a a a a a a")
+    assert index.find_all({("a", "a", "a", "a"): 4}) == {("a", "a", "a", "a"): [0, 4]}
+
+
+def test_remove_spans_merges_overlaps():
+    assert remove_spans("0123456789", [(6, 8), (1, 3), (2, 5)]) == "0589"
+
+
+def test_remove_excessive_repetition_removes_every_extra_occurrence():
+    # Old implementation re-used stale offsets after the first removal
+    text = "Intro. " + "Our coffee is roasted fresh daily. Visit the shop. " * 6
+    result = remove_excessive_repetition(text, max_repeats=2)
+    assert result.lower().count("our coffee is roasted fresh") == 2
+    assert "Intro." in result
+
+
+def test_remove_excessive_repetition_unchanged_without_repeats():
+    text = "One two three four five. Six seven eight nine ten."
+    assert remove_excessive_repetition(text) is text
+
+
+def test_repetition_heuristics_share_index():
+    assert repetition_score("test test test hello hello hello world world world") == 1.0
+    assert repetition_score("") == 0.0
+    assert NGramIndex.from_tokens(["a", "b", "a", "a"]).duplicate_ratio() == 0.5
+    assert _repetition_ratio("x\n\n x \ny\n") == 1.0 - 2 / 3
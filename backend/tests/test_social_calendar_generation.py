@@ -1,5 +1,7 @@
 """Tests for social_calendar_generator: verify hooks, CTAs, and brief context usage."""
 
+import json
+
 import pytest
 from datetime import date, timedelta
 from aicmo.io.client_reports import (
@@ -16,12 +18,80 @@ from aicmo.io.client_reports import (
 )
 from aicmo.generators.social_calendar_generator import (
     generate_social_calendar,
+    _chunk_skeleton,
+    _generate_skeleton,
+    _generate_social_calendar_with_llm_micro_passes,
+    _parse_json_response,
     _stub_social_calendar,
     _get_themes,
     _get_platforms,
 )
 
 
+class FakeBatchChain:
+    """ProviderChain stand-in answering batched prompts with JSON for each listed day."""
+
+    def __init__(self, skip_days=(), malformed_days=(), fail_batches_with_day=None):
+        self.skip_days = set(skip_days)
+        self.malformed_days = set(malformed_days)
+        self.fail_batches_with_day = fail_batches_with_day
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def invoke(self, method_name, prompt):
+        import asyncio
+        import re
+
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+        days = [int(d) for d in re.findall(r"^- Day (\d+):", prompt, re.M)]
+        if self.fail_batches_with_day in days:
+            return (False, None, "fake/failing")
+        entries = []
+        for day in days:
+            if day in self.skip_days:
+                continue
+            if day in self.malformed_days:
+                entries.append({"day": day, "hook": ""})
+                continue
+            entries.append({"day": day, "hook": f"LLM hook for day {day}", "cta": "Book a demo"})
+        return (True, "```json\n" + json.dumps({"days": entries}) + "\n```", "fake/model")
+
+
+class SyncLatencyAdapter:
+    """LLM adapter stand-in with a blocking generate(), like the real adapters."""
+
+    dry_run = False
+
+    def __init__(self, delay):
+        import threading
+
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def generate(self, prompt):
+        import re
+        import time
+
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        days = [int(d) for d in re.findall(r"^- Day (\d+):", prompt, re.M)]
+        return json.dumps({"days": [
+            {"day": day, "hook": f"LLM hook for day {day}", "cta": "Book a demo"} for day in days
+        ]})
+
+
 @pytest.fixture
 def sample_brief():
     """Create a sample brief for testing."""
@@ -29,8 +99,10 @@ def sample_brief():
         brand=BrandBrief(
             brand_name="TechFlow",
             industry="Software",
+            product_service="Workflow automation for teams",
+            primary_goal="Increase platform adoption",
+            primary_customer="Software teams",
             business_type="B2B SaaS",
-            description="Workflow automation for teams",
         ),
         audience=AudienceBrief(
             primary_customer="Software teams",
@@ -357,3 +429,105 @@ class TestIntegrationWithBrief:
         assert len(posts) == 5
         assert all(p.hook for p in posts)
         assert all("Hook idea for day" not in p.hook for p in posts)
+
+
+class TestBatchedLLMMicroPasses:
+    """Test batched, concurrent LLM captions with per-day stub fallback."""
+
+    def _run(self, brief, days, chain):
+        return _generate_social_calendar_with_llm_micro_passes(
+            brief, date(2025, 1, 1), days, _get_themes(days), _get_platforms(brief), chain=chain
+        )
+
+    def test_chunks_are_balanced_and_bounded(self):
+        skeleton = _generate_skeleton(31, _get_themes(31), ["LinkedIn"])
+        chunks = _chunk_skeleton(skeleton, 10)
+        assert [len(c) for c in chunks] == [8, 8, 8, 7]
+        assert [d["day"] for c in chunks for d in c] == list(range(1, 32))
+        assert [len(c) for c in _chunk_skeleton(skeleton[:30], 10)] == [10, 10, 10]
+        assert _chunk_skeleton([], 10) == []
+
+    def test_30_day_calendar_uses_one_request_per_chunk(self, sample_brief):
+        chain = FakeBatchChain()
+        posts = self._run(sample_brief, 30, chain)
+        assert len(posts) == 30
+        assert chain.calls == 3
+        assert chain.max_in_flight > 1
+        assert all(p.hook == f"LLM hook for day {i + 1}" for i, p in enumerate(posts))
+        assert [p.date for p in posts] == [date(2025, 1, 1) + timedelta(days=i) for i in range(30)]
+
+    def test_concurrency_is_capped_by_shared_limit(self, sample_brief, monkeypatch):
+        from aicmo.shared.config import settings
+
+        monkeypatch.setattr(settings, "LLM_CALENDAR_BATCH_DAYS", 7)
+        monkeypatch.setattr(settings, "LLM_MAX_CONCURRENCY", 2)
+        chain = FakeBatchChain()
+        posts = self._run(sample_brief, 28, chain)
+        assert len(posts) == 28
+        assert chain.calls == 4
+        assert chain.max_in_flight == 2
+
+    def test_sync_provider_batches_run_concurrently(self, sample_brief, monkeypatch):
+        import time
+
+        from aicmo.gateways.provider_chain import ProviderChain, ProviderWrapper
+        from aicmo.shared.config import settings
+
+        monkeypatch.setattr(settings, "LLM_CALENDAR_BATCH_DAYS", 7)
+        monkeypatch.setattr(settings, "LLM_MAX_CONCURRENCY", 4)
+        adapter = SyncLatencyAdapter(delay=0.2)
+        chain = ProviderChain("llm", [ProviderWrapper(adapter, "fake/sync")])
+
+        started = time.perf_counter()
+        posts = self._run(sample_brief, 28, chain)
+        elapsed = time.perf_counter() - started
+        assert all(p.hook.startswith("LLM hook") for p in posts)
+        assert adapter.max_in_flight == 4
+        assert elapsed < 0.5  # 4 batches of 0.2s, not 0.8s one after another
+
+    def test_concurrency_cap_is_shared_across_calendars(self, sample_brief, monkeypatch):
+        import threading
+
+        from aicmo.gateways.provider_chain import ProviderChain, ProviderWrapper
+        from aicmo.shared.config import settings
+
+        monkeypatch.setattr(settings, "LLM_CALENDAR_BATCH_DAYS", 7)
+        monkeypatch.setattr(settings, "LLM_MAX_CONCURRENCY", 2)
+        adapter = SyncLatencyAdapter(delay=0.05)
+        chain = ProviderChain("llm", [ProviderWrapper(adapter, "fake/sync")])
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self._run(sample_brief, 28, chain)))
+            for _ in range(3)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(results) == 3
+        assert adapter.max_in_flight == 2
+
+    def test_missing_and_malformed_days_fall_back_to_stub(self, sample_brief):
+        chain = FakeBatchChain(skip_days={3}, malformed_days={5})
+        posts = self._run(sample_brief, 7, chain)
+        assert len(posts) == 7
+        assert posts[0].hook == "LLM hook for day 1"
+        assert posts[2].hook != "LLM hook for day 3" and "TechFlow" in posts[2].hook
+        assert posts[4].hook == "Real Software teams getting real results with TechFlow."
+        assert posts[4].cta != "Book a demo"
+
+    def test_failed_chunk_only_stubs_its_days(self, sample_brief):
+        chain = FakeBatchChain(fail_batches_with_day=15)
+        posts = self._run(sample_brief, 20, chain)
+        assert len(posts) == 20
+        assert chain.calls == 2
+        assert all(p.hook.startswith("LLM hook") for p in posts[:10])
+        assert not any(p.hook.startswith("LLM hook") for p in posts[10:])
+
+    def test_json_fences_are_stripped_case_insensitively(self):
+        body = '{"days": []}'
+        for text in (body, f"```json\n{body}\n```", f"```JSON\n{body}\n```", f"```\n{body}```"):
+            assert _parse_json_response(text) == {"days": []}
+        assert _parse_json_response({"content": f"```Json {body} ```"}) == {"days": []}
+        assert _parse_json_response("```json\nnot json\n```") is None
@@ -0,0 +1,132 @@
+"""
+Tests for incremental training-material ingestion (aicmo.memory.training).
+
+Covers:
+1. Only new/changed files are embedded; repeat syncs are no-ops
+2. Rows of changed and removed files are replaced/deleted
+3. Legacy duplicate rows and evicted rows are reconciled
+4. Background sync and progress reporting
+"""
+
+import os
+
+import pytest
+
+from aicmo.memory import engine, training
+from aicmo.memory.training import get_ingest_status, start_background_sync, sync_training_materials
+
+
+@pytest.fixture
+def library(tmp_path):
+    root = tmp_path / "training"
+    (root / "01_Frameworks").mkdir(parents=True)
+    (root / "03_Writing_Systems" / "hooks").mkdir(parents=True)
+    (root / "01_Frameworks" / "aida.txt").write_text("Attention, interest, desire, action.")
+    (root / "01_Frameworks" / "pas.txt").write_text("Problem, agitate, solve.")
+    (root / "03_Writing_Systems" / "hooks" / "questions.txt").write_text("Open with a question.")
+    return root
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "memory.db")
+
+
+@pytest.fixture
+def embed_calls(monkeypatch):
+    calls = []
+
+    def fake_embed(texts, model=None):
+        calls.append(list(texts))
+        return engine._fake_embed_texts(texts)
+
+    monkeypatch.setattr(engine, "_embed_texts", fake_embed)
+    return calls
+
+
+def _training_titles(db_path):
+    conn = engine._get_conn(db_path)
+    rows = conn.execute(
+        "SELECT title FROM memory_items WHERE kind = ? ORDER BY title", (training.TRAINING_KIND,)
+    ).fetchall()
+    return [r[0] for r in rows]
+
+
+def test_first_sync_ingests_every_file(library, db_path, embed_calls):
+    status = sync_training_materials(str(library), db_path)
+
+    assert status["state"] == "completed"
+    assert (status["total_files"], status["added"], status["processed_files"]) == (3, 3, 3)
+    assert len(embed_calls) == 3
+    assert _training_titles(db_path) == [
+        "01_Frameworks: aida",
+        "01_Frameworks: pas",
+        "03_Writing_Systems: questions",
+    ]
+
+
+def test_repeat_sync_is_idempotent(library, db_path, embed_calls):
+    sync_training_materials(str(library), db_path)
+    status = sync_training_materials(str(library), db_path)
+
+    assert (status["added"], status["updated"], status["unchanged"]) == (0, 0, 3)
+    assert len(embed_calls) == 3
+    assert engine.count_items(db_path) == 3
+
+
+def test_touched_file_with_same_content_is_not_reembedded(library, db_path, embed_calls):
+    sync_training_materials(str(library), db_path)
+    path = library / "01_Frameworks" / "pas.txt"
+    os.utime(path, (1, 1))
+
+    status = sync_training_materials(str(library), db_path)
+    assert status["unchanged"] == 3
+    assert len(embed_calls) == 3
+
+
+def test_changed_and_removed_files(library, db_path, embed_calls):
+    sync_training_materials(str(library), db_path)
+    changed = library / "01_Frameworks" / "aida.txt"
+    changed.write_text("AIDA, revised and extended.")
+    os.utime(changed, (2, 2))
+    (library / "01_Frameworks" / "pas.txt").unlink()
+
+    status = sync_training_materials(str(library), db_path)
+    assert (status["updated"], status["removed"], status["unchanged"]) == (1, 1, 1)
+    assert embed_calls[-1] == ["AIDA, revised and extended."]
+    assert _training_titles(db_path) == ["01_Frameworks: aida", "03_Writing_Systems: questions"]
+
+
+def test_legacy_duplicates_and_evicted_rows_are_reconciled(library, db_path, embed_calls):
+    # Rows from the old full re-ingest on every boot
+    for _ in range(3):
+        engine.learn_from_blocks(
+            training.TRAINING_KIND, [("01_Frameworks: aida", "old")], project_id="default", db_path=db_path
+        )
+    engine.learn_from_blocks("report_section", [("Kept", "learned")], project_id="p1", db_path=db_path)
+    sync_training_materials(str(library), db_path)
+    assert engine.count_items(db_path) == 4
+
+    conn = engine._get_conn(db_path)
+    conn.execute("DELETE FROM memory_items WHERE title = ?", ("01_Frameworks: pas",))
+    conn.commit()
+    status = sync_training_materials(str(library), db_path)
+    assert (status["added"], status["updated"], status["unchanged"]) == (0, 1, 2)
+    assert engine.count_items(db_path) == 4
+
+
+def test_missing_library_completes_without_rows(tmp_path, db_path, embed_calls):
+    status = sync_training_materials(str(tmp_path / "missing"), db_path)
+    assert status["state"] == "completed"
+    assert status["total_files"] == 0
+    assert embed_calls == []
+
+
+def test_background_sync_reports_progress(library, db_path, embed_calls):
+    thread = start_background_sync(str(library), db_path)
+    thread.join(timeout=10)
+
+    status = get_ingest_status()
+    assert status["state"] == "completed"
+    assert status["added"] == 3
+    assert status["duration_seconds"] >= 0
@@ -0,0 +1,198 @@
+"""
+Shared n-gram index for repetition heuristics.
+
+One tokenization pass (a single regex split) records every token, the gap
+before it and whether consecutive tokens are joined by whitespace only.
+Phrase counts, phrase positions and repeat ratios are then read off the
+index in linear time instead of re-scanning the text once per phrase.
+
+Used by:
+- backend.utils.text_cleanup.remove_excessive_repetition (4-5 word phrases)
+- backend.genericity_scoring.repetition_score (token repeats)
+- backend.validators.benchmark_validator._repetition_ratio (line repeats)
+"""
+
+from __future__ import annotations
+
+import operator
+import re
+from collections import Counter
+from functools import lru_cache
+from itertools import accumulate, compress
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Tuple
+
+WORD_PATTERN = re.compile(r"\w+")
+
+NGram = Tuple[str, ...]
+
+
+@lru_cache(maxsize=32)
+def _splitter(token_pattern: Pattern) -> Pattern:
+    # split() with one capturing group alternates gap, token, gap, ..., gap
+    return re.compile(f"({token_pattern.pattern})", token_pattern.flags)
+
+
+class NGramIndex:
+    """
+    Token index over a text.
+
+    Args:
+        text: Source text
+        token_pattern: Regex (without capturing groups) whose matches are
+            the tokens; defaults to \\w+ words
+        lowercase: Fold tokens to lower case for comparison
+    """
+
+    def __init__(self, text: str = "", token_pattern: Pattern = WORD_PATTERN, lowercase: bool = True):
+        self.text = text
+        self._pieces: List[str] = _splitter(token_pattern).split(text) if text else [""]
+        raw_tokens = self._pieces[1::2]
+        self.tokens: List[str] = list(map(str.lower, raw_tokens)) if lowercase else raw_tokens
+        self._joined: Optional[List[bool]] = None
+        self._breaks: Optional[List[int]] = None
+        self._offsets: Optional[List[int]] = None
+
+    @classmethod
+    def from_tokens(cls, tokens: Iterable[str]) -> "NGramIndex":
+        """Index pre-split tokens (e.g. lines); no token is joined to the next."""
+        index = cls()
+        index.tokens = list(tokens)
+        index._joined = [False] * max(len(index.tokens) - 1, 0)
+        return index
+
+    @property
+    def joined(self) -> List[bool]:
+        """joined[i]: tokens i and i+1 are separated by whitespace only."""
+        if self._joined is None:
+            self._joined = list(map(str.isspace, self._pieces[2:-1:2]))
+        return self._joined
+
+    @property
+    def breaks(self) -> List[int]:
+        """breaks[i]: number of non-whitespace gaps among the first i gaps."""
+        if self._breaks is None:
+            self._breaks = list(accumulate(map(operator.not_, self.joined), initial=0))
+        return self._breaks
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    # ------------------------------------------------------------------
+    # N-grams
+    # ------------------------------------------------------------------
+
+    def is_contiguous(self, start: int, n: int) -> bool:
+        """True if tokens start..start+n-1 are separated by whitespace only."""
+        end = start + n - 1
+        return end < len(self.tokens) and self.breaks[end] == self.breaks[start]
+
+    def ngram(self, start: int, n: int) -> NGram:
+        return tuple(self.tokens[start:start + n])
+
+    def char_span(self, start: int, n: int) -> Tuple[int, int]:
+        """Character span in the source text covered by an n-gram."""
+        if self._offsets is None:
+            self._offsets = list(accumulate(map(len, self._pieces), initial=0))
+        # token i is piece 2i+1
+        return self._offsets[2 * start + 1], self._offsets[2 * (start + n - 1) + 2]
+
+    def ngrams(self, n: int, contiguous: bool = True) -> Iterator[Tuple[int, NGram]]:
+        """Yield (start, ngram) for every position, optionally only whitespace-joined ones."""
+        tokens, breaks = self.tokens, self.breaks
+        for start in range(len(tokens) - n + 1):
+            if contiguous and breaks[start + n - 1] != breaks[start]:
+                continue
+            yield start, tuple(tokens[start:start + n])
+
+    def counts(self, n: int = 1, contiguous: bool = True, min_token_length: int = 1) -> Counter:
+        """N-gram counts; for n == 1, tokens shorter than min_token_length are skipped."""
+        if n == 1:
+            if min_token_length > 1:
+                return Counter([t for t in self.tokens if len(t) >= min_token_length])
+            return Counter(self.tokens)
+        return Counter(gram for _, gram in self.ngrams(n, contiguous))
+
+    def runs(self) -> Iterator[Tuple[int, int]]:
+        """Yield (start, length) of each maximal whitespace-joined token run."""
+        start = 0
+        for gap in compress(range(len(self.joined)), map(operator.not_, self.joined)):
+            yield start, gap + 1 - start
+            start = gap + 1
+        if start < len(self.tokens):
+            yield start, len(self.tokens) - start
+
+    def chunked_phrases(self, min_words: int = 4, max_words: int = 5) -> Iterator[Tuple[int, int]]:
+        """
+        Yield (start, length) of non-overlapping phrases, left to right.
+
+        Each whitespace-joined run is cut into max_words chunks with a final
+        chunk of min_words..max_words if enough words remain - the same grid
+        as re.findall(r"\\b(\\w+\\s+\\w+\\s+\\w+\\s+\\w+(?:\\s+\\w+)?)\\b").
+        """
+        for start, length in self.runs():
+            end = start + length
+            while end - start >= min_words:
+                size = min(end - start, max_words)
+                yield start, size
+                start += size
+
+    def find_all(self, phrases: Dict[NGram, int]) -> Dict[NGram, List[int]]:
+        """
+        Start positions of each phrase (non-overlapping per phrase, left to right).
+
+        phrases maps phrase -> length; one pass over the index for all phrases.
+        """
+        found: Dict[NGram, List[int]] = {phrase: [] for phrase in phrases}
+        if not phrases:
+            return found
+        firsts = {phrase[0] for phrase in phrases}
+        lengths = sorted(set(phrases.values()))
+        next_free: Dict[NGram, int] = {}
+        tokens, breaks, total = self.tokens, self.breaks, len(self.tokens)
+        for start in [i for i, token in enumerate(tokens) if token in firsts]:
+            for n in lengths:
+                end = start + n - 1
+                if end >= total or breaks[end] != breaks[start]:
+                    break
+                gram = tuple(tokens[start:end + 1])
+                if phrases.get(gram) == n and start >= next_free.get(gram, 0):
+                    found[gram].append(start)
+                    next_free[gram] = start + n
+        return found
+
+    # ------------------------------------------------------------------
+    # Ratios
+    # ------------------------------------------------------------------
+
+    def repeated_fraction(self, min_count: int = 3, n: int = 1, min_token_length: int = 1) -> float:
+        """Share of n-grams whose n-gram occurs at least min_count times."""
+        counts = self.counts(n, min_token_length=min_token_length)
+        total = sum(counts.values())
+        if not total:
+            return 0.0
+        return sum(c for c in counts.values() if c >= min_count) / total
+
+    def duplicate_ratio(self, n: int = 1) -> float:
+        """1 - unique/total over n-grams (0.0 = all unique)."""
+        counts = self.counts(n)
+        total = sum(counts.values())
+        if not total:
+            return 0.0
+        return 1.0 - len(counts) / total
+
+
+def remove_spans(text: str, spans: Iterable[Tuple[int, int]]) -> str:
+    """Remove character spans (overlaps merged) in a single rebuild."""
+    pieces: List[str] = []
+    cursor = 0
+    for start, end in sorted(spans):
+        if end <= cursor:
+            continue
+        start = max(start, cursor)
+        pieces.append(text[cursor:start])
+        cursor = end
+    pieces.append(text[cursor:])
+    return "".join(pieces)
+
+
+__all__ = ["NGramIndex", "NGram", "WORD_PATTERN", "remove_spans"]
@@ -20,6 +20,8 @@ import re
 from typing import TYPE_CHECKING, List
 from collections import Counter
 
+from backend.utils.ngram_index import NGramIndex, remove_spans
+
 if TYPE_CHECKING:
     from backend.main import GenerateRequest
 
@@ -635,30 +637,23 @@ def remove_excessive_repetition(text: str, max_repeats: int = 2) -> str:
         >>> remove_excessive_repetition(text, max_repeats=2)
         'Great coffee. Great coffee. Quality beverages.'
     """
-    # Find all phrases (4+ words)
-    phrases = re.findall(r"\b(\w+\s+\w+\s+\w+\s+\w+(?:\s+\w+)?)\b", text.lower())
-    phrase_counts = Counter(phrases)
+    # One tokenization pass; phrases (4-5 words) are counted on the same
+    # non-overlapping grid the old findall used
+    index = NGramIndex(text)
+    phrase_counts = Counter(index.ngram(start, n) for start, n in index.chunked_phrases(4, 5))
 
     # Find phrases that appear more than max_repeats
-    excessive = {phrase: count for phrase, count in phrase_counts.items() if count > max_repeats}
+    excessive = {phrase: len(phrase) for phrase, count in phrase_counts.items() if count > max_repeats}
 
     if not excessive:
         return text  # No repetition issues
 
-    # Replace excessive occurrences
-    for phrase in excessive:
-        # Find all occurrences
-        pattern = re.compile(re.escape(phrase), re.IGNORECASE)
-        matches = list(pattern.finditer(text))
-
-        if len(matches) <= max_repeats:
-            continue
-
-        # Keep first max_repeats, remove rest
-        for match in matches[max_repeats:]:
-            # Remove this occurrence
-            start, end = match.span()
-            text = text[:start] + text[end:]
+    # Keep the first max_repeats occurrences of each phrase, remove the rest
+    # in a single span-based rebuild
+    removals = []
+    for phrase, starts in index.find_all(excessive).items():
+        removals.extend(index.char_span(start, len(phrase)) for start in starts[max_repeats:])
+    text = remove_spans(text, removals)
 
     # Clean up after removals
     text = re.sub(r"\s{2,}", " ", text)
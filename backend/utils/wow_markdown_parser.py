@@ -62,7 +62,7 @@ def parse_wow_markdown_to_sections(wow_markdown: str) -> List[Dict[str, str]]:
 
             # Start new section
             section_title = header_match.group(1).strip()
-            current_section_id = _title_to_section_id(section_title)
+            current_section_id = title_to_section_id(section_title)
             current_lines = [line]  # Include header in content
 
         else:
@@ -90,7 +90,7 @@ def parse_wow_markdown_to_sections(wow_markdown: str) -> List[Dict[str, str]]:
     return sections
 
 
-def _title_to_section_id(title: str) -> str:
+def title_to_section_id(title: str) -> str:
     """
     Convert a section title to a section ID.
 
@@ -18,6 +18,7 @@ from backend.utils.benchmark_loader import (
     is_strict_pack,
     BenchmarkNotFoundError,
 )
+from backend.utils.ngram_index import NGramIndex
 
 
 # Sections where we want softer, format-only validation instead of strict snapshot match,
@@ -95,10 +96,7 @@ def _repetition_ratio(text: str) -> float:
     Returns value between 0.0 (all unique) and 1.0 (all duplicates).
     """
     lines = [line.strip() for line in text.splitlines() if line.strip()]
-    if not lines:
-        return 0.0
-    unique = set(lines)
-    return 1.0 - (len(unique) / len(lines))
+    return NGramIndex.from_tokens(lines).duplicate_ratio()
 
 
 def _is_quick_social_soft_section(pack_key: str, section_id: str) -> bool:
@@ -17,6 +17,7 @@ from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional, Sequence
 
 from backend.validators.report_gate import validate_report_sections
+from aicmo.shared.tracing import traced
 
 
 class BenchmarkEnforcementError(RuntimeError):
@@ -58,6 +59,7 @@ def _index_sections_by_id(
     return indexed
 
 
+@traced("stage.enforce_benchmarks", attrs=("pack_key",))
 def enforce_benchmarks_with_regen(
     *,
     pack_key: str,
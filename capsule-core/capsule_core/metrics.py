@@ -1,8 +1,17 @@
 from __future__ import annotations
-from typing import Dict, Tuple
+from bisect import bisect_left
+from typing import Dict, List, Tuple
+import threading
 import time
 from contextlib import contextmanager
 
+# Seconds; same defaults as prometheus_client
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0,
+)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
 
 class Counter:
     def __init__(self) -> None:
@@ -12,9 +21,29 @@ class Counter:
         self.value += n
 
 
-class Histogram:
+class Gauge:
     def __init__(self) -> None:
-        self.values = []
+        self.value = 0.0
+
+    def set(self, v: float) -> None:
+        self.value = v
+
+    def inc(self, n: float = 1) -> None:
+        self.value += n
+
+    def dec(self, n: float = 1) -> None:
+        self.value -= n
+
+
+class Histogram:
+    """Fixed-bucket histogram: constant memory however many values are observed."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot = +Inf
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
 
     @contextmanager
     def time(self):
@@ -25,14 +54,34 @@ class Histogram:
             self.observe(time.perf_counter() - t0)
 
     def observe(self, v: float) -> None:
-        self.values.append(v)
+        with self._lock:
+            self.counts[bisect_left(self.buckets, v)] += 1
+            self.count += 1
+            self.sum += v
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """(upper bound, cumulative count) pairs, Prometheus style."""
+        out, total = [], 0
+        for bound, n in zip(self.buckets, self.counts):
+            total += n
+            out.append((repr(float(bound)), total))
+        out.append(("+Inf", self.count))
+        return out
+
+
+def _labels(key: LabelKey, extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+    pairs = key + extra
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}"
 
 
 class MetricsRegistry:
     def __init__(self, namespace: str = "capsule") -> None:
         self.ns = namespace
-        self.counters: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Counter] = {}
-        self.hists: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Histogram] = {}
+        self.counters: Dict[Tuple[str, LabelKey], Counter] = {}
+        self.gauges: Dict[Tuple[str, LabelKey], Gauge] = {}
+        self.hists: Dict[Tuple[str, LabelKey], Histogram] = {}
 
     def counter(self, name: str, **labels: str) -> Counter:
         key = (f"{self.ns}_{name}", tuple(sorted(labels.items())))
@@ -40,12 +89,42 @@ class MetricsRegistry:
             self.counters[key] = Counter()
         return self.counters[key]
 
-    def histogram(self, name: str, **labels: str) -> Histogram:
+    def gauge(self, name: str, **labels: str) -> Gauge:
+        key = (f"{self.ns}_{name}", tuple(sorted(labels.items())))
+        if key not in self.gauges:
+            self.gauges[key] = Gauge()
+        return self.gauges[key]
+
+    def histogram(self, name: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS, **labels: str) -> Histogram:
         key = (f"{self.ns}_{name}", tuple(sorted(labels.items())))
         if key not in self.hists:
-            self.hists[key] = Histogram()
+            self.hists[key] = Histogram(buckets)
         return self.hists[key]
 
+    def render(self) -> str:
+        """Prometheus text exposition format (for a /metrics endpoint or a push)."""
+        lines: List[str] = []
+        typed = set()
+
+        def header(name: str, kind: str) -> None:
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {name} {kind}")
+
+        for (name, key), c in sorted(self.counters.items()):
+            header(name, "counter")
+            lines.append(f"{name}{_labels(key)} {c.value}")
+        for (name, key), g in sorted(self.gauges.items()):
+            header(name, "gauge")
+            lines.append(f"{name}{_labels(key)} {g.value}")
+        for (name, key), h in sorted(self.hists.items()):
+            header(name, "histogram")
+            for bound, n in h.cumulative():
+                lines.append(f"{name}_bucket{_labels(key, (('le', bound),))} {n}")
+            lines.append(f"{name}_count{_labels(key)} {h.count}")
+            lines.append(f"{name}_sum{_labels(key)} {h.sum}")
+        return "\n".join(lines) + "\n"
+
 
 # singleton convenience
 _registry = MetricsRegistry()
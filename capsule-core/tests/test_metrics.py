@@ -0,0 +1,26 @@
+from capsule_core.metrics import MetricsRegistry
+
+
+def test_histogram_is_bounded():
+    reg = MetricsRegistry("t")
+    h = reg.histogram("latency", buckets=(0.1, 1.0), route="run")
+    for _ in range(10000):
+        h.observe(0.05)
+    h.observe(0.5)
+    h.observe(5.0)
+    assert h.counts == [10000, 1, 1]
+    assert h.count == 10002
+    assert h.cumulative() == [("0.1", 10000), ("1.0", 10001), ("+Inf", 10002)]
+
+
+def test_render_prometheus_text():
+    reg = MetricsRegistry("t")
+    reg.counter("requests_total", route="run").inc(3)
+    reg.gauge("queue_depth").set(7)
+    reg.histogram("latency", buckets=(1.0,)).observe(0.5)
+    text = reg.render()
+    assert '# TYPE t_requests_total counter\nt_requests_total{route="run"} 3\n' in text
+    assert "t_queue_depth 7" in text
+    assert 't_latency_bucket{le="1.0"} 1' in text
+    assert 't_latency_bucket{le="+Inf"} 1' in text
+    assert "t_latency_count 1" in text
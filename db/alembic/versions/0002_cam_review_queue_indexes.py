@@ -0,0 +1,41 @@
+"""add_cam_review_queue_indexes
+
+Indexes for the review queue API: pending tasks are filtered by
+requires_human_review (and campaign / review type), paged in id order and
+counted per review type in SQL.
+
+Revision ID: 0002_cam_review_queue
+Revises: 0001_campaign_ops
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002_cam_review_queue'
+down_revision: Union[str, Sequence[str], None] = '0001_campaign_ops'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create review queue indexes on cam_leads."""
+    op.create_index(
+        'idx_lead_review_queue',
+        'cam_leads',
+        ['requires_human_review', 'review_type', 'id'],
+    )
+    op.create_index(
+        'idx_lead_review_campaign',
+        'cam_leads',
+        ['campaign_id', 'requires_human_review', 'review_type'],
+    )
+
+
+def downgrade() -> None:
+    """Drop review queue indexes."""
+    op.drop_index('idx_lead_review_campaign', table_name='cam_leads')
+    op.drop_index('idx_lead_review_queue', table_name='cam_leads')
@@ -36,6 +36,7 @@ import logging
 from pathlib import Path
 from datetime import datetime
 from typing import Callable, Dict, Any, Optional, Tuple, List
+import html
 import json
 import traceback
 import base64
@@ -1972,8 +1973,13 @@ def aicmo_tab_shell(
     # Gate: determine allowed and render blocking panel if not allowed
     allowed, missing_keys = gate(required_keys)
 
+    # A runner's /aicmo/generate call runs in the background (backend_generate);
+    # until it has finished the reruns only poll it and finish the step with
+    # the context the runner snapshotted (resume_backend_generate)
+    generate_pending = has_background_call(generate_call_key(tab_key), get_backend_base_url())
+    
     with col_generate:
-        is_running = st.session_state[running_key]
+        is_running = st.session_state[running_key] or generate_pending
         generate_disabled = is_running or (not allowed)
         # Show explicit blocked panel when not allowed
         if not allowed:
@@ -1991,14 +1997,17 @@ def aicmo_tab_shell(
             disabled=generate_disabled,
             use_container_width=True,
             key=f"{tab_key}__generate_btn"
-        ):
+        ) or generate_pending:
             # Set running state
             st.session_state[running_key] = True
             st.session_state[error_key] = None
             
             try:
-                # Call runner and store result
-                result = runner(inputs)
+                # Call runner (or resume its pending call) and store result
+                if generate_pending:
+                    result = resume_backend_generate(tab_key)
+                else:
+                    result = runner(inputs)
 
                 # Validate backend content: do NOT fabricate or expand manifest-only responses
                 if result.get("status") == "SUCCESS":
@@ -2083,9 +2092,12 @@ def aicmo_tab_shell(
 # HTTP CLIENT LAYER - Streamlit ↔ Backend Communication
 # ===================================================================
 
-import requests
+import httpx
 import uuid
 
+from aicmo.ui_v2.api_client import get_backend_client
+from aicmo.ui_v2.shared import has_background_call, http_post_json_in_background
+
 def get_backend_base_url() -> Optional[str]:
     """
     Get backend base URL from environment.
@@ -2098,18 +2110,80 @@ def get_backend_base_url() -> Optional[str]:
         log.warning("Backend URL not configured (BACKEND_URL or AICMO_BACKEND_URL)")
     return url
 
+def generate_call_key(tab_key: str) -> str:
+    """Session key of a tab's in-flight /aicmo/generate background call."""
+    return f"{tab_key}__generate_call"
+
+
+def generate_submission_key(tab_key: str) -> str:
+    """Session key of the payload and finisher snapshotted by backend_generate."""
+    return f"{tab_key}__generate_submission"
+
+
+def backend_generate(
+    tab_key: str,
+    payload: Dict[str, Any],
+    finish: Callable[..., Dict[str, Any]],
+    **context: Any,
+) -> Dict[str, Any]:
+    """
+    POST /aicmo/generate for tab_key's Generate button without blocking the page.
+    
+    The request runs in the backend client's background pool and the script
+    reruns until it has finished. The payload, finish and the context it needs
+    are snapshotted in session state when the call is submitted, so the
+    reruns go through resume_backend_generate(tab_key) rather than the runner:
+    the runner's pre-work and the widget inputs are only read once.
+    
+    Returns finish(backend_response, **context) once the call is done.
+    """
+    st.session_state[generate_submission_key(tab_key)] = {
+        "payload": payload,
+        "finish": finish,
+        "context": context,
+    }
+    return resume_backend_generate(tab_key)
+
+
+def resume_backend_generate(tab_key: str) -> Dict[str, Any]:
+    """Poll tab_key's submitted /aicmo/generate call and finish its step once it is done."""
+    submission_key = generate_submission_key(tab_key)
+    submission = st.session_state.get(submission_key)
+    if submission is None:
+        return {
+            "status": "FAILED",
+            "content": "No generate request was submitted for this tab",
+            "meta": {"tab": tab_key},
+            "debug": {},
+        }
+    
+    backend_response = backend_post_json(
+        "/aicmo/generate", submission["payload"], background_key=generate_call_key(tab_key)
+    )
+    if backend_response.get("status") == "RUNNING":
+        return backend_response
+    
+    del st.session_state[submission_key]
+    return submission["finish"](backend_response, **submission["context"])
+
+
 def backend_post_json(
     path: str,
     payload: Dict[str, Any],
-    timeout_s: int = 120,
+    timeout_s: Optional[float] = None,
+    background_key: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
-    POST JSON to backend endpoint.
+    POST JSON to backend endpoint over the shared pooled client.
     
     Args:
         path: Endpoint path (e.g., "/aicmo/generate")
         payload: Request payload dict
-        timeout_s: Request timeout in seconds
+        timeout_s: Request timeout in seconds (default: the endpoint's
+            AICMO_UI_HTTP_ENDPOINT_TIMEOUTS entry)
+        background_key: Run the request as a background call under this
+            session key (see http_post_json_in_background); the script is
+            rerun until it has finished
     
     Returns:
         Response dict with: status, run_id, module, meta, deliverables, error, trace_id
@@ -2124,14 +2198,22 @@ def backend_post_json(
             "deliverables": [],
         }
     
-    url = f"{backend_url}{path}"
+    client = get_backend_client(backend_url)
+    url = f"{client.base_url}{path}"
+    if timeout_s is None:
+        timeout_s = client.timeout_for(path)
+    
+    if background_key is not None:
+        return _backend_post_json_in_background(background_key, path, payload, timeout_s, backend_url)
+    
     trace_id = str(uuid.uuid4())
     
     try:
         log.info(f"POST {path} trace_id={trace_id[:12]}")
         
-        response = requests.post(
-            url,
+        response = client.request(
+            "POST",
+            path,
             json=payload,
             timeout=timeout_s,
             headers={"X-Trace-ID": trace_id},
@@ -2147,7 +2229,7 @@ def backend_post_json(
         log.info(f"POST {path} → {response.status_code} trace_id={trace_id[:12]}")
         return data
     
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         log.error(f"Request timeout: {path}")
         return {
             "status": "FAILED",
@@ -2155,7 +2237,7 @@ def backend_post_json(
             "trace_id": trace_id,
             "deliverables": [],
         }
-    except requests.exceptions.ConnectionError as e:
+    except httpx.ConnectError as e:
         log.error(f"Connection error: {path} {e}")
         return {
             "status": "FAILED",
@@ -2163,7 +2245,7 @@ def backend_post_json(
             "trace_id": trace_id,
             "deliverables": [],
         }
-    except requests.exceptions.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         log.error(f"HTTP error {response.status_code}: {path}")
         try:
             error_data = response.json()
@@ -2184,6 +2266,47 @@ def backend_post_json(
             "deliverables": [],
         }
 
+def _backend_post_json_in_background(
+    key: str,
+    path: str,
+    payload: Dict[str, Any],
+    timeout_s: float,
+    backend_url: str,
+) -> Dict[str, Any]:
+    """backend_post_json's background path; the trace id is kept across reruns."""
+    trace_key = f"{key}__trace_id"
+    if trace_key not in st.session_state:
+        st.session_state[trace_key] = str(uuid.uuid4())
+        log.info(f"POST {path} (background) trace_id={st.session_state[trace_key][:12]}")
+    trace_id = st.session_state[trace_key]
+    
+    result = http_post_json_in_background(
+        key,
+        path,
+        payload,
+        timeout=timeout_s,
+        label="Generating...",
+        headers={"X-Trace-ID": trace_id},
+        base_url=backend_url,
+    )
+    if result is None:
+        # Only reached when st.rerun() returns instead of stopping the script
+        return {"status": "RUNNING", "error": "Backend request still running", "trace_id": trace_id, "deliverables": []}
+    
+    st.session_state.pop(trace_key, None)
+    success, data, error = result
+    if not success or not isinstance(data, dict):
+        log.error(f"POST {path} failed: {error} trace_id={trace_id[:12]}")
+        return {
+            "status": "FAILED",
+            "error": error or "Backend returned a non-object response",
+            "trace_id": trace_id,
+            "deliverables": [],
+        }
+    data.setdefault("trace_id", trace_id)
+    log.info(f"POST {path} → done trace_id={trace_id[:12]}")
+    return data
+
 def validate_backend_response(response: Dict[str, Any]) -> Tuple[bool, str]:
     """
     Validate backend response matches deliverables contract.
@@ -2492,10 +2615,35 @@ def run_strategy_step(inputs: Dict[str, Any]) -> Dict[str, Any]:
                 "debug": {"note": "stub", "lineage": lineage}
             }
         
-        backend_response = backend_post_json(
-            "/aicmo/generate",
-            {"brief": f"Strategy: {campaign_name}", "use_case": "strategy"}
+        return backend_generate(
+            "strategy",
+            {"brief": f"Strategy: {campaign_name}", "use_case": "strategy"},
+            _finish_strategy_step,
+            client_id=client_id,
+            engagement_id=engagement_id,
+            campaign_name=campaign_name,
+            lineage=lineage,
         )
+    except Exception as e:
+        log.error(f"Strategy error: {e}")
+        return {
+            "status": "FAILED",
+            "content": str(e),
+            "meta": {"tab": "strategy"},
+            "debug": {"traceback": traceback.format_exc()}
+        }
+
+
+def _finish_strategy_step(
+    backend_response: Dict[str, Any],
+    client_id: str,
+    engagement_id: str,
+    campaign_name: str,
+    lineage: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Turn the strategy /aicmo/generate response into a Strategy artifact"""
+    try:
+        from aicmo.ui.persistence.artifact_store import ArtifactType, Artifact
         
         is_valid, error_msg = validate_backend_response(backend_response)
         if not is_valid:
@@ -2510,6 +2658,7 @@ def run_strategy_step(inputs: Dict[str, Any]) -> Dict[str, Any]:
         draft_md = backend_envelope_to_markdown(backend_response)
         
         # Create Strategy artifact with lineage
+        artifact_store = get_artifact_store()
         intake_artifact = Artifact.from_dict(st.session_state["artifact_intake"])
         strategy_artifact = artifact_store.create_artifact(
             artifact_type=ArtifactType.STRATEGY,
@@ -2613,10 +2762,35 @@ def run_creatives_step(inputs: Dict[str, Any]) -> Dict[str, Any]:
                 "debug": {"note": "stub", "lineage": lineage}
             }
         
-        backend_response = backend_post_json(
-            "/aicmo/generate",
-            {"brief": f"Creatives for: {topic}", "use_case": "creatives"}
+        return backend_generate(
+            "creatives",
+            {"brief": f"Creatives for: {topic}", "use_case": "creatives"},
+            _finish_creatives_step,
+            client_id=client_id,
+            engagement_id=engagement_id,
+            topic=topic,
+            lineage=lineage,
         )
+    except Exception as e:
+        log.error(f"Creatives error: {e}")
+        return {
+            "status": "FAILED",
+            "content": str(e),
+            "meta": {"tab": "creatives"},
+            "debug": {"traceback": traceback.format_exc()}
+        }
+
+
+def _finish_creatives_step(
+    backend_response: Dict[str, Any],
+    client_id: str,
+    engagement_id: str,
+    topic: str,
+    lineage: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Turn the creatives /aicmo/generate response into a Creatives artifact"""
+    try:
+        from aicmo.ui.persistence.artifact_store import ArtifactType, Artifact
         
         is_valid, error_msg = validate_backend_response(backend_response)
         if not is_valid:
@@ -2631,6 +2805,7 @@ def run_creatives_step(inputs: Dict[str, Any]) -> Dict[str, Any]:
         draft_md = backend_envelope_to_markdown(backend_response)
         
         # Create Creatives artifact with lineage
+        artifact_store = get_artifact_store()
         strategy_artifact = Artifact.from_dict(st.session_state["artifact_strategy"])
         creatives_artifact = artifact_store.create_artifact(
             artifact_type=ArtifactType.CREATIVES,
@@ -2751,12 +2926,41 @@ def run_execution_step(inputs: Dict[str, Any]) -> Dict[str, Any]:
                 "debug": {"note": "stub", "lineage": lineage, "required_types": [t.value for t in required_types]}
             }
         
-        backend_response = backend_post_json("/aicmo/generate", {"campaign_id": campaign_id, "use_case": "execution"})
+        return backend_generate(
+            "execution",
+            {"campaign_id": campaign_id, "use_case": "execution"},
+            _finish_execution_step,
+            client_id=client_id,
+            engagement_id=engagement_id,
+            campaign_id=campaign_id,
+            selected_job_ids=selected_job_ids,
+            lineage=lineage,
+            required_types=[t.value for t in required_types],
+        )
+    except Exception as e:
+        log.error(f"Execution error: {e}")
+        return {"status": "FAILED", "content": str(e), "meta": {"tab": "execution"}, "debug": {"traceback": traceback.format_exc()}}
+
+
+def _finish_execution_step(
+    backend_response: Dict[str, Any],
+    client_id: str,
+    engagement_id: str,
+    campaign_id: str,
+    selected_job_ids: List[str],
+    lineage: Dict[str, Any],
+    required_types: List[str],
+) -> Dict[str, Any]:
+    """Turn the execution /aicmo/generate response into an Execution artifact"""
+    try:
+        from aicmo.ui.persistence.artifact_store import ArtifactType, Artifact
+        
         is_valid, error_msg = validate_backend_response(backend_response)
         if not is_valid:
             return {"status": "FAILED", "content": error_msg, "meta": {"tab": "execution", "trace_id": backend_response.get("trace_id")}, "debug": {"raw_response": backend_response}}
         
         draft_md = backend_envelope_to_markdown(backend_response)
+        artifact_store = get_artifact_store()
         
         # Build source_artifacts from lineage
         source_artifacts = []
@@ -2788,7 +2992,7 @@ def run_execution_step(inputs: Dict[str, Any]) -> Dict[str, Any]:
                 "run_id": backend_response.get("run_id"),
                 "artifact_id": execution_artifact.artifact_id
             },
-            "debug": {"raw_envelope": backend_response, "lineage": lineage, "required_types": [t.value for t in required_types]}
+            "debug": {"raw_envelope": backend_response, "lineage": lineage, "required_types": required_types}
         }
     except Exception as e:
         log.error(f"Execution error: {e}")
@@ -2831,7 +3035,20 @@ def run_monitoring_step(inputs: Dict[str, Any]) -> Dict[str, Any]:
             log.info("[MONITORING] Using dev stub")
             return {"status": "SUCCESS", "content": f"# Performance Report: {campaign_id}\n\n[Stub Mode]\n\n## Notes\n- Edit above", "meta": {"campaign_id": campaign_id}, "debug": {"note": "stub"}}
         
-        backend_response = backend_post_json("/aicmo/generate", {"campaign_id": campaign_id, "use_case": "monitoring"})
+        return backend_generate(
+            "monitoring",
+            {"campaign_id": campaign_id, "use_case": "monitoring"},
+            _finish_monitoring_step,
+            campaign_id=campaign_id,
+        )
+    except Exception as e:
+        log.error(f"Monitoring error: {e}")
+        return {"status": "FAILED", "content": str(e), "meta": {"tab": "monitoring"}, "debug": {"traceback": traceback.format_exc()}}
+
+
+def _finish_monitoring_step(backend_response: Dict[str, Any], campaign_id: str) -> Dict[str, Any]:
+    """Render the monitoring /aicmo/generate response"""
+    try:
         is_valid, error_msg = validate_backend_response(backend_response)
         if not is_valid:
             return {"status": "FAILED", "content": error_msg, "meta": {"tab": "monitoring", "trace_id": backend_response.get("trace_id")}, "debug": {"raw_response": backend_response}}
@@ -2861,7 +3078,15 @@ def run_leadgen_step(inputs: Dict[str, Any]) -> Dict[str, Any]:
             log.info("[LEADGEN] Using dev stub")
             return {"status": "SUCCESS", "content": {"total_leads": 5, "leads": []}, "meta": {"count": 5}, "debug": {}}
         
-        backend_response = backend_post_json("/aicmo/generate", {"filters": filters, "use_case": "leadgen"})
+        return backend_generate("leadgen", {"filters": filters, "use_case": "leadgen"}, _finish_leadgen_step)
+    except Exception as e:
+        log.error(f"Leadgen error: {e}")
+        return {"status": "FAILED", "content": str(e), "meta": {"tab": "leadgen"}, "debug": {}}
+
+
+def _finish_leadgen_step(backend_response: Dict[str, Any]) -> Dict[str, Any]:
+    """Render the leadgen /aicmo/generate response"""
+    try:
         is_valid, error_msg = validate_backend_response(backend_response)
         if not is_valid:
             return {"status": "FAILED", "content": error_msg, "meta": {"tab": "leadgen"}, "debug": {}}
@@ -2883,7 +3108,15 @@ def run_campaigns_full_pipeline(inputs: Dict[str, Any]) -> Dict[str, Any]:
             log.info("[CAMPAIGNS] Using dev stub")
             return {"status": "SUCCESS", "content": {"campaign_id": "test_123", "campaign_name": campaign_name}, "meta": {"status": "executed"}, "debug": {}}
         
-        backend_response = backend_post_json("/aicmo/generate", {"brief": f"Campaign: {campaign_name}", "objectives": inputs.get("objectives", []), "platforms": inputs.get("platforms", [])})
+        return backend_generate("campaigns", {"brief": f"Campaign: {campaign_name}", "objectives": inputs.get("objectives", []), "platforms": inputs.get("platforms", [])}, _finish_campaigns_step, campaign_name=campaign_name)
+    except Exception as e:
+        log.error(f"Campaigns error: {e}")
+        return {"status": "FAILED", "content": str(e), "meta": {"tab": "campaigns"}, "debug": {}}
+
+
+def _finish_campaigns_step(backend_response: Dict[str, Any], campaign_name: str) -> Dict[str, Any]:
+    """Render the campaigns /aicmo/generate response"""
+    try:
         is_valid, error_msg = validate_backend_response(backend_response)
         if not is_valid:
             return {"status": "FAILED", "content": error_msg, "meta": {"tab": "campaigns"}, "debug": {}}
@@ -2903,7 +3136,15 @@ def run_autonomy_step(inputs: Dict[str, Any]) -> Dict[str, Any]:
             log.info("[AUTONOMY] Using dev stub")
             return {"status": "SUCCESS", "content": f"Autonomy: {autonomy_level}", "meta": {"autonomy_level": autonomy_level}, "debug": {}}
         
-        backend_response = backend_post_json("/aicmo/generate", {"autonomy_level": autonomy_level, "use_case": "autonomy"})
+        return backend_generate("autonomy", {"autonomy_level": autonomy_level, "use_case": "autonomy"}, _finish_autonomy_step, autonomy_level=autonomy_level)
+    except Exception as e:
+        log.error(f"Autonomy error: {e}")
+        return {"status": "FAILED", "content": str(e), "meta": {"tab": "autonomy"}, "debug": {}}
+
+
+def _finish_autonomy_step(backend_response: Dict[str, Any], autonomy_level: str) -> Dict[str, Any]:
+    """Confirm the autonomy /aicmo/generate response"""
+    try:
         is_valid, error_msg = validate_backend_response(backend_response)
         if not is_valid:
             return {"status": "FAILED", "content": error_msg, "meta": {"tab": "autonomy"}, "debug": {}}
@@ -2949,7 +3190,15 @@ def run_delivery_step(inputs: Dict[str, Any]) -> Dict[str, Any]:
             log.info("[DELIVERY] Using dev stub")
             return {"status": "SUCCESS", "content": f"Report: {report_type}.pdf", "meta": {"type": report_type}, "debug": {}}
         
-        backend_response = backend_post_json("/aicmo/generate", {"report_type": report_type, "campaign_id": campaign_id, "use_case": "delivery"})
+        return backend_generate("delivery", {"report_type": report_type, "campaign_id": campaign_id, "use_case": "delivery"}, _finish_delivery_step, report_type=report_type)
+    except Exception as e:
+        log.error(f"Delivery error: {e}")
+        return {"status": "FAILED", "content": str(e), "meta": {"tab": "delivery"}, "debug": {}}
+
+
+def _finish_delivery_step(backend_response: Dict[str, Any], report_type: str) -> Dict[str, Any]:
+    """Confirm the delivery /aicmo/generate response"""
+    try:
         is_valid, error_msg = validate_backend_response(backend_response)
         if not is_valid:
             return {"status": "FAILED", "content": error_msg, "meta": {"tab": "delivery"}, "debug": {}}
@@ -2971,7 +3220,15 @@ def run_learn_step(inputs: Dict[str, Any]) -> Dict[str, Any]:
             log.info("[LEARN] Using dev stub")
             return {"status": "SUCCESS", "content": {"query": query, "results": 3}, "meta": {"query": query}, "debug": {}}
         
-        backend_response = backend_post_json("/aicmo/generate", {"query": query, "use_case": "learn"})
+        return backend_generate("learn", {"query": query, "use_case": "learn"}, _finish_learn_step, query=query)
+    except Exception as e:
+        log.error(f"Learn error: {e}")
+        return {"status": "FAILED", "content": str(e), "meta": {"tab": "learn"}, "debug": {}}
+
+
+def _finish_learn_step(backend_response: Dict[str, Any], query: str) -> Dict[str, Any]:
+    """Render the learn /aicmo/generate response"""
+    try:
         is_valid, error_msg = validate_backend_response(backend_response)
         if not is_valid:
             return {"status": "FAILED", "content": error_msg, "meta": {"tab": "learn"}, "debug": {}}
@@ -7062,6 +7319,13 @@ def render_system_diag_tab():
     st.write("")
     st.divider()
     
+    # ===== 7. REQUEST TRACES =====
+    st.subheader("7️⃣ Request Traces")
+    render_request_traces()
+    
+    st.write("")
+    st.divider()
+    
     # ===== QUICK ACTIONS =====
     st.subheader("Quick Actions")
     
@@ -7104,6 +7368,98 @@ def render_system_diag_tab():
             st.rerun()
 
 
+def render_request_traces():
+    """
+    Recently kept backend traces (GET /traces) with a flame view of one trace.
+    
+    Bars are positioned by start offset and sized by duration relative to the
+    root span; one row per nesting level of the span tree.
+    """
+    backend_url = get_backend_base_url()
+    if not backend_url:
+        st.info("BACKEND_URL not configured - traces not available.")
+        return
+    client = get_backend_client(backend_url)
+    
+    source = st.radio("Source", ["memory", "file"], horizontal=True, key="traces_source")
+    ok, data, error = client.get_json("/traces", params={"limit": 50, "source": source})
+    if not ok:
+        st.warning(f"Could not load traces: {error}")
+        return
+    traces = data.get("traces", [])
+    
+    if not traces:
+        st.info("No traces kept yet (slow and failed requests are always kept).")
+        return
+    
+    st.dataframe(
+        pd.DataFrame([
+            {
+                "Trace": t["trace_id"],
+                "Name": t["name"],
+                "Duration (ms)": t["duration_ms"],
+                "Spans": t["span_count"],
+                "Error": "✗" if t["error"] else "",
+                "Pack": t["attributes"].get("pack_key", ""),
+            }
+            for t in traces
+        ]),
+        use_container_width=True,
+        hide_index=True,
+    )
+    
+    trace_id = st.selectbox(
+        "Trace",
+        [t["trace_id"] for t in traces],
+        format_func=lambda tid: next(
+            f"{t['name']} ({t['duration_ms']:.0f} ms)" for t in traces if t["trace_id"] == tid
+        ),
+        key="traces_selected",
+    )
+    ok, data, error = client.get_json(f"/traces/{trace_id}")
+    if not ok:
+        st.warning(f"Could not load trace {trace_id}: {error}")
+        return
+    rows = data.get("flame", [])
+    if not rows:
+        return
+    
+    total_ms = max(r["offset_ms"] + r["duration_ms"] for r in rows) or 1.0
+    bars = []
+    for r in rows:
+        left = 100.0 * r["offset_ms"] / total_ms
+        width = max(0.3, 100.0 * r["duration_ms"] / total_ms)
+        color = "#e45756" if r["error"] else "#f58518" if r["name"] == "db.query" else "#4c78a8"
+        label = f"{r['name']} {r['duration_ms']:.1f}ms"
+        bars.append(
+            f'<div title="{html.escape(label)}" style="position:absolute;top:{r["depth"] * 22}px;'
+            f'left:{left:.3f}%;width:{width:.3f}%;height:20px;background:{color};color:#fff;'
+            f'font-size:11px;overflow:hidden;white-space:nowrap;border-right:1px solid #fff;">'
+            f'{html.escape(label)}</div>'
+        )
+    depth = max(r["depth"] for r in rows) + 1
+    st.markdown(
+        f'<div style="position:relative;height:{depth * 22}px;width:100%;">{"".join(bars)}</div>',
+        unsafe_allow_html=True,
+    )
+    
+    with st.expander("Spans"):
+        st.dataframe(
+            pd.DataFrame([
+                {
+                    "Span": f"{'  ' * r['depth']}{r['name']}",
+                    "Start (ms)": r["offset_ms"],
+                    "Duration (ms)": r["duration_ms"],
+                    "Self (ms)": r["self_ms"],
+                    "Attributes": json.dumps(r["attributes"]),
+                }
+                for r in rows
+            ]),
+            use_container_width=True,
+            hide_index=True,
+        )
+
+
 # ===================================================================
 # MAIN APPLICATION
 # ===================================================================
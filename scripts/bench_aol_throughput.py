@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""
+AOL throughput benchmark: claiming + concurrent dispatch vs. serial dispatch.
+
+Enqueues N POST_SOCIAL-shaped actions whose handler sleeps for a fixed I/O
+latency (standing in for a network call), then drains the queue with one or
+more AOLDaemon instances and reports actions/second.
+
+Usage:
+    python scripts/bench_aol_throughput.py --actions 200 --latency-ms 100
+    python scripts/bench_aol_throughput.py --daemons 2 --concurrency 8 --batch 16
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+workspace_root = Path(__file__).parent.parent
+sys.path.insert(0, str(workspace_root))
+
+from sqlalchemy import create_engine, func, select  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from aicmo.orchestration.daemon import AOLDaemon  # noqa: E402
+from aicmo.orchestration.handlers import register_action_handler  # noqa: E402
+from aicmo.orchestration.models import AOLAction, AOLControlFlags, Base  # noqa: E402
+from aicmo.orchestration.queue import ActionQueue  # noqa: E402
+
+BENCH_ACTION = "BENCH_POST_SOCIAL"
+
+
+def _install_handler(latency_s: float) -> None:
+    @register_action_handler(BENCH_ACTION)
+    def _bench_handler(session, action_id, payload, proof_mode=False):
+        time.sleep(latency_s)
+        ActionQueue.mark_success(session, action_id)
+
+
+def _drain(db_url: str, actions: int, daemons: int, concurrency: int, batch: int) -> float:
+    engine = create_engine(db_url, future=True)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(AOLControlFlags(proof_mode=True))
+    session.commit()
+    for i in range(actions):
+        ActionQueue.enqueue_action(session, BENCH_ACTION, {"n": i})
+
+    def remaining() -> int:
+        return session.execute(
+            select(func.count()).select_from(AOLAction).where(AOLAction.status != "SUCCESS")
+        ).scalar_one()
+
+    workers = [
+        AOLDaemon(db_url, worker_concurrency=concurrency, max_actions_per_tick=batch, exclusive=False)
+        for _ in range(daemons)
+    ]
+    started = time.perf_counter()
+    threads = []
+    for daemon in workers:
+        daemon.IDLE_WAIT_SECONDS = 0.05
+        t = threading.Thread(target=daemon.run, daemon=True)
+        t.start()
+        threads.append(t)
+    while remaining():
+        time.sleep(0.05)
+    elapsed = time.perf_counter() - started
+    for daemon in workers:
+        daemon.running = False
+    for t in threads:
+        t.join(timeout=5)
+    session.close()
+    engine.dispose()
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark AOL action throughput")
+    parser.add_argument("--actions", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=100.0)
+    parser.add_argument("--daemons", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--batch", type=int, default=16)
+    parser.add_argument("--db-url", default=None, help="Defaults to a temporary SQLite file")
+    args = parser.parse_args()
+
+    _install_handler(args.latency_ms / 1000.0)
+    db_url = args.db_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'aol_bench.db')}"
+
+    serial = _drain(db_url, args.actions, daemons=1, concurrency=1, batch=AOLDaemon.MAX_ACTIONS_PER_TICK)
+    scaled = _drain(db_url, args.actions, args.daemons, args.concurrency, args.batch)
+
+    print(f"actions={args.actions} handler_latency={args.latency_ms:.0f}ms")
+    print(f"serial   (1 daemon x 1 worker, batch {AOLDaemon.MAX_ACTIONS_PER_TICK}): "
+          f"{serial:.2f}s  {args.actions / serial:.1f} actions/s")
+    print(f"scaled   ({args.daemons} daemon(s) x {args.concurrency} workers, batch {args.batch}): "
+          f"{scaled:.2f}s  {args.actions / scaled:.1f} actions/s")
+    print(f"speedup  {serial / scaled:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+"""
+Social calendar LLM pass benchmark: per-day requests vs. batched chunks.
+
+Uses a deterministic fake provider behind a real ProviderChain: every
+request sleeps --latency-ms (+ --per-day-ms for each day it covers) and
+answers with well-formed JSON. Reports wall-clock time and request count
+for the micro-pass run one day per request, one request at a time (the
+previous behaviour), and with --batch-days / --concurrency.
+
+Usage:
+    python scripts/bench_social_calendar.py --days 30
+    python scripts/bench_social_calendar.py --days 30 --batch-days 7 --concurrency 2
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+workspace_root = Path(__file__).parent.parent
+sys.path.insert(0, str(workspace_root))
+
+from aicmo.gateways.provider_chain import ProviderChain, ProviderWrapper  # noqa: E402
+from aicmo.generators import social_calendar_generator as calendar  # noqa: E402
+from aicmo.io.client_reports import (  # noqa: E402
+    AssetsConstraintsBrief,
+    AudienceBrief,
+    BrandBrief,
+    ClientInputBrief,
+    GoalBrief,
+    OperationsBrief,
+    ProductServiceBrief,
+    StrategyExtrasBrief,
+    VoiceBrief,
+)
+from aicmo.shared.config import settings  # noqa: E402
+
+_BATCH_DAY = re.compile(r"^- Day (\d+):", re.M)
+
+
+class FakeLLMAdapter:
+    """Deterministic stand-in for an LLM adapter's generate()."""
+
+    dry_run = False
+
+    def __init__(self, latency_ms: float, per_day_ms: float):
+        self.latency = latency_ms / 1000
+        self.per_day = per_day_ms / 1000
+        self.requests = 0
+
+    async def generate(self, prompt: str) -> str:
+        self.requests += 1
+        days = [int(d) for d in _BATCH_DAY.findall(prompt)]
+        await asyncio.sleep(self.latency + self.per_day * max(len(days), 1))
+        return json.dumps({"days": [
+            {"day": d, "hook": f"Hook for day {d}", "cta": "Learn more"} for d in days
+        ]})
+
+
+def _make_chain(adapter: FakeLLMAdapter) -> ProviderChain:
+    return ProviderChain(
+        capability_name="llm",
+        providers=[ProviderWrapper(provider=adapter, provider_name="fake/bench")],
+    )
+
+
+def _brief() -> ClientInputBrief:
+    return ClientInputBrief(
+        brand=BrandBrief(
+            brand_name="Bench Roasters",
+            industry="Coffee",
+            product_service="Specialty coffee",
+            primary_goal="Grow weekday footfall",
+            primary_customer="Remote workers",
+        ),
+        audience=AudienceBrief(primary_customer="Remote workers"),
+        goal=GoalBrief(primary_goal="Grow weekday footfall"),
+        voice=VoiceBrief(),
+        product_service=ProductServiceBrief(),
+        assets_constraints=AssetsConstraintsBrief(focus_platforms=["Instagram", "LinkedIn"]),
+        operations=OperationsBrief(),
+        strategy_extras=StrategyExtrasBrief(),
+    )
+
+
+def _run(brief, days, adapter, batch_days, concurrency):
+    settings.LLM_CALENDAR_BATCH_DAYS = batch_days
+    settings.LLM_MAX_CONCURRENCY = concurrency
+    return calendar._generate_social_calendar_with_llm_micro_passes(
+        brief, date.today(), days, calendar._get_themes(days), ["Instagram", "LinkedIn"],
+        chain=_make_chain(adapter),
+    )
+
+
+def _time(label, brief, days, adapter, batch_days, concurrency) -> float:
+    started = time.perf_counter()
+    result = _run(brief, days, adapter, batch_days, concurrency)
+    elapsed = time.perf_counter() - started
+    filled = sum(1 for r in result if r)
+    print(f"{label:<12} {elapsed * 1000:9.1f} ms   requests={adapter.requests:<4} days={filled}")
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark social calendar LLM passes")
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--latency-ms", type=float, default=200.0, help="Fixed cost per request")
+    parser.add_argument("--per-day-ms", type=float, default=15.0, help="Generation cost per day covered")
+    parser.add_argument("--batch-days", type=int, default=settings.LLM_CALENDAR_BATCH_DAYS)
+    parser.add_argument("--concurrency", type=int, default=settings.LLM_MAX_CONCURRENCY)
+    args = parser.parse_args()
+
+    brief = _brief()
+    print(
+        f"days={args.days} latency={args.latency_ms:.0f}ms+{args.per_day_ms:.0f}ms/day "
+        f"batch_days={args.batch_days} concurrency={args.concurrency}"
+    )
+
+    old = _time("per-day", brief, args.days, FakeLLMAdapter(args.latency_ms, args.per_day_ms), 1, 1)
+    new = _time(
+        "batched", brief, args.days, FakeLLMAdapter(args.latency_ms, args.per_day_ms),
+        args.batch_days, args.concurrency,
+    )
+    print(f"{'speedup':<12} {old / new:9.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+"""
+Repetition-pass benchmark: remove_excessive_repetition vs. the previous
+per-phrase regex + string-splicing implementation, plus the repetition
+heuristics that share backend.utils.ngram_index.
+
+Builds a calendar-like document of N words from combinatorial sentence
+parts (so hundreds of distinct 4-5 word phrases repeat) and times each
+function.
+
+Usage:
+    python scripts/bench_text_cleanup.py --words 50000
+    python scripts/bench_text_cleanup.py --words 50000 --skip-legacy
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+workspace_root = Path(__file__).parent.parent
+sys.path.insert(0, str(workspace_root))
+
+from backend.genericity_scoring import repetition_score  # noqa: E402
+from backend.utils.text_cleanup import remove_excessive_repetition  # noqa: E402
+from backend.validators.benchmark_validator import _repetition_ratio  # noqa: E402
+
+OPENERS = ["Share", "Post", "Publish", "Feature", "Highlight", "Announce", "Celebrate", "Spotlight"]
+SUBJECTS = [
+    "a behind the scenes look at", "a customer story about", "a quick tip on",
+    "a short reel showing", "a carousel explaining", "a poll asking about",
+    "an honest review of", "a founder note on", "a limited offer for",
+    "a team interview about",
+]
+TOPICS = [
+    "our roasting process", "the seasonal menu", "brewing better coffee at home",
+    "sustainable sourcing", "the weekend tasting event", "fresh pastries",
+    "loyalty rewards", "our new cold brew", "the neighbourhood we serve",
+    "latte art basics", "single origin beans", "holiday gift boxes",
+]
+CTAS = [
+    "Tap the link in bio to learn more.", "Visit us this weekend in {city}.",
+    "Order ahead on the app today.", "Tell us your favourite in the comments.",
+]
+CITIES = ["Austin", "Denver", "Portland", "Leeds", "Pune"]
+
+
+def _legacy_remove_excessive_repetition(text: str, max_repeats: int = 2) -> str:
+    """Previous implementation, kept here for comparison only."""
+    phrases = re.findall(r"\b(\w+\s+\w+\s+\w+\s+\w+(?:\s+\w+)?)\b", text.lower())
+    phrase_counts = Counter(phrases)
+    excessive = {phrase: count for phrase, count in phrase_counts.items() if count > max_repeats}
+    if not excessive:
+        return text
+    for phrase in excessive:
+        pattern = re.compile(re.escape(phrase), re.IGNORECASE)
+        matches = list(pattern.finditer(text))
+        if len(matches) <= max_repeats:
+            continue
+        for match in matches[max_repeats:]:
+            start, end = match.span()
+            text = text[:start] + text[end:]
+    text = re.sub(r"\s{2,}", " ", text)
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    return text.strip()
+
+
+def build_document(words: int, seed: int = 7) -> str:
+    """Calendar-like text: ~1000 distinct sentences, each recurring many times."""
+    rng = random.Random(seed)
+    lines, count, day = [], 0, 1
+    while count < words:
+        line = (
+            f"Day {day}: {rng.choice(OPENERS)} {rng.choice(SUBJECTS)} {rng.choice(TOPICS)}. "
+            + rng.choice(CTAS).format(city=rng.choice(CITIES))
+        )
+        lines.append(line)
+        count += len(line.split())
+        day += 1
+    return "\n".join(lines)
+
+
+def _time(label: str, func, *args) -> float:
+    started = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - started
+    summary = f"{len(result)} chars" if isinstance(result, str) else f"{result:.3f}"
+    print(f"{label:<34} {elapsed * 1000:9.1f} ms   -> {summary}")
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the text repetition passes")
+    parser.add_argument("--words", type=int, default=50000)
+    parser.add_argument("--skip-legacy", action="store_true", help="Skip the old implementation")
+    args = parser.parse_args()
+
+    text = build_document(args.words)
+    print(f"words={len(text.split())} chars={len(text)}")
+
+    new = _time("remove_excessive_repetition", remove_excessive_repetition, text)
+    if not args.skip_legacy:
+        old = _time("legacy remove_excessive_repetition", _legacy_remove_excessive_repetition, text)
+        print(f"{'speedup':<34} {old / new:9.1f}x")
+    _time("repetition_score", repetition_score, text)
+    _time("_repetition_ratio", _repetition_ratio, text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
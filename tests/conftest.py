@@ -29,6 +29,16 @@ from aicmo.venture import distribution_models as _venture_dist  # noqa: F401
 pytest_plugins = ["aicmo.shared.testing"]
 
 
+@pytest.fixture(scope="session", autouse=True)
+def trace_file_in_tmp(tmp_path_factory):
+    """Export traces of requests made by the tests under a temp dir, not ~/.cache."""
+    from aicmo.shared.config import settings
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(settings, "TRACE_FILE_PATH", str(tmp_path_factory.mktemp("traces") / "traces.jsonl"))
+        yield
+
+
 @pytest.fixture(scope="session")
 def test_db_engine():
     """Create in-memory SQLite database for testing with transaction support."""
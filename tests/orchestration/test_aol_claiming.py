@@ -0,0 +1,309 @@
+"""Tests for atomic claiming, handler registry and concurrent AOL dispatch."""
+
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from aicmo.orchestration.daemon import AOLDaemon
+from aicmo.orchestration.handlers import ACTION_HANDLERS, register_action_handler
+from aicmo.orchestration.models import AOLAction, AOLControlFlags, AOLExecutionLog, Base
+from aicmo.orchestration.notify import EnqueueWaiter
+from aicmo.orchestration.queue import ActionQueue
+
+
+@pytest.fixture
+def db_url():
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        db_path = f.name
+    url = f"sqlite:///{db_path}"
+    engine = create_engine(url, future=True)
+    Base.metadata.create_all(engine)
+    engine.dispose()
+    yield url
+    if os.path.exists(db_path):
+        os.unlink(db_path)
+
+
+@pytest.fixture
+def session_maker(db_url):
+    engine = create_engine(db_url, future=True)
+    yield sessionmaker(bind=engine, expire_on_commit=False)
+    engine.dispose()
+
+
+@pytest.fixture
+def custom_handler():
+    """Register a temporary handler and remove it afterwards."""
+    registered = []
+
+    def _register(action_type, func):
+        register_action_handler(action_type)(func)
+        registered.append(action_type)
+
+    yield _register
+    for action_type in registered:
+        ACTION_HANDLERS.pop(action_type, None)
+
+
+class TestClaimNext:
+    def test_claim_transitions_to_running(self, session_maker):
+        session = session_maker()
+        for i in range(3):
+            ActionQueue.enqueue_action(session, "POST_SOCIAL", {"n": i})
+
+        claimed = ActionQueue.claim_next(session, "worker-a", max_actions=2)
+        assert [a.status for a in claimed] == ["RUNNING", "RUNNING"]
+        assert {a.claimed_by for a in claimed} == {"worker-a"}
+        assert all(a.claim_expires_utc > datetime.utcnow() for a in claimed)
+
+        # Only the unclaimed row is left for the next worker
+        second = ActionQueue.claim_next(session, "worker-b", max_actions=5)
+        assert len(second) == 1
+        assert ActionQueue.claim_next(session, "worker-c", max_actions=5) == []
+        session.close()
+
+    def test_expired_claim_is_reclaimed(self, session_maker):
+        session = session_maker()
+        action = ActionQueue.enqueue_action(session, "POST_SOCIAL", {})
+        ActionQueue.claim_next(session, "crashed-worker", max_actions=1)
+
+        row = session.get(AOLAction, action.id)
+        row.claim_expires_utc = datetime.utcnow() - timedelta(seconds=1)
+        session.commit()
+
+        reclaimed = ActionQueue.claim_next(session, "live-worker", max_actions=1)
+        assert [a.id for a in reclaimed] == [action.id]
+        assert reclaimed[0].claimed_by == "live-worker"
+        session.close()
+
+    def test_retry_claimable_after_delay(self, session_maker):
+        session = session_maker()
+        action = ActionQueue.enqueue_action(session, "POST_SOCIAL", {})
+        ActionQueue.claim_next(session, "w", max_actions=1)
+        ActionQueue.mark_retry(session, action.id, "boom")
+
+        # Retry delay not reached yet
+        assert ActionQueue.claim_next(session, "w", max_actions=1) == []
+
+        row = session.get(AOLAction, action.id)
+        assert row.claimed_by is None
+        row.not_before_utc = datetime.utcnow() - timedelta(seconds=1)
+        session.commit()
+        assert [a.id for a in ActionQueue.claim_next(session, "w", max_actions=1)] == [action.id]
+        session.close()
+
+    def test_concurrent_claimers_never_overlap(self, session_maker):
+        session = session_maker()
+        for i in range(60):
+            ActionQueue.enqueue_action(session, "POST_SOCIAL", {"n": i})
+        session.close()
+
+        results = {}
+
+        def claimer(name):
+            s = session_maker()
+            mine = []
+            while True:
+                batch = ActionQueue.claim_next(s, name, max_actions=4)
+                if not batch:
+                    break
+                mine.extend(a.id for a in batch)
+            results[name] = mine
+            s.close()
+
+        threads = [threading.Thread(target=claimer, args=(f"w{i}",)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        all_ids = [i for ids in results.values() for i in ids]
+        assert len(all_ids) == 60
+        assert len(set(all_ids)) == 60
+
+    def test_mark_success_releases_claim_and_logs_notes(self, session_maker):
+        session = session_maker()
+        action = ActionQueue.enqueue_action(session, "POST_SOCIAL", {})
+        ActionQueue.claim_next(session, "w", max_actions=1)
+        ActionQueue.mark_success(session, action.id, "3 tasks updated")
+
+        row = session.get(AOLAction, action.id)
+        assert row.status == "SUCCESS"
+        assert row.claimed_by is None and row.claim_expires_utc is None
+        logs = session.execute(
+            select(AOLExecutionLog).where(AOLExecutionLog.action_id == action.id)
+        ).scalars().all()
+        assert [log.message for log in logs] == ["3 tasks updated"]
+        session.close()
+
+
+class TestDaemonDispatch:
+    def test_registered_handler_dispatch(self, db_url, session_maker, custom_handler):
+        seen = []
+
+        def handler(session, action_id, payload, proof_mode=False):
+            seen.append((payload["value"], proof_mode))
+            ActionQueue.mark_success(session, action_id)
+
+        custom_handler("TEST_ECHO", handler)
+        session = session_maker()
+        session.add(AOLControlFlags(proof_mode=True))
+        session.commit()
+        action = ActionQueue.enqueue_action(session, "TEST_ECHO", {"value": 7})
+
+        assert AOLDaemon(db_url).run(max_ticks=1) == 0
+        assert seen == [(7, True)]
+        session.expire_all()
+        assert session.get(AOLAction, action.id).status == "SUCCESS"
+        session.close()
+
+    def test_unknown_action_type_fails(self, db_url, session_maker):
+        session = session_maker()
+        action = ActionQueue.enqueue_action(session, "NOT_A_REAL_TYPE", {})
+        AOLDaemon(db_url).run(max_ticks=1)
+        session.expire_all()
+        row = session.get(AOLAction, action.id)
+        assert row.status == "FAILED"
+        assert "Unknown action type" in row.last_error
+        session.close()
+
+    def test_handler_exception_schedules_retry(self, db_url, session_maker, custom_handler):
+        def handler(session, action_id, payload, proof_mode=False):
+            raise RuntimeError("provider down")
+
+        custom_handler("TEST_FLAKY", handler)
+        session = session_maker()
+        action = ActionQueue.enqueue_action(session, "TEST_FLAKY", {})
+        AOLDaemon(db_url).run(max_ticks=1)
+        session.expire_all()
+        row = session.get(AOLAction, action.id)
+        assert row.status == "RETRY"
+        assert row.attempts == 1
+        assert row.claimed_by is None
+        session.close()
+
+    def test_actions_run_concurrently(self, db_url, session_maker, custom_handler):
+        def slow(session, action_id, payload, proof_mode=False):
+            time.sleep(0.3)
+            ActionQueue.mark_success(session, action_id)
+
+        custom_handler("TEST_SLOW", slow)
+        session = session_maker()
+        for i in range(6):
+            ActionQueue.enqueue_action(session, "TEST_SLOW", {"n": i})
+
+        daemon = AOLDaemon(db_url, worker_concurrency=6, max_actions_per_tick=6)
+        started = time.monotonic()
+        daemon.run(max_ticks=1)
+        elapsed = time.monotonic() - started
+
+        session.expire_all()
+        statuses = session.execute(select(AOLAction.status)).scalars().all()
+        assert statuses == ["SUCCESS"] * 6
+        # Serial execution would take >= 1.8s
+        assert elapsed < 1.5
+        session.close()
+
+    def test_two_daemons_share_queue(self, db_url, session_maker, custom_handler):
+        handled = []
+        lock = threading.Lock()
+
+        def handler(session, action_id, payload, proof_mode=False):
+            with lock:
+                handled.append(action_id)
+            time.sleep(0.01)
+            ActionQueue.mark_success(session, action_id)
+
+        custom_handler("TEST_SHARED", handler)
+        session = session_maker()
+        for i in range(20):
+            ActionQueue.enqueue_action(session, "TEST_SHARED", {"n": i})
+
+        daemons = [AOLDaemon(db_url, worker_concurrency=4, max_actions_per_tick=4) for _ in range(2)]
+        threads = [threading.Thread(target=d.run, kwargs={"max_ticks": 10}) for d in daemons]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sorted(handled) == sorted(set(handled))
+        assert len(handled) == 20
+        session.close()
+
+    def test_claims_limited_to_free_worker_slots(self, db_url, session_maker, custom_handler):
+        release = threading.Event()
+
+        def blocked(session, action_id, payload, proof_mode=False):
+            release.wait(5)
+            ActionQueue.mark_success(session, action_id)
+
+        custom_handler("TEST_BLOCKED", blocked)
+        session = session_maker()
+        for i in range(3):
+            ActionQueue.enqueue_action(session, "TEST_BLOCKED", {"n": i})
+
+        daemon = AOLDaemon(db_url, worker_concurrency=1, max_actions_per_tick=4)
+        daemon.MAX_TICK_SECONDS = 0.05
+        daemon_session = daemon.session_maker()
+        try:
+            daemon._run_tick(daemon_session, 0)  # PARTIAL: the action outlives the tick
+            daemon._run_tick(daemon_session, 1)  # no free slot, nothing new claimed
+            session.expire_all()
+            statuses = sorted(session.execute(select(AOLAction.status)).scalars().all())
+            assert statuses == ["PENDING", "PENDING", "RUNNING"]
+        finally:
+            release.set()
+            daemon._shutdown_executor()
+            daemon_session.close()
+        session.close()
+
+    def test_long_action_keeps_its_claim(self, db_url, session_maker, custom_handler):
+        calls = []
+
+        def slow(session, action_id, payload, proof_mode=False):
+            calls.append(action_id)
+            time.sleep(1.0)  # several visibility timeouts
+            ActionQueue.mark_success(session, action_id)
+
+        custom_handler("TEST_LONG", slow)
+        session = session_maker()
+        action = ActionQueue.enqueue_action(session, "TEST_LONG", {})
+
+        owner = AOLDaemon(db_url, worker_concurrency=1, visibility_timeout_seconds=0.3)
+        owner.MAX_TICK_SECONDS = 0.1
+        other = AOLDaemon(db_url, worker_concurrency=1, visibility_timeout_seconds=0.3)
+        other.IDLE_WAIT_SECONDS = 0.1
+        # Same process, so give the second daemon its own identity
+        other.owner = other.lease_manager.owner = "other-host:1"
+
+        first = threading.Thread(target=owner.run, kwargs={"max_ticks": 1})
+        first.start()
+        time.sleep(0.05)  # let the owner claim the action first
+        second = threading.Thread(target=other.run, kwargs={"max_ticks": 10})
+        second.start()
+        first.join()
+        second.join()
+
+        assert calls == [action.id]
+        session.expire_all()
+        assert session.get(AOLAction, action.id).status == "SUCCESS"
+        session.close()
+
+
+def test_enqueue_wakes_waiter(session_maker):
+    session = session_maker()
+    waiter = EnqueueWaiter(session.get_bind())
+    waiter.wait(0)  # clear any pending signal
+
+    threading.Timer(0.05, lambda: ActionQueue.enqueue_action(session_maker(), "POST_SOCIAL", {})).start()
+    started = time.monotonic()
+    assert waiter.wait(5.0) is True
+    assert time.monotonic() - started < 2.0
+    waiter.close()
+    session.close()
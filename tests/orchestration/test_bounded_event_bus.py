@@ -0,0 +1,301 @@
+"""Tests for BoundedEventBus (queued dispatch, back-pressure, batching, outbox)."""
+import os
+import tempfile
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine
+
+from aicmo.orchestration.internal.event_bus import (
+    BoundedEventBus,
+    InProcessEventBus,
+    OVERFLOW_DROP_NEWEST,
+    SqlEventOutbox,
+)
+from aicmo.shared.ids import EventId
+
+
+@pytest.fixture
+def bus():
+    b = BoundedEventBus(history_size=5, queue_size=10)
+    yield b
+    b.close(timeout=2)
+
+
+@pytest.fixture
+def outbox_engine():
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        db_path = f.name
+    engine = create_engine(f"sqlite:///{db_path}", future=True)
+    yield engine
+    engine.dispose()
+    os.unlink(db_path)
+
+
+def _event(n, event_type="test.event"):
+    return EventId(f"evt_{n}"), {"event_type": event_type, "n": n}
+
+
+def test_inprocess_history_is_bounded():
+    bus = InProcessEventBus(max_history=3)
+    for i in range(10):
+        bus.publish(*_event(i))
+    assert [e[1]["n"] for e in bus.get_published_events()] == [7, 8, 9]
+
+
+def test_publish_delivers_in_order(bus):
+    received = []
+    bus.subscribe("test.event", lambda event_id, data: received.append(data["n"]))
+    for i in range(8):
+        bus.publish(*_event(i))
+    assert bus.flush(timeout=2)
+    assert received == list(range(8))
+
+
+def test_missing_event_type_rejected(bus):
+    with pytest.raises(ValueError):
+        bus.publish(EventId("evt_x"), {"payload": 1})
+
+
+def test_slow_subscriber_does_not_block_publisher_or_peers(bus):
+    release = threading.Event()
+    fast = []
+    bus.subscribe("test.event", lambda event_id, data: release.wait(5), name="slow")
+    bus.subscribe("test.event", lambda event_id, data: fast.append(data["n"]), name="fast")
+
+    started = time.monotonic()
+    for i in range(5):
+        bus.publish(*_event(i))
+    assert time.monotonic() - started < 0.5
+
+    deadline = time.monotonic() + 2
+    while len(fast) < 5 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert fast == list(range(5))
+
+    stats = {s["name"]: s for s in bus.subscriber_stats()}
+    assert stats["slow"]["lag"] >= 4
+    assert stats["fast"]["lag"] == 0
+    release.set()
+
+
+def test_full_queue_drops_oldest_and_counts(bus):
+    release = threading.Event()
+    received = []
+
+    def slow(event_id, data):
+        release.wait(5)
+        received.append(data["n"])
+
+    bus.subscribe("test.event", slow, name="slow")
+    bus.publish(*_event(0))
+    time.sleep(0.05)  # worker is now blocked on event 0
+    for i in range(1, 21):
+        bus.publish(*_event(i))
+
+    stats = bus.subscriber_stats()[0]
+    assert stats["dropped"] == 10
+    assert stats["lag"] == 10
+    release.set()
+    assert bus.flush(timeout=2)
+    assert received == [0] + list(range(11, 21))
+
+
+def test_drop_newest_policy():
+    bus = BoundedEventBus(queue_size=2, overflow=OVERFLOW_DROP_NEWEST)
+    release = threading.Event()
+    received = []
+    bus.subscribe("test.event", lambda event_id, data: (release.wait(5), received.append(data["n"])))
+    bus.publish(*_event(0))
+    time.sleep(0.05)
+    for i in range(1, 6):
+        bus.publish(*_event(i))
+    release.set()
+    assert bus.flush(timeout=2)
+    assert received == [0, 1, 2]
+    assert bus.subscriber_stats()[0]["dropped"] == 3
+    bus.close()
+
+
+def test_history_ring_buffer_and_replay(bus):
+    for i in range(12):
+        bus.publish(*_event(i))
+    bus.publish(*_event(99, event_type="other.event"))
+    assert len(bus.get_published_events()) == 5
+
+    replayed = []
+    count = bus.replay(lambda event_id, data: replayed.append(data["n"]), event_type="test.event")
+    assert count == 4
+    assert replayed == [8, 9, 10, 11]
+
+
+def test_batch_delivery(bus):
+    batches = []
+    bus.subscribe_batch("test.event", lambda events: batches.append([d["n"] for _, d in events]),
+                        max_batch=4, max_wait_seconds=0.2)
+    for i in range(10):
+        bus.publish(*_event(i))
+    assert bus.flush(timeout=2)
+    assert [n for batch in batches for n in batch] == list(range(10))
+    assert all(len(batch) <= 4 for batch in batches)
+    assert len(batches) < 10
+    assert bus.subscriber_stats()[0]["delivered"] == 10
+
+
+def test_handler_failure_is_counted_and_isolated(bus):
+    received = []
+
+    def flaky(event_id, data):
+        if data["n"] == 1:
+            raise RuntimeError("boom")
+        received.append(data["n"])
+
+    bus.subscribe("test.event", flaky)
+    for i in range(3):
+        bus.publish(*_event(i))
+    assert bus.flush(timeout=2)
+    assert received == [0, 2]
+    stats = bus.subscriber_stats()[0]
+    assert stats["failed"] == 1
+    assert stats["delivered"] == 2
+
+
+def test_outbox_marks_dispatched(outbox_engine):
+    outbox = SqlEventOutbox(outbox_engine)
+    bus = BoundedEventBus(outbox=outbox)
+    received = []
+    bus.subscribe("test.event", lambda event_id, data: received.append(data["n"]))
+    bus.publish(*_event(1))
+    bus.publish(*_event(2, event_type="unsubscribed.event"))
+    assert bus.flush(timeout=2)
+    bus.close()
+    assert received == [1]
+    assert outbox.pending() == []
+
+
+def test_outbox_replays_undelivered_events_after_restart(outbox_engine):
+    # First process "crashes" while its only subscriber is still busy
+    first = BoundedEventBus(outbox=SqlEventOutbox(outbox_engine))
+    stuck = threading.Event()
+    first.subscribe("test.event", lambda event_id, data: stuck.wait(5))
+    for i in range(3):
+        first.publish(*_event(i))
+
+    # Restart: pending rows are re-delivered to the new subscriber
+    outbox = SqlEventOutbox(outbox_engine)
+    assert len(outbox.pending()) == 3
+    second = BoundedEventBus(outbox=outbox)
+    received = []
+    second.subscribe("test.event", lambda event_id, data: received.append(event_id))
+    assert second.replay_outbox() == 3
+    assert second.flush(timeout=2)
+    second.close()
+    assert received == [EventId(f"evt_{i}") for i in range(3)]
+    assert outbox.pending() == []
+
+    stuck.set()
+    first.close(timeout=2)
+
+
+def test_failed_handler_leaves_outbox_row_for_replay(outbox_engine):
+    outbox = SqlEventOutbox(outbox_engine)
+    bus = BoundedEventBus(outbox=outbox)
+    attempts = []
+
+    def flaky(event_id, data):
+        attempts.append(event_id)
+        if len(attempts) == 1:
+            raise RuntimeError("boom")
+
+    bus.subscribe("test.event", flaky)
+    bus.publish(*_event(1))
+    assert bus.flush(timeout=2)
+    assert len(outbox.pending()) == 1
+
+    assert bus.replay_outbox() == 1
+    assert bus.flush(timeout=2)
+    bus.close()
+    assert attempts == [EventId("evt_1"), EventId("evt_1")]
+    assert outbox.pending() == []
+
+
+def test_replay_skips_in_flight_and_unsubscribed_events(outbox_engine):
+    outbox = SqlEventOutbox(outbox_engine)
+    bus = BoundedEventBus(outbox=outbox)
+    release = threading.Event()
+    received = []
+
+    def slow(event_id, data):
+        release.wait(5)
+        received.append(event_id)
+
+    bus.subscribe("test.event", slow)
+    bus.publish(*_event(1))
+    # Another process's event type: no subscriber here, stays pending
+    outbox.append(*_event(2, event_type="other.event"))
+
+    assert bus.replay_outbox() == 0
+    release.set()
+    assert bus.flush(timeout=2)
+    bus.close()
+    assert received == [EventId("evt_1")]
+    assert [event_id for _, event_id, _ in outbox.pending()] == [EventId("evt_2")]
+
+
+def test_periodic_replay_redelivers_pending_events(outbox_engine):
+    outbox = SqlEventOutbox(outbox_engine)
+    outbox.append(*_event(1))  # left behind by a crashed process
+
+    bus = BoundedEventBus(outbox=outbox)
+    received = []
+    bus.subscribe("test.event", lambda event_id, data: received.append(event_id))
+    bus.start_outbox_replay(interval_seconds=0.05, initial_delay_seconds=0.01)
+
+    deadline = time.monotonic() + 2
+    while outbox.pending() and time.monotonic() < deadline:
+        time.sleep(0.02)
+    bus.close()
+    assert received == [EventId("evt_1")]
+    assert outbox.pending() == []
+    assert bus.stats()["outbox"]["replayed"] == 1
+
+
+def test_event_bus_stats_endpoint(outbox_engine):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from backend.routers.health import router
+
+    outbox = SqlEventOutbox(outbox_engine)
+    bus = BoundedEventBus(outbox=outbox)
+    bus.subscribe("test.event", lambda event_id, data: None, name="audit")
+    bus.publish(*_event(1))
+    assert bus.flush(timeout=2)
+
+    app = FastAPI()
+    app.include_router(router)
+    response = TestClient(app).get("/health/event_bus")
+    bus.close()
+
+    assert response.status_code == 200
+    [entry] = [b for b in response.json()["buses"] if b["outbox"] is not None]
+    assert entry["subscribers"][0]["name"] == "audit"
+    assert entry["subscribers"][0]["delivered"] == 1
+    assert entry["outbox"]["pending"] == 0
+
+
+def test_create_event_bus_uses_the_shared_engine(monkeypatch, tmp_path):
+    from aicmo.orchestration.internal.event_bus import create_event_bus
+    from aicmo.shared.config import settings
+    from aicmo.shared.db import get_engine
+
+    url = f"sqlite:///{tmp_path / 'outbox.db'}"
+    monkeypatch.setattr(settings, "EVENT_BUS_MODE", "bounded")
+    monkeypatch.setattr(settings, "EVENT_BUS_OUTBOX_URL", url)
+    monkeypatch.setattr(settings, "EVENT_BUS_REPLAY_INTERVAL_SECONDS", 0)
+
+    bus = create_event_bus()
+    bus.close()
+
+    assert bus.outbox.engine is get_engine(url)
@@ -0,0 +1,256 @@
+"""Tests for the asynchronous job runner and /jobs API."""
+
+import os
+import tempfile
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from aicmo.orchestration.jobs import (
+    JobRunner,
+    JobStore,
+    LatencyHistogram,
+    UnknownJobKind,
+)
+from aicmo.orchestration.models import AOLJob
+
+
+@pytest.fixture
+def engine():
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        db_path = f.name
+    eng = create_engine(
+        f"sqlite:///{db_path}", connect_args={"check_same_thread": False}, future=True
+    )
+    yield eng
+    eng.dispose()
+    if os.path.exists(db_path):
+        os.unlink(db_path)
+
+
+def _wait_for(runner, job_id, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = runner.get(job_id)
+        if job["status"] in ("SUCCEEDED", "FAILED"):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} did not finish: {runner.get(job_id)}")
+
+
+class TestJobRunner:
+    def test_submit_returns_immediately_and_persists_result(self, engine):
+        release = threading.Event()
+
+        def slow(payload, ctx):
+            ctx.report_progress(0.5, "half way")
+            release.wait(5)
+            return {"echo": payload["value"]}
+
+        runner = JobRunner(engine, max_workers=2, handlers={"slow": slow})
+        try:
+            job_id = runner.submit("slow", {"value": 42}, tenant_id="t1")
+            assert runner.get(job_id)["status"] in ("QUEUED", "RUNNING")
+
+            release.set()
+            job = _wait_for(runner, job_id)
+            assert job["status"] == "SUCCEEDED"
+            assert job["progress"] == 1.0
+            assert job["result"] == {"echo": 42}
+        finally:
+            runner.shutdown()
+
+    def test_failed_handler_marks_job_failed(self, engine):
+        def boom(payload, ctx):
+            raise RuntimeError("renderer exploded")
+
+        runner = JobRunner(engine, handlers={"boom": boom})
+        try:
+            job = _wait_for(runner, runner.submit("boom", {}))
+            assert job["status"] == "FAILED"
+            assert "renderer exploded" in job["error"]
+            assert runner.stats()["outcomes"]["boom"] == {"failed": 1}
+        finally:
+            runner.shutdown()
+
+    def test_unknown_kind_rejected(self, engine):
+        runner = JobRunner(engine, handlers={})
+        try:
+            with pytest.raises(UnknownJobKind):
+                runner.submit("nope", {})
+        finally:
+            runner.shutdown()
+
+    def test_per_tenant_concurrency_limit(self, engine):
+        lock = threading.Lock()
+        active = {"t1": 0, "t2": 0}
+        peak = {"t1": 0, "t2": 0}
+
+        def work(payload, ctx):
+            tenant = payload["tenant"]
+            with lock:
+                active[tenant] += 1
+                peak[tenant] = max(peak[tenant], active[tenant])
+            time.sleep(0.05)
+            with lock:
+                active[tenant] -= 1
+            return {}
+
+        runner = JobRunner(engine, max_workers=4, per_tenant_limit=1, handlers={"work": work})
+        try:
+            ids = [runner.submit("work", {"tenant": "t1"}, tenant_id="t1") for _ in range(3)]
+            ids += [runner.submit("work", {"tenant": "t2"}, tenant_id="t2") for _ in range(3)]
+            for job_id in ids:
+                assert _wait_for(runner, job_id)["status"] == "SUCCEEDED"
+        finally:
+            runner.shutdown()
+
+        assert peak == {"t1": 1, "t2": 1}
+
+    def test_interrupted_jobs_recovered_on_startup(self, engine):
+        AOLJob.__table__.create(engine, checkfirst=True)
+        session = sessionmaker(bind=engine, expire_on_commit=False)()
+        job = JobStore.create_job(session, "work", {"n": 1}, tenant_id="t1")
+        # Claimed by a runner that died: its lease has already expired
+        assert JobStore.claim(session, job.id, "dead-runner", lease_seconds=-1)
+        session.close()
+
+        runner = JobRunner(engine, handlers={"work": lambda payload, ctx: {"n": payload["n"]}})
+        try:
+            recovered = _wait_for(runner, job.id)
+            assert recovered["status"] == "SUCCEEDED"
+            assert recovered["result"] == {"n": 1}
+        finally:
+            runner.shutdown()
+
+    def test_jobs_with_live_lease_are_not_recovered(self, engine):
+        AOLJob.__table__.create(engine, checkfirst=True)
+        session = sessionmaker(bind=engine, expire_on_commit=False)()
+        job = JobStore.create_job(session, "work", {}, tenant_id="t1")
+        assert JobStore.claim(session, job.id, "other-runner", lease_seconds=60)
+        assert not JobStore.claim(session, job.id, "third-runner", lease_seconds=60)
+        session.close()
+
+        calls = []
+        runner = JobRunner(
+            engine, handlers={"work": lambda payload, ctx: calls.append(1) or {}}, heartbeat_seconds=0.05
+        )
+        try:
+            time.sleep(0.3)
+            assert calls == []
+            assert runner.get(job.id)["status"] == "RUNNING"
+        finally:
+            runner.shutdown()
+
+    def test_each_job_runs_once_across_runners(self, engine):
+        lock = threading.Lock()
+        calls = {}
+
+        def work(payload, ctx):
+            with lock:
+                calls[payload["n"]] = calls.get(payload["n"], 0) + 1
+            time.sleep(0.02)
+            return {}
+
+        runners = [
+            JobRunner(engine, max_workers=4, per_tenant_limit=10, handlers={"work": work}, heartbeat_seconds=0.02)
+            for _ in range(3)
+        ]
+        try:
+            ids = [runners[0].submit("work", {"n": n}) for n in range(20)]
+            for job_id in ids:
+                assert _wait_for(runners[0], job_id)["status"] == "SUCCEEDED"
+        finally:
+            for runner in runners:
+                runner.shutdown()
+
+        assert calls == {n: 1 for n in range(20)}
+
+    def test_heartbeat_keeps_long_jobs_claimed(self, engine):
+        calls = []
+        release = threading.Event()
+
+        def slow(payload, ctx):
+            calls.append(1)
+            release.wait(5)
+            return {}
+
+        owner = JobRunner(engine, handlers={"slow": slow}, lease_seconds=0.2, heartbeat_seconds=0.05)
+        other = JobRunner(engine, handlers={"slow": slow}, lease_seconds=0.2, heartbeat_seconds=0.05)
+        try:
+            job_id = owner.submit("slow", {})
+            time.sleep(0.6)  # three lease lifetimes
+            assert calls == [1]
+            release.set()
+            assert _wait_for(owner, job_id)["status"] == "SUCCEEDED"
+        finally:
+            owner.shutdown()
+            other.shutdown()
+
+    def test_tenant_limit_holds_across_runners(self, engine):
+        AOLJob.__table__.create(engine, checkfirst=True)
+        session = sessionmaker(bind=engine, expire_on_commit=False)()
+        first = JobStore.create_job(session, "work", {}, tenant_id="t1")
+        second = JobStore.create_job(session, "work", {}, tenant_id="t1")
+        assert JobStore.claim(session, first.id, "runner-a", 60, per_tenant_limit=1)
+        assert not JobStore.claim(session, second.id, "runner-b", 60, per_tenant_limit=1)
+
+        JobStore.mark_succeeded(session, first.id, {}, owner="runner-a")
+        assert JobStore.claim(session, second.id, "runner-b", 60, per_tenant_limit=1)
+        assert not JobStore.mark_succeeded(session, second.id, {}, owner="runner-a")
+        session.close()
+
+    def test_latency_histogram_recorded(self, engine):
+        runner = JobRunner(engine, handlers={"fast": lambda payload, ctx: {}})
+        try:
+            _wait_for(runner, runner.submit("fast", {}))
+            hist = runner.stats()["latency_seconds"]["fast"]
+            assert hist["count"] == 1
+            assert hist["buckets"]["+Inf"] == 1
+        finally:
+            runner.shutdown()
+
+
+def test_latency_histogram_buckets_are_cumulative():
+    hist = LatencyHistogram(buckets=(1, 5))
+    for v in (0.2, 3, 3, 9):
+        hist.observe(v)
+    assert hist.to_dict()["buckets"] == {"1": 1, "5": 3, "+Inf": 4}
+
+
+def test_jobs_api_roundtrip(engine, monkeypatch):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from aicmo.orchestration import jobs as jobs_module
+    from backend.routers import jobs as jobs_router_module
+
+    monkeypatch.setitem(jobs_module.JOB_HANDLERS, "echo", lambda payload, ctx: {"ok": payload})
+    monkeypatch.setattr(jobs_router_module, "get_engine", lambda: engine)
+    jobs_module.reset_job_runner()
+
+    app = FastAPI()
+    app.include_router(jobs_router_module.router)
+    client = TestClient(app)
+    try:
+        resp = client.post("/jobs", json={"kind": "echo", "payload": {"a": 1}}, headers={"X-Tenant-Id": "acme"})
+        assert resp.status_code == 202
+        job_id = resp.json()["job_id"]
+
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            body = client.get(f"/jobs/{job_id}").json()
+            if body["status"] == "SUCCEEDED":
+                break
+            time.sleep(0.01)
+        assert body["tenant_id"] == "acme"
+        assert body["result"] == {"ok": {"a": 1}}
+
+        assert client.get("/jobs/does-not-exist").status_code == 404
+        assert client.post("/jobs", json={"kind": "unknown"}).status_code == 400
+        assert client.get("/jobs/stats").json()["latency_seconds"]["echo"]["count"] == 1
+    finally:
+        jobs_module.reset_job_runner()
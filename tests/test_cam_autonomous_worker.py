@@ -65,6 +65,28 @@ class TestCamWorker:
         assert hasattr(worker, 'config')
         assert worker.config.enabled, "Worker should be enabled"
     
+    def test_cycle_mode_is_the_default(self, worker_config):
+        """Steps run in sequence unless AICMO_CAM_WORKER_MODE=scheduled."""
+        assert worker_config.mode == "cycle"
+    
+    def test_heartbeat_is_kept_inside_lock_ttl(self, worker, monkeypatch):
+        """Sleeping between cycles refreshes the heartbeat well before the lock goes stale."""
+        from aicmo.cam.worker import cam_worker
+        from aicmo.cam.worker.locking import LOCK_TTL_MINUTES
+        
+        assert worker.config.heartbeat_seconds <= LOCK_TTL_MINUTES * 60 // 3
+        worker.config.interval_seconds = 300
+        now = [0.0]
+        monkeypatch.setattr(cam_worker.time, "monotonic", lambda: now[0])
+        monkeypatch.setattr(cam_worker.time, "sleep", lambda s: now.__setitem__(0, now[0] + s))
+        beats = []
+        monkeypatch.setattr(worker, "_update_heartbeat", lambda: beats.append(now[0]))
+        
+        worker._sleep_with_heartbeat(300)
+        gaps = [b - a for a, b in zip([0.0] + beats, beats)]
+        assert beats[-1] == 300
+        assert max(gaps) <= worker.config.heartbeat_seconds
+    
     def test_worker_runs_one_cycle(self, worker, session):
         """Test worker runs one complete cycle without crashing."""
         worker.session = session
@@ -0,0 +1,156 @@
+"""
+Tests for batched reply classification in CamFlowRunner step 3.
+
+Tests:
+1. A backlog larger than one chunk drains in one run, one commit per chunk
+2. Lead transitions are grouped: one lead query per chunk, no N+1
+3. CAM_CLASSIFY_MAX_PER_STEP caps a run; the next run picks up the rest
+4. A failing reply only fails itself; the rest of its chunk is committed
+5. Modules without the batch methods are called per reply
+"""
+
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+import aicmo.venture.models  # noqa: F401  (registers the ventures table LeadDB refers to)
+from aicmo.cam.composition import CamFlowRunner
+from aicmo.cam.config import settings as cam_settings
+from aicmo.cam.contracts import ClassifyReplyResponse, ReplyClassificationEnum
+from aicmo.cam.db_models import Base, CampaignDB, InboundEmailDB, LeadDB
+from aicmo.cam.services.follow_up_engine import FollowUpEngine
+from aicmo.cam.services.reply_classifier import ReplyClassifier
+from aicmo.shared.db import dispose_engines, get_engine, track_queries
+
+BODIES = [
+    "I'm interested, let's talk next week.",  # POSITIVE -> qualified
+    "Not interested, please stop.",  # NEGATIVE -> suppressed
+    "I am out of office until Monday.",  # OOO -> no change
+]
+
+
+@pytest.fixture
+def db_session(tmp_path):
+    engine = get_engine(f"sqlite:///{tmp_path / 'cam.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    dispose_engines()
+
+
+def _seed(session, n_leads, replies_per_lead=1):
+    campaign = CampaignDB(name="Batch")
+    session.add(campaign)
+    session.flush()
+    leads = [LeadDB(campaign_id=campaign.id, name=f"Lead {i}", email=f"lead{i}@example.com") for i in range(n_leads)]
+    session.add_all(leads)
+    session.flush()
+    n = 0
+    for r in range(replies_per_lead):
+        for i, lead in enumerate(leads):
+            session.add(InboundEmailDB(
+                lead_id=lead.id,
+                campaign_id=campaign.id,
+                provider="IMAP",
+                provider_msg_uid=f"uid-{n}",
+                from_email=lead.email,
+                subject="RE: Outreach",
+                body_text=BODIES[(i + r) % len(BODIES)],
+                received_at=datetime.utcnow(),
+            ))
+            n += 1
+    session.commit()
+    return leads
+
+
+def _runner(session, classifier=None, followup=None, **limits):
+    services = {
+        "ClassificationModule": classifier or ReplyClassifier(),
+        "FollowUpModule": followup or FollowUpEngine(session),
+    }
+    container = Mock()
+    container.get_service.side_effect = services.get
+    settings = cam_settings.model_copy(update={"CAM_CLASSIFY_CHUNK_SIZE": 100, **limits})
+    return CamFlowRunner(container, Mock(), session, cam_settings=settings)
+
+
+def _statuses(session):
+    rows = session.execute(text("SELECT status, COUNT(*) FROM cam_leads GROUP BY status")).all()
+    return dict(rows)
+
+
+def test_backlog_drains_in_one_run_with_a_commit_per_chunk(db_session):
+    _seed(db_session, 230)
+    runner = _runner(db_session)
+    commits = Mock(wraps=db_session.commit)
+    db_session.commit = commits
+
+    result = runner._step_classify_and_process_replies()
+
+    assert result.success and result.items_processed == 230
+    assert runner.count_unclassified_replies() == 0
+    assert commits.call_count == 6  # per chunk: FollowUpModule's commit + the step's
+    assert _statuses(db_session) == {"qualified": 77, "suppressed": 77, "NEW": 76}
+
+
+def test_lead_updates_are_grouped_per_chunk(db_session):
+    _seed(db_session, 50, replies_per_lead=4)
+    runner = _runner(db_session)
+
+    with track_queries("classify step") as stats:
+        result = runner._step_classify_and_process_replies()
+
+    assert result.items_processed == 200
+    lead_selects = [sql for sql in stats.statements if sql.startswith("SELECT") and "FROM cam_leads" in sql]
+    assert sum(stats.statements[sql] for sql in lead_selects) == 2  # one per chunk
+    assert stats.n_plus_one(threshold=10) == []
+    # The last actionable reply of each lead wins (OOO leaves the status alone)
+    assert _statuses(db_session) == {"qualified": 17, "suppressed": 33}
+
+
+def test_max_per_step_caps_a_run(db_session):
+    _seed(db_session, 250)
+    runner = _runner(db_session, CAM_CLASSIFY_MAX_PER_STEP=120)
+
+    assert runner._step_classify_and_process_replies().items_processed == 120
+    assert runner.count_unclassified_replies() == 130
+    assert runner._step_classify_and_process_replies().items_processed == 120
+    assert runner._step_classify_and_process_replies().items_processed == 10
+    assert runner.count_unclassified_replies() == 0
+
+
+def test_failing_reply_only_fails_itself(db_session):
+    leads = _seed(db_session, 30)
+    bad_lead = leads[7].id
+
+    class FlakyFollowUp(FollowUpEngine):
+        def process_replies(self, requests):
+            if any(r.lead_id == bad_lead for r in requests):
+                raise RuntimeError("lead locked")
+            return super().process_replies(requests)
+
+    runner = _runner(db_session, followup=FlakyFollowUp(db_session))
+    result = runner._step_classify_and_process_replies()
+
+    assert result.success and result.items_processed == 29
+    unclassified = db_session.query(InboundEmailDB).filter(InboundEmailDB.classification.is_(None)).all()
+    assert [e.lead_id for e in unclassified] == [bad_lead]
+
+
+def test_modules_without_batch_methods_are_called_per_reply(db_session):
+    _seed(db_session, 5)
+    classifier = Mock(spec=["classify"])
+    classifier.classify.return_value = ClassifyReplyResponse(
+        classification=ReplyClassificationEnum.NEUTRAL, confidence=0.0, reason="n/a"
+    )
+    followup = Mock(spec=["process_reply"])
+
+    result = _runner(db_session, classifier=classifier, followup=followup)._step_classify_and_process_replies()
+
+    assert result.items_processed == 5
+    assert classifier.classify.call_count == 5
+    assert followup.process_reply.call_count == 5
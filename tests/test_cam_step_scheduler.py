@@ -0,0 +1,245 @@
+"""
+Tests for CamStepScheduler (per-step cadences for the CAM worker).
+
+Tests:
+1. Steps run on their own cadences
+2. A slow step neither blocks other steps nor overlaps itself
+3. Poll is deferred while the classify backlog is full, and wakes classify
+4. Each thread gets its own runner; failures roll back that runner's session
+5. The background dispatcher runs due steps
+6. Classification runs before, and never alongside, no-reply timeouts
+7. The default schedules map onto real CamFlowRunner steps
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from aicmo.cam.composition import CamFlowRunner, CamStepScheduler, StepResult, StepSchedule, default_schedules
+
+
+class FakeRunner:
+    """Stands in for CamFlowRunner: records calls, optionally blocks."""
+
+    def __init__(self, log, gates, backlog):
+        self.log = log
+        self.gates = gates
+        self.backlog = backlog
+        self.db_session = Mock()
+        self.thread = threading.current_thread().name
+
+    def _step(self, name, items=0):
+        self.log.append((name, threading.current_thread().name))
+        gate = self.gates.get(name)
+        if gate is not None:
+            gate.wait(5)
+        return StepResult(step_name=name, step_number=0, success=True, items_processed=items)
+
+    def send(self):
+        return self._step("send")
+
+    def metrics(self):
+        return self._step("metrics")
+
+    def poll(self):
+        return self._step("poll", items=self.backlog.get("fetched", 0))
+
+    def classify(self):
+        self.backlog["pending"] = 0
+        return self._step("classify")
+
+    def timeouts(self):
+        return self._step("timeouts")
+
+    def count_pending(self):
+        return self.backlog["pending"]
+
+    def broken(self):
+        raise RuntimeError("boom")
+
+
+class ManualClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def harness():
+    log, gates, backlog, runners = [], {}, {"pending": 0, "fetched": 0}, []
+    clock = ManualClock()
+
+    def factory():
+        runner = FakeRunner(log, gates, backlog)
+        runners.append(runner)
+        return runner
+
+    def make(schedules, **kwargs):
+        scheduler = CamStepScheduler(factory, schedules, clock=clock, **kwargs)
+        made.append(scheduler)
+        return scheduler
+
+    made = []
+    yield make, clock, log, gates, backlog, runners
+    for gate in gates.values():
+        gate.set()
+    for scheduler in made:
+        scheduler.stop()
+
+
+def _drain(scheduler, timeout=5.0):
+    deadline = time.time() + timeout
+    while any(s["in_flight"] for s in scheduler.stats().values()) and time.time() < deadline:
+        time.sleep(0.005)
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.005)
+    assert condition()
+
+
+def test_steps_run_on_their_own_cadences(harness):
+    make, clock, log, _, _, _ = harness
+    scheduler = make([StepSchedule("send", "send", 5), StepSchedule("metrics", "metrics", 600)])
+
+    for _ in range(4):
+        scheduler.run_due()
+        _drain(scheduler)
+        clock.now += 5
+
+    counts = {name: sum(1 for n, _ in log if n == name) for name in ("send", "metrics")}
+    assert counts == {"send": 4, "metrics": 1}
+
+
+def test_slow_step_does_not_block_others_or_overlap(harness):
+    make, clock, log, gates, _, _ = harness
+    gates["metrics"] = threading.Event()
+    scheduler = make([StepSchedule("send", "send", 5), StepSchedule("metrics", "metrics", 5)])
+
+    for _ in range(3):
+        scheduler.run_due()
+        _wait_for(lambda: scheduler.stats()["send"]["in_flight"] == 0)
+        clock.now += 5
+
+    stats = scheduler.stats()
+    assert stats["send"]["runs"] == 3  # sending kept its cadence
+    assert stats["metrics"]["in_flight"] == 1  # still the first run
+    assert stats["metrics"]["skipped_overlap"] == 2
+    gates["metrics"].set()
+    _drain(scheduler)
+    assert scheduler.stats()["metrics"]["runs"] == 1
+
+
+def test_backpressure_defers_poll_and_poll_wakes_classify(harness):
+    make, clock, log, _, backlog, _ = harness
+    scheduler = make([
+        StepSchedule("classify", "classify", 600, backlog_method="count_pending"),
+        StepSchedule("poll", "poll", 60, wakes=("classify",), backlog_of="classify", max_backlog=10),
+    ])
+    scheduler.state["classify"].next_due = clock.now + 600  # not due on its own
+
+    backlog["pending"] = 10
+    assert scheduler.run_due() == []
+    assert scheduler.stats()["poll"]["deferred_backpressure"] == 1
+
+    backlog["pending"], backlog["fetched"] = 3, 4
+    clock.now += 60
+    assert scheduler.run_due() == ["poll"]
+    _drain(scheduler)
+    assert scheduler.state["classify"].next_due == 0.0  # woken by the poll
+    assert scheduler.run_due() == ["classify"]
+    _drain(scheduler)
+    assert [name for name, _ in log] == ["poll", "classify"]
+
+
+def test_each_thread_has_its_own_runner_and_failures_roll_back(harness):
+    make, clock, log, gates, _, runners = harness
+    gates["send"], gates["metrics"] = threading.Event(), threading.Event()
+    scheduler = make([
+        StepSchedule("send", "send", 5),
+        StepSchedule("metrics", "metrics", 5),
+        StepSchedule("broken", "broken", 5),
+    ])
+
+    scheduler.run_due()
+    _wait_for(lambda: len(runners) == 3)
+    assert len({r.thread for r in runners}) == 3
+    gates["send"].set()
+    gates["metrics"].set()
+    _drain(scheduler)
+
+    stats = scheduler.stats()["broken"]
+    assert stats["failures"] == 1 and stats["last_error"] == "boom"
+    failed = [r for r in runners if r.db_session.rollback.called]
+    assert len(failed) == 1
+
+
+def test_background_dispatcher_runs_steps(harness):
+    make, clock, log, _, _, _ = harness
+    scheduler = make([StepSchedule("send", "send", 5)])
+    scheduler.clock = time.monotonic
+    scheduler.start()
+    _wait_for(lambda: any(n == "send" for n, _ in log))
+    scheduler.stop()
+    assert scheduler.stats()["send"]["runs"] >= 1
+
+
+def test_classification_runs_before_and_never_alongside_timeouts(harness):
+    make, clock, log, gates, _, _ = harness
+    gates["classify"] = threading.Event()
+    scheduler = make([
+        StepSchedule("classify", "classify", 15, mutex="replies"),
+        StepSchedule("timeouts", "timeouts", 300, mutex="replies", runs_after=("classify",)),
+    ])
+
+    scheduler.state["timeouts"].next_due = clock.now + 1
+    assert scheduler.run_due() == ["classify"]
+    _wait_for(lambda: len(log) == 1)
+    clock.now += 1
+    assert scheduler.run_due() == ["timeouts"]
+    time.sleep(0.05)
+    assert [name for name, _ in log] == ["classify"]  # timeouts wait for the running classify
+    gates["classify"].set()
+    _drain(scheduler)
+
+    # The timeouts slot classifies whatever arrived since, in the same thread, first
+    names = [name for name, _ in log]
+    assert names == ["classify", "classify", "timeouts"]
+    assert log[1][1] == log[2][1]
+
+
+def test_timeouts_are_skipped_when_classification_fails(harness):
+    make, clock, log, _, _, _ = harness
+    scheduler = make([
+        StepSchedule("broken", "broken", 15, mutex="replies"),
+        StepSchedule("timeouts", "timeouts", 300, mutex="replies", runs_after=("broken",)),
+    ])
+    scheduler.state["broken"].next_due = clock.now + 600
+
+    assert scheduler.run_due() == ["timeouts"]
+    _drain(scheduler)
+    assert log == []
+    assert scheduler.stats()["timeouts"]["failures"] == 1
+
+
+def test_default_schedules_match_flow_runner_steps():
+    schedules = default_schedules()
+    assert len(schedules) == 7
+    for schedule in schedules:
+        assert callable(getattr(CamFlowRunner, schedule.method))
+        if schedule.backlog_method:
+            assert callable(getattr(CamFlowRunner, schedule.backlog_method))
+    by_name = {s.name: s for s in schedules}
+    assert by_name["send_emails"].interval_seconds < by_name["compute_metrics"].interval_seconds
+    assert by_name["poll_inbox"].backlog_of == "classify_replies"
+    assert by_name["no_reply_timeouts"].runs_after == ("classify_replies",)
+    assert by_name["no_reply_timeouts"].mutex == by_name["classify_replies"].mutex is not None
+
+    with pytest.raises(ValueError):
+        CamStepScheduler(Mock, [StepSchedule("poll", "poll", 1, wakes=("missing",))])
@@ -0,0 +1,194 @@
+"""
+Tests for the rate-limited async enrichment pipeline.
+
+Drives EnrichmentPipeline against a local fake Apollo/Dropcontact server:
+- concurrency and bulk endpoints (throughput)
+- per-provider token buckets
+- email/domain cache with negative entries
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from aicmo.crm.enrichment import EnrichmentPipeline, TokenBucket
+from aicmo.crm.enrichment_cache import EnrichmentCache
+from aicmo.crm.models import Contact, CRMRepository
+from aicmo.shared.config import settings
+
+UNKNOWN = "ghost"  # local part Apollo has no record of
+
+
+class FakeProviderServer:
+    """Apollo People Search + Dropcontact verify endpoints with injected latency."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.requests = []
+        self.fail_paths = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                status, payload = server.handle(self.path, body)
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def handle(self, path, body):
+        with self._lock:
+            self.requests.append(path)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if path in self.fail_paths:
+                return 500, {"error": "boom"}
+            if path == "/apollo/people/search":
+                return 200, {"contacts": [
+                    {
+                        "email": email,
+                        "title": "Head of Growth",
+                        "organization": {"name": email.split("@")[1].split(".")[0].title()},
+                    }
+                    for email in body["q_emails"]
+                    if not email.startswith(UNKNOWN)
+                ]}
+            if path == "/dropcontact/contact/verify":
+                return 200, {"status": "valid"}
+            if path == "/dropcontact/contact/verify/batch":
+                return 200, {"contacts": [{"email": c["email"], "status": "valid"} for c in body["contacts"]]}
+            return 404, {}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def count(self, suffix):
+        return sum(1 for path in self.requests if path.endswith(suffix))
+
+
+@pytest.fixture
+def server(monkeypatch):
+    fake = FakeProviderServer()
+    monkeypatch.setenv("APOLLO_API_KEY", "test-key")
+    monkeypatch.setenv("APOLLO_API_BASE", f"{fake.url}/apollo")
+    monkeypatch.setenv("DROPCONTACT_API_KEY", "test-key")
+    monkeypatch.setenv("DROPCONTACT_API_BASE", f"{fake.url}/dropcontact")
+    monkeypatch.setattr(settings, "ENRICHMENT_APOLLO_RATE_PER_SECOND", 0.0)
+    monkeypatch.setattr(settings, "ENRICHMENT_DROPCONTACT_RATE_PER_SECOND", 0.0)
+    yield fake
+    fake.httpd.shutdown()
+
+
+@pytest.fixture
+def pipeline(server, tmp_path):
+    pipeline = EnrichmentPipeline(cache=EnrichmentCache(str(tmp_path / "enrichment.db")))
+    pipeline.repository = CRMRepository(tmp_path / "contacts.json")
+    return pipeline
+
+
+def _contacts(n, domain="acme.com", prefix="user"):
+    return [Contact(email=f"{prefix}{i}@{domain}", domain=domain) for i in range(n)]
+
+
+def test_large_batch_uses_bulk_endpoints(pipeline, server):
+    started = time.perf_counter()
+    contacts = asyncio.run(pipeline.enrich_batch(_contacts(40)))
+    elapsed = time.perf_counter() - started
+
+    assert all(c.enrichment and c.enrichment.company_name == "Acme" for c in contacts)
+    assert all(c.enrichment.email_verified for c in contacts)
+    assert server.count("/people/search") == 40 // settings.ENRICHMENT_APOLLO_BULK_SIZE
+    assert server.count("/verify/batch") == 1
+    # 80 sequential single calls would take 80 * delay
+    assert elapsed < 20 * server.delay
+    assert len(pipeline.repository.get_all_contacts()) == 40
+
+
+def test_small_batch_runs_single_requests_concurrently(pipeline, server):
+    started = time.perf_counter()
+    contacts = asyncio.run(pipeline.enrich_batch(_contacts(3)))
+    elapsed = time.perf_counter() - started
+
+    assert all(c.enrichment for c in contacts)
+    assert server.count("/people/search") == 3
+    assert server.count("/contact/verify") == 3
+    assert server.max_in_flight >= 2
+    assert elapsed < 5 * server.delay
+
+
+def test_concurrency_is_capped(pipeline, server, monkeypatch):
+    monkeypatch.setattr(settings, "ENRICHMENT_BULK_MIN", 1000)  # force single requests
+    monkeypatch.setattr(settings, "ENRICHMENT_MAX_CONCURRENCY", 3)
+    asyncio.run(pipeline.enrich_batch(_contacts(12)))
+    assert server.count("/people/search") == 12
+    assert server.max_in_flight <= 3
+
+
+def test_re_enrichment_is_served_from_cache(pipeline, server):
+    contacts = _contacts(6) + [Contact(email=f"{UNKNOWN}@acme.com", domain="acme.com")]
+    first = asyncio.run(pipeline.enrich_batch(contacts))
+    calls = len(server.requests)
+
+    # Unknown person at a known company gets the domain's company fields
+    assert first[-1].enrichment.company_name == "Acme"
+    assert first[-1].enrichment.enrichment_source == "apollo_domain"
+
+    again = asyncio.run(pipeline.enrich_batch(_contacts(6) + [Contact(email=f"{UNKNOWN}@other.com", domain="other.com")]))
+    assert len(server.requests) == calls + 1  # only the new contact
+    assert again[0].enrichment.job_title == "Head of Growth"
+    assert again[0].enrichment.email_verified
+    assert again[-1].enrichment is None
+
+    asyncio.run(pipeline.enrich_batch([Contact(email=f"{UNKNOWN}@other.com", domain="other.com")]))
+    assert len(server.requests) == calls + 1  # negative entry cached
+    assert pipeline.cache.stats()["hits"] >= 7
+
+
+def test_failed_requests_are_not_cached(pipeline, server):
+    server.fail_paths.add("/apollo/people/search")
+    contacts = asyncio.run(pipeline.enrich_batch(_contacts(2)))
+    assert all(c.enrichment is None for c in contacts)
+
+    server.fail_paths.clear()
+    contacts = asyncio.run(pipeline.enrich_batch(_contacts(2)))
+    assert all(c.enrichment for c in contacts)
+    assert server.count("/people/search") == 4
+
+
+def test_token_bucket_paces_provider_requests(pipeline, server, monkeypatch):
+    monkeypatch.setattr(settings, "ENRICHMENT_BULK_MIN", 1000)
+    pipeline.apollo_limiter = TokenBucket(rate=20, burst=1)
+    started = time.perf_counter()
+    asyncio.run(pipeline.enrich_batch(_contacts(6)))
+    # 1 immediate + 5 paced at 20/s
+    assert time.perf_counter() - started >= 5 / 20 - 0.02
+
+
+def test_unconfigured_providers_make_no_requests(tmp_path, monkeypatch):
+    monkeypatch.delenv("APOLLO_API_KEY", raising=False)
+    pipeline = EnrichmentPipeline(cache=EnrichmentCache(str(tmp_path / "enrichment.db")))
+    pipeline.repository = CRMRepository(tmp_path / "contacts.json")
+    contacts = asyncio.run(pipeline.enrich_batch(_contacts(3)))
+    assert all(c.enrichment is None for c in contacts)
+    assert pipeline.cache.stats()["stores"] == 0
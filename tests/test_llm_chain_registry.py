@@ -0,0 +1,137 @@
+"""Tests for long-lived LLM chains: registry reuse, persistent health, bounded log, deadlines (async and sync)."""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from aicmo.gateways.provider_chain import ProviderChain, ProviderHealth, ProviderWrapper
+from aicmo.llm.cache import reset_response_cache
+from aicmo.llm.router import get_llm_client, reset_llm_clients
+from aicmo.shared.config import settings
+
+
+class FakeAdapter:
+    dry_run = False
+
+    def __init__(self, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    async def generate(self, prompt):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("provider error")
+        return f"ok:{prompt}"
+
+
+class BlockingAdapter:
+    dry_run = False
+
+    def __init__(self, event):
+        self.event = event
+
+    def generate(self, prompt):
+        self.event.wait(2)
+        return "late"
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "LLM_CACHE_PATH", str(tmp_path / "llm_cache.db"))
+    reset_response_cache()
+    reset_llm_clients()
+    yield
+    reset_llm_clients()
+    reset_response_cache()
+
+
+def test_get_llm_client_reuses_chain_and_adapters():
+    chain = get_llm_client("SOCIAL_CONTENT")
+    assert get_llm_client("SOCIAL_CONTENT") is chain
+    assert get_llm_client("SOCIAL_CONTENT", profile_override="standard") is not chain
+
+    other = get_llm_client("EMAIL_COPY")  # also "cheap": same models, same wrappers
+    assert other is not chain
+    assert [w.provider for w in other.providers] == [w.provider for w in chain.providers]
+    assert other.providers[0] is chain.providers[0]
+
+    reset_llm_clients()
+    assert get_llm_client("SOCIAL_CONTENT") is not chain
+
+
+def test_health_survives_between_calls():
+    chain = get_llm_client("SOCIAL_CONTENT")
+    success, _, _ = asyncio.run(chain.invoke("generate", prompt="hello"))
+    assert success
+
+    again = get_llm_client("SOCIAL_CONTENT")
+    first = again._get_sorted_providers()[0]
+    assert first.status.total_calls == 1
+    assert first.status.avg_latency_ms is not None
+    assert again.get_status_report()["total_operations"] == 1
+
+
+def test_operation_log_is_bounded():
+    chain = ProviderChain(
+        "llm", [ProviderWrapper(FakeAdapter(), "fake/a")], operation_log_size=5
+    )
+
+    async def run():
+        for i in range(20):
+            await chain.invoke("generate", prompt=str(i))
+
+    asyncio.run(run())
+    report = chain.get_status_report()
+    assert len(chain._operation_log) == 5
+    assert report["total_operations"] == 20
+    assert len(report["recent_operations"]) == 5
+
+
+def test_error_rate_ewma_demotes_flaky_provider():
+    flaky = ProviderWrapper(FakeAdapter(fail=True), "fake/flaky", health_threshold_failures=100)
+    steady = ProviderWrapper(FakeAdapter(), "fake/steady")
+    chain = ProviderChain("llm", [flaky, steady])
+
+    async def run():
+        for _ in range(3):
+            assert (await chain.invoke("generate", prompt="x"))[0]
+
+    asyncio.run(run())
+    assert flaky.status.error_rate == pytest.approx(0.3)
+    assert steady.status.error_rate == 0.0
+    assert chain._get_sorted_providers()[0] is steady
+    # Once demoted, the flaky provider is no longer tried first
+    assert flaky.provider.calls == 1
+
+
+def test_hung_async_provider_fails_over_at_deadline():
+    hung = ProviderWrapper(FakeAdapter(delay=5), "fake/hung", timeout_seconds=0.05)
+    backup = ProviderWrapper(FakeAdapter(), "fake/backup", timeout_seconds=0.05)
+    chain = ProviderChain("llm", [hung, backup])
+
+    started = time.perf_counter()
+    success, result, provider = asyncio.run(chain.invoke("generate", prompt="x"))
+    assert time.perf_counter() - started < 1
+    assert (success, result, provider) == (True, "ok:x", "fake/backup")
+    assert hung.status.error_message.startswith("TimeoutError")
+    assert hung.status.health == ProviderHealth.DEGRADED
+
+
+def test_hung_sync_provider_fails_over_at_deadline():
+    # The blocking call is abandoned in its worker thread; the loop moves on
+    release = threading.Event()
+    hung = ProviderWrapper(BlockingAdapter(release), "fake/blocking", timeout_seconds=0.05)
+    backup = ProviderWrapper(FakeAdapter(), "fake/backup")
+    chain = ProviderChain("llm", [hung, backup])
+
+    started = time.perf_counter()
+    try:
+        success, result, provider = asyncio.run(chain.invoke("generate", prompt="x"))
+    finally:
+        release.set()
+    assert time.perf_counter() - started < 1
+    assert (success, result, provider) == (True, "ok:x", "fake/backup")
+    assert hung.status.error_message.startswith("TimeoutError")
@@ -0,0 +1,198 @@
+"""Tests for the shared LLM response cache and its ProviderChain / client wiring."""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from aicmo.gateways.provider_chain import ProviderChain, ProviderWrapper
+from aicmo.llm import cache as llm_cache
+from aicmo.llm.cache import (
+    ChainResponseCache,
+    LLMResponseCache,
+    get_response_cache,
+    make_cache_key,
+    reset_response_cache,
+    should_cache,
+)
+from aicmo.shared.config import settings
+
+
+@pytest.fixture(autouse=True)
+def cache_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "LLM_CACHE_PATH", str(tmp_path / "llm_cache.db"))
+    monkeypatch.setattr(settings, "LLM_CACHE_MODE", "deterministic")
+    reset_response_cache()
+    yield tmp_path / "llm_cache.db"
+    reset_response_cache()
+
+
+class CountingAdapter:
+    dry_run = False
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate(self, prompt, temperature=None, **options):
+        self.calls += 1
+        return f"answer {self.calls}"
+
+
+def test_key_normalises_prompt_whitespace():
+    assert make_cache_key("openai", "m", "Hello   world\n") == make_cache_key("openai", "m", " Hello world")
+    assert make_cache_key("openai", "m", "x", 0.0) != make_cache_key("openai", "m", "x", 0.7)
+    assert make_cache_key("openai", "m", "x", 0.0, 100) != make_cache_key("openai", "m", "x", 0.0, 200)
+    assert make_cache_key("openai", "m", "x") != make_cache_key("perplexity", "m", "x")
+    assert make_cache_key("openai", "m", "x", options={"system": "a"}) != make_cache_key(
+        "openai", "m", "x", options={"system": "b"}
+    )
+    assert make_cache_key("openai", "m", "x", options={"a": 1, "b": 2}) == make_cache_key(
+        "openai", "m", "x", options={"b": 2, "a": 1}
+    )
+
+
+def test_default_cache_path_is_outside_the_working_tree():
+    from aicmo.shared.config import AicmoSettings
+
+    path = AicmoSettings.model_fields["LLM_CACHE_PATH"].default
+    assert path.startswith("~")
+
+
+def test_cache_policy(monkeypatch):
+    assert should_cache(temperature=0)
+    assert not should_cache(temperature=0.7)
+    assert not should_cache("SOCIAL_CONTENT")
+    assert should_cache("KAIZEN_QA")
+    assert should_cache(temperature=0.7, cache=True)
+    assert not should_cache(temperature=0, cache=False)
+    assert not should_cache("CREATIVE_IDEATION", temperature=0)
+
+    monkeypatch.setattr(settings, "LLM_CACHE_MODE", "all")
+    assert should_cache("SOCIAL_CONTENT", temperature=0.9)
+    assert not should_cache("CREATIVE_IDEATION")
+
+    monkeypatch.setattr(settings, "LLM_CACHE_MODE", "off")
+    assert not should_cache(temperature=0, cache=True)
+    assert get_response_cache() is None
+
+
+def test_counters_and_saved_tokens(cache_path):
+    cache = LLMResponseCache(str(cache_path))
+    assert cache.get("k") is None
+    cache.put("k", "x" * 40, provider="openai", model="m", tokens=25)
+    assert cache.get("missing", "k") == ("k", "x" * 40)
+    assert cache.get("k") == ("k", "x" * 40)
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["stores"]) == (2, 1, 1)
+    assert stats["saved_tokens"] == 50
+    assert stats["entries"] == 1
+    assert stats["hit_rate"] == pytest.approx(2 / 3, abs=1e-3)
+
+
+def test_lru_eviction_and_ttl(cache_path, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(llm_cache.time, "time", lambda: clock[0])
+    cache = LLMResponseCache(str(cache_path), max_entries=3, ttl_seconds=100)
+    for i in range(4):
+        clock[0] += 1
+        cache.put(f"k{i}", f"v{i}")
+    clock[0] += 1
+    cache.get("k0")  # k0 is now the most recently used
+    assert cache.evict() == 1
+    assert cache.get("k1") is None
+    assert cache.get("k0") is not None
+
+    clock[0] += 200
+    assert cache.get("k0") is None  # expired
+    assert cache.evict() == 2
+    assert cache.stats()["entries"] == 0
+
+
+def test_chain_serves_repeat_calls_from_cache():
+    adapter = CountingAdapter()
+    chain = ProviderChain(
+        "llm",
+        [ProviderWrapper(adapter, "fake/model-a")],
+        response_cache=ChainResponseCache("KAIZEN_QA"),
+    )
+
+    async def run():
+        first = await chain.invoke("generate", prompt="Score this   draft")
+        second = await chain.invoke("generate", prompt="Score this draft")
+        bypass = await chain.invoke("generate", prompt="Score this draft", cache=False)
+        return first, second, bypass
+
+    first, second, bypass = asyncio.run(run())
+    assert first == second == (True, "answer 1", "fake/model-a")
+    assert bypass == (True, "answer 2", "fake/model-a")
+    assert adapter.calls == 2
+    assert get_response_cache().stats()["hits"] == 1
+
+
+def test_chain_key_covers_every_output_affecting_kwarg():
+    adapter = CountingAdapter()
+    chain = ProviderChain(
+        "llm", [ProviderWrapper(adapter, "fake/model-a")], response_cache=ChainResponseCache("KAIZEN_QA")
+    )
+
+    async def run():
+        await chain.invoke("generate", prompt="Score", system="strict grader")
+        await chain.invoke("generate", prompt="Score", system="lenient grader")
+        await chain.invoke("generate", prompt="Score", system="strict grader", top_p=0.5)
+        # Transport-only options don't split the entry
+        return await chain.invoke("generate", prompt="Score", system="strict grader", timeout=5)
+
+    assert asyncio.run(run()) == (True, "answer 1", "fake/model-a")
+    assert adapter.calls == 3
+
+
+def test_chain_skips_cache_for_non_deterministic_use_case():
+    adapter = CountingAdapter()
+    chain = ProviderChain(
+        "llm", [ProviderWrapper(adapter, "fake/model-a")], response_cache=ChainResponseCache("SOCIAL_CONTENT")
+    )
+
+    async def run():
+        await chain.invoke("generate", prompt="Write a hook", temperature=0.9)
+        await chain.invoke("generate", prompt="Write a hook", temperature=0.9)
+        await chain.invoke("generate", prompt="Write a hook", temperature=0)
+        await chain.invoke("generate", prompt="Write a hook", temperature=0)
+
+    asyncio.run(run())
+    assert adapter.calls == 3
+
+
+def test_llm_client_caches_temperature_zero(monkeypatch):
+    pytest.importorskip("openai")
+    from backend.services.llm_client import LLMClient
+
+    client = LLMClient(api_key="sk-test")
+    fake = AsyncMock(return_value="classified: positive")
+    monkeypatch.setattr(client, "_generate_with_openai", fake)
+
+    async def run():
+        a = await client.generate("Classify: thanks!", temperature=0)
+        b = await client.generate("Classify:  thanks!", temperature=0)
+        await client.generate("Write copy", temperature=0.7)
+        await client.generate("Write copy", temperature=0.7)
+        return a, b
+
+    assert asyncio.run(run()) == ("classified: positive", "classified: positive")
+    assert fake.await_count == 3
+
+
+def test_rewrite_text_block_opt_in_cache():
+    from aicmo.llm.client import _rewrite_text_block
+
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=" Polished "))])
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    args = (client, "gpt-4o-mini", "{}", "Hook", "Original hook")
+    assert _rewrite_text_block(*args, provider="openai", cache=True) == "Polished"
+    assert _rewrite_text_block(*args, provider="openai", cache=True) == "Polished"
+    assert _rewrite_text_block(*args, provider="openai") == "Polished"  # 0.7: not cached by default
+    assert len(calls) == 2
@@ -7,17 +7,23 @@ Tests:
 3. Publishing Campaign Tests
 4. Publishing Pipeline Tests
 5. Multi-Channel Publishing Tests
+6. Concurrent Campaign Publishing Tests (fake channels, durable job store)
 
 Run with: pytest tests/test_phase2_publishing.py -v
 """
 
+import asyncio
+import time
+
 import pytest
 from datetime import datetime
 from aicmo.publishing import (
     ContentType, Channel, PublishingStatus, PublishingMetrics,
     ContentVersion, Content, PublishingJob, PublishingCampaign,
+    PublishingPipeline, PublishingJobStore, FakeChannelPoster,
     get_publishing_pipeline, reset_publishing_pipeline,
 )
+from aicmo.shared.config import settings
 
 
 class TestContentModel:
@@ -138,15 +144,19 @@ class TestPublishingCampaign:
 class TestPublishingPipeline:
     """Test publishing pipeline."""
     
-    def setup_method(self):
-        """Reset pipeline before each test."""
+    @pytest.fixture(autouse=True)
+    def pipeline_on_tmp_store(self, tmp_path):
+        """The shared pipeline writes its jobs under tmp_path, never the default path."""
+        reset_publishing_pipeline(PublishingPipeline(store=PublishingJobStore(str(tmp_path / "jobs.db"))))
+        yield
         reset_publishing_pipeline()
     
-    def test_pipeline_initialization(self):
+    def test_pipeline_initialization(self, tmp_path):
         """Test pipeline initializes."""
         pipeline = get_publishing_pipeline()
         assert pipeline is not None
         assert pipeline.crm is not None
+        assert pipeline.store.path.startswith(str(tmp_path))
     
     def test_get_publishing_job(self):
         """Test retrieving publishing job."""
@@ -160,5 +170,183 @@ class TestPublishingPipeline:
         assert retrieved.content_id == "c1"
 
 
+CHANNELS = [Channel.LINKEDIN, Channel.TWITTER, Channel.INSTAGRAM]
+
+
+def _approved_content(i: int, channels=CHANNELS) -> Content:
+    content = Content(content_type=ContentType.SOCIAL_POST, title=f"Post {i}")
+    for channel in channels:
+        content.add_version(ContentVersion(platform=channel, title=f"Post {i}", body=f"Body {i}", hashtags=["launch"]))
+    content.approve()
+    return content
+
+
+def _campaign(contents, channels=CHANNELS) -> PublishingCampaign:
+    campaign = PublishingCampaign(name="Launch")
+    for content in contents:
+        campaign.add_content(content.content_id)
+    for channel in channels:
+        campaign.add_channel(channel)
+    return campaign
+
+
+class TestCampaignPublishing:
+    """Test concurrent campaign publishing against fake channels."""
+    
+    @pytest.fixture(autouse=True)
+    def fast_limits(self, monkeypatch):
+        monkeypatch.setattr(settings, "PUBLISHING_CHANNEL_RATE_PER_SECOND", 0.0)
+        monkeypatch.setattr(settings, "PUBLISHING_RETRY_BACKOFF_SECONDS", 0.0)
+        monkeypatch.setattr(settings, "PUBLISHING_CHANNEL_CONCURRENCY", 4)
+        monkeypatch.setattr(settings, "PUBLISHING_MAX_ATTEMPTS", 3)
+    
+    def _pipeline(self, tmp_path, **poster_kwargs):
+        posters = {channel: FakeChannelPoster(channel.value, **poster_kwargs) for channel in CHANNELS}
+        store = PublishingJobStore(str(tmp_path / "jobs.db"))
+        return PublishingPipeline(store=store, posters=posters), posters
+    
+    @pytest.mark.asyncio
+    async def test_large_campaign_publishes_concurrently(self, tmp_path):
+        """500 items x 3 channels publish in bounded time within the channel limits."""
+        pipeline, posters = self._pipeline(tmp_path, latency_seconds=0.005)
+        contents = [_approved_content(i) for i in range(500)]
+        campaign = _campaign(contents)
+        
+        started = time.perf_counter()
+        results = await pipeline.publish_campaign(campaign, contents=contents)
+        elapsed = time.perf_counter() - started
+        
+        # Serially this is 1500 x 5ms = 7.5s of channel latency alone
+        assert elapsed < 5
+        assert len(results) == 500
+        for poster in posters.values():
+            assert len(poster.posts) == 500
+            assert 1 < poster.max_in_flight <= 4
+        assert posters[Channel.TWITTER].posts[0].body_text == "Body 0\n\n#launch"
+        assert pipeline.get_campaign_summary(campaign.campaign_id) == {
+            channel.value: {"published": 500} for channel in CHANNELS
+        }
+    
+    @pytest.mark.asyncio
+    async def test_failed_posts_are_retried(self, tmp_path):
+        """Transient failures are retried; persistent ones end FAILED."""
+        pipeline, posters = self._pipeline(tmp_path, failures={"Post 0": 2, "Post 1": 10})
+        contents = [_approved_content(i) for i in range(3)]
+        campaign = _campaign(contents)
+        
+        results = await pipeline.publish_campaign(campaign, contents=contents)
+        
+        recovered = results[contents[0].content_id][Channel.LINKEDIN]
+        assert recovered.status == PublishingStatus.PUBLISHED
+        assert recovered.attempts == 3
+        assert recovered.external_url.startswith("https://linkedin.example/")
+        failed = results[contents[1].content_id][Channel.LINKEDIN]
+        assert failed.status == PublishingStatus.FAILED
+        assert failed.attempts == 3
+        assert "Simulated linkedin failure" in failed.error_message
+        
+        stored = pipeline.get_campaign_jobs(campaign.campaign_id, PublishingStatus.FAILED)
+        assert {job.job_id for job in stored} == {
+            results[contents[1].content_id][channel].job_id for channel in CHANNELS
+        }
+    
+    @pytest.mark.asyncio
+    async def test_jobs_survive_restart_and_resume(self, tmp_path):
+        """A new pipeline on the same store sees every job and only publishes the rest."""
+        pipeline, _ = self._pipeline(tmp_path)
+        contents = [_approved_content(i) for i in range(10)]
+        campaign = _campaign(contents)
+        await pipeline.publish_campaign(campaign, contents=contents[:6])
+        
+        # Items 6-9 were unknown to the first run
+        summary = pipeline.get_campaign_summary(campaign.campaign_id)
+        assert summary[Channel.LINKEDIN.value] == {"published": 6, "failed": 4}
+        
+        # Simulate a crash mid-post: one job left PUBLISHING
+        store = pipeline.store
+        interrupted = store.jobs_for_campaign(campaign.campaign_id, PublishingStatus.PUBLISHED)[0]
+        interrupted.mark_publishing()
+        store.save(interrupted)
+        
+        restarted, posters = self._pipeline(tmp_path)
+        assert restarted.get_publishing_job(interrupted.job_id).status == PublishingStatus.PUBLISHING
+        assert store.unfinished_campaigns() == [campaign.campaign_id]
+        
+        await restarted.publish_campaign(campaign, contents=contents)
+        
+        jobs = restarted.get_campaign_jobs(campaign.campaign_id)
+        assert len(jobs) == 30
+        assert all(job.status == PublishingStatus.PUBLISHED for job in jobs)
+        assert sum(len(poster.posts) for poster in posters.values()) == 4 * 3 + 1
+        assert store.unfinished_campaigns() == []
+    
+    @pytest.mark.asyncio
+    async def test_live_claims_are_not_resumed(self, tmp_path, monkeypatch):
+        """A PUBLISHING job is resumed only once its lease has expired."""
+        pipeline, _ = self._pipeline(tmp_path)
+        contents = [_approved_content(0)]
+        campaign = _campaign(contents, channels=[Channel.LINKEDIN])
+        await pipeline.publish_campaign(campaign, contents=contents)
+        
+        store = pipeline.store
+        job = store.jobs_for_campaign(campaign.campaign_id)[0]
+        job.mark_queued()
+        store.save(job)
+        assert store.claim(job.job_id, "other-host:1", lease_seconds=60) is not None
+        assert store.claim(job.job_id, "third-host:1", lease_seconds=60) is None
+        
+        other, posters = self._pipeline(tmp_path)
+        results = await other.publish_campaign(campaign, contents=contents)
+        assert posters[Channel.LINKEDIN].attempts == 0
+        assert results[contents[0].content_id][Channel.LINKEDIN].owner == "other-host:1"
+        
+        # The other publisher died: once its lease runs out the job is resumed
+        monkeypatch.setattr(settings, "PUBLISHING_LEASE_SECONDS", 60.0)
+        store._conn().execute("UPDATE publishing_jobs SET lease_until = '2000-01-01T00:00:00'")
+        store._conn().commit()
+        results = await other.publish_campaign(campaign, contents=contents)
+        resumed = results[contents[0].content_id][Channel.LINKEDIN]
+        assert resumed.status == PublishingStatus.PUBLISHED
+        assert resumed.owner is None and store.get(job.job_id).owner is None
+        assert posters[Channel.LINKEDIN].attempts == 1
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_publishers_post_each_job_once(self, tmp_path):
+        """Two pipelines publishing the same campaign on one store never double-post."""
+        first, first_posters = self._pipeline(tmp_path, latency_seconds=0.002)
+        second, second_posters = self._pipeline(tmp_path, latency_seconds=0.002)
+        contents = [_approved_content(i) for i in range(40)]
+        campaign = _campaign(contents)
+        
+        await asyncio.gather(
+            first.publish_campaign(campaign, contents=contents),
+            second.publish_campaign(campaign, contents=contents),
+        )
+        
+        posted = [
+            post.body_text
+            for posters in (first_posters, second_posters)
+            for channel, poster in posters.items()
+            for post in poster.posts
+        ]
+        assert len(posted) == 40 * 3
+        jobs = first.get_campaign_jobs(campaign.campaign_id)
+        assert len(jobs) == 120
+        assert all(job.status == PublishingStatus.PUBLISHED and job.attempts == 1 for job in jobs)
+    
+    @pytest.mark.asyncio
+    async def test_unapproved_content_is_not_published(self, tmp_path):
+        """Draft content never reaches a channel."""
+        pipeline, posters = self._pipeline(tmp_path)
+        draft = Content(title="Draft")
+        
+        assert await pipeline.publish_content(draft, [Channel.LINKEDIN]) == {}
+        
+        results = await pipeline.publish_campaign(_campaign([draft]), contents=[draft])
+        job = results[draft.content_id][Channel.LINKEDIN]
+        assert job.status == PublishingStatus.FAILED
+        assert posters[Channel.LINKEDIN].attempts == 0
+
+
 # Pytest async support
 pytest_plugins = ('pytest_asyncio',)
@@ -115,6 +115,28 @@ class TestReplyClassifier:
         
         # Should lean toward negative due to explicit 'cannot'
         assert classification in (ReplyClassification.NEGATIVE, ReplyClassification.NEUTRAL)
+    
+    def test_classify_many_matches_classify(self):
+        """Test batch classification gives the per-email results, without cross-email matches."""
+        classifier = ReplyClassifier()
+        emails = [
+            ("RE: Great opportunity", "Hey! I'm very interested. Let's talk more about it."),
+            ("RE: Your message", "Not interested, I cannot help with this project. Stop."),
+            ("Automatic reply", "I am out of office until Monday, returning then."),
+            ("Undeliverable", "Delivery failed: 550 user unknown, no such user."),
+            ("RE: Outreach", "Please unsubscribe me and stop emailing."),
+            ("RE: Outreach", "Noted."),
+            ("RE: Outreach", "Sorry, I am not"),  # "not\s+interested" must not span emails
+            ("interested", ""),
+            ("auto", ""),
+            ("", "reply"),
+            ("", ""),
+        ]
+        
+        batch = classifier.classify_texts(emails)
+        
+        assert batch == [classifier.classify(subject, body) for subject, body in emails]
+        assert classifier.classify_texts([]) == []
 
 
 if __name__ == "__main__":
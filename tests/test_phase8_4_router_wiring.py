@@ -43,8 +43,8 @@ class TestPhase84RouterWiring:
         with open("/workspaces/AICMO/aicmo/generators/social_calendar_generator.py") as f:
             content = f.read()
         assert "from aicmo.llm.router import get_llm_client" in content
-        # Check the _generate_llm_caption_for_day function
-        func_content = content.split("def _generate_llm_caption_for_day")[1].split("\n        return None")[0]
+        # Check the batched caption pass
+        func_content = content.split("def _generate_llm_captions_batched")[1].split("\ndef _brief_context")[0]
         assert "asyncio.run" in func_content
 
     def test_directions_engine_imports_router(self):
@@ -94,7 +94,7 @@ class TestPhase84UseCaseMappings:
         """Verify Social Calendar generator uses SOCIAL_CONTENT use case."""
         with open("/workspaces/AICMO/aicmo/generators/social_calendar_generator.py") as f:
             content = f.read()
-        func = content.split("def _generate_llm_caption_for_day")[1].split("\n        return None")[0]
+        func = content.split("def _generate_llm_captions_batched")[1].split("\ndef _brief_context")[0]
         assert "LLMUseCase.SOCIAL_CONTENT" in func or "use_case=LLMUseCase.SOCIAL_CONTENT" in func or 'use_case="SOCIAL_CONTENT"' in func
 
     def test_directions_uses_creative_spec(self):
@@ -136,7 +136,7 @@ class TestPhase84AsyncCalls:
         """Verify Social Calendar uses async invoke pattern."""
         with open("/workspaces/AICMO/aicmo/generators/social_calendar_generator.py") as f:
             content = f.read()
-        func = content.split("def _generate_llm_caption_for_day")[1].split("\n        return None")[0]
+        func = content.split("def _generate_llm_captions_batched")[1].split("\ndef _brief_context")[0]
         assert "asyncio.run" in func
         assert "chain.invoke" in func
 
@@ -180,7 +180,7 @@ class TestPhase84NoOldClientsRemain:
         """Verify social_calendar doesn't import old clients in LLM func."""
         with open("/workspaces/AICMO/aicmo/generators/social_calendar_generator.py") as f:
             content = f.read()
-        llm_func = content.split("def _generate_llm_caption_for_day")[1].split("def _stub_")[0]
+        llm_func = content.split("def _generate_llm_captions_batched")[1].split("def _stub_")[0]
         assert "_get_openai_client" not in llm_func
         assert "_get_claude_client" not in llm_func
 
@@ -21,7 +21,8 @@ from aicmo.brand.memory import (
     BrandGenerationRecord,
     BrandGenerationInsight,
 )
-from aicmo.brand.repository import BrandBrainRepository
+from aicmo.brand.repository import BrandBrainRepository, LazyGenerationHistory
+from aicmo.shared.db import track_queries
 from aicmo.brand.brain import (
     BrandBrainInsightExtractor,
     generate_with_brand_brain,
@@ -339,6 +340,204 @@ class TestBrandBrainRepository:
             
             brands = repo.list_brands()
             assert len(brands) == 3
+    
+    @staticmethod
+    def _seed_history(repo, brand_id, count):
+        memory = BrandMemory(brand_id=brand_id, brand_name="Big Brand")
+        base = datetime(2025, 1, 1)
+        for i in range(count):
+            memory.add_generation_record(BrandGenerationRecord(
+                generation_id=f"gen-{i:05d}",
+                generator_type="swot_generator",
+                brand_id=brand_id,
+                brief_id=None,
+                prompt="",
+                brief_summary=None,
+                output_json={"strengths": [f"Strength {i}"], "padding": "x" * 500},
+                llm_provider="claude",
+                completion_time_ms=100.0,
+                created_at=base + timedelta(minutes=i),
+                confidence_score=0.5 if i % 2 else 0.9,
+                extracted_insights=[BrandGenerationInsight(
+                    insight_text=f"Insight {i % 7}",
+                    confidence=0.8,
+                    frequency=1,
+                    last_seen=base,
+                    source_context="SWOT analysis",
+                    generator_type="swot_generator",
+                )],
+            ))
+        repo.save_memory(memory)
+        return memory
+    
+    def test_load_memory_is_lazy_and_set_based(self):
+        """Loading reads totals only; pages and outputs are fetched on demand."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = BrandBrainRepository(os.path.join(tmpdir, "big.db"), page_size=50)
+            self._seed_history(repo, "big-brand", 2000)
+            
+            with track_queries("load") as stats:
+                loaded = repo.load_memory("big-brand")
+            assert stats.count == 1
+            history = loaded.generation_history
+            assert isinstance(history, LazyGenerationHistory)
+            assert len(history) == 2000
+            assert history.confidence_total() == pytest.approx(1400.0)
+            
+            # Newest first; reaching record 120 fetches three pages, two queries each
+            with track_queries("page") as stats:
+                record = history[120]
+            assert record.generation_id == "gen-01879"
+            assert stats.count == 6
+            assert record.extracted_insights[0].insight_text == "Insight 3"
+            assert not record.output_loaded
+            
+            with track_queries("output") as stats:
+                assert record.output_json["strengths"] == ["Strength 1879"]
+            assert stats.count == 1
+            
+            with track_queries("iterate") as stats:
+                ids = [r.generation_id for r in history]
+            assert ids == [f"gen-{i:05d}" for i in reversed(range(2000))]
+            assert stats.count == 2 * (2000 // 50 - 3)
+    
+    def test_consolidate_streams_insights_of_unfetched_records(self):
+        """consolidate_insights reads the insights of the whole history in one query."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = BrandBrainRepository(os.path.join(tmpdir, "big.db"), page_size=50)
+            seeded = self._seed_history(repo, "big-brand", 500)
+            seeded.consolidate_insights()
+            expected = {i.insight_text: i.frequency for i in seeded.consolidated_insights}
+            
+            loaded = repo.load_memory("big-brand")
+            with track_queries("consolidate") as stats:
+                loaded.consolidate_insights()
+            assert stats.count == 1
+            assert {i.insight_text: i.frequency for i in loaded.consolidated_insights} == expected
+            # Consolidation doesn't modify the records' own insights
+            assert all(r.extracted_insights[0].frequency == 1 for r in seeded.generation_history)
+    
+    def test_save_writes_only_new_or_changed_records(self):
+        """Saving a loaded memory writes just what changed since it was loaded."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = BrandBrainRepository(os.path.join(tmpdir, "big.db"), page_size=50)
+            self._seed_history(repo, "big-brand", 300)
+            
+            memory = repo.load_memory("big-brand")
+            with track_queries("noop-save") as stats:
+                repo.save_memory(memory)
+            assert not any("generation_records" in sql or "insights" in sql for sql in stats.statements)
+            
+            new_record = BrandGenerationRecord(
+                generation_id="gen-new",
+                generator_type="persona_generator",
+                brand_id="big-brand",
+                brief_id=None,
+                prompt="",
+                brief_summary=None,
+                output_json={"personas": []},
+                llm_provider="claude",
+                completion_time_ms=50.0,
+                confidence_score=0.2,
+            )
+            memory.add_generation_record(new_record)
+            assert memory.total_generations == 301
+            assert memory.avg_generation_quality == pytest.approx((210.0 + 0.2) / 301)
+            edited = memory.generation_history[3]
+            edited.confidence_score = 0.1
+            edited.output_json = {"strengths": ["Rewritten"]}
+            
+            with track_queries("save") as stats:
+                repo.save_memory(memory)
+            writes = {sql: n for sql, n in stats.statements.items() if not sql.startswith("SELECT")}
+            assert sum(writes.values()) == 7  # brand, metadata, insert, header, output, insights x2
+            
+            reloaded = repo.load_memory("big-brand")
+            history = reloaded.generation_history
+            assert len(history) == 301
+            assert history[0].generation_id == "gen-new"  # newest first
+            assert history[4].generation_id == edited.generation_id
+            assert history[4].confidence_score == 0.1
+            assert history[4].output_json == {"strengths": ["Rewritten"]}
+            assert len(history[4].extracted_insights) == 1
+            
+            # Re-saving doesn't duplicate insights
+            repo.save_memory(reloaded)
+            assert len(repo.get_recent_insights("big-brand", days=100000, limit=1000)) == 300
+    
+    def test_insight_summaries_are_maintained_on_save(self):
+        """Summaries match a full consolidation and are read with one keyed query."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = BrandBrainRepository(os.path.join(tmpdir, "big.db"), page_size=50)
+            seeded = self._seed_history(repo, "big-brand", 700)
+            
+            with track_queries("summary") as stats:
+                summary = repo.get_insight_summary("big-brand", "swot_generator")
+            assert stats.count == 1
+            seeded.consolidate_insights()
+            assert summary == seeded.get_insight_summary(max_insights=5, max_tokens=300)
+            assert summary.startswith("Brand Memory Insights:\n- Insight ")
+            
+            # Unknown generator types fall back to the brand-wide summary
+            assert repo.get_insight_summary("big-brand", "persona_generator") == summary
+            assert repo.get_insight_summary("other-brand") == ""
+            
+            # Token budget bounds the rendered context
+            short = repo.get_insight_summary("big-brand", max_tokens=10)
+            assert short.count("\n- ") == 1
+            
+            # Loading brings the ranked insights along without reading the history
+            loaded = repo.load_memory("big-brand")
+            assert [i.insight_text for i in loaded.consolidated_insights][:7] == [
+                i.insight_text for i in sorted(
+                    seeded.consolidated_insights,
+                    key=lambda x: (x.confidence * x.frequency, x.last_seen),
+                    reverse=True,
+                )
+            ]
+    
+    def test_summaries_refresh_only_for_new_records_and_rebuild(self):
+        """A new record updates its generator's summary; rebuild replays stored insights."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = BrandBrainRepository(os.path.join(tmpdir, "big.db"), page_size=50)
+            self._seed_history(repo, "big-brand", 20)
+            
+            memory = repo.load_memory("big-brand")
+            memory.add_generation_record(BrandGenerationRecord(
+                generation_id="gen-persona",
+                generator_type="persona_generator",
+                brand_id="big-brand",
+                brief_id=None,
+                prompt="",
+                brief_summary=None,
+                output_json={},
+                llm_provider="claude",
+                completion_time_ms=50.0,
+                extracted_insights=[BrandGenerationInsight(
+                    insight_text="Personas want speed",
+                    confidence=0.9,
+                    frequency=1,
+                    last_seen=datetime.utcnow(),
+                    source_context="Persona generation",
+                    generator_type="persona_generator",
+                )],
+            ))
+            repo.save_memory(memory)
+            persona = repo.get_insight_summary("big-brand", "persona_generator")
+            assert persona == "Brand Memory Insights:\n- Personas want speed"
+            assert "Personas want speed" not in repo.get_insight_summary("big-brand", "swot_generator")
+            
+            before = {
+                scope: repo.get_insight_summary("big-brand", scope)
+                for scope in ("swot_generator", "persona_generator", None)
+            }
+            repo.save_memory(repo.load_memory("big-brand"))  # nothing new: nothing refreshed
+            repo.rebuild_insight_summaries("big-brand")
+            after = {
+                scope: repo.get_insight_summary("big-brand", scope)
+                for scope in ("swot_generator", "persona_generator", None)
+            }
+            assert after == before
 
 
 class TestBrandBrainInsightExtractor:
@@ -0,0 +1,199 @@
+"""
+Tests for the sampling profiler (aicmo.shared.profiling):
+- on-demand captures and the idle sampler
+- speedscope / pstats / collapsed exports
+- slow request capture with the request fingerprint
+- the admin API
+"""
+
+import json
+import marshal
+import os
+import pstats
+import re
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from aicmo.shared import profiling
+from aicmo.shared.config import settings
+from backend.routers.profiling import router as profiling_router
+
+
+@pytest.fixture(autouse=True)
+def profile_settings(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "PROFILE_DIR", str(tmp_path / "profiles"))
+    monkeypatch.setattr(settings, "PROFILE_INTERVAL_MS", 2.0)
+    monkeypatch.setattr(settings, "PROFILE_SLOW_REQUESTS", False)
+    monkeypatch.delenv("ADMIN_TOKEN", raising=False)
+
+
+def busy_regex_loop(seconds):
+    pattern = re.compile(r"(\w+)\s+(\w+)")
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pattern.sub(r"\2 \1", "alpha beta gamma delta " * 20)
+
+
+def _profile_busy_thread(mode="wall", seconds=0.3):
+    worker = threading.Thread(target=busy_regex_loop, args=(seconds,), name="busy")
+    worker.start()
+    try:
+        return profiling.profile_for(seconds * 0.8, mode=mode)
+    finally:
+        worker.join()
+
+
+def test_profile_for_samples_other_threads():
+    profile = _profile_busy_thread()
+
+    assert profile.ticks > 10
+    busy = [stack for (thread, stack), _ in profile.stacks.items() if thread == "busy"]
+    assert busy
+    assert any(frame[2] == "busy_regex_loop" for stack in busy for frame in stack)
+    assert profile.duration >= 0.2
+
+
+def test_sampler_parks_when_no_capture_is_active():
+    profiling.profile_for(0.02)
+    assert profiling._sampler.active() == 0
+    assert not profiling._sampler._wake.is_set()
+
+
+def test_cpu_mode_drops_parked_threads():
+    parked = threading.Event()
+    waiter = threading.Thread(target=parked.wait, name="parked")
+    waiter.start()
+    try:
+        wall = profiling.profile_for(0.05, mode="wall")
+        cpu = profiling.profile_for(0.05, mode="cpu")
+    finally:
+        parked.set()
+        waiter.join()
+
+    assert any(thread == "parked" for thread, _ in wall.stacks)
+    assert not any(thread == "parked" for thread, _ in cpu.stacks)
+
+
+def test_exports(tmp_path):
+    profile = _profile_busy_thread()
+
+    speedscope = profile.to_speedscope()
+    assert speedscope["$schema"] == "https://www.speedscope.app/file-format-schema.json"
+    names = {f["name"] for f in speedscope["shared"]["frames"]}
+    assert "busy_regex_loop" in names
+    for p in speedscope["profiles"]:
+        assert p["type"] == "sampled" and len(p["samples"]) == len(p["weights"])
+
+    pstats_path = tmp_path / "out.pstats"
+    pstats_path.write_bytes(profile.to_pstats())
+    stats = pstats.Stats(str(pstats_path))
+    busy = [(key, value) for key, value in stats.stats.items() if key[2] == "busy_regex_loop"]
+    assert busy
+    (_, (_, calls, self_time, cumulative, callers)) = busy[0]
+    assert calls > 0 and cumulative >= self_time
+    assert any(caller[2] == "run" for caller in callers)
+
+    collapsed = profile.to_collapsed().splitlines()
+    assert any(line.startswith("busy;") and "busy_regex_loop" in line for line in collapsed)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in collapsed)
+
+
+def test_save_load_and_prune(monkeypatch):
+    monkeypatch.setattr(settings, "PROFILE_MAX_FILES", 2)
+    profile = profiling.profile_for(0.02, name="worker")
+    ids = [profiling.save_profile(profile, key=f"run {i}") for i in range(3)]
+
+    listed = profiling.list_profiles()
+    assert len(listed) == 2
+    assert ids[0] not in {p["id"] for p in listed}
+    loaded = profiling.load_profile(ids[-1])
+    assert loaded.stacks == profile.stacks
+    assert loaded.interval == profile.interval
+    assert profiling.load_profile("../../etc/passwd") is None
+
+
+def _slow_app(threshold_ms):
+    app = FastAPI()
+    app.add_middleware(profiling.SlowRequestProfiler, threshold_ms=threshold_ms)
+
+    @app.get("/report/{speed}")
+    async def report(speed: str):
+        profiling.annotate_request(fingerprint=f"fp-{speed}")
+        busy_regex_loop(0.15 if speed == "slow" else 0.0)
+        return {"ok": True}
+
+    return app
+
+
+def test_slow_requests_are_profiled_with_their_fingerprint(monkeypatch):
+    monkeypatch.setattr(settings, "PROFILE_SLOW_REQUESTS", True)
+    client = TestClient(_slow_app(threshold_ms=100))
+
+    assert client.get("/report/fast").status_code == 200
+    assert client.get("/report/slow").status_code == 200
+
+    saved = profiling.list_profiles()
+    assert len(saved) == 1
+    meta = saved[0]["meta"]
+    assert meta["fingerprint"] == "fp-slow"
+    assert meta["route"] == "/report/{speed}"
+    assert meta["status"] == 200
+    assert meta["duration_ms"] >= 100
+    assert "fp-slow" in saved[0]["id"]
+    frames = {f[2] for (_, stack) in profiling.load_profile(saved[0]["id"]).stacks for f in stack}
+    assert "busy_regex_loop" in frames
+
+
+def test_slow_request_capture_is_off_by_default():
+    client = TestClient(_slow_app(threshold_ms=0))
+    assert client.get("/report/slow").status_code == 200
+    assert profiling.list_profiles() == []
+    assert profiling._sampler.active() == 0
+
+
+def test_admin_api(monkeypatch):
+    app = FastAPI()
+    app.include_router(profiling_router)
+    client = TestClient(app)
+
+    created = client.post("/admin/profiling/sample", params={"seconds": 0.05}).json()
+    assert created["samples"] > 0
+    listed = client.get("/admin/profiling/profiles").json()["profiles"]
+    assert [p["id"] for p in listed] == [created["id"]]
+
+    speedscope = client.get(created["download_url"])
+    assert speedscope.headers["content-disposition"].endswith('.speedscope.json"')
+    assert json.loads(speedscope.content)["profiles"]
+    raw = client.get(created["download_url"], params={"format": "pstats"}).content
+    assert isinstance(marshal.loads(raw), dict)
+    assert client.get(created["download_url"], params={"format": "collapsed"}).status_code == 200
+
+    assert client.get("/admin/profiling/profiles/missing").status_code == 404
+    too_long = settings.PROFILE_MAX_SECONDS + 1
+    assert client.post("/admin/profiling/sample", params={"seconds": too_long}).status_code == 400
+
+    monkeypatch.setenv("ADMIN_TOKEN", "s3cr3t")
+    assert client.get("/admin/profiling/profiles").status_code == 401
+    assert client.get("/admin/profiling/profiles", headers={"x-admin-token": "s3cr3t"}).status_code == 200
+
+
+@pytest.mark.skipif(not hasattr(os, "kill") or not hasattr(profiling.signal, "SIGUSR2"), reason="POSIX only")
+def test_sigusr2_profiles_the_worker(monkeypatch):
+    monkeypatch.setattr(settings, "PROFILE_SIGNAL_SECONDS", 0.05)
+    previous = profiling.signal.getsignal(profiling.signal.SIGUSR2)
+    try:
+        assert profiling.install_signal_handler("cam_worker")
+        os.kill(os.getpid(), profiling.signal.SIGUSR2)
+        deadline = time.time() + 5
+        while not profiling.list_profiles() and time.time() < deadline:
+            time.sleep(0.02)
+    finally:
+        profiling.signal.signal(profiling.signal.SIGUSR2, previous)
+
+    saved = profiling.list_profiles()
+    assert saved and saved[0]["name"] == "cam_worker"
+    assert saved[0]["meta"]["pid"] == os.getpid()
@@ -0,0 +1,190 @@
+"""Tests for hedged ProviderChain requests and per-provider latency percentiles."""
+import asyncio
+import time
+
+import pytest
+
+from aicmo.gateways.provider_chain import HedgeBudget, ProviderChain, ProviderHealth, ProviderWrapper
+from aicmo.llm.router import get_hedge_budget_ratio, get_llm_client, reset_llm_clients
+from aicmo.shared.config import settings
+
+
+class LatencyAdapter:
+    """Fake LLM adapter with injected latency; records cancellations."""
+
+    dry_run = False
+
+    def __init__(self, name, delay):
+        self.name = name
+        self.delay = delay
+        self.calls = 0
+        self.cancelled = 0
+
+    async def generate(self, prompt):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return f"{self.name}:{prompt}"
+
+
+class SyncLatencyAdapter:
+    """Like LatencyAdapter, but with a blocking generate() as the real adapters have."""
+
+    dry_run = False
+
+    def __init__(self, name, delay):
+        self.name = name
+        self.delay = delay
+        self.calls = 0
+
+    def generate(self, prompt):
+        self.calls += 1
+        time.sleep(self.delay)
+        return f"{self.name}:{prompt}"
+
+
+def _warm(wrapper, latency_ms=10.0, samples=20):
+    for _ in range(samples):
+        wrapper._record_success(latency_ms)
+
+
+def _chain(primary_delay, backup_delay, budget=None, warm=True):
+    primary = ProviderWrapper(LatencyAdapter("primary", primary_delay), "fake/primary")
+    backup = ProviderWrapper(LatencyAdapter("backup", backup_delay), "fake/backup")
+    if warm:
+        _warm(primary, 10.0)
+        _warm(backup, 20.0)
+    chain = ProviderChain("llm", [primary, backup], hedge_budget=budget or HedgeBudget(ratio=0.5))
+    return chain, primary, backup
+
+
+def _invoke(chain):
+    started = time.perf_counter()
+    outcome = asyncio.run(chain.invoke("generate", prompt="p"))
+    return outcome, time.perf_counter() - started
+
+
+def test_latency_percentiles():
+    wrapper = ProviderWrapper(LatencyAdapter("a", 0), "fake/a")
+    for ms in range(100, 0, -1):
+        wrapper._record_success(float(ms))
+    assert wrapper.latency_percentiles() == {"p50": 50.0, "p95": 95.0, "p99": 99.0, "samples": 100}
+    assert ProviderWrapper(LatencyAdapter("b", 0), "fake/b").latency_percentiles()["p95"] is None
+
+
+def test_slow_primary_is_hedged_and_loser_cancelled():
+    chain, primary, backup = _chain(primary_delay=1.0, backup_delay=0.01)
+    (success, result, provider), elapsed = _invoke(chain)
+    assert (success, result, provider) == (True, "backup:p", "fake/backup")
+    assert elapsed < 0.5
+    assert primary.provider.cancelled == 1
+    report = chain.get_status_report()
+    assert report["hedging"]["fired"] == 1
+    assert report["hedging"]["won"] == 1
+    assert primary.status.total_failures == 0  # cancellation is not a provider failure
+    # The cancelled primary still counts as a sample of at least the hedge delay
+    assert primary.latency_percentiles()["samples"] == 21
+    assert max(primary._latencies) >= 10.0
+
+
+def test_slow_sync_primary_is_hedged():
+    primary = ProviderWrapper(SyncLatencyAdapter("primary", 1.0), "fake/primary")
+    backup = ProviderWrapper(SyncLatencyAdapter("backup", 0.01), "fake/backup")
+    _warm(primary, 10.0)
+    _warm(backup, 20.0)
+    chain = ProviderChain("llm", [primary, backup], hedge_budget=HedgeBudget(ratio=0.5))
+
+    (success, result, provider), elapsed = _invoke(chain)
+    assert (success, result, provider) == (True, "backup:p", "fake/backup")
+    assert elapsed < 0.5  # the abandoned primary doesn't hold up the caller
+    assert chain.get_status_report()["hedging"]["won"] == 1
+    assert primary.status.total_failures == 0
+
+
+def test_repeated_hedges_raise_the_primary_p95():
+    chain, primary, backup = _chain(primary_delay=1.0, backup_delay=0.05, budget=HedgeBudget(ratio=1.0))
+    chain._get_sorted_providers = lambda: [primary, backup]  # keep the primary first
+    for _ in range(3):
+        (_, _, provider), _ = _invoke(chain)
+        assert provider == "fake/backup"
+    # Without the cancelled samples the primary's p95 would still read 10ms
+    assert primary.latency_percentiles()["samples"] == 23
+    assert primary.latency_percentile(95) >= 50.0
+
+
+def test_fast_primary_is_not_hedged():
+    chain, primary, backup = _chain(primary_delay=0.0, backup_delay=0.0)
+    (success, _, provider), _ = _invoke(chain)
+    assert (success, provider) == (True, "fake/primary")
+    assert backup.provider.calls == 0
+    assert chain.get_status_report()["hedging"]["fired"] == 0
+
+
+def test_no_hedge_without_enough_latency_samples():
+    chain, primary, backup = _chain(primary_delay=0.1, backup_delay=0.0, warm=False)
+    (success, _, provider), elapsed = _invoke(chain)
+    assert (success, provider) == (True, "fake/primary")
+    assert elapsed >= 0.1
+    assert backup.provider.calls == 0
+
+
+def test_hedging_budget_caps_extra_calls():
+    chain, primary, backup = _chain(
+        primary_delay=0.15, backup_delay=0.0, budget=HedgeBudget(ratio=0.0, max_tokens=1)
+    )
+    (_, _, first), _ = _invoke(chain)
+    # Reset the primary's p95 so it stays the preferred provider
+    primary._latencies.clear()
+    _warm(primary, 10.0)
+    (_, _, second), elapsed = _invoke(chain)
+    assert first == "fake/backup"
+    assert second == "fake/primary" and elapsed >= 0.15
+    assert chain.hedge_budget.to_dict()["hedges"] == 1
+
+
+def test_unhealthy_backup_is_not_used_for_hedging():
+    chain, primary, backup = _chain(primary_delay=0.1, backup_delay=0.0)
+    backup.status.health = ProviderHealth.UNHEALTHY
+    (success, _, provider), _ = _invoke(chain)
+    assert (success, provider) == (True, "fake/primary")
+    assert backup.provider.calls == 0
+
+
+def test_failed_hedge_race_falls_back_to_remaining_providers():
+    class Failing(LatencyAdapter):
+        async def generate(self, prompt):
+            await super().generate(prompt)
+            raise RuntimeError("boom")
+
+    primary = ProviderWrapper(Failing("primary", 0.05), "fake/primary", health_threshold_failures=10)
+    backup = ProviderWrapper(Failing("backup", 0.0), "fake/backup", health_threshold_failures=10)
+    third = ProviderWrapper(LatencyAdapter("third", 0.0), "fake/third")
+    for w in (primary, backup):
+        _warm(w, 1.0)
+    chain = ProviderChain("llm", [primary, backup, third], hedge_budget=HedgeBudget())
+    (success, result, provider), _ = _invoke(chain)
+    assert (success, result, provider) == (True, "third:p", "fake/third")
+    assert primary.provider.calls == backup.provider.calls == third.provider.calls == 1
+
+
+def test_router_hedge_budget_per_use_case(monkeypatch):
+    reset_llm_clients()
+    try:
+        assert get_llm_client("SOCIAL_CONTENT").hedge_budget is None
+        reset_llm_clients()
+
+        monkeypatch.setattr(settings, "LLM_HEDGE_ENABLED", True)
+        monkeypatch.setenv("LLM_HEDGE_BUDGET_EMAIL_COPY", "0.25")
+        assert get_hedge_budget_ratio("SOCIAL_CONTENT") == settings.LLM_HEDGE_BUDGET_RATIO
+        assert get_hedge_budget_ratio("EMAIL_COPY") == 0.25
+
+        social = get_llm_client("SOCIAL_CONTENT")
+        email = get_llm_client("EMAIL_COPY")
+        assert social.hedge_budget is not email.hedge_budget
+        assert email.hedge_budget.ratio == 0.25
+        assert get_llm_client("SOCIAL_CONTENT", profile_override="standard").hedge_budget is social.hedge_budget
+    finally:
+        reset_llm_clients()
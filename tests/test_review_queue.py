@@ -252,5 +252,101 @@ class TestReviewQueueEdgeCases:
         assert len(notes_after_approve) > len(notes_after_flag)
 
 
+
+class TestReviewQueuePaging:
+    """Test SQL-side filtering, paging and aggregates used by the review queue API."""
+    
+    @pytest.fixture
+    def review_db(self, tmp_path):
+        """Database on the shared engine (query tracking) with 3 campaigns and 250 pending review tasks."""
+        import aicmo.venture.models  # noqa: F401  (ventures table referenced by cam_leads)
+        from aicmo.shared.db import dispose_engines, get_engine
+        
+        engine = get_engine(f"sqlite:///{tmp_path / 'review.db'}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        campaigns = [CampaignDB(name=f"Campaign {i}") for i in range(3)]
+        session.add_all(campaigns)
+        session.flush()
+        types = ["MESSAGE", "PROPOSAL", "PRICING", None]  # None shows as MESSAGE
+        session.add_all([
+            LeadDB(
+                campaign_id=campaigns[i % 3].id,
+                name=f"Lead {i}",
+                requires_human_review=i < 250,
+                review_type=types[i % 4],
+                notes=f"[Reply] answer {i}" if i % 2 else None,
+            )
+            for i in range(300)
+        ])
+        session.commit()
+        yield session, campaigns
+        session.close()
+        dispose_engines()
+    
+    def test_page_and_summary_are_computed_in_sql(self, review_db):
+        from aicmo.cam.engine.review_queue import get_review_queue_page
+        from aicmo.shared.db import track_queries
+        
+        session, _ = review_db
+        with track_queries("review page") as stats:
+            tasks, total, summary = get_review_queue_page(session, limit=20, offset=40)
+        
+        assert stats.count == 2  # one page query, one GROUP BY
+        assert total == 250
+        assert summary == {"MESSAGE": 125, "PROPOSAL": 63, "PRICING": 62}
+        assert [t.lead_id for t in tasks] == list(range(41, 61))
+        assert tasks[0].review_type == "MESSAGE"
+        assert tasks[1].last_reply_snippet == "[Reply] answer 41"
+    
+    def test_page_filters(self, review_db):
+        from aicmo.cam.engine.review_queue import get_review_queue, get_review_queue_page
+        
+        session, campaigns = review_db
+        tasks, total, summary = get_review_queue_page(session, review_type="MESSAGE", limit=1000)
+        assert total == len(tasks) == 125
+        assert summary == {"MESSAGE": 125}
+        
+        tasks, total, summary = get_review_queue_page(
+            session, campaign_id=campaigns[1].id, review_type="PRICING"
+        )
+        expected = [i + 1 for i in range(250) if i % 3 == 1 and i % 4 == 2]
+        assert [t.lead_id for t in tasks] == expected
+        assert total == len(expected)
+        
+        all_in_campaign = get_review_queue(session, campaign_id=campaigns[1].id)
+        assert len(all_in_campaign) == sum(1 for i in range(250) if i % 3 == 1)
+    
+    def test_stats_from_aggregates(self, review_db):
+        from aicmo.cam.engine.review_queue import get_review_queue_stats
+        from aicmo.shared.db import track_queries
+        
+        session, _ = review_db
+        with track_queries("review stats") as query_stats:
+            stats = get_review_queue_stats(session)
+        
+        assert query_stats.count == 2
+        assert stats["total_pending"] == 250
+        assert stats["by_type"] == {"MESSAGE": 125, "PROPOSAL": 63, "PRICING": 62}
+        assert stats["by_campaign"] == {"Campaign 0": 84, "Campaign 1": 83, "Campaign 2": 83}
+        assert stats["oldest_task_created_at"] is not None
+    
+    def test_review_queries_use_indexes(self, review_db):
+        from sqlalchemy import text
+        
+        session, campaigns = review_db
+        plans = [
+            session.execute(text(f"EXPLAIN QUERY PLAN {sql}"), params).all()
+            for sql, params in [
+                ("SELECT review_type, count(id) FROM cam_leads WHERE requires_human_review = 1 "
+                 "GROUP BY review_type", {}),
+                ("SELECT id FROM cam_leads WHERE requires_human_review = 1 AND campaign_id = :c "
+                 "AND review_type = 'PRICING'", {"c": campaigns[1].id}),
+            ]
+        ]
+        for plan in plans:
+            assert any("idx_lead_review" in row[-1] for row in plan), plan
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
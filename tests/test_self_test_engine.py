@@ -4,6 +4,9 @@ Self-Test Engine Pytest Integration
 Light smoke tests to ensure self-test engine runs without crashing.
 """
 
+import json
+from pathlib import Path
+
 import pytest
 
 from aicmo.self_test.discovery import (
@@ -129,6 +132,72 @@ class TestSelfTestSnapshots:
         assert result.has_diff is False
         assert result.severity == "none"
 
+    def test_unchanged_payload_compares_by_hash(self, tmp_path, monkeypatch):
+        """An unchanged output never loads the stored payload."""
+        manager = SnapshotManager(str(tmp_path))
+        manager.save_snapshot("test_feature", "test_scenario", {"b": [1, 2], "a": "x"})
+
+        def fail(digest):
+            raise AssertionError("payload should not be loaded")
+
+        monkeypatch.setattr(manager, "_read_object", fail)
+        result = manager.compare_with_snapshot("test_feature", "test_scenario", {"a": "x", "b": [1, 2]})
+        assert result.has_diff is False
+
+    def test_changed_payload_is_diffed(self, tmp_path):
+        """A changed output gets a structural diff against the latest snapshot."""
+        manager = SnapshotManager(str(tmp_path))
+        manager.save_snapshot("test_feature", "test_scenario", {"key": "value", "items": [1, 2]})
+
+        result = manager.compare_with_snapshot("test_feature", "test_scenario", {"items": [1, 2, 3], "new": True})
+        assert result.has_diff is True
+        assert result.severity == "moderate"
+        assert result.removed_keys == ["key"]
+        assert result.added_keys == ["new"]
+        assert result.length_diffs == {"items": (2, 3)}
+
+    def test_payloads_are_deduplicated_with_history(self, tmp_path):
+        """Equal payloads share one object; each change adds a history entry."""
+        manager = SnapshotManager(str(tmp_path))
+        manager.save_snapshot("feature", "s1", {"v": 1})
+        manager.save_snapshot("feature", "s1", {"v": 1})
+        manager.save_snapshot("feature", "s2", {"v": 1})
+        manager.save_snapshot("feature", "s1", {"v": 2})
+
+        history = manager.get_history("feature", "s1")
+        assert len(history) == 2
+        assert manager.load_payload(history[1]["hash"]) == {"v": 1}
+        assert manager.load_snapshot("feature", "s1")["payload"] == {"v": 2}
+        assert manager.get_snapshot_stats() == {"total_snapshots": 2, "features": 1, "objects": 2}
+
+    def test_collect_garbage_trims_history(self, tmp_path):
+        """Old versions beyond keep_history and their objects are removed."""
+        manager = SnapshotManager(str(tmp_path))
+        for version in range(4):
+            manager.save_snapshot("feature", "scenario", {"v": version})
+
+        assert manager.collect_garbage(keep_history=2) == {"entries_removed": 2, "objects_removed": 2}
+        assert [manager.load_payload(h["hash"]) for h in manager.get_history("feature", "scenario")] == [
+            {"v": 3},
+            {"v": 2},
+        ]
+
+    def test_legacy_json_snapshots_are_imported(self, tmp_path):
+        """Snapshots in the old one-file-per-scenario layout stay comparable."""
+        legacy = tmp_path / "test_feature" / "test_scenario.json"
+        legacy.parent.mkdir()
+        legacy.write_text(json.dumps({
+            "feature": "test_feature",
+            "scenario": "test_scenario",
+            "timestamp": "2025-01-01T00:00:00",
+            "metadata": {},
+            "payload": {"key": "value"},
+        }))
+
+        manager = SnapshotManager(str(tmp_path))
+        assert manager.load_snapshot("test_feature", "test_scenario")["payload"] == {"key": "value"}
+        assert manager.compare_with_snapshot("test_feature", "test_scenario", {"key": "value"}).has_diff is False
+
 
 class TestSelfTestOrchestrator:
     """Test the main orchestrator."""
@@ -744,3 +813,63 @@ class TestExternalIntegrationsHealth:
         assert "env_vars_present" in service.details
         assert "api_endpoint" in service.details
         assert "check_type" in service.details
+
+
+class TestParallelExecution:
+    """Test the worker pool and the generator result cache."""
+
+    REPO_ROOT = str(Path(__file__).resolve().parents[1])
+
+    @staticmethod
+    def _signature(result):
+        return [
+            (f.name, f.status, f.scenarios_passed, f.scenarios_failed, f.scenarios_skipped, f.errors)
+            for f in result.features
+        ]
+
+    def test_worker_pool_matches_in_process_run(self, tmp_path):
+        """Running in a process pool gives the same results as running in-process."""
+        serial = SelfTestOrchestrator(str(tmp_path / "a"), self.REPO_ROOT, max_workers=1, use_cache=False)
+        parallel = SelfTestOrchestrator(str(tmp_path / "b"), self.REPO_ROOT, max_workers=2, use_cache=False)
+
+        serial_result = serial.run_self_test(quick_mode=True)
+        parallel_result = parallel.run_self_test(quick_mode=True)
+
+        assert any(f.scenarios_passed for f in parallel_result.features)
+        assert self._signature(parallel_result) == self._signature(serial_result)
+        assert parallel_result.workers == 2
+        assert parallel_result.wall_time_seconds > 0
+        assert "generators" in parallel_result.phase_timings
+
+    def test_unchanged_generators_are_served_from_cache(self, tmp_path):
+        """A second run reuses passing scenarios instead of re-running them."""
+        orchestrator = SelfTestOrchestrator(
+            str(tmp_path / "snapshots"), self.REPO_ROOT, max_workers=2,
+            cache_path=str(tmp_path / "cache.db"),
+        )
+        first = orchestrator.run_self_test(quick_mode=True)
+        second = orchestrator.run_self_test(quick_mode=True)
+
+        assert first.cache_hits == 0
+        passed = [f for f in first.features if f.category.value == "generator" and f.status.value == "pass"]
+        assert second.cache_hits == sum(f.scenarios_passed for f in passed) > 0
+        assert self._signature(second) == self._signature(first)
+        for feature in second.features:
+            if feature.name in {f.name for f in passed}:
+                assert feature.details["cached_scenarios"] == feature.scenarios_passed
+
+    def test_cache_key_follows_generator_source(self, tmp_path, monkeypatch):
+        """Editing a generator's source changes its cache key."""
+        from aicmo.self_test.cache import scenario_key, source_fingerprint
+
+        module_file = tmp_path / "fake_self_test_generator.py"
+        module_file.write_text("def generate(brief):\n    return {'text': 'v1'}\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        brief = get_quick_test_briefs(1)[0]
+
+        before = scenario_key(source_fingerprint("fake_self_test_generator"), brief, {"checks": {}})
+        module_file.write_text("def generate(brief):\n    return {'text': 'v2'}\n")
+        after = scenario_key(source_fingerprint("fake_self_test_generator"), brief, {"checks": {}})
+
+        assert before != after
+        assert scenario_key("abc", brief, {"checks": {}}) != scenario_key("abc", brief, {"checks": {"format": True}})
@@ -0,0 +1,131 @@
+"""Tests for the shared engine/connection registry and query instrumentation."""
+import logging
+import os
+import threading
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from aicmo.shared.db import (
+    dispose_engines,
+    get_engine,
+    get_sqlite_connection,
+    normalize_sql,
+    track_queries,
+)
+from backend.db.query_stats import QueryStatsMiddleware
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    yield str(tmp_path / "registry.db")
+    dispose_engines()
+
+
+def test_engine_is_shared_per_url(db_path):
+    url = f"sqlite:///{db_path}"
+    assert get_engine(url) is get_engine(url)
+    assert get_engine(url) is not get_engine(f"sqlite:///{db_path}.other")
+
+
+def test_sqlite_engine_applies_pragmas(db_path):
+    with get_engine(f"sqlite:///{db_path}").connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+
+
+def test_sqlite_connection_is_long_lived_per_thread(db_path):
+    conn = get_sqlite_connection(db_path)
+    conn.execute("CREATE TABLE t (id INTEGER)")
+    conn.commit()
+    conn.close()
+    assert get_sqlite_connection(db_path) is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    other = []
+    t = threading.Thread(target=lambda: other.append(get_sqlite_connection(db_path)))
+    t.start()
+    t.join()
+    assert other[0] is not conn
+
+
+def test_sqlite_close_discards_uncommitted_work(db_path):
+    conn = get_sqlite_connection(db_path)
+    conn.execute("CREATE TABLE t (id INTEGER)")
+    conn.commit()
+    conn.execute("INSERT INTO t VALUES (1)")
+    conn.close()
+    assert get_sqlite_connection(db_path).execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+
+def test_sqlite_connection_reopens_replaced_file(db_path):
+    conn = get_sqlite_connection(db_path)
+    conn.execute("CREATE TABLE old_table (id INTEGER)")
+    conn.commit()
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(db_path + suffix):
+            os.unlink(db_path + suffix)
+    open(db_path, "wb").close()
+
+    fresh = get_sqlite_connection(db_path)
+    tables = fresh.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
+    assert tables == []
+
+
+def test_normalize_sql_collapses_literals():
+    assert normalize_sql("SELECT * FROM t WHERE id = 42 AND name = 'x'") == \
+        normalize_sql("SELECT *  FROM t WHERE id = 7 AND name = 'yy'")
+    assert normalize_sql("SELECT * FROM t WHERE id IN (?, ?, ?)") == "SELECT * FROM t WHERE id IN (?)"
+
+
+def test_track_queries_counts_engine_and_sqlite3(db_path):
+    engine = get_engine(f"sqlite:///{db_path}")
+    conn = get_sqlite_connection(db_path)
+    with track_queries("outer") as outer:
+        with engine.connect() as c:
+            c.execute(text("SELECT 1"))
+        with track_queries("inner") as inner:
+            conn.execute("SELECT 2")
+            conn.cursor().execute("SELECT 3")
+    assert inner.count == 2
+    assert outer.count == 3
+    assert outer.total_seconds > 0
+
+    with engine.connect() as c:
+        c.execute(text("SELECT 1"))
+    assert outer.count == 3
+
+
+def test_n_plus_one_is_logged_with_label(db_path, caplog):
+    conn = get_sqlite_connection(db_path)
+    conn.execute("CREATE TABLE items (id INTEGER)")
+    conn.commit()
+    with caplog.at_level(logging.WARNING, logger="aicmo.shared.db"):
+        with track_queries("GET /brands/{brand_id}") as stats:
+            for i in range(12):
+                conn.execute(f"SELECT * FROM items WHERE id = {i}").fetchall()
+    assert stats.n_plus_one() == [("SELECT * FROM items WHERE id = ?", 12)]
+    assert "Possible N+1 query in GET /brands/{brand_id}" in caplog.text
+
+
+def test_middleware_labels_route_and_sets_headers(db_path, caplog):
+    engine = get_engine(f"sqlite:///{db_path}")
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware)
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int):
+        with engine.connect() as c:
+            for _ in range(10):
+                c.execute(text("SELECT :id"), {"id": item_id})
+        return {"ok": True}
+
+    with caplog.at_level(logging.WARNING, logger="aicmo.shared.db"):
+        response = TestClient(app).get("/items/5")
+    assert response.status_code == 200
+    assert response.headers["X-DB-Query-Count"] == "10"
+    assert response.headers["Server-Timing"].startswith("db;dur=")
+    assert "Possible N+1 query in GET /items/{item_id}" in caplog.text
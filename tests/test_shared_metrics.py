@@ -0,0 +1,148 @@
+"""
+Tests for the shared Prometheus metrics (aicmo.shared.metrics) and their wiring:
+- per-route request / DB time histograms from QueryStatsMiddleware
+- provider call counters from ProviderWrapper
+- cache hit/miss counters
+- push_snapshot for worker processes
+- GET /metrics on the main API
+"""
+
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+
+from aicmo.gateways.provider_chain import ProviderChain, ProviderWrapper
+from aicmo.llm.cache import LLMResponseCache
+from aicmo.shared import metrics
+from aicmo.shared.config import settings
+from aicmo.shared.db import dispose_engines, get_engine
+from backend.db.query_stats import QueryStatsMiddleware
+
+
+def _value(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_middleware_records_route_and_db_time(tmp_path):
+    engine = get_engine(f"sqlite:///{tmp_path / 'm.db'}")
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware)
+
+    @app.get("/widgets/{widget_id}")
+    def read_widget(widget_id: int):
+        with engine.connect() as c:
+            for _ in range(3):
+                c.execute(text("SELECT :id"), {"id": widget_id})
+        return {"ok": True}
+
+    route = "/widgets/{widget_id}"
+    before = _value("aicmo_request_db_queries_sum", route=route)
+    client = TestClient(app)
+    for widget_id in (1, 2):
+        assert client.get(f"/widgets/{widget_id}").status_code == 200
+    assert client.get("/nope/123").status_code == 404
+    dispose_engines()
+
+    assert _value("aicmo_http_request_seconds_count", method="GET", route=route, status="200") >= 2
+    assert _value("aicmo_request_db_queries_sum", route=route) - before == 6
+    assert _value("aicmo_request_db_seconds_count", route=route) >= 2
+    # Raw unmatched paths never become label values
+    assert _value("aicmo_http_request_seconds_count", method="GET", route="unmatched", status="404") >= 1
+    assert REGISTRY.get_sample_value(
+        "aicmo_http_request_seconds_count", {"method": "GET", "route": "/nope/123", "status": "404"}
+    ) is None
+
+
+class FlakyAdapter:
+    dry_run = False
+
+    def __init__(self, fail):
+        self.fail = fail
+
+    async def generate(self, prompt):
+        if self.fail:
+            raise RuntimeError("down")
+        return prompt
+
+
+def test_provider_calls_are_counted_per_capability_and_provider():
+    chain = ProviderChain(
+        "metrics_test",
+        [
+            ProviderWrapper(FlakyAdapter(fail=True), "metrics/primary"),
+            ProviderWrapper(FlakyAdapter(fail=False), "metrics/backup"),
+        ],
+    )
+    labels = {"capability": "metrics_test"}
+    before_fail = _value("aicmo_provider_calls_total", provider="metrics/primary", outcome="failure", **labels)
+    before_ok = _value("aicmo_provider_calls_total", provider="metrics/backup", outcome="success", **labels)
+
+    success, result, _ = asyncio.run(chain.invoke("generate", "hi"))
+
+    assert success and result == "hi"
+    assert _value("aicmo_provider_calls_total", provider="metrics/primary", outcome="failure", **labels) == before_fail + 1
+    assert _value("aicmo_provider_calls_total", provider="metrics/backup", outcome="success", **labels) == before_ok + 1
+    assert _value("aicmo_provider_call_seconds_count", provider="metrics/backup", **labels) >= 1
+
+
+def test_llm_cache_hits_and_misses(tmp_path):
+    cache = LLMResponseCache(str(tmp_path / "llm.db"))
+    hits = _value("aicmo_cache_requests_total", cache="llm", result="hit")
+    misses = _value("aicmo_cache_requests_total", cache="llm", result="miss")
+
+    assert cache.get("k") is None
+    cache.put("k", "answer", provider="openai", model="m")
+    assert cache.get("k") == ("k", "answer")
+
+    assert _value("aicmo_cache_requests_total", cache="llm", result="hit") == hits + 1
+    assert _value("aicmo_cache_requests_total", cache="llm", result="miss") == misses + 1
+
+
+def test_pdf_render_timer():
+    before = _value("aicmo_pdf_render_seconds_count", template="t.html")
+    with metrics.time_pdf_render("t.html"):
+        pass
+    assert _value("aicmo_pdf_render_seconds_count", template="t.html") == before + 1
+
+
+def test_histograms_have_fixed_buckets():
+    hist = metrics.SECTION_GENERATION_SECONDS.labels("metrics_pack", "overview")
+    for _ in range(5000):
+        hist.observe(0.2)
+    samples = [
+        s for s in REGISTRY.collect()
+        if s.name == "aicmo_section_generation_seconds"
+    ][0].samples
+    buckets = [s for s in samples if s.name.endswith("_bucket") and s.labels["pack"] == "metrics_pack"]
+    assert len(buckets) == len(metrics.SECTION_BUCKETS) + 1
+
+
+def test_push_snapshot_writes_textfile(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_PUSHGATEWAY_URL", "")
+    monkeypatch.setattr(settings, "METRICS_TEXTFILE_DIR", "")
+    assert metrics.push_snapshot("cam_worker") is False
+
+    monkeypatch.setattr(settings, "METRICS_TEXTFILE_DIR", str(tmp_path / "prom"))
+    metrics.WORKER_CYCLE_SECONDS.labels("cam_worker", "success").observe(1.5)
+    assert metrics.push_snapshot("cam_worker") is True
+    content = (tmp_path / "prom" / "cam_worker.prom").read_text()
+    assert 'aicmo_worker_cycle_seconds_count{status="success",worker="cam_worker"}' in content
+
+
+def test_push_snapshot_failure_is_not_raised(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_PUSHGATEWAY_URL", "127.0.0.1:9")  # discard port
+    monkeypatch.setattr(settings, "METRICS_TEXTFILE_DIR", "")
+    assert metrics.push_snapshot("aol_daemon") is False
+
+
+def test_main_app_exposes_metrics():
+    from backend.main import app
+
+    response = TestClient(app).get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "aicmo_http_request_seconds" in response.text
+    assert "aicmo_provider_calls_total" in response.text
@@ -0,0 +1,104 @@
+"""
+Tests for aicmo.shared.step_graph: dependency order, concurrency,
+failure/timeout capture and graph validation.
+"""
+
+import threading
+import time
+
+import pytest
+
+from aicmo.shared import tracing
+from aicmo.shared.step_graph import (
+    FAILED,
+    SKIPPED,
+    SUCCEEDED,
+    TIMED_OUT,
+    Step,
+    run_step_graph,
+    step_timings,
+)
+
+
+def test_dependencies_receive_upstream_values():
+    results = run_step_graph([
+        Step("total", lambda deps: deps["a"] + deps["b"], ("a", "b")),
+        Step("a", lambda deps: 1),
+        Step("b", lambda deps: 2),
+    ])
+    assert list(results) == ["total", "a", "b"]
+    assert results["total"].value == 3
+    assert all(r.status == SUCCEEDED for r in results.values())
+
+
+def test_independent_steps_overlap():
+    barrier = threading.Barrier(3, timeout=2)
+    started = time.perf_counter()
+    results = run_step_graph([Step(name, lambda deps: barrier.wait()) for name in ("x", "y", "z")])
+    assert time.perf_counter() - started < 1
+    assert all(r.ok for r in results.values())
+
+
+def test_failures_skip_dependents_unless_optional():
+    def boom(deps):
+        raise ValueError("nope")
+
+    results = run_step_graph([
+        Step("required", boom),
+        Step("hint", boom, optional=True),
+        Step("after_required", lambda deps: "ran", ("required",)),
+        Step("after_hint", lambda deps: deps["hint"], ("hint",)),
+        Step("leaf", lambda deps: "ran", ("after_required",)),
+    ])
+    assert results["required"].status == FAILED
+    assert results["required"].error == "ValueError: nope"
+    assert results["after_required"].status == SKIPPED
+    assert results["leaf"].status == SKIPPED
+    assert results["after_hint"].status == SUCCEEDED
+    assert results["after_hint"].value is None
+
+
+def test_timeouts_do_not_wait_for_the_step():
+    release = threading.Event()
+    started = time.perf_counter()
+    results = run_step_graph(
+        [
+            Step("stuck", lambda deps: release.wait(5), timeout=0.1),
+            Step("fast", lambda deps: "done"),
+            Step("after", lambda deps: "ran", ("stuck",)),
+        ],
+    )
+    release.set()
+    assert time.perf_counter() - started < 1
+    assert results["stuck"].status == TIMED_OUT
+    assert results["after"].status == SKIPPED
+    assert results["fast"].value == "done"
+    timings = step_timings(results)
+    assert timings["stuck"]["seconds"] >= 0.1
+    assert "error" not in timings["fast"]
+
+
+@pytest.mark.parametrize(
+    "steps, message",
+    [
+        ([Step("a", lambda d: 1, ("missing",))], "unknown"),
+        ([Step("a", lambda d: 1), Step("a", lambda d: 2)], "Duplicate"),
+        ([Step("a", lambda d: 1, ("b",)), Step("b", lambda d: 1, ("a",))], "cycle"),
+    ],
+)
+def test_invalid_graphs_are_rejected(steps, message):
+    with pytest.raises(ValueError, match=message):
+        run_step_graph(steps)
+
+
+def test_steps_are_traced_under_the_caller(monkeypatch, tmp_path):
+    from aicmo.shared.config import settings
+
+    monkeypatch.setattr(settings, "TRACE_SAMPLE_RATE", 1.0)
+    monkeypatch.setattr(settings, "TRACE_FILE_PATH", str(tmp_path / "traces.jsonl"))
+    with tracing.start_trace("flow") as root:
+        run_step_graph([Step("a", lambda deps: None), Step("b", lambda deps: None, ("a",))])
+        trace_id = root.trace.trace_id
+
+    rows = tracing.flame(tracing.get_trace(trace_id))
+    assert [(r["name"], r["depth"]) for r in rows] == [("flow", 0), ("step.a", 1), ("step.b", 1)]
@@ -0,0 +1,223 @@
+"""
+Tests for per-request tracing (aicmo.shared.tracing):
+- span nesting across sync/async code and DB statements
+- tail sampling (slow and failed traces are kept with all their spans)
+- OTLP/JSON export off the calling thread and flame rows
+- TracingMiddleware and GET /traces
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from aicmo.shared import tracing
+from aicmo.shared.config import settings
+from aicmo.shared.db import dispose_engines, get_engine
+from backend.routers.traces import router as traces_router
+
+
+@pytest.fixture(autouse=True)
+def trace_settings(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "TRACING_ENABLED", True)
+    monkeypatch.setattr(settings, "TRACE_EXPORTERS", "file")
+    monkeypatch.setattr(settings, "TRACE_FILE_PATH", str(tmp_path / "traces.jsonl"))
+    monkeypatch.setattr(settings, "TRACE_SAMPLE_RATE", 1.0)
+    monkeypatch.setattr(settings, "TRACE_SLOW_MS", 8000.0)
+    tracing.clear_recent()
+    yield
+    tracing.clear_recent()
+
+
+def _spans(otlp):
+    return otlp["resourceSpans"][0]["scopeSpans"][0]["spans"]
+
+
+def _attrs(span):
+    return {a["key"]: a["value"] for a in span["attributes"]}
+
+
+def test_spans_nest_under_the_root():
+    @tracing.traced("section", attrs=("section_id",))
+    def generate(section_id):
+        with tracing.span("llm.call", provider="openai"):
+            return section_id
+
+    with tracing.start_trace("generate_report", pack_key="quick_social_basic") as root:
+        generate(section_id="overview")
+        trace_id = root.trace.trace_id
+
+    otlp = tracing.get_trace(trace_id)
+    spans = {s["name"]: s for s in _spans(otlp)}
+    assert set(spans) == {"generate_report", "section", "llm.call"}
+    assert "parentSpanId" not in spans["generate_report"]
+    assert spans["section"]["parentSpanId"] == spans["generate_report"]["spanId"]
+    assert spans["llm.call"]["parentSpanId"] == spans["section"]["spanId"]
+    assert _attrs(spans["section"])["section_id"] == {"stringValue": "overview"}
+    assert _attrs(spans["generate_report"])["pack_key"] == {"stringValue": "quick_social_basic"}
+    assert all(s["traceId"] == trace_id for s in spans.values())
+
+
+def test_span_outside_a_trace_is_a_noop():
+    with tracing.span("orphan") as s:
+        s.set_attribute("ignored", 1)
+    assert s is tracing.NOOP_SPAN
+    assert tracing.recent_traces() == []
+
+
+def test_async_functions_keep_context():
+    @tracing.traced("stage.async")
+    async def stage():
+        await asyncio.sleep(0)
+        with tracing.span("inner"):
+            return tracing.current_trace_id()
+
+    async def run():
+        with tracing.start_trace("root") as root:
+            inner_id = await stage()
+        return root.trace.trace_id, inner_id
+
+    trace_id, inner_id = asyncio.run(run())
+    assert trace_id == inner_id
+    names = [row["name"] for row in tracing.flame(tracing.get_trace(trace_id))]
+    assert names == ["root", "stage.async", "inner"]
+
+
+def test_fast_traces_are_sampled_and_slow_or_failed_ones_kept(monkeypatch):
+    monkeypatch.setattr(settings, "TRACE_SAMPLE_RATE", 0.0)
+    monkeypatch.setattr(settings, "TRACE_SLOW_MS", 20.0)
+
+    with tracing.start_trace("fast"):
+        pass
+    with tracing.start_trace("slow"):
+        time.sleep(0.03)
+    with pytest.raises(ValueError):
+        with tracing.start_trace("failed"):
+            raise ValueError("boom")
+
+    kept = {t["name"]: t for t in tracing.recent_traces()}
+    assert set(kept) == {"slow", "failed"}
+    assert kept["slow"]["duration_ms"] >= 20
+    assert kept["failed"]["error"] is True
+
+
+def test_slow_traces_keep_their_breakdown_at_zero_sample_rate(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "TRACE_SAMPLE_RATE", 0.0)
+    monkeypatch.setattr(settings, "TRACE_SLOW_MS", 20.0)
+    engine = get_engine(f"sqlite:///{tmp_path / 't.db'}")
+
+    with tracing.start_trace("slow") as root:
+        assert tracing.is_recording()
+        with tracing.span("stage"):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            time.sleep(0.03)
+        trace_id = root.trace.trace_id
+    dispose_engines()
+
+    names = [(r["name"], r["depth"]) for r in tracing.flame(tracing.get_trace(trace_id))]
+    assert names == [("slow", 0), ("stage", 1), ("db.query", 2)]
+
+
+def test_file_export_is_otlp_json(tmp_path):
+    with tracing.start_trace("exported", attempts=2, ratio=0.5, cached=False):
+        pass
+
+    assert tracing.flush_exports()
+    lines = (tmp_path / "traces.jsonl").read_text().splitlines()
+    assert len(lines) == 1
+    otlp = json.loads(lines[0])
+    resource = otlp["resourceSpans"][0]["resource"]["attributes"]
+    assert {"key": "service.name", "value": {"stringValue": "aicmo"}} in resource
+    span = _spans(otlp)[0]
+    assert len(span["traceId"]) == 32 and len(span["spanId"]) == 16
+    assert int(span["endTimeUnixNano"]) >= int(span["startTimeUnixNano"])
+    assert _attrs(span) == {
+        "attempts": {"intValue": "2"},
+        "ratio": {"doubleValue": 0.5},
+        "cached": {"boolValue": False},
+    }
+
+    # Still retrievable after the in-memory ring is cleared
+    trace_id = span["traceId"]
+    tracing.clear_recent()
+    assert tracing.get_trace(trace_id) == otlp
+
+
+def test_flame_rows_have_offsets_and_self_time():
+    with tracing.start_trace("root") as root:
+        with tracing.span("child"):
+            time.sleep(0.01)
+        trace_id = root.trace.trace_id
+
+    rows = tracing.flame(tracing.get_trace(trace_id))
+    assert [(r["name"], r["depth"]) for r in rows] == [("root", 0), ("child", 1)]
+    assert rows[0]["offset_ms"] == 0
+    assert rows[1]["duration_ms"] >= 10
+    assert rows[0]["self_ms"] == pytest.approx(rows[0]["duration_ms"] - rows[1]["duration_ms"], abs=0.01)
+
+
+def test_db_statements_become_spans(tmp_path):
+    engine = get_engine(f"sqlite:///{tmp_path / 't.db'}")
+    with tracing.start_trace("job:export") as root:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1 WHERE 2 = 2"))
+        trace_id = root.trace.trace_id
+    dispose_engines()
+
+    queries = [s for s in _spans(tracing.get_trace(trace_id)) if s["name"] == "db.query"]
+    assert queries
+    assert _attrs(queries[-1])["db.statement"] == {"stringValue": "SELECT ? WHERE ? = ?"}
+
+
+def test_span_limit_counts_dropped_spans(monkeypatch):
+    monkeypatch.setattr(settings, "TRACE_MAX_SPANS", 3)
+    with tracing.start_trace("root") as root:
+        for _ in range(5):
+            with tracing.span("child"):
+                pass
+        trace_id = root.trace.trace_id
+
+    otlp = tracing.get_trace(trace_id)
+    assert len(_spans(otlp)) == 3
+    resource = {a["key"]: a["value"] for a in otlp["resourceSpans"][0]["resource"]["attributes"]}
+    assert resource["aicmo.dropped_spans"] == {"intValue": "3"}
+
+
+def test_middleware_and_traces_api():
+    app = FastAPI()
+    app.add_middleware(tracing.TracingMiddleware)
+    app.include_router(traces_router)
+
+    @app.get("/reports/{report_id}")
+    def read_report(report_id: int):
+        with tracing.span("load", report_id=report_id):
+            return {"ok": True}
+
+    client = TestClient(app)
+    response = client.get("/reports/7")
+    trace_id = response.headers["x-trace-id"]
+
+    listing = client.get("/traces").json()["traces"]
+    summary = next(t for t in listing if t["trace_id"] == trace_id)
+    assert summary["name"] == "GET /reports/{report_id}"
+    assert summary["attributes"]["http.route"] == "/reports/{report_id}"
+    assert summary["attributes"]["http.status_code"] == 200
+
+    detail = client.get(f"/traces/{trace_id}").json()
+    assert [r["name"] for r in detail["flame"]] == ["GET /reports/{report_id}", "load"]
+    assert client.get("/traces", params={"source": "file"}).json()["traces"]
+    assert client.get("/traces/0123456789abcdef0123456789abcdef").status_code == 404
+
+
+def test_disabled_tracing_records_nothing(monkeypatch):
+    monkeypatch.setattr(settings, "TRACING_ENABLED", False)
+    with tracing.start_trace("root") as root:
+        with tracing.span("child"):
+            pass
+    assert root is tracing.NOOP_SPAN
+    assert tracing.recent_traces() == []
@@ -0,0 +1,235 @@
+"""
+Tests for the Streamlit UI's shared backend client (aicmo.ui_v2.api_client)
+and server-side conditional GETs (aicmo.shared.http_cache):
+- one pooled client per backend URL
+- ETag revalidation and the freshness window
+- per-endpoint timeouts and GET retries
+- background calls with polling
+- ConditionalGetMiddleware ETags and 304s
+"""
+
+import threading
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from aicmo.shared.http_cache import ConditionalGetMiddleware, compute_etag, etag_matches
+from aicmo.ui_v2.api_client import (
+    BackendClient,
+    get_backend_client,
+    parse_endpoint_timeouts,
+    reset_backend_clients,
+)
+
+
+class FakeBackend:
+    """MockTransport handler serving /campaigns with an ETag; records every request."""
+
+    def __init__(self):
+        self.requests = []
+        self.version = 1
+        self.statuses = []  # status codes to return before the real response
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.statuses:
+            return httpx.Response(self.statuses.pop(0))
+        if request.url.path == "/slow":
+            time.sleep(0.2)
+            return httpx.Response(200, json={"done": True})
+        if request.method == "POST":
+            self.version += 1
+            return httpx.Response(201, json={"version": self.version})
+        etag = f'W/"v{self.version}"'
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(200, json={"version": self.version}, headers={"ETag": etag})
+
+
+@pytest.fixture
+def backend():
+    return FakeBackend()
+
+
+@pytest.fixture
+def client(backend):
+    client = BackendClient(
+        "http://backend",
+        timeout=7,
+        endpoint_timeouts={"/aicmo": 60, "/aicmo/generate": 120},
+        retries=2,
+        cache_ttl=0,
+        transport=httpx.MockTransport(backend),
+    )
+    yield client
+    client.close()
+
+
+def test_parse_endpoint_timeouts():
+    assert parse_endpoint_timeouts("/aicmo/generate=120, /health=3,bad,/x=y") == {
+        "/aicmo/generate": 120.0,
+        "/health": 3.0,
+    }
+
+
+def test_timeout_uses_longest_matching_prefix(client, backend):
+    assert client.timeout_for("/aicmo/generate") == 120
+    assert client.timeout_for("/aicmo/other") == 60
+    assert client.timeout_for("/campaigns") == 7
+
+    client.post_json("/aicmo/generate", {})
+    assert backend.requests[-1].extensions["timeout"]["read"] == 120
+
+
+def test_unchanged_reads_are_revalidated_with_etag(client, backend):
+    assert client.get_json("/campaigns") == (True, {"version": 1}, None)
+    assert client.get_json("/campaigns") == (True, {"version": 1}, None)
+
+    assert "if-none-match" not in backend.requests[0].headers
+    assert backend.requests[1].headers["if-none-match"] == 'W/"v1"'
+
+
+def test_fresh_reads_skip_the_request(backend):
+    client = BackendClient("http://backend", cache_ttl=60, transport=httpx.MockTransport(backend))
+    for _ in range(5):
+        assert client.get_json("/campaigns", params={"limit": 10})[1] == {"version": 1}
+    assert len(backend.requests) == 1
+
+    # Different params are a different read
+    client.get_json("/campaigns", params={"limit": 20})
+    assert len(backend.requests) == 2
+
+    # A write marks cached reads stale; they are revalidated, not refetched blindly
+    client.post_json("/campaigns", {"name": "x"})
+    assert client.get_json("/campaigns", params={"limit": 10})[1] == {"version": 2}
+    assert backend.requests[-1].headers["if-none-match"] == 'W/"v1"'
+    client.close()
+
+
+def test_gets_are_retried_on_gateway_errors(client, backend, monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda s: None)
+    backend.statuses = [503, 502]
+    assert client.get_json("/campaigns") == (True, {"version": 1}, None)
+    assert len(backend.requests) == 3
+
+    backend.statuses = [503, 503, 503]
+    ok, data, error = client.get_json("/other")
+    assert not ok and error.startswith("Backend returned 503")
+
+
+def test_errors_are_returned_not_raised(backend):
+    def timeout(request):
+        raise httpx.ReadTimeout("slow", request=request)
+
+    client = BackendClient("http://backend", timeout=2, transport=httpx.MockTransport(timeout))
+    assert client.get_json("/campaigns") == (False, None, "Request timeout after 2s")
+    client.close()
+
+
+def test_background_call_can_be_polled(client):
+    call_id = client.submit("GET", "/slow")
+    call = client.poll(call_id)
+    assert not call.done
+    assert call.result() is None
+    assert 0 <= call.progress < 1
+
+    call.future.result(timeout=5)
+    assert call.done and call.progress == 1.0
+    assert call.result() == (True, {"done": True}, None)
+
+    client.forget(call_id)
+    assert client.poll(call_id) is None
+
+
+def test_background_post_sends_headers(client, backend):
+    call_id = client.submit("POST", "/aicmo/generate", payload={"q": 1}, headers={"X-Trace-ID": "abc"})
+    call = client.poll(call_id)
+    call.future.result(timeout=5)
+    assert call.result()[0] is True
+    assert backend.requests[-1].headers["x-trace-id"] == "abc"
+    assert backend.requests[-1].extensions["timeout"]["read"] == 120
+
+
+def test_shared_client_per_backend_url(monkeypatch):
+    monkeypatch.delenv("AICMO_BACKEND_URL", raising=False)
+    monkeypatch.delenv("BACKEND_URL", raising=False)
+    assert get_backend_client() is None
+
+    monkeypatch.setenv("AICMO_BACKEND_URL", "http://backend:8000/")
+    try:
+        clients = []
+        threads = [threading.Thread(target=lambda: clients.append(get_backend_client())) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len({id(c) for c in clients}) == 1
+        assert get_backend_client("http://backend:8000") is clients[0]
+        assert clients[0].base_url == "http://backend:8000"
+    finally:
+        reset_backend_clients()
+
+
+# ── ConditionalGetMiddleware ─────────────────────────────────────
+
+
+@pytest.fixture
+def app_client():
+    app = FastAPI()
+    app.add_middleware(ConditionalGetMiddleware, max_body_bytes=1000)
+    state = {"items": [1, 2, 3]}
+
+    @app.get("/items")
+    def items():
+        return {"items": state["items"]}
+
+    @app.get("/big")
+    def big():
+        return {"blob": "x" * 2000}
+
+    @app.get("/text")
+    def text():
+        from fastapi.responses import PlainTextResponse
+        return PlainTextResponse("hello")
+
+    with TestClient(app) as client:
+        yield client, state
+
+
+def test_json_gets_get_an_etag_and_304(app_client):
+    client, state = app_client
+    first = client.get("/items")
+    etag = first.headers["etag"]
+    assert etag == compute_etag(first.content)
+
+    again = client.get("/items", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["etag"] == etag
+
+    state["items"].append(4)
+    changed = client.get("/items", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json() == {"items": [1, 2, 3, 4]}
+    assert changed.headers["etag"] != etag
+
+
+def test_large_and_non_json_responses_pass_through(app_client):
+    client, _ = app_client
+    big = client.get("/big")
+    assert big.status_code == 200 and "etag" not in big.headers
+    assert len(big.json()["blob"]) == 2000
+
+    text = client.get("/text")
+    assert text.text == "hello" and "etag" not in text.headers
+
+
+def test_etag_matching_is_weak():
+    assert etag_matches('"abc"', 'W/"abc"')
+    assert etag_matches('W/"x", W/"abc"', 'W/"abc"')
+    assert etag_matches("*", 'W/"abc"')
+    assert not etag_matches(None, 'W/"abc"')
+    assert not etag_matches('W/"abd"', 'W/"abc"')
@@ -7,7 +7,7 @@ These tests verify that Fix #1 (parsing wow_markdown into sections) works correc
 from backend.utils.wow_markdown_parser import (
     parse_wow_markdown_to_sections,
     validate_section_completeness,
-    _title_to_section_id,
+    title_to_section_id,
 )
 
 
@@ -95,16 +95,16 @@ Fourth section
 
 def test_title_to_section_id_normalization():
     """Test section title normalization."""
-    assert _title_to_section_id("Client Overview") == "overview"
-    assert _title_to_section_id("30-Day Social Calendar") == "detailed_30_day_calendar"
-    assert _title_to_section_id("Messaging Framework") == "messaging_framework"
-    assert _title_to_section_id("KPI Plan") == "kpi_plan_light"
-    assert _title_to_section_id("Final Summary") == "final_summary"
+    assert title_to_section_id("Client Overview") == "overview"
+    assert title_to_section_id("30-Day Social Calendar") == "detailed_30_day_calendar"
+    assert title_to_section_id("Messaging Framework") == "messaging_framework"
+    assert title_to_section_id("KPI Plan") == "kpi_plan_light"
+    assert title_to_section_id("Final Summary") == "final_summary"
 
 
 def test_title_to_section_id_handles_special_chars():
     """Test that special characters are removed from section IDs."""
-    assert _title_to_section_id("Section (with) special! chars@") == "section_with_special_chars"
+    assert title_to_section_id("Section (with) special! chars@") == "section_with_special_chars"
 
 
 def test_validate_section_completeness_all_present():
@@ -0,0 +1,167 @@
+"""
+Tests for the precompiled WOW template renderer.
+
+The single-pass renderer must produce the same markdown as the old
+replace-per-placeholder implementation, and a section map equal to what
+parse_wow_markdown_to_sections would recover from that markdown.
+"""
+
+import re
+from unittest.mock import patch
+
+import pytest
+
+from aicmo.presets.wow_templates import WOW_TEMPLATES, get_wow_template
+from backend.pdf_renderer import build_pdf_context_for_wow_package
+from backend.services.wow_reports import (
+    apply_wow_template,
+    compile_wow_template,
+    get_compiled_wow_template,
+    render_wow_template,
+)
+from backend.utils.wow_markdown_parser import parse_wow_markdown_to_sections
+
+_PLACEHOLDER = re.compile(r"{{\s*([a-zA-Z0-9_]+)\s*}}")
+
+
+def _legacy_apply(template, values):
+    result = template
+    for key, value in values.items():
+        result = result.replace(f"{{{{{key}}}}}", "" if value is None else str(value))
+    return _PLACEHOLDER.sub("", result)
+
+
+def _values_for(package_key, skip_every=3):
+    names = get_compiled_wow_template(package_key).placeholders
+    values = {name: f"{name} content\nsecond line" for i, name in enumerate(names) if i % skip_every}
+    values["brand_name"] = "Driftwood Cafe"
+    return values
+
+
+@pytest.mark.parametrize("package_key", sorted(WOW_TEMPLATES))
+def test_render_matches_legacy_replace_and_parser(package_key):
+    values = _values_for(package_key)
+    rendered = render_wow_template(package_key, values)
+
+    assert rendered.markdown == _legacy_apply(get_wow_template(package_key), values)
+    parsed = parse_wow_markdown_to_sections(rendered.markdown)
+    assert [(s["id"], s["content"]) for s in rendered.sections] == [
+        (s["id"], s["content"]) for s in parsed
+    ]
+
+
+def test_section_map_has_title_and_body():
+    rendered = render_wow_template(
+        "quick_social_basic", {"brand_name": "Driftwood", "overview": "We roast coffee."}
+    )
+    overview = rendered.sections[0]
+    assert overview["id"] == "overview"
+    assert overview["title"] == "Brand & Context Snapshot"
+    assert overview["body"].startswith("We roast coffee.")
+    assert overview["content"].startswith("## Brand & Context Snapshot\n\nWe roast coffee.")
+
+
+def test_unfilled_placeholders_kept_when_not_stripping():
+    markdown = apply_wow_template("quick_social_basic", {"brand_name": "Driftwood"}, strip_unfilled=False)
+    assert "{{overview}}" in markdown
+    assert "{{brand_name}}" not in markdown
+
+
+def test_template_artifacts_in_values_are_stripped():
+    markdown = apply_wow_template(
+        "quick_social_basic", {"brand_name": "Driftwood", "overview": "Hello {{city}}!"}
+    )
+    assert "Hello !" in markdown
+    assert "{{" not in markdown
+
+
+def test_incomplete_brief_uses_fallback_template():
+    rendered = render_wow_template("quick_social_basic", {"brand_name": ""})
+    assert rendered.package_key == "fallback_basic"
+
+
+def test_templates_compile_once():
+    assert get_compiled_wow_template("quick_social_basic") is get_compiled_wow_template(
+        "quick_social_basic"
+    )
+    compiled = compile_wow_template("Intro {{a}}\n## One\n{{b}}\n## Two\nx {{a}}\n")
+    assert [s.id for s in compiled.sections] == ["one", "two"]
+    assert compiled.placeholders == ["a", "b"]
+
+
+def test_validation_uses_rendered_sections_without_reparsing():
+    from backend.main import _apply_wow_to_output
+
+    rendered = render_wow_template("quick_social_basic", _values_for("quick_social_basic"))
+    output = type("Output", (), {"wow_markdown": rendered.markdown, "wow_sections": rendered.sections})()
+    req = type("Req", (), {"wow_enabled": True, "wow_package_key": "quick_social_basic"})()
+    result = type("Result", (), {"status": "PASS", "section_results": []})()
+
+    with patch(
+        "backend.utils.wow_markdown_parser.parse_wow_markdown_to_sections",
+        side_effect=AssertionError("markdown was re-parsed"),
+    ), patch("backend.validators.report_gate.validate_report_sections", return_value=result) as validate:
+        assert _apply_wow_to_output(output, req) is output
+
+    assert validate.call_args.kwargs["sections"] is rendered.sections
+
+
+def test_pdf_context_uses_rendered_sections():
+    rendered = render_wow_template(
+        "quick_social_basic", {"brand_name": "Driftwood", "overview": "We roast coffee."}
+    )
+    context = build_pdf_context_for_wow_package(
+        {"brand_name": "Driftwood", "wow_sections": rendered.sections}, "quick_social_basic"
+    )
+    assert "We roast" in context["overview_html"]
+
+
+def test_generate_attaches_the_rendered_section_map():
+    from backend.main import _apply_wow_to_output
+
+    blocks = {"overview": "We roast coffee."}
+    output = type("Output", (), {"wow_markdown": None, "wow_sections": None, "extra_sections": blocks})()
+    req = type(
+        "Req",
+        (),
+        {
+            "wow_enabled": True,
+            "wow_package_key": "quick_social_basic",
+            "brief": {"brand": {"brand_name": "Driftwood Cafe", "industry": "Coffee"}},
+        },
+    )()
+
+    with patch(
+        "backend.utils.wow_markdown_parser.parse_wow_markdown_to_sections",
+        side_effect=AssertionError("markdown was parsed"),
+    ):
+        assert _apply_wow_to_output(output, req) is output
+
+    assert "We roast coffee." in output.wow_markdown
+    assert output.wow_sections[0]["id"] == "overview"
+    assert [s["id"] for s in output.wow_sections] == [
+        s["id"] for s in parse_wow_markdown_to_sections(output.wow_markdown)
+    ]
+
+
+def test_pdf_context_parses_markdown_only_reports_once():
+    rendered = render_wow_template(
+        "quick_social_basic", {"brand_name": "Driftwood", "overview": "We roast coffee."}
+    )
+    report = {"brand_name": "Driftwood", "wow_markdown": rendered.markdown}
+    context = build_pdf_context_for_wow_package(report, "quick_social_basic")
+    assert "We roast" in context["overview_html"]
+    assert report["wow_sections"] == rendered.sections
+
+
+def test_validation_attaches_parsed_sections():
+    from backend.main import _apply_wow_to_output
+
+    rendered = render_wow_template("quick_social_basic", _values_for("quick_social_basic"))
+    output = type("Output", (), {"wow_markdown": rendered.markdown, "wow_sections": None})()
+    req = type("Req", (), {"wow_enabled": True, "wow_package_key": "quick_social_basic"})()
+    result = type("Result", (), {"status": "PASS", "section_results": []})()
+
+    with patch("backend.validators.report_gate.validate_report_sections", return_value=result):
+        assert _apply_wow_to_output(output, req) is output
+    assert output.wow_sections == parse_wow_markdown_to_sections(rendered.markdown)